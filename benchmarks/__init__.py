@@ -0,0 +1,4 @@
+"""Latency and query-count benchmarks for the CRM's hot paths.
+
+Run them with ``python benchmarks/run.py``; see :mod:`benchmarks.run`.
+"""
@@ -0,0 +1,178 @@
+"""The benchmarked operations.
+
+Each case picks its documents from the dataset with ``rng``, so the same
+dataset and seed time the same calls. Cases that change data (adding lines,
+shipping, receiving, creating purchase orders) use a different document or
+line on every iteration, which keeps each call doing the same work.
+"""
+
+import io
+from functools import partial
+
+from core.address_book_logic import AddressBookLogic
+from core.invoice_generator import generate_invoice_pdf
+from core.inventory_service import InventoryService
+from core.logic.product_management import ProductLogic
+from core.packing_slip_generator import generate_packing_slip_pdf
+from core.purchase_logic import PurchaseLogic
+from core.purchase_order_generator import generate_po_pdf
+from core.purchase_order_service import PurchaseOrderService
+from core.quote_generator import generate_quote_pdf
+from core.render_session import DocumentRenderSession
+from core.replenishment_service import ReplenishmentService
+from core.repositories import InventoryRepository, ProductRepository, PurchaseOrderRepository
+from core.sales_logic import SalesLogic
+from core.sales_order_generator import generate_sales_order_pdf
+from shared.structs import PurchaseDocumentStatus, SalesDocumentStatus, SalesDocumentType
+
+REPLENISHMENT_BATCH = 20
+
+
+def _ids(db, sql: str, params=()) -> list:
+    return [row[0] for row in db.conn.execute(sql, params).fetchall()]
+
+
+def _sample(rng, ids: list, count: int) -> list:
+    """``count`` of ``ids`` in random order, repeating only if there are too few."""
+    if not ids:
+        return []
+    picked = rng.sample(ids, min(count, len(ids)))
+    return [picked[index % len(picked)] for index in range(count)]
+
+
+def get_all_products(db, rng, iterations):
+    logic = ProductLogic(db)
+    for _ in range(iterations):
+        yield logic.get_all_products
+
+
+def add_item_to_sales_document(db, rng, iterations):
+    logic = SalesLogic(db)
+    documents = _ids(db, "SELECT id FROM sales_documents WHERE status = ? ORDER BY id",
+                     (SalesDocumentStatus.QUOTE_DRAFT.value,))
+    products = _ids(db, "SELECT id FROM products WHERE is_active = 1 ORDER BY id")
+    for document_id in _sample(rng, documents, iterations):
+        yield partial(logic.add_item_to_sales_document, document_id, rng.choice(products), 2)
+
+
+def record_shipment(db, rng, iterations):
+    logic = SalesLogic(db)
+    # One line per open order, with stock to spare for every iteration.
+    lines = db.conn.execute(
+        """
+        SELECT i.sales_document_id, MIN(i.id)
+        FROM sales_document_items i
+        JOIN sales_documents d ON d.id = i.sales_document_id
+        JOIN products p ON p.id = i.product_id
+        WHERE d.document_type = ? AND d.status = ?
+          AND i.quantity - i.shipped_quantity >= 1 AND p.quantity_on_hand >= ?
+        GROUP BY i.sales_document_id
+        ORDER BY i.sales_document_id
+        """,
+        (SalesDocumentType.SALES_ORDER.value, SalesDocumentStatus.SO_OPEN.value, iterations),
+    ).fetchall()
+    for document_id, item_id in rng.sample([tuple(line) for line in lines], min(iterations, len(lines))):
+        yield partial(logic.record_shipment, document_id, {item_id: 1})
+
+
+def record_item_receipt(db, rng, iterations):
+    logic = PurchaseLogic(db)
+    items = _ids(
+        db,
+        """
+        SELECT i.id
+        FROM purchase_document_items i
+        JOIN purchase_documents d ON d.id = i.purchase_document_id
+        WHERE d.status = ? AND i.product_id IS NOT NULL
+          AND i.quantity - COALESCE((SELECT SUM(r.quantity) FROM purchase_receipts r
+                                     WHERE r.purchase_document_item_id = i.id), 0) >= 1
+        ORDER BY i.id
+        """,
+        (PurchaseDocumentStatus.PO_ISSUED.value,),
+    )
+    for item_id in rng.sample(items, min(iterations, len(items))):
+        yield partial(logic.record_item_receipt, item_id, 1)
+
+
+def get_products_below_reorder(db, rng, iterations):
+    service = InventoryService(InventoryRepository(db), ProductRepository(db))
+    for _ in range(iterations):
+        yield service.get_products_below_reorder
+
+
+def process_queue(db, rng, iterations):
+    inventory_repo = InventoryRepository(db)
+    product_repo = ProductRepository(db)
+    po_service = PurchaseOrderService(PurchaseOrderRepository(db), InventoryService(inventory_repo, product_repo))
+    service = ReplenishmentService(inventory_repo, product_repo, po_service)
+    products = _ids(db, "SELECT DISTINCT product_id FROM product_vendors ORDER BY product_id")
+    service.process_queue()  # Start from an empty queue.
+    for _ in range(iterations):
+        for product_id in rng.sample(products, min(REPLENISHMENT_BATCH, len(products))):
+            inventory_repo.add_replenishment_item(product_id, 10)
+        yield service.process_queue
+
+
+def get_account_details(db, rng, iterations):
+    logic = AddressBookLogic(db)
+    accounts = _ids(db, "SELECT id FROM accounts ORDER BY id")
+    for account_id in _sample(rng, accounts, iterations):
+        yield partial(logic.get_account_details, account_id)
+
+
+def _render(db, generator, document_id, **kwargs):
+    """Render one document on a fresh session, as a popup export does."""
+    with DocumentRenderSession(db) as session:
+        data = generator(document_id, output_path=io.BytesIO(), session=session, **kwargs)
+    if data is None:
+        raise RuntimeError(f"{generator.__name__} could not render document {document_id}")
+    return data
+
+
+def _sales_pdf(generator, document_type: SalesDocumentType):
+    def case(db, rng, iterations):
+        documents = _ids(db, "SELECT id FROM sales_documents WHERE document_type = ? ORDER BY id",
+                         (document_type.value,))
+        for document_id in _sample(rng, documents, iterations):
+            yield partial(_render, db, generator, document_id)
+    return case
+
+
+def purchase_order_pdf(db, rng, iterations):
+    documents = _ids(db, "SELECT id FROM purchase_documents WHERE status != ? ORDER BY id",
+                     (PurchaseDocumentStatus.RFQ.value,))
+    for document_id in _sample(rng, documents, iterations):
+        yield partial(_render, db, generate_po_pdf, document_id)
+
+
+def packing_slip_pdf(db, rng, iterations):
+    documents = db.conn.execute(
+        "SELECT id, document_number FROM sales_documents WHERE document_type = ? AND status = ? ORDER BY id",
+        (SalesDocumentType.SALES_ORDER.value, SalesDocumentStatus.SO_FULFILLED.value),
+    ).fetchall()
+    for document_id, number in _sample(rng, [tuple(row) for row in documents], iterations):
+        shipped = {
+            item_id: quantity for item_id, quantity in db.conn.execute(
+                "SELECT id, shipped_quantity FROM sales_document_items WHERE sales_document_id = ?",
+                (document_id,),
+            )
+        }
+        yield partial(_render, db, generate_packing_slip_pdf, document_id,
+                      shipments=shipped, shipment_number=f"{number}.001")
+
+
+# name -> (case, default iterations)
+CASES = {
+    "products.get_all_products": (get_all_products, 5),
+    "sales.add_item_to_sales_document": (add_item_to_sales_document, 50),
+    "sales.record_shipment": (record_shipment, 30),
+    "purchases.record_item_receipt": (record_item_receipt, 30),
+    "inventory.get_products_below_reorder": (get_products_below_reorder, 10),
+    "replenishment.process_queue": (process_queue, 20),
+    "accounts.get_account_details": (get_account_details, 200),
+    "pdf.invoice": (_sales_pdf(generate_invoice_pdf, SalesDocumentType.INVOICE), 20),
+    "pdf.quote": (_sales_pdf(generate_quote_pdf, SalesDocumentType.QUOTE), 20),
+    "pdf.sales_order": (_sales_pdf(generate_sales_order_pdf, SalesDocumentType.SALES_ORDER), 20),
+    "pdf.purchase_order": (purchase_order_pdf, 20),
+    "pdf.packing_slip": (packing_slip_pdf, 20),
+}
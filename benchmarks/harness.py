@@ -0,0 +1,143 @@
+"""Timing, query counting and baseline comparison for the benchmark cases.
+
+A case is a function ``case(db, rng, iterations)`` that does its untimed
+setup and then yields one zero-argument callable per iteration. Only the
+callables are timed, so work done between yields (picking the next
+document, refilling a queue) does not count. While a callable runs, every
+SQL statement the connection executes is counted, including the statements
+run by triggers.
+"""
+
+import json
+import math
+import platform
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+
+PERCENTILES = (50, 90, 95, 99)
+DEFAULT_WARMUP = 2
+# A case regresses when its median is slower than the baseline's by this
+# fraction plus MIN_SLACK_MS, or when it runs more statements per call. The
+# slack keeps sub-millisecond cases from failing on timer noise.
+DEFAULT_TOLERANCE = 0.5
+MIN_SLACK_MS = 1.0
+
+
+@dataclass
+class CaseResult:
+    """Latencies in milliseconds and statements per call for one case."""
+
+    iterations: int
+    mean_ms: float
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    queries_per_call: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """The ``pct``th percentile of ``values``, interpolating between neighbours."""
+    if not values:
+        raise ValueError("percentile of no values")
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class QueryCounter:
+    """Counts statements executed on ``conn`` while the block runs."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.count = 0
+
+    def _trace(self, _statement: str) -> None:
+        self.count += 1
+
+    def __enter__(self):
+        self.conn.set_trace_callback(self._trace)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.conn.set_trace_callback(None)
+
+
+def run_case(case, db, rng, iterations: int, warmup: int = DEFAULT_WARMUP) -> CaseResult:
+    """Time ``iterations`` calls of ``case`` after ``warmup`` untimed ones."""
+    samples = []
+    counter = QueryCounter(db.conn)
+    for index, call in enumerate(case(db, rng, warmup + iterations)):
+        if index < warmup:
+            call()
+            continue
+        with counter:
+            started = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - started)
+    if not samples:
+        raise RuntimeError("the dataset has no documents this case can use")
+    millis = [sample * 1000 for sample in samples]
+    spread = {f"p{pct}_ms": round(percentile(millis, pct), 3) for pct in PERCENTILES}
+    return CaseResult(
+        iterations=len(millis),
+        mean_ms=round(sum(millis) / len(millis), 3),
+        max_ms=round(max(millis), 3),
+        queries_per_call=round(counter.count / len(millis), 2),
+        **spread,
+    )
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+            timings: bool = True) -> list[str]:
+    """Regressions of ``results`` against ``baseline``, one line of text each.
+
+    Both map case names to :meth:`CaseResult.to_dict` output. Cases missing
+    from either side are not compared. With ``timings`` False only statement
+    counts are compared, for a baseline recorded on another machine.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous["p50_ms"] * (1 + tolerance) + MIN_SLACK_MS
+        if timings and current["p50_ms"] > limit:
+            regressions.append(
+                f"{name}: median {current['p50_ms']:.2f} ms, baseline {previous['p50_ms']:.2f} ms "
+                f"(limit {limit:.2f} ms)"
+            )
+        if current["queries_per_call"] > previous["queries_per_call"] + 1e-9:
+            regressions.append(
+                f"{name}: {current['queries_per_call']:g} statements per call, "
+                f"baseline {previous['queries_per_call']:g}"
+            )
+    return regressions
+
+
+def load_json(path: str) -> dict | None:
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def save_json(path: str, data: dict) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2, sort_keys=True)
+        handle.write("\n")
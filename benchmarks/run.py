@@ -0,0 +1,162 @@
+"""Run the benchmark cases against a large generated dataset.
+
+The dataset comes from ``scripts/synthetic_data.py``. It is generated once
+per ``--scale`` and ``--seed`` into ``benchmarks/.data`` and reused after
+that. Pass ``--db`` to use a file you generated yourself. Cases change data,
+so every run works on a fresh copy of the dataset.
+
+Each case reports latency percentiles and SQL statements per call. The
+results are written to ``--output`` as JSON and compared with
+``benchmarks/baseline.json``. A case that runs more statements per call is a
+regression and makes the run exit with status 1. So is a case whose median
+exceeds the baseline's by more than ``--tolerance`` (plus 1 ms), but only
+when the baseline was recorded in the same environment (Python, SQLite and
+platform); timings from another machine say nothing about this one.
+``--update-baseline`` stores this run as the new baseline instead.
+
+    python benchmarks/run.py
+    python benchmarks/run.py --only pdf.invoice --only sales.record_shipment
+    python benchmarks/run.py --update-baseline
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Ensure project root is on the path for absolute imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from benchmarks.cases import CASES
+from benchmarks.harness import (
+    DEFAULT_TOLERANCE,
+    DEFAULT_WARMUP,
+    compare,
+    environment,
+    load_json,
+    run_case,
+    save_json,
+)
+from core.database import DatabaseHandler
+from scripts.synthetic_data import DEFAULT_SEED, Scale, generate
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BENCHMARK_DIR, ".data")
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCHMARK_DIR, "results.json")
+DEFAULT_SCALE = 0.1
+
+
+def dataset_path(scale: float, seed: int) -> str:
+    """The cached dataset for ``scale`` and ``seed``, generating it if needed."""
+    path = os.path.join(DATA_DIR, f"synthetic-{scale:g}-{seed}.db")
+    if not os.path.exists(path):
+        os.makedirs(DATA_DIR, exist_ok=True)
+        partial = path + ".partial"
+        if os.path.exists(partial):
+            os.remove(partial)
+        print(f"Generating dataset {path} …")
+        generate(partial, Scale().scaled(scale), seed=seed, progress=lambda line: print(f"  {line}"))
+        os.replace(partial, path)
+    return path
+
+
+def run_cases(source: str, names, seed: int = DEFAULT_SEED, iterations: int | None = None,
+              warmup: int = DEFAULT_WARMUP, progress=None) -> dict:
+    """Run the cases ``names`` on a copy of the database ``source``.
+
+    Returns case name -> :meth:`CaseResult.to_dict`. ``iterations``
+    overrides every case's default count.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "benchmark.db")
+        shutil.copyfile(source, path)
+        db = DatabaseHandler(path)
+        try:
+            for name in names:
+                case, default_iterations = CASES[name]
+                rng = random.Random(f"{seed}:{name}")
+                result = run_case(case, db, rng, iterations or default_iterations, warmup)
+                results[name] = result.to_dict()
+                if progress:
+                    progress(name, result)
+        finally:
+            db.close()
+    return results
+
+
+def _print_result(name, result) -> None:
+    print(f"{name:40} {result.p50_ms:9.2f} {result.p95_ms:9.2f} {result.p99_ms:9.2f} "
+          f"{result.max_ms:9.2f} {result.queries_per_call:9.1f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", help="existing dataset to copy instead of the generated one")
+    parser.add_argument("--scale", type=float, default=DEFAULT_SCALE,
+                        help="dataset size relative to the synthetic_data.py defaults")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--only", action="append", choices=sorted(CASES), help="run just this case")
+    parser.add_argument("--iterations", type=int, help="timed calls per case (default: per case)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown of the median, as a fraction of the baseline")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store this run as the baseline instead of comparing")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        source = args.db
+        dataset = {"file": os.path.basename(args.db), "seed": args.seed}
+    else:
+        source = dataset_path(args.scale, args.seed)
+        dataset = {"scale": args.scale, "seed": args.seed}
+
+    names = args.only or list(CASES)
+    print(f"{'case':40} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9} {'queries':>9}")
+    started = time.perf_counter()
+    results = run_cases(source, names, seed=args.seed, iterations=args.iterations,
+                        warmup=args.warmup, progress=_print_result)
+    print(f"Ran {len(results)} cases in {time.perf_counter() - started:.1f}s")
+
+    report = {"dataset": dataset, "environment": environment(), "results": results}
+    save_json(args.output, report)
+    print(f"Wrote {args.output}")
+
+    if args.update_baseline:
+        baseline = load_json(args.baseline) or {}
+        if baseline.get("dataset") == dataset:
+            report["results"] = {**baseline.get("results", {}), **results}
+        save_json(args.baseline, report)
+        print(f"Updated baseline {args.baseline}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+    if baseline.get("dataset") != dataset:
+        print(f"Baseline was recorded on {baseline.get('dataset')}, not {dataset}; not compared.")
+        return 0
+    same_environment = baseline.get("environment") == report["environment"]
+    if not same_environment:
+        print(f"Baseline was recorded on {baseline.get('environment')}, not {report['environment']}; "
+              "comparing statement counts only.")
+    regressions = compare(results, baseline.get("results", {}), args.tolerance, timings=same_environment)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if regressions:
+        return 1
+    print("No regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -123,56 +123,101 @@ class AddressBookLogic:
                 logger.warning("Could not process account record %s. Error: %s", acc_data, e)
         return accounts_list
 
+    def get_accounts_page(self, filters: Optional[dict] = None, sort_key: str = "name",
+                          after: Optional[tuple] = None, limit: int = 100) -> tuple[List[Account], Optional[tuple]]:
+        """
+        Retrieve one keyset-paginated page of accounts.
+        Pass the returned cursor as ``after`` to get the next page; it is None
+        on the last page. Prefix ``sort_key`` with ``-`` to sort descending.
+        """
+        rows, next_cursor = self.account_repo.get_accounts_page(
+            self._page_filter_values(filters), sort_key, after, limit
+        )
+        # The page rows also carry rule and term names for sorting.
+        fields = ("id", "name", "phone", "description", "account_type", "pricing_rule_id", "payment_term_id")
+        accounts_list = []
+        for row in rows:
+            try:
+                accounts_list.append(Account.from_row(tuple(row[field] for field in fields)))
+            except (ValueError, KeyError) as e:
+                logger.warning("Could not process account record %s. Error: %s", row, e)
+        return accounts_list, next_cursor
+
+    @staticmethod
+    def _page_filter_values(filters: Optional[dict]) -> dict:
+        """Convert Enum filter values to the strings stored in the database."""
+        return {key: value.value if isinstance(value, Enum) else value
+                for key, value in (filters or {}).items()}
+
     def get_account_details(self, account_id) -> Account | None:
         """Retrieve full account details, including new fields."""
         data = self.account_repo.get_account_details(account_id)
         if data:
-            account_type_enum = None
-            account_type_str = data.get("account_type")
-            if account_type_str:
-                try:
-                    account_type_enum = AccountType(account_type_str)
-                except ValueError:
-                    logger.warning("Invalid account type string '%s' in DB for account ID %s", account_type_str, data.get('id'))
-
-            address_map: dict[int, Address] = {}
-            for addr_data in data.get('addresses', []):
-                addr_id = addr_data['address_id']
-                address = address_map.get(addr_id)
-                if not address:
-                    address = Address(
-                        address_id=addr_id,
-                        street=addr_data['street'],
-                        city=addr_data['city'],
-                        state=addr_data['state'],
-                        zip_code=addr_data['zip'],
-                        country=addr_data['country'],
-                    )
-                    address.address_types = []
-                    address.primary_types = []
-                    address_map[addr_id] = address
-                address.address_types.append(addr_data['address_type'])
-                if addr_data['is_primary']:
-                    address.primary_types.append(addr_data['address_type'])
-
-            addresses = list(address_map.values())
-            for address in addresses:
-                address.address_type = address.address_types[0] if address.address_types else ""
-                address.is_primary = address.address_type in address.primary_types
-
-            return Account(
-                account_id=data.get("id"),  # Ensure key matches db output
-                name=data.get("name"),
-                phone=data.get("phone"),
-                addresses=addresses,
-                website=data.get("website"),
-                description=data.get("description"),
-                account_type=account_type_enum,
-                pricing_rule_id=data.get("pricing_rule_id"),
-                payment_term_id=data.get("payment_term_id")
-            )
+            return self._account_from_data(data)
         return None
 
+    def get_accounts_details(self, account_ids) -> dict[int, Account]:
+        """Retrieve full details for many accounts at once, keyed by account id.
+
+        Addresses for all accounts are prefetched in a single query.
+        """
+        accounts_data = self.account_repo.get_accounts_details(account_ids)
+        return {account_id: self._account_from_data(data) for account_id, data in accounts_data.items()}
+
+    def get_account_summaries(self, account_ids) -> dict[int, dict]:
+        """Retrieve id, name, account_type, pricing_rule_id and payment_term_id for many accounts.
+
+        Use this instead of get_account_details when addresses are not needed,
+        e.g. to resolve customer names for a document list.
+        """
+        return self.account_repo.get_account_summaries(account_ids)
+
+    def _account_from_data(self, data: dict) -> Account:
+        account_type_enum = None
+        account_type_str = data.get("account_type")
+        if account_type_str:
+            try:
+                account_type_enum = AccountType(account_type_str)
+            except ValueError:
+                logger.warning("Invalid account type string '%s' in DB for account ID %s", account_type_str, data.get('id'))
+
+        address_map: dict[int, Address] = {}
+        for addr_data in data.get('addresses', []):
+            addr_id = addr_data['address_id']
+            address = address_map.get(addr_id)
+            if not address:
+                address = Address(
+                    address_id=addr_id,
+                    street=addr_data['street'],
+                    city=addr_data['city'],
+                    state=addr_data['state'],
+                    zip_code=addr_data['zip'],
+                    country=addr_data['country'],
+                )
+                address.address_types = []
+                address.primary_types = []
+                address_map[addr_id] = address
+            address.address_types.append(addr_data['address_type'])
+            if addr_data['is_primary']:
+                address.primary_types.append(addr_data['address_type'])
+
+        addresses = list(address_map.values())
+        for address in addresses:
+            address.address_type = address.address_types[0] if address.address_types else ""
+            address.is_primary = address.address_type in address.primary_types
+
+        return Account(
+            account_id=data.get("id"),  # Ensure key matches db output
+            name=data.get("name"),
+            phone=data.get("phone"),
+            addresses=addresses,
+            website=data.get("website"),
+            description=data.get("description"),
+            account_type=account_type_enum,
+            pricing_rule_id=data.get("pricing_rule_id"),
+            payment_term_id=data.get("payment_term_id")
+        )
+
     def get_accounts(self): # This likely returns tuples (id, name)
         """Retrieve all accounts (typically for dropdowns)."""
         return self.account_repo.get_accounts()
@@ -289,17 +334,24 @@ class AddressBookLogic:
     def get_all_contacts(self) -> list[Contact]:
         """Retrieve all contacts as Contact objects."""
         contacts_data = self.contact_repo.get_all_contacts()
-        contact_list = []
-        for row_data in contacts_data:
-            contact_list.append(Contact(
-                contact_id=row_data["id"], # Ensure key matches db output
-                name=row_data["name"],
-                phone=row_data["phone"],
-                email=row_data["email"],
-                role=row_data.get("role", ""), # Add role
-                account_id=row_data["account_id"]
-            ))
-        return contact_list
+        return [self._contact_from_row(row_data) for row_data in contacts_data]
+
+    def get_contacts_page(self, filters: Optional[dict] = None, sort_key: str = "name",
+                          after: Optional[tuple] = None, limit: int = 100) -> tuple[list[Contact], Optional[tuple]]:
+        """Retrieve one keyset-paginated page of contacts and the cursor for the next page."""
+        rows, next_cursor = self.contact_repo.get_contacts_page(filters, sort_key, after, limit)
+        return [self._contact_from_row(row_data) for row_data in rows], next_cursor
+
+    @staticmethod
+    def _contact_from_row(row_data: dict) -> Contact:
+        return Contact(
+            contact_id=row_data["id"], # Ensure key matches db output
+            name=row_data["name"],
+            phone=row_data["phone"],
+            email=row_data["email"],
+            role=row_data.get("role", ""), # Add role
+            account_id=row_data["account_id"]
+        )
 
     def delete_contact(self, contact_id: int):
         """Delete a specific contact."""
@@ -425,39 +477,66 @@ class AddressBookLogic:
 
     def get_all_interactions(self, company_id: int = None, contact_id: int = None) -> List['Interaction']:
         """Retrieve all interactions, optionally filtered by company or contact, as Interaction objects."""
-        from shared.structs import Interaction, InteractionType # Local import
-        import datetime
-
         interactions_data = self.interaction_repo.get_interactions(company_id=company_id, contact_id=contact_id)
-        interaction_list = []
-        for row_data in interactions_data:
-            interaction_type_enum = None
-            if row_data.get("interaction_type"):
-                try:
-                    interaction_type_enum = InteractionType(row_data["interaction_type"])
-                except ValueError:
-                    logger.warning("Invalid interaction type '%s' found for interaction ID %s", row_data['interaction_type'], row_data.get('interaction_id'))
-                    interaction_type_enum = InteractionType.OTHER
+        return [self._interaction_from_row(row_data) for row_data in interactions_data]
 
-            date_time_obj = None
-            if row_data.get("date_time"):
-                try:
-                    date_time_obj = datetime.datetime.fromisoformat(row_data["date_time"])
-                except ValueError:
-                    logger.warning("Invalid date format '%s' found for interaction ID %s", row_data['date_time'], row_data.get('interaction_id'))
+    def get_interaction_page(self, company_id: int = None, contact_id: int = None, before=None,
+                             limit: int = 50, types=None, date_from=None, date_to=None):
+        """
+        Retrieve one page of interactions for a company or contact, newest first.
 
-            interaction_list.append(Interaction(
-                interaction_id=row_data.get("interaction_id"),
-                company_id=row_data.get("company_id"),
-                contact_id=row_data.get("contact_id"),
-                interaction_type=interaction_type_enum,
-                date_time=date_time_obj,
-                subject=row_data.get("subject"),
-                description=row_data.get("description"),
-                created_by_user_id=row_data.get("created_by_user_id"),
-                attachment_path=row_data.get("attachment_path")
-            ))
-        return interaction_list
+        Returns ``(interactions, next_cursor)``. Pass ``next_cursor`` back as
+        ``before`` to fetch the following page; it is None on the last page.
+        ``types`` is a list of InteractionType (or their values). ``date_from``
+        and ``date_to`` are inclusive and may be dates, datetimes or ISO strings.
+        """
+        type_values = [t.value if isinstance(t, Enum) else t for t in types] if types else None
+        if isinstance(date_from, (datetime.date, datetime.datetime)):
+            date_from = date_from.isoformat()
+        if isinstance(date_to, datetime.datetime):
+            date_to = date_to.isoformat()
+        elif isinstance(date_to, datetime.date):
+            # A plain date covers the whole day.
+            date_to = f"{date_to.isoformat()}T23:59:59.999999"
+
+        rows = self.interaction_repo.get_interaction_page(
+            company_id=company_id, contact_id=contact_id, before=before, limit=limit,
+            types=type_values, date_from=date_from, date_to=date_to,
+        )
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = (rows[-1]["date_time"], rows[-1]["interaction_id"])
+        return [self._interaction_from_row(row_data) for row_data in rows], next_cursor
+
+    def _interaction_from_row(self, row_data: dict) -> 'Interaction':
+        from shared.structs import Interaction, InteractionType # Local import
+
+        interaction_type_enum = None
+        if row_data.get("interaction_type"):
+            try:
+                interaction_type_enum = InteractionType(row_data["interaction_type"])
+            except ValueError:
+                logger.warning("Invalid interaction type '%s' found for interaction ID %s", row_data['interaction_type'], row_data.get('interaction_id'))
+                interaction_type_enum = InteractionType.OTHER
+
+        date_time_obj = None
+        if row_data.get("date_time"):
+            try:
+                date_time_obj = datetime.datetime.fromisoformat(row_data["date_time"])
+            except ValueError:
+                logger.warning("Invalid date format '%s' found for interaction ID %s", row_data['date_time'], row_data.get('interaction_id'))
+
+        return Interaction(
+            interaction_id=row_data.get("interaction_id"),
+            company_id=row_data.get("company_id"),
+            contact_id=row_data.get("contact_id"),
+            interaction_type=interaction_type_enum,
+            date_time=date_time_obj,
+            subject=row_data.get("subject"),
+            description=row_data.get("description"),
+            created_by_user_id=row_data.get("created_by_user_id"),
+            attachment_path=row_data.get("attachment_path")
+        )
 
     def delete_interaction(self, interaction_id: int):
         """Delete a specific interaction."""
@@ -545,6 +624,32 @@ class AddressBookLogic:
         task_list = [Task.from_dict(data) for data in tasks_data]
         return task_list
 
+    def get_tasks_page(self, filters: Optional[dict] = None, sort_key: str = "due_date",
+                       after: Optional[tuple] = None, limit: int = 100) -> tuple[List['Task'], Optional[tuple]]:
+        """
+        Retrieve one keyset-paginated page of tasks as Task objects.
+        Enum filter values are converted to their string values.
+        """
+        from shared.structs import Task # Local import
+
+        rows, next_cursor = self.task_repo.get_tasks_page(
+            self._page_filter_values(filters), sort_key, after, limit
+        )
+        return [Task.from_dict(data) for data in rows], next_cursor
+
+    def get_task_list_rows(self, filters: Optional[dict] = None, sort: tuple[str, bool] = ("due_date", False),
+                           limit: Optional[int] = None, offset: int = 0) -> list[dict]:
+        """
+        Retrieve display rows for the task list, joined with company, contact and
+        assigned user names and filtered/sorted in SQL.
+        ``sort`` is a (column, descending) pair; enum filter values are converted
+        to their string values.
+        """
+        sort_column, descending = sort
+        return self.task_repo.get_task_list_rows(
+            self._page_filter_values(filters), sort_column, descending, limit, offset
+        )
+
     def update_task_details(self, task: 'Task') -> 'Task':
         """
         Updates an existing task after validation.
@@ -606,32 +711,14 @@ class AddressBookLogic:
     def check_and_update_overdue_tasks(self) -> int:
         """
         Checks for tasks that are past their due date and not yet 'Completed' or 'Overdue'.
-        Updates their status to 'Overdue'.
+        Updates their status to 'Overdue' in a single set-based UPDATE.
         Returns the number of tasks updated.
         """
-        from shared.structs import TaskStatus, Task # Local import
-        import datetime
-
         now = datetime.datetime.now(datetime.timezone.utc)
-        # For due_date comparison, if due_date is just a date, compare against date part of now.
-        # If due_date includes time, compare against now (datetime).
-        # The DB stores due_date as ISO string.
-        # To correctly identify tasks due *before* today as overdue,
-        # we should compare against the beginning of the current day.
-        # If a task's due_date is 'YYYY-MM-DD', it implies by end of that day.
-        # So, it's overdue if current_date is already YYYY-MM-(DD+1).
-
+        # A task due 'YYYY-MM-DD' is due by the end of that day, so it only
+        # becomes overdue once the current date has moved past it.
         current_day_iso_date_str = now.date().isoformat()
-        overdue_tasks_data = self.task_repo.get_overdue_tasks(current_day_iso_date_str)
-
-        updated_count = 0
-        for task_data in overdue_tasks_data:
-            task = Task.from_dict(task_data) # Convert to Task object to easily manage status
-            if task.status != TaskStatus.COMPLETED and task.status != TaskStatus.OVERDUE:
-                updated_at_ts = datetime.datetime.now(datetime.timezone.utc)
-                self.task_repo.update_task_status(task.task_id, TaskStatus.OVERDUE.value, updated_at_ts.isoformat())
-                updated_count += 1
-        return updated_count
+        return self.task_repo.mark_overdue_tasks(current_day_iso_date_str, now.isoformat())
 
     # User methods
     def get_all_users(self) -> list[tuple[int, str]]:
@@ -763,19 +850,7 @@ class AddressBookLogic:
         Returns a flat list of (leaf_category_id, full_path_string) for all leaf categories.
         Example: [(10, "Electronics\\Audio\\Headphones"), (12, "Books\\Fiction")]
         """
-        all_categories_map = self._get_all_categories_map()
-        leaf_paths = []
-
-        # Identify all leaf nodes (nodes that are not parents to any other node)
-        # More simply, any node can be a leaf if it's selected.
-        # The goal is to list all categories with their full path.
-
-        for cat_id, (name, parent_id) in all_categories_map.items():
-            path = self._get_category_path_string(cat_id, all_categories_map)
-            leaf_paths.append((cat_id, path))
-
-        leaf_paths.sort(key=lambda x: x[1]) # Sort by path string
-        return leaf_paths
+        return self.product_repo.get_all_product_category_paths()
 
 
     def add_category(self, name: str, parent_id: int | None = None) -> int:
@@ -794,18 +869,12 @@ class AddressBookLogic:
 
     def update_category_parent(self, category_id: int, new_parent_id: int | None):
         """Updates an existing category's parent."""
-        # Add more sophisticated cycle detection here if needed.
-        # E.g., ensure new_parent_id is not a descendant of category_id.
         if category_id == new_parent_id: # Basic check already in DB, but good to have in logic too
             raise ValueError("A category cannot be its own parent.")
 
-        # More advanced cycle detection: Walk up from new_parent_id to see if category_id is an ancestor.
-        current_ancestor_id = new_parent_id
-        all_cats_map = self._get_all_categories_map()
-        while current_ancestor_id is not None:
-            if current_ancestor_id == category_id:
-                raise ValueError("Cannot set parent to a descendant category (creates a cycle).")
-            _name, current_ancestor_id = all_cats_map.get(current_ancestor_id, (None, None))
+        # Cycle detection: the new parent must not sit inside the moved subtree.
+        if new_parent_id is not None and self.product_repo.is_category_descendant(category_id, new_parent_id):
+            raise ValueError("Cannot set parent to a descendant category (creates a cycle).")
 
         self.product_repo.update_product_category_parent(category_id, new_parent_id)
 
@@ -822,25 +891,11 @@ class AddressBookLogic:
         units_tuples = self.product_repo.get_all_product_units_of_measure_from_table() # Returns list of (id, name)
         return [name for id, name in units_tuples] # Extract just the names
 
-    def _get_category_path_string(self, category_id: int, all_categories_map: dict[int, tuple[str, int | None]]) -> str:
-        """
-        Helper function to recursively build the full category path string.
-        all_categories_map is a dictionary: {id: (name, parent_id)}
-        """
-        if category_id is None or category_id not in all_categories_map:
+    def _get_category_path_string(self, category_id: int) -> str:
+        """Returns the cached full category path string, e.g. ``Electronics\\Audio``."""
+        if category_id is None:
             return ""
-
-        name, parent_id = all_categories_map[category_id]
-        if parent_id is None or parent_id not in all_categories_map:
-            return name
-        else:
-            parent_path = self._get_category_path_string(parent_id, all_categories_map)
-            return f"{parent_path}\\{name}"
-
-    def _get_all_categories_map(self) -> dict[int, tuple[str, int | None]]:
-        """Helper to fetch all categories and put them into a map for easy lookup."""
-        categories_data = self.product_repo.get_all_product_categories_from_table() # (id, name, parent_id)
-        return {cat_id: (name, parent_id) for cat_id, name, parent_id in categories_data}
+        return self.product_repo.get_product_category_path(category_id) or ""
 
     # --- Pricing Rule Methods ---
     def create_pricing_rule(self, rule_name: str, markup_percentage: float = None, fixed_markup: float = None) -> Optional[int]:
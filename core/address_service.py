@@ -65,37 +65,28 @@ class AddressService:
         return None
 
     def save_account_addresses(self, account):
-        """Persist addresses for an account after enforcing primary constraints."""
-        self.account_repo.clear_account_addresses(account.account_id)
+        """Persist addresses for an account after enforcing primary constraints.
+
+        Only the differences from the stored addresses are written, in a single
+        transaction. Newly created addresses get their ``address_id`` set.
+        """
         self.enforce_single_primary(account.addresses)
+        submitted = []
         for address in account.addresses:
-            if address.address_id:
-                self.address_repo.update_address(
-                    address.address_id,
-                    address.street,
-                    address.city,
-                    address.state,
-                    address.zip_code,
-                    address.country,
-                )
-                addr_id = address.address_id
-            else:
-                addr_id = self.address_repo.add_address(
-                    address.street,
-                    address.city,
-                    address.state,
-                    address.zip_code,
-                    address.country,
-                )
-
             types = getattr(address, "address_types", None) or [
                 t for t in [getattr(address, "address_type", "")] if t
             ]
             primary_types = getattr(address, "primary_types", [])
-            for addr_type in types:
-                self.account_repo.add_account_address(
-                    account.account_id,
-                    addr_id,
-                    addr_type,
-                    addr_type in primary_types,
-                )
+            submitted.append({
+                "address_id": address.address_id,
+                "street": address.street,
+                "city": address.city,
+                "state": address.state,
+                "zip": address.zip_code,
+                "country": address.country,
+                "types": {addr_type: addr_type in primary_types for addr_type in types},
+            })
+
+        address_ids = self.account_repo.save_account_addresses(account.account_id, submitted)
+        for address, address_id in zip(account.addresses, address_ids):
+            address.address_id = address_id
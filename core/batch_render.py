@@ -0,0 +1,174 @@
+"""Render many document PDFs in one go.
+
+    python -m core.batch_render --type invoice --status "Invoice Draft" \\
+        --since 2026-09-01 --out invoices/ --workers 8
+
+Documents are selected with a single query, then rendered across a process
+pool. Every worker process keeps one read-only :class:`DocumentRenderSession`
+for all the documents it renders, and each PDF is written to a temporary
+file that is renamed into place only once it is complete, so the output
+directory never holds a half-written file.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from core.database import DatabaseHandler
+from core.render_cache import DOCUMENT_KINDS
+from core.render_session import DocumentRenderSession
+from core.repositories import PurchaseRepository, SalesRepository
+from shared.utils import sanitize_filename
+
+_worker_session: DocumentRenderSession | None = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of :func:`render_batch`; ``failures`` pairs document numbers with errors."""
+
+    rendered: list = field(default_factory=list)
+    failures: list = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def total(self) -> int:
+        return len(self.rendered) + len(self.failures)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.total / self.seconds if self.seconds else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"Rendered {len(self.rendered)} of {self.total} documents in {self.seconds:.2f} s "
+            f"({self.docs_per_second:.1f} docs/s), {len(self.failures)} failed."
+        ]
+        lines.extend(f"  {number}: {error}" for number, error in self.failures)
+        return "\n".join(lines)
+
+
+def select_documents(db: DatabaseHandler, kind: str, status: str | None = None,
+                     since: str | None = None) -> list[tuple[int, str]]:
+    """``(id, document_number)`` of the documents of ``kind`` to render."""
+    document_type, _prefix, _generator = DOCUMENT_KINDS[kind]
+    if document_type is None:
+        return PurchaseRepository(db).get_purchase_document_numbers(status, since)
+    return SalesRepository(db).get_sales_document_numbers(document_type.value, status, since)
+
+
+def render_batch(kind: str, out_dir: str, db_path: str | None = None, status: str | None = None,
+                 since: str | None = None, workers: int = 4) -> BatchSummary:
+    """Render every matching document of ``kind`` into ``out_dir``.
+
+    With ``workers=0`` documents are rendered in this process, one after
+    the other, which is handy for debugging a single failing document.
+    """
+    if workers < 0:
+        raise ValueError("workers must not be negative.")
+    started = time.perf_counter()
+    # A regular connection brings the schema up to date and creates the
+    # default company row if needed; the workers only ever read.
+    with DocumentRenderSession(db_path=db_path) as session:
+        db_path = session.db.db_path
+        company_context = session.company_context()
+        documents = select_documents(session.db, kind, status, since)
+
+    os.makedirs(out_dir, exist_ok=True)
+    _document_type, prefix, _generator = DOCUMENT_KINDS[kind]
+    jobs = [
+        (kind, doc_id, os.path.join(out_dir, f"{prefix}_{sanitize_filename(number)}.pdf"))
+        for doc_id, number in documents
+    ]
+
+    if not jobs:
+        results = []
+    elif workers == 0:
+        _init_worker(db_path, company_context)
+        try:
+            results = [_render_one(*job) for job in jobs]
+        finally:
+            _close_worker()
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(db_path, company_context)) as pool:
+            chunksize = max(1, len(jobs) // (workers * 4))
+            results = list(pool.map(_render_one, *zip(*jobs), chunksize=chunksize))
+
+    summary = BatchSummary()
+    for (_doc_id, number), (path, error) in zip(documents, results):
+        if error is None:
+            summary.rendered.append(path)
+        else:
+            summary.failures.append((number, error))
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def _init_worker(db_path: str, company_context: tuple) -> None:
+    global _worker_session
+    _worker_session = DocumentRenderSession(db_path=db_path, read_only=True,
+                                            company_context=company_context)
+
+
+def _close_worker() -> None:
+    global _worker_session
+    if _worker_session is not None:
+        _worker_session.close()
+        _worker_session = None
+
+
+def _render_one(kind: str, doc_id: int, path: str) -> tuple[str, str | None]:
+    """Render one document to ``path``; returns ``(path, error or None)``."""
+    _document_type, _prefix, generator = DOCUMENT_KINDS[kind]
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    # The generators report problems on stdout/stderr instead of raising.
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            generator(doc_id, output_path=temp_path, session=_worker_session)
+        if not os.path.exists(temp_path):
+            messages = [line for line in output.getvalue().splitlines() if line.strip()]
+            return path, messages[0] if messages else "No PDF was produced."
+        os.replace(temp_path, path)
+        return path, None
+    except Exception as exc:
+        return path, str(exc)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _iso_date(value: str) -> str:
+    try:
+        return datetime.date.fromisoformat(value).isoformat()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not an ISO date (YYYY-MM-DD): {value!r}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render PDFs for many documents at once.")
+    parser.add_argument("--type", dest="kind", required=True, choices=sorted(DOCUMENT_KINDS),
+                        help="Kind of document to render.")
+    parser.add_argument("--status", help='Only documents in this status, e.g. "Invoice Draft".')
+    parser.add_argument("--since", type=_iso_date, help="Only documents created on or after this date.")
+    parser.add_argument("--out", required=True, help="Directory the PDFs are written to.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes; 0 renders in this process.")
+    parser.add_argument("--db", help="Database file (defaults to the application database).")
+    args = parser.parse_args(argv)
+
+    summary = render_batch(args.kind, args.out, db_path=args.db, status=args.status,
+                           since=args.since, workers=args.workers)
+    print(summary.format())
+    return 1 if summary.failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
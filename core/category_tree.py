@@ -0,0 +1,161 @@
+"""Maintenance of the product category closure table and cached paths.
+
+Every category has one row per ancestor (including itself at depth 0) in
+``product_category_closure`` and its display path cached in
+``product_categories.full_path``.  The helpers below work on a plain cursor so
+that both :class:`core.database.DatabaseHandler` and the standalone functions
+in :mod:`core.logic.product_management` keep the two structures in step
+inside their own transactions.
+"""
+
+import sqlite3
+
+CATEGORY_PATH_SEPARATOR = "\\"
+
+# Guard against runaway recursion should legacy data contain a parent cycle.
+_MAX_DEPTH = 64
+
+
+def rebuild_category_closure(cursor: sqlite3.Cursor) -> None:
+    """Rebuild the closure table and every ``full_path`` from ``parent_id``."""
+    cursor.execute("DELETE FROM product_category_closure")
+    cursor.execute(
+        """
+        WITH RECURSIVE tree(ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM product_categories
+            UNION ALL
+            SELECT t.ancestor_id, c.id, t.depth + 1
+            FROM tree t
+            JOIN product_categories c ON c.parent_id = t.descendant_id
+            WHERE t.depth < ?
+        )
+        INSERT OR IGNORE INTO product_category_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+        """,
+        (_MAX_DEPTH,),
+    )
+    cursor.execute(
+        """
+        WITH RECURSIVE paths(id, path, depth) AS (
+            SELECT id, name, 0 FROM product_categories
+            WHERE parent_id IS NULL
+               OR parent_id NOT IN (SELECT id FROM product_categories)
+            UNION ALL
+            SELECT c.id, p.path || ? || c.name, p.depth + 1
+            FROM paths p
+            JOIN product_categories c ON c.parent_id = p.id
+            WHERE p.depth < ?
+        )
+        UPDATE product_categories
+        SET full_path = (SELECT path FROM paths WHERE paths.id = product_categories.id)
+        """,
+        (CATEGORY_PATH_SEPARATOR, _MAX_DEPTH),
+    )
+
+
+def child_path(cursor: sqlite3.Cursor, parent_id: int | None, name: str) -> str:
+    """Return the full path a category called ``name`` gets under ``parent_id``."""
+    if parent_id is None:
+        return name
+    cursor.execute("SELECT full_path FROM product_categories WHERE id = ?", (parent_id,))
+    row = cursor.fetchone()
+    if not row or row[0] is None:
+        return name
+    return f"{row[0]}{CATEGORY_PATH_SEPARATOR}{name}"
+
+
+def insert_category(cursor: sqlite3.Cursor, name: str, parent_id: int | None, description: str | None = None) -> int:
+    """Insert a leaf category together with its closure rows and path."""
+    cursor.execute(
+        "INSERT INTO product_categories (name, parent_id, description, full_path) VALUES (?, ?, ?, ?)",
+        (name, parent_id, description, child_path(cursor, parent_id, name)),
+    )
+    category_id = cursor.lastrowid
+    cursor.execute(
+        """
+        INSERT INTO product_category_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, ?, depth + 1 FROM product_category_closure WHERE descendant_id = ?
+        UNION ALL
+        SELECT ?, ?, 0
+        """,
+        (category_id, parent_id, category_id, category_id),
+    )
+    return category_id
+
+
+def is_descendant(cursor: sqlite3.Cursor, ancestor_id: int, category_id: int) -> bool:
+    """Return True if ``category_id`` lies strictly below ``ancestor_id``."""
+    cursor.execute(
+        "SELECT 1 FROM product_category_closure WHERE ancestor_id = ? AND descendant_id = ? AND depth > 0",
+        (ancestor_id, category_id),
+    )
+    return cursor.fetchone() is not None
+
+
+def refresh_subtree_paths(cursor: sqlite3.Cursor, category_id: int) -> None:
+    """Recompute the cached path of a category and all of its descendants.
+
+    Must run after ``name``/``parent_id`` changed but before ``full_path`` is
+    touched, as the old path prefix is swapped for the new one.
+    """
+    cursor.execute("SELECT name, parent_id, full_path FROM product_categories WHERE id = ?", (category_id,))
+    row = cursor.fetchone()
+    if not row:
+        return
+    name, parent_id, old_path = row[0], row[1], row[2]
+    cursor.execute(
+        """
+        UPDATE product_categories
+        SET full_path = ? || substr(full_path, ?)
+        WHERE id IN (SELECT descendant_id FROM product_category_closure WHERE ancestor_id = ?)
+        """,
+        (child_path(cursor, parent_id, name), len(old_path or "") + 1, category_id),
+    )
+
+
+def move_subtree(cursor: sqlite3.Cursor, category_id: int, new_parent_id: int | None) -> None:
+    """Re-parent a category, rewriting closure rows and paths of its subtree."""
+    cursor.execute("UPDATE product_categories SET parent_id = ? WHERE id = ?", (new_parent_id, category_id))
+    cursor.execute(
+        """
+        DELETE FROM product_category_closure
+        WHERE descendant_id IN (
+            SELECT descendant_id FROM product_category_closure WHERE ancestor_id = ?
+        )
+        AND ancestor_id IN (
+            SELECT ancestor_id FROM product_category_closure
+            WHERE descendant_id = ? AND ancestor_id != ?
+        )
+        """,
+        (category_id, category_id, category_id),
+    )
+    if new_parent_id is not None:
+        cursor.execute(
+            """
+            INSERT INTO product_category_closure (ancestor_id, descendant_id, depth)
+            SELECT sup.ancestor_id, sub.descendant_id, sup.depth + sub.depth + 1
+            FROM product_category_closure sup
+            CROSS JOIN product_category_closure sub
+            WHERE sup.descendant_id = ? AND sub.ancestor_id = ?
+            """,
+            (new_parent_id, category_id),
+        )
+    refresh_subtree_paths(cursor, category_id)
+
+
+def delete_category(cursor: sqlite3.Cursor, category_id: int) -> int:
+    """Delete a category, promoting its children to top level.
+
+    Products in the category are unassigned. Returns the number of category
+    rows deleted.
+    """
+    cursor.execute("SELECT id FROM product_categories WHERE parent_id = ?", (category_id,))
+    for (child_id,) in cursor.fetchall():
+        move_subtree(cursor, child_id, None)
+    cursor.execute("UPDATE products SET category_id = NULL WHERE category_id = ?", (category_id,))
+    cursor.execute(
+        "DELETE FROM product_category_closure WHERE ancestor_id = ? OR descendant_id = ?",
+        (category_id, category_id),
+    )
+    cursor.execute("DELETE FROM product_categories WHERE id = ?", (category_id,))
+    return cursor.rowcount
@@ -1,13 +1,26 @@
 import sqlite3
 import os
+import pathlib
 import datetime  # Import datetime
 import logging
 from typing import Optional
 from .database_setup import DB_NAME, initialize_database  # Import from database_setup
+from . import category_tree
+from .schema.search import rebuild_search_index
 from shared.structs import InventoryTransactionType
 
 logger = logging.getLogger(__name__)
 
+# Stay well below SQLITE_MAX_VARIABLE_NUMBER when expanding ``IN (...)`` lists.
+_IN_CHUNK_SIZE = 500
+
+
+def _chunked(ids, size: int = _IN_CHUNK_SIZE):
+    """Yield de-duplicated ids in lists small enough for one ``IN (...)`` clause."""
+    unique_ids = list(dict.fromkeys(i for i in ids if i is not None))
+    for start in range(0, len(unique_ids), size):
+        yield unique_ids[start:start + size]
+
 # --- Custom Adapters and Converters for datetime ---
 def adapt_datetime_iso(val):
     """Adapt datetime.datetime to ISO 8601 string."""
@@ -53,7 +66,12 @@ def convert_date_iso(val_bytes):
 
 
 class DatabaseHandler:
-    def __init__(self, db_name=None): # db_name is now optional, primarily for testing
+    def __init__(self, db_name=None, read_only=False): # db_name is now optional, primarily for testing
+        """Open the application database.
+
+        ``read_only`` opens an existing database file for queries only and
+        skips schema setup; worker threads use it for their own connections.
+        """
         if db_name is None:
             # Determine the path to the database file relative to this script's location
             # core/database.py
@@ -68,6 +86,8 @@ class DatabaseHandler:
             db_path = os.path.join(base_dir, DB_NAME)
         else:
             db_path = db_name
+        self.db_path = db_path
+        self.read_only = read_only
 
         # Ensure the directory for the database exists, if db_path includes directories
         db_dir = os.path.dirname(db_path)
@@ -83,7 +103,14 @@ class DatabaseHandler:
         sqlite3.register_converter("datetime", convert_timestamp_iso)
         sqlite3.register_converter("date", convert_date_iso)
 
-        self.conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        if read_only:
+            self.conn = sqlite3.connect(
+                f"{pathlib.Path(db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            )
+        else:
+            self.conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
         self.conn.row_factory = sqlite3.Row # Access columns by name, good practice
 
         # Enable foreign key support. Must be done for each connection if not compiled in.
@@ -98,9 +125,13 @@ class DatabaseHandler:
 
         self.cursor = self.conn.cursor()
 
+        # {"path": "fast" | "full", "seconds": ...} from initialize_database.
+        self.init_timing = None
+        if read_only:
+            return
         # Initialize tables using the centralized setup script
         # Pass the connection to avoid re-opening or issues with in-memory DBs during tests
-        initialize_database(db_conn=self.conn)
+        self.init_timing = initialize_database(db_conn=self.conn)
 
     def close(self):
         """Close the database connection."""
@@ -109,6 +140,65 @@ class DatabaseHandler:
     # The create_tables method is now removed from here, as table creation
     # is handled by initialize_database() from database_setup.py
 
+
+    def _keyset_page(self, base_query, conditions, params, sort_column, id_column,
+                     descending, after, limit, sort_field, id_field):
+        """Fetch one page of ``base_query`` ordered by ``(sort_column, id_column)``.
+
+        ``after`` is the cursor returned with the previous page. One extra row
+        is read to tell whether another page follows. Returns
+        ``(rows, next_cursor)``; ``next_cursor`` is None on the last page.
+        Nullable sort columns must be given as ``COALESCE(column, '')``, which
+        is the value a NULL field is stored as in the cursor.
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1.")
+        conditions = list(conditions)
+        params = list(params)
+        if after is not None:
+            conditions.append(f"({sort_column}, {id_column}) {'<' if descending else '>'} (?, ?)")
+            params.extend(after)
+        query = base_query
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        direction = "DESC" if descending else "ASC"
+        query += f" ORDER BY {sort_column} {direction}, {id_column} {direction} LIMIT ?"
+        params.append(limit + 1)
+
+        self.cursor.execute(query, params)
+        rows = [dict(row) for row in self.cursor.fetchall()]
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        sort_value = rows[-1][sort_field]
+        return rows, ("" if sort_value is None else sort_value, rows[-1][id_field])
+
+    @staticmethod
+    def _page_sort(sort_key, sort_columns):
+        """Resolve ``sort_key`` (prefix ``-`` for descending) against a whitelist.
+
+        ``sort_columns`` maps sort keys to (SQL column, result field).
+        """
+        descending = sort_key.startswith("-")
+        key = sort_key.lstrip("-")
+        if key not in sort_columns:
+            raise ValueError(f"Unsupported sort key: {sort_key}")
+        sort_column, sort_field = sort_columns[key]
+        return sort_column, sort_field, descending
+
+    @staticmethod
+    def _page_filters(filters, filter_columns):
+        """Translate equality ``filters`` into WHERE conditions via a whitelist."""
+        conditions, params = [], []
+        for key, value in (filters or {}).items():
+            if key not in filter_columns:
+                raise ValueError(f"Unsupported filter: {key}")
+            if value is None:
+                continue
+            conditions.append(f"{filter_columns[key]} = ?")
+            params.append(value)
+        return conditions, params
+
 #address related methods
     def add_address(self, street, city, state, zip, country):
         """Add a new address and return its ID."""
@@ -211,6 +301,29 @@ class DatabaseHandler:
         columns = [desc[0] for desc in self.cursor.description]
         return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
 
+
+    CONTACT_PAGE_SORTS = {
+        "name": ("c.name", "name"),
+        "phone": ("COALESCE(c.phone, '')", "phone"),
+        "email": ("COALESCE(c.email, '')", "email"),
+        "role": ("COALESCE(c.role, '')", "role"),
+        "account_name": ("COALESCE(a.name, '')", "account_name"),
+        "id": ("c.id", "id"),
+    }
+
+    def get_contacts_page(self, filters=None, sort_key="name", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_all_contacts`.
+
+        ``filters`` may hold ``account_id``. Returns ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.CONTACT_PAGE_SORTS)
+        conditions, params = self._page_filters(filters, {"account_id": "c.account_id"})
+        return self._keyset_page("""
+            SELECT c.id, c.name, c.phone, c.email, c.role, c.account_id, a.name AS account_name
+            FROM contacts c
+            LEFT JOIN accounts a ON c.account_id = a.id
+        """, conditions, params, sort_column, "c.id", descending, after, limit, sort_field, "id")
+
     def delete_contact(self, contact_id):
         """Delete a specific contact."""
         logger.debug("DB.delete_contact: received contact_id type %s value %s", type(contact_id), contact_id)
@@ -229,6 +342,90 @@ class DatabaseHandler:
         """, (account_id, address_id, address_type, is_primary))
         self.conn.commit()
 
+    def save_account_addresses(self, account_id, addresses) -> list[int]:
+        """Synchronise an account's addresses with ``addresses`` in one transaction.
+
+        ``addresses`` is a list of dicts with ``address_id`` (None for new
+        addresses), ``street``, ``city``, ``state``, ``zip``, ``country`` and
+        ``types``, a dict of address_type -> is_primary. Only rows that differ
+        from what is stored are written. Addresses no longer referenced by any
+        account or the company are deleted. Returns the address ids in order.
+        """
+        self.cursor.execute("""
+            SELECT a.address_id, a.street, a.city, a.state, a.zip, a.country, aa.address_type, aa.is_primary
+            FROM addresses a
+            JOIN account_addresses aa ON a.address_id = aa.address_id
+            WHERE aa.account_id = ?
+        """, (account_id,))
+        stored_values = {}
+        stored_links = {}
+        for row in self.cursor.fetchall():
+            stored_values[row['address_id']] = (row['street'], row['city'], row['state'], row['zip'], row['country'])
+            stored_links[(row['address_id'], row['address_type'])] = bool(row['is_primary'])
+
+        address_ids = []
+        wanted_links = {}
+        try:
+            for address in addresses:
+                values = (address['street'], address['city'], address['state'], address['zip'], address['country'])
+                address_id = address.get('address_id')
+                if not address_id:
+                    self.cursor.execute("""
+                        INSERT INTO addresses (street, city, state, zip, country)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, values)
+                    address_id = self.cursor.lastrowid
+                elif stored_values.get(address_id) != values:
+                    self.cursor.execute("""
+                        UPDATE addresses
+                        SET street = ?, city = ?, state = ?, zip = ?, country = ?
+                        WHERE address_id = ?
+                    """, values + (address_id,))
+                address_ids.append(address_id)
+                for address_type, is_primary in address['types'].items():
+                    wanted_links[(address_id, address_type)] = bool(is_primary)
+
+            removed_links = [key for key in stored_links if key not in wanted_links]
+            if removed_links:
+                self.cursor.executemany(
+                    "DELETE FROM account_addresses WHERE account_id = ? AND address_id = ? AND address_type = ?",
+                    [(account_id, address_id, address_type) for address_id, address_type in removed_links],
+                )
+            changed_links = [
+                (account_id, address_id, address_type, is_primary)
+                for (address_id, address_type), is_primary in wanted_links.items()
+                if stored_links.get((address_id, address_type)) != is_primary
+            ]
+            if changed_links:
+                self.cursor.executemany("""
+                    INSERT INTO account_addresses (account_id, address_id, address_type, is_primary)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (account_id, address_id, address_type) DO UPDATE SET is_primary = excluded.is_primary
+                """, changed_links)
+
+            self._delete_orphaned_addresses({address_id for address_id, _ in removed_links})
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+        return address_ids
+
+    def _delete_orphaned_addresses(self, candidate_ids):
+        """Deletes the given addresses if no account or company still references them."""
+        for chunk in _chunked(candidate_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                DELETE FROM addresses
+                WHERE address_id IN ({placeholders})
+                  AND NOT EXISTS (SELECT 1 FROM account_addresses aa WHERE aa.address_id = addresses.address_id)
+                  AND NOT EXISTS (SELECT 1 FROM company_addresses ca WHERE ca.address_id = addresses.address_id)
+                  AND NOT EXISTS (
+                      SELECT 1 FROM company_information ci
+                      WHERE ci.billing_address_id = addresses.address_id
+                         OR ci.shipping_address_id = addresses.address_id
+                  )
+            """, chunk)
+
     def get_account_addresses(self, account_id):
         """Retrieve all addresses for an account."""
         self.cursor.execute("""
@@ -257,6 +454,32 @@ class DatabaseHandler:
         results = self.cursor.fetchall()
         return results
 
+
+    ACCOUNT_PAGE_SORTS = {
+        "name": ("a.name", "name"),
+        "phone": ("COALESCE(a.phone, '')", "phone"),
+        "description": ("COALESCE(a.description, '')", "description"),
+        "account_type": ("a.account_type", "account_type"),
+        "pricing_rule": ("COALESCE(pr.rule_name, '')", "pricing_rule_name"),
+        "payment_term": ("COALESCE(pt.term_name, '')", "payment_term_name"),
+        "id": ("a.id", "id"),
+    }
+
+    def get_accounts_page(self, filters=None, sort_key="name", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_all_accounts`.
+
+        ``filters`` may hold ``account_type``. Returns ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.ACCOUNT_PAGE_SORTS)
+        conditions, params = self._page_filters(filters, {"account_type": "a.account_type"})
+        return self._keyset_page("""
+            SELECT a.id, a.name, a.phone, a.description, a.account_type, a.pricing_rule_id,
+                   a.payment_term_id, pr.rule_name AS pricing_rule_name, pt.term_name AS payment_term_name
+            FROM accounts a
+            LEFT JOIN pricing_rules pr ON pr.rule_id = a.pricing_rule_id
+            LEFT JOIN payment_terms pt ON pt.term_id = a.payment_term_id
+        """, conditions, params, sort_column, "a.id", descending, after, limit, sort_field, "id")
+
     def get_accounts(self):
         """Retrieve all accounts."""
         self.cursor.execute("SELECT id, name FROM accounts") # Potentially for dropdowns
@@ -284,6 +507,52 @@ class DatabaseHandler:
             return account_data
         return None
 
+    def get_account_summaries(self, account_ids) -> dict[int, dict]:
+        """Retrieve id, name, type, pricing rule and payment term for many accounts, keyed by id."""
+        summaries = {}
+        for chunk in _chunked(account_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                SELECT id, name, account_type, pricing_rule_id, payment_term_id
+                FROM accounts
+                WHERE id IN ({placeholders})
+            """, chunk)
+            for row in self.cursor.fetchall():
+                summaries[row["id"]] = dict(row)
+        return summaries
+
+    def get_addresses_for_accounts(self, account_ids) -> dict[int, list]:
+        """Retrieve the addresses of many accounts, keyed by account id."""
+        addresses = {account_id: [] for account_id in account_ids}
+        for chunk in _chunked(account_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                SELECT aa.account_id, a.address_id, a.street, a.city, a.state, a.zip, a.country, aa.address_type, aa.is_primary
+                FROM addresses a
+                JOIN account_addresses aa ON a.address_id = aa.address_id
+                WHERE aa.account_id IN ({placeholders})
+            """, chunk)
+            for row in self.cursor.fetchall():
+                addresses[row["account_id"]].append(row)
+        return addresses
+
+    def get_accounts_details(self, account_ids) -> dict[int, dict]:
+        """Retrieve full details of many accounts, prefetching their addresses in one query."""
+        accounts = {}
+        for chunk in _chunked(account_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                SELECT a.id, a.name, a.phone, a.website, a.description, a.account_type, a.pricing_rule_id, a.payment_term_id
+                FROM accounts AS a
+                WHERE a.id IN ({placeholders})
+            """, chunk)
+            for row in self.cursor.fetchall():
+                accounts[row["id"]] = dict(row)
+        addresses = self.get_addresses_for_accounts(list(accounts))
+        for account_id, account_data in accounts.items():
+            account_data['addresses'] = addresses.get(account_id, [])
+        return accounts
+
     def update_account(self, account_id, name, phone, website, description, account_type, pricing_rule_id=None, payment_term_id=None):
         """Update an existing account."""
         self.cursor.execute("""
@@ -338,6 +607,46 @@ class DatabaseHandler:
         columns = [desc[0] for desc in self.cursor.description]
         return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
 
+    def get_interaction_page(self, company_id=None, contact_id=None, before=None, limit=50,
+                             types=None, date_from=None, date_to=None):
+        """Retrieve one page of an account's or contact's interactions, newest first.
+
+        ``before`` is the (date_time, interaction_id) of the last row of the
+        previous page; ``date_from``/``date_to`` are inclusive ISO bounds.
+        """
+        if not company_id and not contact_id:
+            raise ValueError("Either company_id or contact_id must be provided for an interaction page.")
+        query = """
+            SELECT interaction_id, company_id, contact_id, interaction_type, date_time, subject, description, created_by_user_id, attachment_path
+            FROM interactions
+        """
+        if company_id:
+            query += " WHERE company_id = ?"
+            params = [company_id]
+        else:
+            query += " WHERE contact_id = ?"
+            params = [contact_id]
+        if company_id and contact_id:
+            query += " AND contact_id = ?"
+            params.append(contact_id)
+        if before is not None:
+            query += " AND (date_time, interaction_id) < (?, ?)"
+            params.extend(before)
+        if types:
+            query += f" AND interaction_type IN ({', '.join('?' * len(types))})"
+            params.extend(types)
+        if date_from:
+            query += " AND date_time >= ?"
+            params.append(date_from)
+        if date_to:
+            query += " AND date_time <= ?"
+            params.append(date_to)
+        query += " ORDER BY date_time DESC, interaction_id DESC LIMIT ?"
+        params.append(limit)
+
+        self.cursor.execute(query, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
     def update_interaction(self, interaction_id, company_id, contact_id, interaction_type, date_time, subject, description, created_by_user_id, attachment_path):
         """Update an existing interaction."""
         if not company_id and not contact_id:
@@ -436,6 +745,86 @@ class DatabaseHandler:
         columns = [desc[0] for desc in self.cursor.description]
         return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
 
+    # Sortable columns of get_task_list_rows mapped to their SQL expressions.
+    TASK_LIST_SORT_COLUMNS = {
+        "title": "t.title COLLATE NOCASE",
+        "due_date": "t.due_date",
+        "status": "t.status",
+        "priority": "CASE t.priority WHEN 'Low' THEN 1 WHEN 'Medium' THEN 2 WHEN 'High' THEN 3 ELSE 0 END",
+        "company": "a.name COLLATE NOCASE",
+        "contact": "c.name COLLATE NOCASE",
+        "assigned_user": "u.username COLLATE NOCASE",
+    }
+
+
+    TASK_PAGE_SORTS = {
+        "due_date": ("due_date", "due_date"),
+        "created_at": ("created_at", "created_at"),
+        "task_id": ("task_id", "task_id"),
+    }
+
+    def get_tasks_page(self, filters=None, sort_key="due_date", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_tasks`.
+
+        ``filters`` may hold ``company_id``, ``contact_id``, ``status``,
+        ``assigned_user_id``, ``priority`` and ``include_deleted``. Returns
+        ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.TASK_PAGE_SORTS)
+        filters = dict(filters or {})
+        include_deleted = filters.pop("include_deleted", False)
+        conditions, params = self._page_filters(filters, {
+            "company_id": "company_id", "contact_id": "contact_id", "status": "status",
+            "assigned_user_id": "assigned_to_user_id", "priority": "priority",
+        })
+        if not include_deleted:
+            conditions.append("is_deleted = 0")
+        return self._keyset_page("""
+            SELECT task_id, company_id, contact_id, title, description, due_date,
+                   status, priority, assigned_to_user_id, created_by_user_id,
+                   created_at, updated_at
+            FROM tasks
+        """, conditions, params, sort_column, "task_id", descending, after, limit, sort_field, "task_id")
+
+    def get_task_list_rows(self, filters: dict | None = None, sort_column: str = "due_date",
+                           descending: bool = False, limit: int | None = None,
+                           offset: int = 0) -> list[dict]:
+        """Retrieve task display rows joined with company, contact and user names.
+
+        Supported filters: company_id, contact_id, status, assigned_user_id,
+        priority and include_deleted.
+        """
+        filters = filters or {}
+        query = """
+            SELECT t.task_id, t.title, substr(t.due_date, 1, 10) AS due_date, t.status, t.priority,
+                   a.name AS company, c.name AS contact, u.username AS assigned_user
+            FROM tasks t
+            LEFT JOIN accounts a ON a.id = t.company_id
+            LEFT JOIN contacts c ON c.id = t.contact_id
+            LEFT JOIN users u ON u.user_id = t.assigned_to_user_id
+            WHERE 1=1
+        """
+        params = []
+        if not filters.get("include_deleted"):
+            query += " AND t.is_deleted = 0"
+        for key, column in (("company_id", "t.company_id"), ("contact_id", "t.contact_id"),
+                            ("status", "t.status"), ("assigned_user_id", "t.assigned_to_user_id"),
+                            ("priority", "t.priority")):
+            if filters.get(key) is not None:
+                query += f" AND {column} = ?"
+                params.append(filters[key])
+
+        if sort_column not in self.TASK_LIST_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort tasks by '{sort_column}'.")
+        direction = "DESC" if descending else "ASC"
+        query += f" ORDER BY {self.TASK_LIST_SORT_COLUMNS[sort_column]} {direction}, t.task_id {direction}"
+        if limit is not None:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+
+        self.cursor.execute(query, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
     def update_task(self, task_id: int, task_data: dict) -> None:
         """Update an existing task."""
         if not task_data:
@@ -480,23 +869,19 @@ class DatabaseHandler:
         )
         self.conn.commit()
 
-    def get_overdue_tasks(self, current_date_iso: str) -> list[dict]:
-        """
-        Retrieve tasks that are overdue (due_date < current_date)
-        and not in 'Completed' or 'Overdue' status, excluding soft-deleted tasks.
-        """
-        query = """
-            SELECT task_id, company_id, contact_id, title, description, due_date,
-                   status, priority, assigned_to_user_id, created_by_user_id,
-                   created_at, updated_at
-            FROM tasks
+    def mark_overdue_tasks(self, current_date_iso: str, updated_at_iso: str) -> int:
+        """Set status 'Overdue' on every open task due before current_date_iso; returns rows changed."""
+        self.cursor.execute(
+            """
+            UPDATE tasks SET status = 'Overdue', updated_at = ?
             WHERE due_date < ?
-              AND status NOT IN ('Completed', 'Overdue')
               AND is_deleted = 0
-        """
-        self.cursor.execute(query, (current_date_iso,))
-        columns = [desc[0] for desc in self.cursor.description]
-        return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
+              AND status NOT IN ('Completed', 'Overdue')
+            """,
+            (updated_at_iso, current_date_iso),
+        )
+        self.conn.commit()
+        return self.cursor.rowcount
 
 # Product related methods
 
@@ -642,6 +1027,11 @@ class DatabaseHandler:
 
         return product_dict
 
+    def get_product_suggest_rows(self) -> list[tuple]:
+        """Return (id, sku, name) for every active product, for the type-ahead index."""
+        self.cursor.execute("SELECT id, sku, name FROM products WHERE is_active = TRUE")
+        return [tuple(row) for row in self.cursor.fetchall()]
+
     def get_all_products(self) -> list[dict]:
         """Retrieve all products with their current cost and sale price."""
         self.cursor.execute("""
@@ -676,6 +1066,67 @@ class DatabaseHandler:
             prod['sale_price'] = sale_row['price'] if sale_row else None
         return products
 
+
+    PRODUCT_PAGE_SORTS = {
+        "name": ("p.name", "name"),
+        "sku": ("p.sku", "sku"),
+        "description": ("COALESCE(p.description, '')", "description"),
+        "cost": ("COALESCE(cost, '')", "cost"),
+        "is_active": ("COALESCE(p.is_active, '')", "is_active"),
+        "category": ("COALESCE(cat.full_path, '')", "category_path"),
+        "unit_of_measure": ("COALESCE(uom.name, '')", "unit_of_measure_name"),
+        "quantity_on_hand": ("p.quantity_on_hand", "quantity_on_hand"),
+        "reorder_point": ("p.reorder_point", "reorder_point"),
+        "reorder_quantity": ("p.reorder_quantity", "reorder_quantity"),
+        "safety_stock": ("p.safety_stock", "safety_stock"),
+        "id": ("p.id", "product_id"),
+    }
+
+    def get_products_by_ids(self, product_ids) -> dict[int, dict]:
+        """Name and description of many products, keyed by product ID.
+
+        Document generators only print these two fields, so this skips the
+        joins and price lookups of :meth:`get_product_details`.
+        """
+        products = {}
+        for chunk in _chunked(product_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                SELECT id AS product_id, name, description
+                FROM products
+                WHERE id IN ({placeholders})
+            """, chunk)
+            for row in self.cursor.fetchall():
+                products[row["product_id"]] = dict(row)
+        return products
+
+    def get_products_page(self, filters=None, sort_key="name", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_all_products`.
+
+        ``filters`` may hold ``is_active`` and ``category_id``. Current prices
+        are looked up for the page's rows only. Returns ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.PRODUCT_PAGE_SORTS)
+        filters = dict(filters or {})
+        if filters.get("is_active") is not None:
+            filters["is_active"] = 1 if filters["is_active"] else 0
+        conditions, params = self._page_filters(filters, {"is_active": "p.is_active", "category_id": "p.category_id"})
+        return self._keyset_page("""
+            SELECT p.id as product_id, p.sku, p.name, p.description, p.category_id,
+                   p.unit_of_measure_id, uom.name as unit_of_measure_name,
+                   p.quantity_on_hand, p.reorder_point, p.reorder_quantity, p.safety_stock,
+                   p.is_active, cat.name as category_name, cat.full_path as category_path,
+                   (SELECT price FROM product_prices
+                    WHERE product_id = p.id AND price_type = 'COST'
+                    ORDER BY valid_from DESC LIMIT 1) AS cost,
+                   (SELECT price FROM product_prices
+                    WHERE product_id = p.id AND price_type = 'SALE'
+                    ORDER BY valid_from DESC LIMIT 1) AS sale_price
+            FROM products p
+            LEFT JOIN product_categories cat ON p.category_id = cat.id
+            LEFT JOIN product_units_of_measure uom ON p.unit_of_measure_id = uom.id
+        """, conditions, params, sort_column, "p.id", descending, after, limit, sort_field, "product_id")
+
     def update_product(self, product_db_id: int, sku: str, name: str, description: str, cost: float, sale_price: float,
                        is_active: bool, category_name: str = None, unit_of_measure_name: str = None,
                        quantity_on_hand: float = 0, reorder_point: float = 0,
@@ -786,6 +1237,43 @@ class DatabaseHandler:
         self.cursor.execute(query, params)
         return [dict(row) for row in self.cursor.fetchall()]
 
+
+    DOCUMENT_PAGE_SORTS = {
+        "created_date": ("created_date", "created_date"),
+        "document_number": ("document_number", "document_number"),
+        "id": ("id", "id"),
+    }
+
+    def get_sales_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_all_sales_documents`.
+
+        ``filters`` may hold ``customer_id``, ``document_type``, ``status`` and
+        ``is_active`` (True unless given). Returns ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.DOCUMENT_PAGE_SORTS)
+        filters = {"is_active": True, **(filters or {})}
+        if filters["is_active"] is not None:
+            filters["is_active"] = 1 if filters["is_active"] else 0
+        conditions, params = self._page_filters(filters, {
+            "customer_id": "customer_id", "document_type": "document_type",
+            "status": "status", "is_active": "is_active",
+        })
+        return self._keyset_page(
+            "SELECT * FROM sales_documents", conditions, params,
+            sort_column, "id", descending, after, limit, sort_field, "id",
+        )
+
+    def get_sales_document_numbers(self, document_type=None, status=None, since=None) -> list[tuple[int, str]]:
+        """``(id, document_number)`` of active sales documents, oldest first.
+
+        ``since`` is an ISO date compared against ``created_date``.
+        """
+        conditions, params = self._page_filters(
+            {"document_type": document_type, "status": status},
+            {"document_type": "document_type", "status": "status"},
+        )
+        return self._document_numbers("sales_documents", conditions, params, since)
+
     def update_sales_document(self, doc_id: int, updates: dict):
         """Updates a sales document. 'updates' is a dict of column:value."""
         if not updates:
@@ -799,6 +1287,20 @@ class DatabaseHandler:
         self.cursor.execute(f"UPDATE sales_documents SET {set_clause} WHERE id = ?", values)
         self.conn.commit()
 
+    def expire_quotes(self, as_of_iso: str) -> int:
+        """Marks draft and sent quotes whose expiry_date is before as_of_iso as expired; returns rows changed."""
+        self.cursor.execute(
+            """
+            UPDATE sales_documents SET status = 'Quote Expired'
+            WHERE expiry_date < ?
+              AND document_type = 'Quote'
+              AND status IN ('Quote Draft', 'Quote Sent')
+            """,
+            (as_of_iso,),
+        )
+        self.conn.commit()
+        return self.cursor.rowcount
+
     def delete_sales_document(self, doc_id: int):
         """Soft deletes a sales document by marking it inactive."""
         self.cursor.execute(
@@ -860,12 +1362,9 @@ class DatabaseHandler:
         if not name:
             return None # Or raise ValueError
         try:
-            self.cursor.execute(
-                "INSERT INTO product_categories (name, parent_id) VALUES (?, ?)",
-                (name, parent_id)
-            )
+            category_id = category_tree.insert_category(self.cursor, name, parent_id)
             self.conn.commit()
-            return self.cursor.lastrowid
+            return category_id
         except sqlite3.IntegrityError: # Handles UNIQUE constraint on name
             self.conn.rollback()
             return self.get_product_category_id_by_name(name) # Return existing ID
@@ -876,25 +1375,71 @@ class DatabaseHandler:
             raise ValueError("New category name cannot be empty.")
         try:
             self.cursor.execute("UPDATE product_categories SET name = ? WHERE id = ?", (new_name, category_db_id)) # Use id
+            category_tree.refresh_subtree_paths(self.cursor, category_db_id)
             self.conn.commit()
         except sqlite3.IntegrityError:
             self.conn.rollback()
             raise ValueError(f"Category name '{new_name}' already exists.")
 
     def update_product_category_parent(self, category_db_id: int, new_parent_id: int | None): # Renamed
-        """Updates a category's parent_id."""
+        """Updates a category's parent_id, moving its whole subtree."""
         if category_db_id == new_parent_id:
             raise ValueError("A category cannot be its own parent.")
-        # Cycle detection should be in logic layer if more complex than self-parenting
-        self.cursor.execute("UPDATE product_categories SET parent_id = ? WHERE id = ?", (new_parent_id, category_db_id)) # Use id
-        self.conn.commit()
+        if new_parent_id is not None and self.is_category_descendant(category_db_id, new_parent_id):
+            raise ValueError("Cannot set parent to a descendant category (creates a cycle).")
+        try:
+            category_tree.move_subtree(self.cursor, category_db_id, new_parent_id)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
 
     def delete_product_category(self, category_db_id: int): # Renamed
         """Deletes a category. Products using it will have category_id set to NULL.
            Child categories will have parent_id set to NULL."""
-        # FK constraints (ON DELETE SET NULL) handle relationships.
-        self.cursor.execute("DELETE FROM product_categories WHERE id = ?", (category_db_id,)) # Use id
-        self.conn.commit()
+        try:
+            category_tree.delete_category(self.cursor, category_db_id)
+            self.conn.commit()
+        except sqlite3.Error:
+            self.conn.rollback()
+            raise
+
+    def is_category_descendant(self, ancestor_id: int, category_db_id: int) -> bool:
+        """Returns True if ``category_db_id`` lies strictly below ``ancestor_id``."""
+        return category_tree.is_descendant(self.cursor, ancestor_id, category_db_id)
+
+    def get_category_descendant_ids(self, category_db_id: int) -> set[int]:
+        """Retrieves the IDs of all categories strictly below a category."""
+        self.cursor.execute(
+            "SELECT descendant_id FROM product_category_closure WHERE ancestor_id = ? AND depth > 0",
+            (category_db_id,),
+        )
+        return {row[0] for row in self.cursor.fetchall()}
+
+    def get_product_category_path(self, category_db_id: int) -> str | None:
+        """Retrieves the cached full path of a category."""
+        if category_db_id is None:
+            return None
+        self.cursor.execute("SELECT full_path FROM product_categories WHERE id = ?", (category_db_id,))
+        row = self.cursor.fetchone()
+        return row[0] if row else None
+
+    def get_all_product_category_paths(self) -> list[tuple[int, str]]:
+        """Retrieves (id, full_path) for every category, ordered by path."""
+        self.cursor.execute("SELECT id, full_path FROM product_categories ORDER BY full_path")
+        return [(row[0], row[1]) for row in self.cursor.fetchall()]
+
+    def get_products_in_category_recursive(self, category_db_id: int, active_only: bool = True) -> list[dict]:
+        """Retrieves products in a category or any of its descendants."""
+        sql = """
+            SELECT p.* FROM products p
+            JOIN product_category_closure cc ON cc.descendant_id = p.category_id
+            WHERE cc.ancestor_id = ?
+        """
+        if active_only:
+            sql += " AND p.is_active = TRUE"
+        self.cursor.execute(sql, (category_db_id,))
+        return [dict(row) for row in self.cursor.fetchall()]
 
     def get_product_category_id_by_name(self, name: str) -> int | None:
         """Retrieves the ID of a category by its name."""
@@ -1144,6 +1689,43 @@ class DatabaseHandler:
         columns = [desc[0] for desc in self.cursor.description]
         return [dict(zip(columns, row)) for row in self.cursor.fetchall()]
 
+
+    def get_purchase_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
+        """Keyset-paginated counterpart of :meth:`get_all_purchase_documents`.
+
+        ``filters`` may hold ``vendor_id``, ``status`` and ``is_active`` (True
+        unless given). Sort keys match :meth:`get_sales_documents_page`.
+        Returns ``(rows, next_cursor)``.
+        """
+        sort_column, sort_field, descending = self._page_sort(sort_key, self.DOCUMENT_PAGE_SORTS)
+        filters = {"is_active": True, **(filters or {})}
+        if filters["is_active"] is not None:
+            filters["is_active"] = 1 if filters["is_active"] else 0
+        conditions, params = self._page_filters(filters, {
+            "vendor_id": "vendor_id", "status": "status", "is_active": "is_active",
+        })
+        return self._keyset_page(
+            "SELECT * FROM purchase_documents", conditions, params,
+            sort_column, "id", descending, after, limit, sort_field, "id",
+        )
+
+    def get_purchase_document_numbers(self, status=None, since=None) -> list[tuple[int, str]]:
+        """Purchase counterpart of :meth:`get_sales_document_numbers`."""
+        conditions, params = self._page_filters({"status": status}, {"status": "status"})
+        return self._document_numbers("purchase_documents", conditions, params, since)
+
+    def _document_numbers(self, table, conditions, params, since):
+        conditions = ["is_active = 1", *conditions]
+        if since:
+            conditions.append("created_date >= ?")
+            params.append(since)
+        self.cursor.execute(
+            f"SELECT id, document_number FROM {table} WHERE {' AND '.join(conditions)} "
+            "ORDER BY created_date, id",
+            params,
+        )
+        return [(row["id"], row["document_number"]) for row in self.cursor.fetchall()]
+
     def update_purchase_document_status(self, doc_id: int, new_status: str):
         """Updates the status of a purchase document."""
         self.cursor.execute("UPDATE purchase_documents SET status = ? WHERE id = ?", (new_status, doc_id))
@@ -1357,6 +1939,107 @@ class DatabaseHandler:
         row = self.cursor.fetchone()
         return row[0] if row else 0.0
 
+    def get_on_order_quantities(self, product_ids) -> dict[int, float]:
+        """Quantity on order for many products, keyed by product ID (0 if none)."""
+        quantities = {product_id: 0 for product_id in product_ids}
+        for chunk in _chunked(product_ids):
+            placeholders = ", ".join("?" * len(chunk))
+            self.cursor.execute(f"""
+                SELECT product_id, SUM(quantity_change) AS qty
+                FROM inventory_transactions
+                WHERE transaction_type = ? AND product_id IN ({placeholders})
+                GROUP BY product_id
+            """, (InventoryTransactionType.PURCHASE_ORDER.value, *chunk))
+            for row in self.cursor.fetchall():
+                quantities[row["product_id"]] = row["qty"]
+        return quantities
+
+    def get_open_sales_order_lines(self, document_type: str, status: str) -> list[dict]:
+        """Return every line of the active sales orders in ``status`` in one query.
+
+        Each row carries its document number plus the product's on-hand and
+        on-order quantities (0 for lines without a product). Rows are ordered
+        newest document first, then by line id.
+        """
+        self.cursor.execute(
+            """
+            SELECT d.id AS document_id, d.document_number,
+                   i.id AS item_id, i.product_id, i.product_description,
+                   i.quantity, COALESCE(i.shipped_quantity, 0) AS shipped_quantity,
+                   COALESCE(p.quantity_on_hand, 0) AS on_hand,
+                   COALESCE(oo.qty, 0) AS on_order
+            FROM sales_documents d
+            JOIN sales_document_items i ON i.sales_document_id = d.id
+            LEFT JOIN products p ON p.id = i.product_id
+            LEFT JOIN (
+                SELECT product_id, SUM(quantity_change) AS qty
+                FROM inventory_transactions
+                WHERE transaction_type = ?
+                GROUP BY product_id
+            ) oo ON oo.product_id = i.product_id
+            WHERE d.document_type = ? AND d.status = ? AND d.is_active = 1
+            ORDER BY d.created_date DESC, d.id DESC, i.id
+            """,
+            (InventoryTransactionType.PURCHASE_ORDER.value, document_type, status),
+        )
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_purchase_document_lines(self, status: str) -> list[dict]:
+        """Return the active purchase documents in ``status`` with their lines.
+
+        Received quantities are summed from ``purchase_receipts``. Documents
+        without lines appear once with NULL item columns.
+        """
+        self.cursor.execute(
+            """
+            SELECT d.id AS document_id, d.document_number,
+                   i.id AS item_id, i.product_id, i.product_description, i.quantity,
+                   (SELECT COALESCE(SUM(r.quantity), 0) FROM purchase_receipts r
+                    WHERE r.purchase_document_item_id = i.id) AS received_quantity
+            FROM purchase_documents d
+            LEFT JOIN purchase_document_items i ON i.purchase_document_id = d.id
+            WHERE d.status = ? AND d.is_active = 1
+            ORDER BY d.created_date DESC, d.id DESC, i.id
+            """,
+            (status,),
+        )
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_reorder_candidates(self) -> list[dict]:
+        """Return products whose on-hand plus on-order stock is below their reorder point."""
+        self.cursor.execute(
+            """
+            SELECT p.id AS product_id, p.name,
+                   COALESCE(p.quantity_on_hand, 0) AS on_hand,
+                   COALESCE(oo.qty, 0) AS on_order,
+                   COALESCE(p.reorder_point, 0) AS reorder_point,
+                   COALESCE(p.reorder_quantity, 0) AS reorder_quantity
+            FROM products p
+            LEFT JOIN (
+                SELECT product_id, SUM(quantity_change) AS qty
+                FROM inventory_transactions
+                WHERE transaction_type = ?
+                GROUP BY product_id
+            ) oo ON oo.product_id = p.id
+            WHERE COALESCE(p.quantity_on_hand, 0) + COALESCE(oo.qty, 0) < COALESCE(p.reorder_point, 0)
+            ORDER BY p.name
+            """,
+            (InventoryTransactionType.PURCHASE_ORDER.value,),
+        )
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_table_versions(self, tables) -> dict:
+        """Return the change counter of each tracked table in ``tables``."""
+        tables = list(tables)
+        if not tables:
+            return {}
+        placeholders = ", ".join("?" for _ in tables)
+        self.cursor.execute(
+            f"SELECT table_name, version FROM table_changes WHERE table_name IN ({placeholders})",
+            tables,
+        )
+        return {name: version for name, version in self.cursor.fetchall()}
+
     def get_all_on_order_quantities(self) -> list[dict]:
         """Return on-order quantities grouped by product."""
         self.cursor.execute(
@@ -1392,6 +2075,115 @@ class DatabaseHandler:
         self.cursor.execute("DELETE FROM replenishment_queue WHERE id = ?", (item_id,))
         self.conn.commit()
 
+    def add_render_jobs(self, jobs: list[dict], now: str) -> list[int]:
+        """Queue render jobs in one transaction and return their IDs.
+
+        Each job is a dict with ``kind``, ``document_id``, ``output_path``,
+        ``max_attempts`` and an optional ``label``.
+        """
+        ids = []
+        for job in jobs:
+            self.cursor.execute(
+                """
+                INSERT INTO render_jobs (kind, document_id, label, output_path, max_attempts,
+                                         next_attempt_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (job["kind"], job["document_id"], job.get("label"), job["output_path"],
+                 job["max_attempts"], now, now, now),
+            )
+            ids.append(self.cursor.lastrowid)
+        self.conn.commit()
+        return ids
+
+    def claim_render_job(self, now: str) -> dict | None:
+        """Mark the oldest due queued job as running and return it.
+
+        The claim only succeeds while the row is still queued, so several
+        workers on their own connections never pick the same job.
+        """
+        while True:
+            self.cursor.execute(
+                """
+                SELECT id FROM render_jobs
+                WHERE status = 'Queued' AND next_attempt_at <= ?
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+                """,
+                (now,),
+            )
+            row = self.cursor.fetchone()
+            if row is None:
+                return None
+            self.cursor.execute(
+                """
+                UPDATE render_jobs
+                SET status = 'Running', attempts = attempts + 1, updated_at = ?
+                WHERE id = ? AND status = 'Queued'
+                """,
+                (now, row["id"]),
+            )
+            claimed = self.cursor.rowcount == 1
+            self.conn.commit()
+            if claimed:
+                return self.get_render_job(row["id"])
+
+    def get_render_job(self, job_id: int) -> dict | None:
+        self.cursor.execute("SELECT * FROM render_jobs WHERE id = ?", (job_id,))
+        row = self.cursor.fetchone()
+        return dict(row) if row else None
+
+    def get_render_jobs(self, limit: int = 500) -> list[dict]:
+        """Most recently queued render jobs first."""
+        self.cursor.execute("SELECT * FROM render_jobs ORDER BY id DESC LIMIT ?", (limit,))
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def get_render_job_counts(self) -> dict:
+        """Number of render jobs per status."""
+        self.cursor.execute("SELECT status, COUNT(*) FROM render_jobs GROUP BY status")
+        return {status: count for status, count in self.cursor.fetchall()}
+
+    def update_render_job(self, job_id: int, status: str, now: str,
+                          last_error: str | None = None, next_attempt_at: str | None = None) -> None:
+        """Record the outcome of a render attempt."""
+        self.cursor.execute(
+            """
+            UPDATE render_jobs
+            SET status = ?, last_error = ?, next_attempt_at = COALESCE(?, next_attempt_at), updated_at = ?
+            WHERE id = ?
+            """,
+            (status, last_error, next_attempt_at, now, job_id),
+        )
+        self.conn.commit()
+
+    def requeue_render_jobs(self, statuses: list[str], now: str, job_ids: list[int] | None = None,
+                            reset_attempts: bool = False) -> int:
+        """Put jobs in ``statuses`` (optionally only ``job_ids``) back in the queue."""
+        conditions = [f"status IN ({', '.join('?' for _ in statuses)})"]
+        params = [now, now, *statuses]
+        if job_ids is not None:
+            if not job_ids:
+                return 0
+            conditions.append(f"id IN ({', '.join('?' for _ in job_ids)})")
+            params.extend(job_ids)
+        attempts = "0" if reset_attempts else "attempts"
+        self.cursor.execute(
+            f"""
+            UPDATE render_jobs
+            SET status = 'Queued', attempts = {attempts}, next_attempt_at = ?, updated_at = ?
+            WHERE {' AND '.join(conditions)}
+            """,
+            params,
+        )
+        self.conn.commit()
+        return self.cursor.rowcount
+
+    def delete_render_jobs(self, status: str) -> int:
+        """Delete every render job in ``status``; returns how many went."""
+        self.cursor.execute("DELETE FROM render_jobs WHERE status = ?", (status,))
+        self.conn.commit()
+        return self.cursor.rowcount
+
     def get_default_vendor_for_product(self, product_id: int) -> int | None:
         """Return the default vendor ID for a product, if one exists."""
         self.cursor.execute(
@@ -1526,3 +2318,30 @@ class DatabaseHandler:
         """, (name, phone))
         self.conn.commit()
         return self.cursor.lastrowid
+
+# Full-text search methods
+    def search_index(self, match, kinds=None, limit=20):
+        """Run an FTS5 ``match`` expression against the global search index.
+
+        Results are ranked by BM25 with title hits weighted above body hits.
+        """
+        query = """
+            SELECT kind, source_id, title,
+                   snippet(search_index, 1, '[', ']', '...', 8) AS snippet,
+                   bm25(search_index, 10.0, 1.0) AS rank
+            FROM search_index
+            WHERE search_index MATCH ?
+        """
+        params = [match]
+        if kinds:
+            query += f" AND kind IN ({', '.join('?' * len(kinds))})"
+            params.extend(kinds)
+        query += " ORDER BY rank LIMIT ?"
+        params.append(limit)
+        self.cursor.execute(query, params)
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def rebuild_search_index(self):
+        """Repopulate the search index from the source tables."""
+        rebuild_search_index(self.cursor)
+        self.conn.commit()
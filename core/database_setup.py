@@ -1,14 +1,22 @@
+import functools
+import hashlib
+import logging
 import sqlite3
+import sys
+import time
 
 from .schema import (
     accounts,
+    changes,
     common,
     company,
     interactions,
     products,
     inventory,
     purchase,
+    render_jobs,
     sales,
+    search,
     tasks,
     users,
     versioning,
@@ -16,6 +24,25 @@ from .schema import (
 
 DB_NAME = "product_management.db"
 
+logger = logging.getLogger(__name__)
+
+# Schema modules in creation order; each provides ``create_schema(cursor)``.
+SCHEMA_MODULES = (
+    common,
+    products,
+    accounts,
+    users,
+    interactions,
+    tasks,
+    sales,
+    purchase,
+    inventory,
+    company,
+    search,
+    render_jobs,
+    changes,
+)
+
 def get_db_connection():
     """Establish a connection to the SQLite database."""
     conn = sqlite3.connect(DB_NAME)
@@ -28,18 +55,7 @@ def create_tables(db_conn=None):
     conn = db_conn if conn_was_provided else get_db_connection()
     try:
         cursor = conn.cursor()
-        for module in (
-            common,
-            products,
-            accounts,
-            users,
-            interactions,
-            tasks,
-            sales,
-            purchase,
-            inventory,
-            company,
-        ):
+        for module in SCHEMA_MODULES:
             module.create_schema(cursor)
         # Ensure account_documents table exists for storing documents linked to accounts
         cursor.execute(
@@ -69,13 +85,41 @@ def create_tables(db_conn=None):
         if not conn_was_provided and conn:
             conn.close()
 
+@functools.lru_cache(maxsize=None)
+def ddl_hash() -> str:
+    """Hash of the code that creates and migrates the schema.
+
+    Covers every schema module, the migrations and this file, so editing any
+    DDL changes the hash and makes existing databases take the full path once.
+    """
+    digest = hashlib.sha256()
+    for module in (*SCHEMA_MODULES, versioning, sys.modules[__name__]):
+        with open(module.__file__, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
 def initialize_database(db_conn=None):
-    """Initialise the database and seed essential data."""
+    """Initialise the database and seed essential data.
+
+    When the stored fingerprint (``schema_version`` plus :func:`ddl_hash`)
+    is current this is a single query. Returns ``{"path": "fast" | "full",
+    "seconds": elapsed}``.
+    """
+    started = time.perf_counter()
+    conn_was_provided = db_conn is not None
+    conn = db_conn if conn_was_provided else get_db_connection()
+    try:
+        if versioning.fingerprint_matches(conn.cursor(), ddl_hash()):
+            return _timing("fast", started)
+    finally:
+        if not conn_was_provided:
+            conn.close()
+
     db_label = DB_NAME if db_conn is None else "provided connection"
     print(f"Initializing database '{db_label}'...")
     create_tables(db_conn=db_conn)
 
-    conn_was_provided = db_conn is not None
     conn = db_conn if conn_was_provided else get_db_connection()
     try:
         cursor = conn.cursor()
@@ -84,12 +128,21 @@ def initialize_database(db_conn=None):
         versioning.apply_migrations(cursor, versioning.SCHEMA_VERSION)
 
         cursor.execute("INSERT OR IGNORE INTO users (username) VALUES ('system_user')")
+        versioning.store_fingerprint(cursor, ddl_hash())
         conn.commit()
     except sqlite3.Error as e:
         print(f"Error seeding initial data: {e}")
     finally:
         if not conn_was_provided and conn:
             conn.close()
+    return _timing("full", started)
+
+
+def _timing(path: str, started: float) -> dict:
+    seconds = time.perf_counter() - started
+    logger.debug("Database initialisation took the %s path in %.1f ms", path, seconds * 1000)
+    return {"path": path, "seconds": seconds}
+
 
 if __name__ == "__main__":
     initialize_database()
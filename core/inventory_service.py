@@ -3,12 +3,28 @@ from __future__ import annotations
 from typing import Optional
 
 from core.repositories import InventoryRepository, ProductRepository
-from shared.structs import InventoryTransactionType
+from shared.structs import (
+    InventoryTransactionType,
+    PurchaseDocumentStatus,
+    SalesDocumentStatus,
+    SalesDocumentType,
+)
 
 
 class InventoryService:
     """Service layer for inventory adjustments and replenishment checks."""
 
+    # Tables feeding the inventory work lists; see ``get_change_token``.
+    WORK_QUEUE_TABLES = (
+        "products",
+        "sales_documents",
+        "sales_document_items",
+        "purchase_documents",
+        "purchase_document_items",
+        "purchase_receipts",
+        "inventory_transactions",
+    )
+
     def __init__(self, inventory_repo: InventoryRepository, product_repo: ProductRepository):
         self.inventory_repo = inventory_repo
         self.product_repo = product_repo
@@ -57,10 +73,23 @@ class InventoryService:
         )
         return self.inventory_repo.get_on_order_level(product_id)
 
+    def get_change_token(self) -> tuple:
+        """Return a value that changes whenever the inventory work lists may have.
+
+        It is built from the per-table change counters, so comparing tokens
+        is a single cheap query instead of rebuilding the lists.
+        """
+        versions = self.inventory_repo.get_table_versions(self.WORK_QUEUE_TABLES)
+        return tuple(versions.get(table, 0) for table in self.WORK_QUEUE_TABLES)
+
     def get_on_order_level(self, product_id: int) -> float:
         """Return the quantity currently on order for a product."""
         return self.inventory_repo.get_on_order_level(product_id)
 
+    def get_on_order_levels(self, product_ids) -> dict[int, float]:
+        """Return the quantity on order for each of ``product_ids`` in one query."""
+        return self.inventory_repo.get_on_order_levels(product_ids)
+
     def get_products_on_order(self) -> list[dict]:
         """Return products with aggregated on-order quantities and on-hand stock."""
         entries = self.inventory_repo.get_all_on_order_levels()
@@ -106,3 +135,89 @@ class InventoryService:
                     }
                 )
         return low_stock
+
+    def get_work_queue(self) -> dict:
+        """Return the inventory work lists in three queries.
+
+        The result maps ``to_order``, ``reorder``, ``to_receive`` and
+        ``ready_to_ship`` to lists. Document sections hold dicts with
+        ``document_id``, ``document_number`` and ``items``:
+
+        * ``to_order``: open sales order lines that on-hand plus on-order
+          stock cannot cover, with ``on_hand``, ``on_order`` and ``to_order``.
+        * ``reorder``: products below their reorder point that no
+          ``to_order`` line already covers, shaped like
+          :meth:`get_products_below_reorder`.
+        * ``to_receive``: every issued PO with its lines still awaiting
+          ``remaining`` units; POs with nothing left are listed empty.
+        * ``ready_to_ship``: open sales order lines with ``remaining`` units
+          to ship, with the product's ``on_hand``.
+        """
+        order_lines = self.inventory_repo.get_open_sales_order_lines(
+            SalesDocumentType.SALES_ORDER.value, SalesDocumentStatus.SO_OPEN.value
+        )
+        to_order: list[dict] = []
+        ready_to_ship: list[dict] = []
+        ordered_products: set[int] = set()
+        for line in order_lines:
+            remaining = line["quantity"] - line["shipped_quantity"]
+            shortfall = remaining - (line["on_hand"] + line["on_order"])
+            if shortfall > 0:
+                self._document_entry(to_order, line)["items"].append(
+                    {**line, "remaining": remaining, "to_order": shortfall}
+                )
+                if line["product_id"]:
+                    ordered_products.add(line["product_id"])
+            if remaining > 0:
+                self._document_entry(ready_to_ship, line)["items"].append(
+                    {**line, "remaining": remaining}
+                )
+
+        reorder = [
+            {
+                "product_id": product["product_id"],
+                "name": product["name"],
+                "on_hand": product["on_hand"],
+                "on_order": product["on_order"],
+                "to_order": max(
+                    product["reorder_quantity"],
+                    product["reorder_point"] - (product["on_hand"] + product["on_order"]),
+                ),
+            }
+            for product in self.inventory_repo.get_reorder_candidates()
+            if product["product_id"] not in ordered_products
+        ]
+
+        to_receive: list[dict] = []
+        for line in self.inventory_repo.get_purchase_document_lines(
+            PurchaseDocumentStatus.PO_ISSUED.value
+        ):
+            entry = self._document_entry(to_receive, line)
+            if line["item_id"] is None:
+                continue
+            remaining = line["quantity"] - line["received_quantity"]
+            if remaining > 0:
+                entry["items"].append({**line, "remaining": remaining})
+
+        return {
+            "to_order": to_order,
+            "reorder": reorder,
+            "to_receive": to_receive,
+            "ready_to_ship": ready_to_ship,
+        }
+
+    @staticmethod
+    def _document_entry(section: list[dict], line: dict) -> dict:
+        """Return the entry for ``line``'s document, appending it if new.
+
+        Lines arrive grouped by document, so only the last entry is checked.
+        """
+        if not section or section[-1]["document_id"] != line["document_id"]:
+            section.append(
+                {
+                    "document_id": line["document_id"],
+                    "document_number": line["document_number"],
+                    "items": [],
+                }
+            )
+        return section[-1]
@@ -1,12 +1,16 @@
 import sqlite3
 from datetime import datetime
 from core.database_setup import DB_NAME as MAIN_APP_DB_NAME
+from core import category_tree
+from core.product_index import ProductSuggestIndex
+from core.search_service import build_match_query
 
 DB_NAME = MAIN_APP_DB_NAME
 
 class ProductLogic:
     def __init__(self, db_handler):
         self.db = db_handler
+        self._suggest_index = None  # Built on first suggest() call
 
     def save_product(self, product_struct) -> int | None:
         # Ensure SKU is generated if not present, especially for new products.
@@ -33,6 +37,7 @@ class ProductLogic:
             )
             if new_product_id:
                 product_struct.product_id = new_product_id # Update struct with new ID
+                self._update_suggest_index(new_product_id, sku_to_use, product_struct.name, product_struct.is_active)
             return new_product_id
         else: # Updating existing product
             self.db.update_product(
@@ -51,6 +56,7 @@ class ProductLogic:
                 safety_stock=getattr(product_struct, 'safety_stock', 0),
                 # currency and price_valid_from will use defaults in db.update_product
             )
+            self._update_suggest_index(product_struct.product_id, sku_to_use, product_struct.name, product_struct.is_active)
             return product_struct.product_id
 
     def get_product_details(self, product_id: int):
@@ -59,10 +65,8 @@ class ProductLogic:
             from shared.structs import Product
             category_path = ""
             if product_data_dict.get('category_id'):
-                 cat_name = self.db.get_product_category_name_by_id(product_data_dict['category_id'])
-                 # Full path construction would require _get_all_categories_map and _get_category_path_string
-                 # For now, using leaf name or ID if name not found.
-                 category_path = cat_name if cat_name else str(product_data_dict['category_id'])
+                 cat_path = self.db.get_product_category_path(product_data_dict['category_id'])
+                 category_path = cat_path if cat_path else str(product_data_dict['category_id'])
 
             return Product(
                 product_id=product_data_dict.get("product_id"),
@@ -82,55 +86,64 @@ class ProductLogic:
 
     def get_all_products(self):
         products_data_list = self.db.get_all_products()
-        products_list = []
+        category_paths = dict(self.db.get_all_product_category_paths())
+        return [self._product_from_row(p_dict, category_paths) for p_dict in products_data_list]
+
+    def get_products_page(self, filters: dict | None = None, sort_key: str = "name",
+                          after: tuple | None = None, limit: int = 100):
+        """Return one keyset-paginated page of products and the cursor for the next page."""
+        rows, next_cursor = self.db.get_products_page(filters, sort_key, after, limit)
+        category_paths = {row['category_id']: row['category_path'] for row in rows if row.get('category_id')}
+        return [self._product_from_row(p_dict, category_paths) for p_dict in rows], next_cursor
+
+    @staticmethod
+    def _product_from_row(p_dict: dict, category_paths: dict):
         from shared.structs import Product
-        all_categories_map = self._get_all_categories_map_internal() # Cache for efficiency
-        for p_dict in products_data_list:
-            category_path = ""
-            if p_dict.get('category_id'):
-                 category_path = self._get_category_path_string_internal(p_dict['category_id'], all_categories_map)
-
-            products_list.append(Product(
-                product_id=p_dict.get("product_id"),
-                name=p_dict.get("name"),
-                description=p_dict.get("description"),
-                cost=p_dict.get("cost"), # From product_prices
-                sale_price=p_dict.get("sale_price"), # From product_prices
-                is_active=p_dict.get("is_active", True),
-                category=category_path,
-                unit_of_measure=p_dict.get("unit_of_measure_name"),
-                quantity_on_hand=p_dict.get("quantity_on_hand", 0),
-                reorder_point=p_dict.get("reorder_point", 0),
-                reorder_quantity=p_dict.get("reorder_quantity", 0),
-                safety_stock=p_dict.get("safety_stock", 0),
-            ))
-        return products_list
+        category_path = ""
+        if p_dict.get('category_id'):
+             category_path = category_paths.get(p_dict['category_id']) or ""
+
+        return Product(
+            product_id=p_dict.get("product_id"),
+            name=p_dict.get("name"),
+            description=p_dict.get("description"),
+            cost=p_dict.get("cost"), # From product_prices
+            sale_price=p_dict.get("sale_price"), # From product_prices
+            is_active=p_dict.get("is_active", True),
+            category=category_path,
+            unit_of_measure=p_dict.get("unit_of_measure_name"),
+            quantity_on_hand=p_dict.get("quantity_on_hand", 0),
+            reorder_point=p_dict.get("reorder_point", 0),
+            reorder_quantity=p_dict.get("reorder_quantity", 0),
+            safety_stock=p_dict.get("safety_stock", 0),
+        )
 
     def delete_product(self, product_id: int):
-        return self.db.delete_product(product_id)
-
-    def _get_all_categories_map_internal(self) -> dict[int, tuple[str, int | None]]:
-        categories_data = self.db.get_all_product_categories_from_table()
-        return {cat_id: (name, parent_id) for cat_id, name, parent_id in categories_data}
-
-    def _get_category_path_string_internal(self, category_id: int, all_categories_map: dict[int, tuple[str, int | None]]) -> str:
-        if category_id is None or category_id not in all_categories_map:
-            return ""
-        name, parent_id = all_categories_map[category_id]
-        if parent_id is None or parent_id not in all_categories_map:
-            return name
+        result = self.db.delete_product(product_id)
+        if self._suggest_index is not None:
+            self._suggest_index.remove(product_id)
+        return result
+
+    def suggest(self, query: str, limit: int = 10):
+        """Return ranked :class:`ProductMatch` suggestions for a partial SKU or name.
+
+        The index is built from one catalogue query on first use and kept
+        current by ``save_product``/``delete_product``.
+        """
+        if self._suggest_index is None:
+            self._suggest_index = ProductSuggestIndex(self.db.get_product_suggest_rows())
+        return self._suggest_index.suggest(query, limit)
+
+    def _update_suggest_index(self, product_id, sku, name, is_active):
+        if self._suggest_index is None:
+            return
+        if is_active:
+            self._suggest_index.add(product_id, sku, name)
         else:
-            parent_path = self._get_category_path_string_internal(parent_id, all_categories_map)
-            return f"{parent_path}\\\\{name}"
+            self._suggest_index.remove(product_id)
 
     def get_flat_category_paths(self) -> list[tuple[int, str]]:
-        all_categories_map = self._get_all_categories_map_internal()
-        leaf_paths = []
-        for cat_id, (name, parent_id) in all_categories_map.items():
-            path = self._get_category_path_string_internal(cat_id, all_categories_map)
-            leaf_paths.append((cat_id, path))
-        leaf_paths.sort(key=lambda x: x[1])
-        return leaf_paths
+        return self.db.get_all_product_category_paths()
 
     def get_all_product_units_of_measure(self) -> list[str]:
         units_tuples = self.db.get_all_product_units_of_measure_from_table()
@@ -148,12 +161,8 @@ class ProductLogic:
     def update_product_category_parent(self, category_id: int, new_parent_id: int | None):
         if category_id == new_parent_id:
             raise ValueError("A category cannot be its own parent.")
-        current_ancestor_id = new_parent_id
-        all_cats_map = self._get_all_categories_map_internal()
-        while current_ancestor_id is not None:
-            if current_ancestor_id == category_id:
-                raise ValueError("Cannot set parent to a descendant category (creates a cycle).")
-            _name, current_ancestor_id = all_cats_map.get(current_ancestor_id, (None, None))
+        if new_parent_id is not None and self.db.is_category_descendant(category_id, new_parent_id):
+            raise ValueError("Cannot set parent to a descendant category (creates a cycle).")
         return self.db.update_product_category_parent(category_id, new_parent_id)
 
     def delete_product_category(self, category_id: int):
@@ -417,7 +426,16 @@ def list_products(filters: dict = None, db_conn=None) -> list[dict]:
         _filters.pop('is_active', None)
 
         for key, value in _filters.items():
-            if key in ["name", "sku", "description"]:
+            if key == "query":
+                # Word-prefix search through the FTS index rather than a
+                # full scan with LIKE '%x%'.
+                match = build_match_query(value or "")
+                if match:
+                    conditions.append(
+                        "id IN (SELECT source_id FROM search_index WHERE search_index MATCH ? AND kind = 'product')"
+                    )
+                    params.append(match)
+            elif key in ["name", "sku", "description"]:
                 conditions.append(f"{key} LIKE ?")
                 params.append(f"%{value}%")
             elif key == "category_id" and value is None:
@@ -458,10 +476,9 @@ def create_category(data: dict, db_conn=None) -> int | None:
             if not parent_cat:
                 print(f"Error: Parent category with ID {parent_id} does not exist.")
                 return None
-        cursor.execute("INSERT INTO product_categories (name, parent_id, description) VALUES (?, ?, ?)",
-                       (name, parent_id, description))
+        category_id = category_tree.insert_category(cursor, name, parent_id, description)
         if not conn_provided: conn.commit()
-        return cursor.lastrowid
+        return category_id
     except sqlite3.Error as e:
         print(f"Database error creating category: {e}")
         if conn_provided: conn.rollback()
@@ -497,6 +514,7 @@ def update_category(category_id: int, data: dict, db_conn=None) -> bool:
             return False
         fields_to_update = []
         values_to_update = []
+        move_to_parent = False
         if 'name' in data and data['name']:
             fields_to_update.append("name = ?")
             values_to_update.append(data['name'])
@@ -513,18 +531,21 @@ def update_category(category_id: int, data: dict, db_conn=None) -> bool:
                 if new_parent_id == category_id:
                     print("Error: A category cannot be its own parent.")
                     return False
-                descendants = get_category_descendants_ids(category_id, db_conn=conn)
-                if new_parent_id in descendants:
+                if category_tree.is_descendant(cursor, category_id, new_parent_id):
                     print(f"Error: Cannot set parent to a descendant category (ID: {new_parent_id}).")
                     return False
-            fields_to_update.append("parent_id = ?")
-            values_to_update.append(new_parent_id)
-        if not fields_to_update: return True
-        values_to_update.append(category_id)
-        sql = f"UPDATE product_categories SET {', '.join(fields_to_update)} WHERE id = ?"
-        cursor.execute(sql, tuple(values_to_update))
+            move_to_parent = True
+        if not fields_to_update and not move_to_parent: return True
+        if fields_to_update:
+            values_to_update.append(category_id)
+            sql = f"UPDATE product_categories SET {', '.join(fields_to_update)} WHERE id = ?"
+            cursor.execute(sql, tuple(values_to_update))
+        if move_to_parent:
+            category_tree.move_subtree(cursor, category_id, new_parent_id)
+        else:
+            category_tree.refresh_subtree_paths(cursor, category_id)
         if not conn_provided: conn.commit()
-        return cursor.rowcount > 0
+        return True
     except sqlite3.Error as e:
         print(f"Error updating category {category_id}: {e}")
         if conn_provided: conn.rollback()
@@ -542,14 +563,9 @@ def delete_category(category_id: int, db_conn=None) -> bool:
         if children:
             print(f"Error: Category {category_id} has child categories.")
             return False
-        products_in_cat = list_products(filters={'category_id': category_id, 'is_active': None}, db_conn=conn)
-        if products_in_cat:
-            print(f"Category {category_id} has products. Unassigning them.")
-            for prod in products_in_cat:
-                update_product(prod['id'], {'category_id': None}, db_conn=conn)
-        cursor.execute("DELETE FROM product_categories WHERE id = ?", (category_id,))
+        deleted = category_tree.delete_category(cursor, category_id)
         if not conn_provided: conn.commit()
-        return cursor.rowcount > 0
+        return deleted > 0
     except sqlite3.Error as e:
         print(f"Error deleting category {category_id}: {e}")
         if conn_provided: conn.rollback()
@@ -578,44 +594,29 @@ def list_categories(parent_id: int | None = None, db_conn=None) -> list[dict]:
 def get_category_descendants_ids(category_id: int, db_conn=None) -> set[int]:
     conn_provided = db_conn is not None
     conn = db_conn if conn_provided else get_db_connection()
-    all_categories_for_tree = []
     try:
         cursor = conn.cursor()
-        cursor.execute("SELECT id, parent_id FROM product_categories")
-        all_categories_for_tree = cursor.fetchall()
+        cursor.execute(
+            "SELECT descendant_id FROM product_category_closure WHERE ancestor_id = ? AND depth > 0",
+            (category_id,))
+        return {row[0] for row in cursor.fetchall()}
     except sqlite3.Error as e:
-        print(f"Database error fetching all categories for descendants check: {e}")
+        print(f"Database error fetching descendants of category {category_id}: {e}")
         return set()
     finally:
-        if not conn_provided and conn and conn != db_conn:
-             conn.close()
-    adj = {}
-    for cat_id_db, p_id_db in all_categories_for_tree:
-        if p_id_db not in adj: adj[p_id_db] = []
-        adj[p_id_db].append(cat_id_db)
-    q = [category_id]
-    visited_descendants = set()
-    head = 0
-    while head < len(q):
-        current_cat_id = q[head]; head += 1
-        if current_cat_id in adj:
-            for child_id in adj[current_cat_id]:
-                if child_id not in visited_descendants:
-                    visited_descendants.add(child_id)
-                    q.append(child_id)
-    return visited_descendants
+        if not conn_provided and conn:
+            conn.close()
 
 def list_products_in_category_recursive(category_id: int, db_conn=None) -> list[dict]:
     conn_provided = db_conn is not None
     conn = db_conn if conn_provided else get_db_connection()
     try:
         cursor = conn.cursor()
-        descendant_ids = get_category_descendants_ids(category_id, db_conn=conn)
-        category_ids_to_query = {category_id}.union(descendant_ids)
-        if not category_ids_to_query: return []
-        placeholders = ', '.join(['?'] * len(category_ids_to_query))
-        sql = f"SELECT * FROM products WHERE category_id IN ({placeholders}) AND is_active = TRUE"
-        cursor.execute(sql, tuple(list(category_ids_to_query)))
+        cursor.execute("""
+            SELECT p.* FROM products p
+            JOIN product_category_closure cc ON cc.descendant_id = p.category_id
+            WHERE cc.ancestor_id = ? AND p.is_active = TRUE
+        """, (category_id,))
         return [dict(row) for row in cursor.fetchall()]
     except sqlite3.Error as e:
         print(f"Database error in list_products_in_category_recursive: {e}")
@@ -1,5 +1,6 @@
 import os
 import sys
+from typing import BinaryIO
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.dirname(SCRIPT_DIR)
@@ -7,15 +8,20 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from core.database import DatabaseHandler
-from core.sales_logic import SalesLogic
-from core.address_book_logic import AddressBookLogic
-from shared.structs import SalesDocumentItem, Account, Address
-from shared.utils import sanitize_filename, address_has_type, address_is_primary_for
-from core.pdf_generator import PDF, get_company_pdf_context
-from core.repositories import AddressRepository, AccountRepository
-from core.address_service import AddressService
-from core.company_repository import CompanyRepository
-from core.company_service import CompanyService
+from shared.structs import SalesDocumentItem, Account
+from shared.utils import sanitize_filename
+from core.pdf_generator import (
+    LAYOUTS,
+    DocumentContent,
+    LineRow,
+    PartyBlock,
+    address_lines,
+    build_pdf,
+    date_line,
+    preferred_address,
+    write_pdf,
+)
+from core.render_session import DocumentRenderSession
 
 
 def generate_packing_slip_pdf(
@@ -23,8 +29,9 @@ def generate_packing_slip_pdf(
     shipments: dict[int, float],
     shipment_number: str,
     previous_shipments: dict[int, float] | None = None,
-    output_path: str | None = None,
+    output_path: str | BinaryIO | None = None,
     db_handler: DatabaseHandler | None = None,
+    session: DocumentRenderSession | None = None,
 ):
     """Generate a packing slip PDF for the specified shipment.
 
@@ -36,21 +43,21 @@ def generate_packing_slip_pdf(
         before this shipment. When provided, outstanding quantities are
         calculated relative to the selected shipment rather than the current
         cumulative shipped totals.
-    output_path: Optional explicit path for the resulting PDF file.
+    output_path: Optional explicit path for the resulting PDF file, or a
+        binary file-like object to write it to.
+    db_handler: Optional connection to render on; ignored when ``session``
+        is given.
+    session: Optional :class:`DocumentRenderSession` shared across
+        documents.
+
+    Returns:
+        The PDF as a ``memoryview``, or None if it could not be rendered.
     """
-    close_db = False
+    own_session = session is None
     try:
-        if db_handler is None:
-            db_handler = DatabaseHandler()
-            close_db = True
-        sales_logic = SalesLogic(db_handler)
-        address_book_logic = AddressBookLogic(db_handler)
-
-        address_repo = AddressRepository(db_handler)
-        account_repo = AccountRepository(db_handler)
-        address_service = AddressService(address_repo, account_repo)
-        company_repo = CompanyRepository(db_handler)
-        company_service = CompanyService(company_repo, address_service)
+        if own_session:
+            session = DocumentRenderSession(db_handler)
+        sales_logic = session.sales_logic
 
         doc = sales_logic.get_sales_document_details(sales_document_id)
         if not doc:
@@ -63,39 +70,34 @@ def generate_packing_slip_pdf(
             company_shipping_address_pdf_lines,
             _company_remittance_address_pdf_lines,
             _company_billing_address_pdf_lines,
-        ) = get_company_pdf_context(company_service)
-
-        customer: Account | None = None
-        customer_shipping_address: Address | None = None
-        if doc.customer_id:
-            customer = address_book_logic.get_account_details(doc.customer_id)
-            if customer:
-                for addr in customer.addresses:
-                    if address_is_primary_for(addr, "Shipping"):
-                        customer_shipping_address = addr
-                        break
-                if (
-                    not customer_shipping_address
-                    and any(address_has_type(addr, "Shipping") for addr in customer.addresses)
-                ):
-                    customer_shipping_address = next(
-                        addr for addr in customer.addresses if address_has_type(addr, "Shipping")
-                    )
-
-        shipped_items: list[tuple[str, float]] = []
+        ) = session.company_context()
+
+        customer: Account | None = session.get_account(doc.customer_id)
+        ship_to_lines = []
+        if customer:
+            shipping_address = preferred_address(customer.addresses, "Shipping")
+            ship_to_lines.append(customer.name or "N/A")
+            if shipping_address:
+                ship_to_lines += address_lines(shipping_address)
+
+        all_items = sales_logic.get_items_for_sales_document(sales_document_id)
+        items_by_id = {item.id: item for item in all_items}
+        session.prefetch_products(item.product_id for item in all_items)
+
+        def describe(item: SalesDocumentItem) -> list[tuple[str, str]]:
+            product = session.get_product(item.product_id)
+            if product and product.get("name"):
+                return [("", product["name"])]
+            return [("", item.product_description or "")]
+
+        shipped_rows: list[LineRow] = []
         for item_id, qty in shipments.items():
-            item: SalesDocumentItem = sales_logic.get_sales_document_item_details(item_id)
+            item = items_by_id.get(item_id) or sales_logic.get_sales_document_item_details(item_id)
             if not item:
                 continue
-            description = item.product_description
-            if item.product_id:
-                prod = sales_logic.product_repo.get_product_details(item.product_id)
-                if prod and prod.get("name"):
-                    description = prod["name"]
-            shipped_items.append((description, qty))
-
-        outstanding_items: list[tuple[str, float]] = []
-        all_items = sales_logic.get_items_for_sales_document(sales_document_id)
+            shipped_rows.append(LineRow(describe(item), [f"{qty:.2f}"]))
+
+        outstanding_rows: list[LineRow] = []
         for item in all_items:
             if previous_shipments is not None:
                 prev_qty = previous_shipments.get(item.id, 0)
@@ -104,100 +106,36 @@ def generate_packing_slip_pdf(
             else:
                 remaining_qty = item.quantity - item.shipped_quantity
             if remaining_qty > 0:
-                description = item.product_description
-                if item.product_id:
-                    prod = sales_logic.product_repo.get_product_details(item.product_id)
-                    if prod and prod.get("name"):
-                        description = prod["name"]
-                outstanding_items.append((description, remaining_qty))
-
-        pdf = PDF(
-            document_number=shipment_number,
+                outstanding_rows.append(LineRow(describe(item), [f"{remaining_qty:.2f}"]))
+
+        content = DocumentContent(
+            title="Packing Slip",
+            number=shipment_number,
             company_name=company_name_for_header,
-            company_billing_address_lines=company_shipping_address_pdf_lines,
-            document_type="Packing Slip",
+            company_lines=company_shipping_address_pdf_lines,
+            dates=[date_line("Date", doc.created_date)],
+            parties=[PartyBlock("Ship To:", ship_to_lines)],
+            tables=[shipped_rows, outstanding_rows],
         )
-        pdf.alias_nb_pages()
-        pdf.add_page()
-
-        line_height = 7
-        col_width_full = pdf.w - 2 * pdf.l_margin
-
-        pdf.set_font("Arial", "", 11)
-        date_str = f"Date: {doc.created_date.split('T')[0] if doc.created_date else 'N/A'}"
-        pdf.cell(0, line_height, date_str, 0, 1, "R")
-        pdf.ln(line_height * 1.5)
-
-        col_width_half = col_width_full / 2 - 5
-        pdf.set_font("Arial", "B", 11)
-        pdf.cell(col_width_half, line_height, "Ship To:", 0, 1, "L")
-        pdf.set_font("Arial", "", 11)
-        if customer:
-            pdf.cell(col_width_half, line_height, customer.name or "N/A", 0, 1, "L")
-            if customer_shipping_address:
-                pdf.multi_cell(
-                    col_width_half,
-                    line_height,
-                    "\n".join(
-                        filter(
-                            None,
-                            [
-                                customer_shipping_address.street or "",
-                                f"{customer_shipping_address.city or ''}, {customer_shipping_address.state or ''} {customer_shipping_address.zip_code or ''}",
-                                (customer_shipping_address.country or "").strip(),
-                            ],
-                        )
-                    ),
-                    0,
-                    "L",
-                )
-        pdf.ln(line_height)
-
-        pdf.set_font("Arial", "B", 10)
-        desc_col = col_width_full * 0.80
-        qty_col = col_width_full * 0.20
-        pdf.set_fill_color(220, 220, 220)
-        pdf.cell(desc_col, line_height, "Product/Service Description", 1, 0, "C", 1)
-        pdf.cell(qty_col, line_height, "Qty Shipped", 1, 1, "C", 1)
-        pdf.set_font("Arial", "", 9)
-        if shipped_items:
-            for desc, qty in shipped_items:
-                pdf.cell(desc_col, line_height, desc, 1, 0, "L")
-                pdf.cell(qty_col, line_height, f"{qty:.2f}", 1, 1, "R")
-        else:
-            pdf.cell(col_width_full, line_height, "No items in this shipment.", 1, 1, "C")
-
-        if outstanding_items:
-            pdf.ln(line_height * 1.5)
-
-            pdf.set_font("Arial", "B", 11)
-            pdf.cell(0, line_height, "Items Remaining to Ship", 0, 1, "L")
-            pdf.set_font("Arial", "B", 10)
-            pdf.set_fill_color(220, 220, 220)
-            pdf.cell(desc_col, line_height, "Product/Service Description", 1, 0, "C", 1)
-            pdf.cell(qty_col, line_height, "Qty Remaining", 1, 1, "C", 1)
-            pdf.set_font("Arial", "", 9)
-            for desc, qty in outstanding_items:
-                pdf.cell(desc_col, line_height, desc, 1, 0, "L")
-                pdf.cell(qty_col, line_height, f"{qty:.2f}", 1, 1, "R")
-
-            pdf.ln(line_height * 1.5)
+        pdf = build_pdf(LAYOUTS["packing_slip"], content)
 
         if output_path:
-            filename = output_path
+            destination = output_path
         else:
             sanitized_doc_number = sanitize_filename(shipment_number)
-            filename = f"PackingSlip_{sanitized_doc_number}.pdf"
+            destination = f"PackingSlip_{sanitized_doc_number}.pdf"
 
-        pdf.output(filename, "F")
-        print(f"PDF generated: {filename}")
+        data = write_pdf(pdf, destination)
+        if not hasattr(destination, "write"):
+            print(f"PDF generated: {destination}")
+        return data
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
         import traceback
         traceback.print_exc()
     finally:
-        if db_handler and close_db:
-            db_handler.close()
+        if own_session and session is not None:
+            session.close()
 
 
 __all__ = ["generate_packing_slip_pdf"]
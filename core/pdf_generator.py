@@ -1,5 +1,7 @@
+import functools
 import os
 import sys
+from dataclasses import dataclass, field
 from fpdf import FPDF
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -129,3 +131,500 @@ def get_company_pdf_context(service: CompanyService):
     billing_lines = _format_address_lines(billing_addr)
 
     return company_name, company_phone, shipping_lines, remittance_lines, billing_lines
+
+
+# --- Spec-driven document renderer ---------------------------------------
+#
+# Every document type shares one layout: the page header, right-aligned
+# dates, one or two party blocks ("Shipping Address:", "Vendor:", ...),
+# detail lines, line item tables and notes. A LayoutSpec describes what
+# differs per type; a DocumentContent holds the data of one document.
+
+LINE_HEIGHT = 7
+ROW_LINE_HEIGHT = 5
+COLUMN_GAP = 10
+HEADER_FILL = (220, 220, 220)
+
+
+@dataclass(frozen=True)
+class Column:
+    """A line item column; ``share`` is its fraction of the content width."""
+
+    heading: str
+    share: float
+    align: str = "R"
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """One line item table. The first column holds the wrapped description.
+
+    ``empty_text`` is printed when there are no rows; with None the table
+    is left out entirely.
+    """
+
+    columns: tuple
+    title: str | None = None
+    empty_text: str | None = "No items in this document."
+    subtotal: bool = False
+    line_height: float = ROW_LINE_HEIGHT
+
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    tables: tuple
+    gap_before_tables: float = 1.0  # In multiples of LINE_HEIGHT.
+
+
+@dataclass
+class PartyBlock:
+    title: str
+    lines: list
+
+
+@dataclass
+class LineRow:
+    """``description`` holds ``(font style, text)`` pairs; ``values`` the other columns."""
+
+    description: list
+    values: list
+
+
+@dataclass
+class DocumentContent:
+    title: str
+    number: str
+    company_name: str
+    company_lines: list
+    dates: list = field(default_factory=list)
+    parties: list = field(default_factory=list)
+    details: list = field(default_factory=list)
+    tables: list = field(default_factory=list)  # Rows per table of the layout.
+    subtotal: float = 0.0
+    notes: str | None = None
+
+
+_ITEM_COLUMNS = (
+    Column("Product/Service Description", 0.50, "L"),
+    Column("Qty", 0.10),
+    Column("Unit Price", 0.20),
+    Column("Line Total", 0.20),
+)
+_ITEM_TABLE = TableSpec(_ITEM_COLUMNS, subtotal=True)
+
+LAYOUTS = {
+    "invoice": LayoutSpec((_ITEM_TABLE,)),
+    "quote": LayoutSpec((_ITEM_TABLE,)),
+    "sales_order": LayoutSpec((_ITEM_TABLE,)),
+    "purchase_order": LayoutSpec((_ITEM_TABLE,), gap_before_tables=1.5),
+    "packing_slip": LayoutSpec((
+        TableSpec(
+            (Column("Product/Service Description", 0.80, "L"), Column("Qty Shipped", 0.20)),
+            empty_text="No items in this shipment.",
+            line_height=LINE_HEIGHT,
+        ),
+        TableSpec(
+            (Column("Product/Service Description", 0.80, "L"), Column("Qty Remaining", 0.20)),
+            title="Items Remaining to Ship",
+            empty_text=None,
+            line_height=LINE_HEIGHT,
+        ),
+    )),
+}
+
+
+class FontMetrics:
+    """Widths of one core font at one size, with words and wrapped text cached.
+
+    Shared by every document rendered in the process, so a batch measures
+    each distinct word, and wraps each distinct description, only once.
+    """
+
+    _cache: dict = {}
+    MAX_ENTRIES = 50_000  # Per cache; they are simply cleared when full.
+
+    def __init__(self, char_widths: dict, size: float):
+        self._char_widths = char_widths
+        self._size = size
+        self._words: dict = {}
+        self._wrapped: dict = {}
+        self.space = self.width(" ")
+
+    @classmethod
+    def for_pdf(cls, pdf: FPDF) -> "FontMetrics":
+        """Metrics of the font currently selected in ``pdf``."""
+        key = (pdf.font_family, pdf.font_style, pdf.font_size)
+        metrics = cls._cache.get(key)
+        if metrics is None:
+            metrics = cls._cache[key] = cls(pdf.current_font["cw"], pdf.font_size)
+        return metrics
+
+    def width(self, text: str) -> float:
+        width = self._words.get(text)
+        if width is None:
+            char_widths = self._char_widths
+            width = sum(char_widths.get(char, 0) for char in text) * self._size / 1000.0
+            if len(self._words) >= self.MAX_ENTRIES:
+                self._words.clear()
+            self._words[text] = width
+        return width
+
+    def wrap(self, text: str, width: float) -> tuple:
+        """Break ``text`` into lines no wider than ``width``, like ``multi_cell``."""
+        key = (text, width)
+        lines = self._wrapped.get(key)
+        if lines is None:
+            if len(self._wrapped) >= self.MAX_ENTRIES:
+                self._wrapped.clear()
+            lines = self._wrapped[key] = tuple(self._wrap(text, width))
+        return lines
+
+    def _wrap(self, text: str, width: float) -> list:
+        lines = []
+        for paragraph in text.replace("\r", "").split("\n"):
+            line, line_width = "", 0.0
+            for word in paragraph.split(" "):
+                word_width = self.width(word)
+                if line and line_width + self.space + word_width <= width:
+                    line += " " + word
+                    line_width += self.space + word_width
+                    continue
+                if line:
+                    lines.append(line)
+                while word_width > width and len(word) > 1:
+                    cut = self._fit(word, width)
+                    lines.append(word[:cut])
+                    word = word[cut:]
+                    word_width = self.width(word)
+                line, line_width = word, word_width
+            lines.append(line)
+        return lines
+
+    def _fit(self, word: str, width: float) -> int:
+        used = 0.0
+        for index, char in enumerate(word):
+            used += self._char_widths.get(char, 0) * self._size / 1000.0
+            if used > width:
+                return max(1, index)
+        return len(word)
+
+
+@functools.lru_cache(maxsize=None)
+def column_geometry(columns: tuple, left: float, width: float) -> tuple:
+    """``(x, width, align)`` of every column, computed once per table layout."""
+    geometry = []
+    x = left
+    for column in columns:
+        column_width = width * column.share
+        geometry.append((x, column_width, column.align))
+        x += column_width
+    return tuple(geometry)
+
+
+def build_pdf(layout: LayoutSpec, content: DocumentContent) -> PDF:
+    """Lay out ``content`` according to ``layout`` and return the finished PDF.
+
+    Save it with ``pdf.output(path, "F")`` or turn it into bytes with
+    :func:`pdf_bytes`.
+    """
+    pdf = PDF(
+        document_number=content.number,
+        company_name=content.company_name,
+        company_billing_address_lines=content.company_lines,
+        document_type=content.title,
+    )
+    pdf.alias_nb_pages()
+    pdf.add_page()
+    width = pdf.w - 2 * pdf.l_margin
+
+    pdf.set_font("Arial", "", 11)
+    for line in content.dates:
+        pdf.cell(0, LINE_HEIGHT, line, 0, 1, "R")
+    pdf.ln(LINE_HEIGHT * 1.5)
+
+    _draw_parties(pdf, content.parties, width)
+    pdf.set_font("Arial", "", 11)
+    for line in content.details:
+        pdf.cell(0, LINE_HEIGHT, line, 0, 1, "L")
+    pdf.ln(LINE_HEIGHT * layout.gap_before_tables)
+
+    for index, table in enumerate(layout.tables):
+        rows = content.tables[index] if index < len(content.tables) else []
+        _draw_table(pdf, table, rows, content.subtotal, width)
+
+    if content.notes and content.notes.strip():
+        pdf.ln(LINE_HEIGHT * 1.5)
+        pdf.set_font("Arial", "B", 11)
+        pdf.cell(0, LINE_HEIGHT, "Notes:", 0, 1, "L")
+        pdf.set_font("Arial", "", 10)
+        pdf.multi_cell(0, LINE_HEIGHT, content.notes.strip(), 0, "L")
+    return pdf
+
+
+def pdf_bytes(pdf: FPDF) -> bytes:
+    """The finished document as bytes, without touching the file system."""
+    # FPDF 1.7 keeps the document as a latin-1 str.
+    return pdf.output(dest="S").encode("latin-1")
+
+
+def write_pdf(pdf: FPDF, destination=None) -> memoryview:
+    """Finish ``pdf`` and return its bytes, writing them to ``destination`` too.
+
+    ``destination`` is a file path or a binary file-like object (anything
+    with ``write``, e.g. ``io.BytesIO`` or an open socket file); with None the
+    document only stays in memory.
+    """
+    data = memoryview(pdf_bytes(pdf))
+    if destination is None:
+        return data
+    if hasattr(destination, "write"):
+        destination.write(data)
+    else:
+        with open(destination, "wb") as handle:
+            handle.write(data)
+    return data
+
+
+def _draw_parties(pdf: PDF, parties: list, width: float) -> None:
+    if not parties:
+        return
+    column_width = width / 2 - COLUMN_GAP / 2
+    top = pdf.get_y()
+    bottom = top
+    for index, party in enumerate(parties):
+        pdf.set_xy(pdf.l_margin + index * (column_width + COLUMN_GAP), top)
+        pdf.set_font("Arial", "B", 11)
+        pdf.cell(column_width, LINE_HEIGHT, party.title, 0, 2, "L")
+        pdf.set_font("Arial", "", 11)
+        metrics = FontMetrics.for_pdf(pdf)
+        for line in party.lines:
+            for wrapped in metrics.wrap(line, column_width - 2 * pdf.c_margin):
+                pdf.cell(column_width, LINE_HEIGHT, wrapped, 0, 2, "L")
+        bottom = max(bottom, pdf.get_y())
+    pdf.set_xy(pdf.l_margin, bottom)
+
+
+class _RowWriter:
+    """Writes table rows straight into the page content stream.
+
+    ``FPDF.cell`` re-checks page breaks, re-measures and re-formats every
+    coordinate on each call. Rows here are laid out with the column geometry
+    converted to points once and the cached :class:`FontMetrics`, then
+    emitted with one ``_out`` per row.
+    """
+
+    SIZE = 9
+
+    def __init__(self, pdf: PDF, geometry: tuple, line_height: float):
+        self.pdf = pdf
+        k = pdf.k
+        self.k = k
+        self.line_height = line_height
+        self.c_margin = pdf.c_margin
+        self.columns = [(x, width, align, x * k, width * k) for x, width, align in geometry]
+        self.text_width = geometry[0][1] - 2 * pdf.c_margin
+        self.fonts = {}
+        for style in ("", "B", "I"):
+            pdf.set_font("Arial", style, self.SIZE)
+            self.fonts[style] = (f"/F{pdf.current_font['i']} {self.SIZE:.2f} Tf", FontMetrics.for_pdf(pdf))
+        # Text is drawn 0.3 font sizes below the middle of its line, as in cell().
+        self.baseline = 0.3 * self.SIZE / k
+
+    def wrap(self, description: list) -> list:
+        lines = [
+            (style, line)
+            for style, text in description
+            for line in self.fonts[style][1].wrap(text, self.text_width)
+        ]
+        return lines or [("", "")]
+
+    def write(self, top: float, height: float, lines: list, values: list) -> None:
+        pdf, k = self.pdf, self.k
+        page_height = pdf.h
+        y_pt = (page_height - top) * k
+        height_pt = -height * k
+        ops = []
+        x, _width, _align, x_pt, width_pt = self.columns[0]
+        ops.append(f"{x_pt:.2f} {y_pt:.2f} {width_pt:.2f} {height_pt:.2f} re S")
+        text_x = (x + self.c_margin) * k
+        for number, (style, line) in enumerate(lines):
+            if line:
+                y = top + number * self.line_height + 0.5 * self.line_height + self.baseline
+                ops.append(self._text(style, text_x, (page_height - y) * k, line))
+
+        value_y = (page_height - (top + 0.5 * height + self.baseline)) * k
+        metrics = self.fonts[""][1]
+        for (x, width, align, x_pt, width_pt), value in zip(self.columns[1:], values):
+            ops.append(f"{x_pt:.2f} {y_pt:.2f} {width_pt:.2f} {height_pt:.2f} re S")
+            if not value:
+                continue
+            if align == "R":
+                text_x = x + width - self.c_margin - metrics.width(value)
+            elif align == "C":
+                text_x = x + (width - metrics.width(value)) / 2
+            else:
+                text_x = x + self.c_margin
+            ops.append(self._text("", text_x * k, value_y, value))
+        # Leave FPDF's own notion of the current font in force.
+        ops.append(f"BT /F{pdf.current_font['i']} {pdf.font_size_pt:.2f} Tf ET")
+        pdf._out("\n".join(ops))
+
+    def _text(self, style: str, x_pt: float, y_pt: float, text: str) -> str:
+        escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        return f"BT {self.fonts[style][0]} {x_pt:.2f} {y_pt:.2f} Td ({escaped}) Tj ET"
+
+
+def _draw_table_header(pdf: PDF, geometry: tuple, columns: tuple) -> None:
+    pdf.set_font("Arial", "B", 10)
+    pdf.set_fill_color(*HEADER_FILL)
+    for (x, column_width, _align), column in zip(geometry, columns):
+        pdf.set_x(x)
+        pdf.cell(column_width, LINE_HEIGHT, column.heading, 1, 0, "C", 1)
+    pdf.ln(LINE_HEIGHT)
+
+
+def _draw_table(pdf: PDF, table: TableSpec, rows: list, subtotal: float, width: float) -> None:
+    if not rows and table.empty_text is None:
+        return
+    if table.title:
+        pdf.ln(LINE_HEIGHT * 1.5)
+        pdf.set_font("Arial", "B", 11)
+        pdf.cell(0, LINE_HEIGHT, table.title, 0, 1, "L")
+
+    geometry = column_geometry(table.columns, pdf.l_margin, width)
+    _draw_table_header(pdf, geometry, table.columns)
+    if not rows:
+        pdf.set_font("Arial", "", 9)
+        pdf.cell(width, LINE_HEIGHT, table.empty_text, 1, 1, "C")
+
+    writer = _RowWriter(pdf, geometry, table.line_height)
+    page_room = pdf.page_break_trigger - pdf.t_margin - LINE_HEIGHT
+    for row in rows:
+        lines = writer.wrap(row.description)
+        height = len(lines) * table.line_height
+        room = pdf.page_break_trigger - pdf.get_y()
+        # Start rows that do not fit on a new page instead of splitting them.
+        # Rows taller than a whole page are split, starting where they are
+        # if at least one line fits there.
+        if height > room and pdf.get_y() > pdf.t_margin + LINE_HEIGHT and (
+                height <= page_room or room < table.line_height):
+            pdf.add_page()
+            _draw_table_header(pdf, geometry, table.columns)
+        values = row.values
+        while lines:
+            fit = max(1, int((pdf.page_break_trigger - pdf.get_y()) / table.line_height + 1e-9))
+            part, lines = lines[:fit], lines[fit:]
+            top = pdf.get_y()
+            height = len(part) * table.line_height
+            writer.write(top, height, part, values)
+            pdf.set_y(top + height)
+            # The values are shown once, next to the start of the description.
+            values = [""] * len(values)
+            if lines:
+                pdf.add_page()
+                _draw_table_header(pdf, geometry, table.columns)
+
+    if table.subtotal:
+        total_x, total_width, _align = geometry[-1]
+        pdf.set_font("Arial", "B", 10)
+        pdf.cell(total_x - pdf.l_margin, LINE_HEIGHT, "Subtotal:", 1, 0, "R")
+        pdf.cell(total_width, LINE_HEIGHT, f"${subtotal:.2f}", 1, 1, "R")
+
+
+# --- Content helpers shared by the generators -----------------------------
+
+
+def preferred_address(addresses, address_type: str) -> Address | None:
+    """The primary address of ``address_type``, else any of that type."""
+    addresses = addresses or []
+    primary = next((a for a in addresses if address_is_primary_for(a, address_type)), None)
+    return primary or next((a for a in addresses if address_has_type(a, address_type)), None)
+
+
+def address_lines(address: Address) -> list[str]:
+    """Street, city line and country of ``address``, skipping blank parts."""
+    return [
+        line
+        for line in (
+            address.street or "",
+            f"{address.city or ''}, {address.state or ''} {address.zip_code or ''}",
+            (address.country or "").strip(),
+        )
+        if line
+    ]
+
+
+def date_line(label: str, iso_value: str | None) -> str:
+    return f"{label}: {iso_value.split('T')[0] if iso_value else 'N/A'}"
+
+
+def item_rows(items, get_product, line_total) -> tuple[list, float]:
+    """Line item rows for the standard item table and their subtotal.
+
+    ``get_product`` returns a product's name and description (or None);
+    ``line_total`` returns an item's total, which may be None.
+    """
+    rows = []
+    subtotal = 0.0
+    for item in items:
+        total = line_total(item)
+        total = total if total is not None else 0.0
+        if item.unit_price is None and item.quantity and total:
+            unit_price = total / item.quantity
+        else:
+            unit_price = item.unit_price if item.unit_price is not None else 0.0
+        subtotal += total
+
+        product = get_product(item.product_id)
+        name = product.get("name") if product else None
+        description = product.get("description") if product else item.product_description
+        lines = []
+        if name:
+            lines.append(("B", name))
+        if description:
+            lines.append(("", description))
+        if item.note:
+            lines.append(("I", item.note))
+        quantity = f"{item.quantity:.2f}" if item.quantity is not None else "0.00"
+        rows.append(LineRow(lines, [quantity, f"${unit_price:.2f}", f"${total:.2f}"]))
+    return rows, subtotal
+
+
+def sales_document_content(doc, items, customer, company_context, term_name, get_product,
+                           title: str, dates: list) -> DocumentContent:
+    """Content of a quote, sales order or invoice.
+
+    ``company_context`` is the :func:`get_company_pdf_context` tuple; the
+    header shows the remittance address.
+    """
+    company_name, _phone, _shipping, remittance_lines, _billing = company_context
+    if customer:
+        shipping = preferred_address(customer.addresses, "Shipping")
+        billing = preferred_address(customer.addresses, "Billing")
+        ship_lines = [customer.name or "N/A"]
+        ship_lines += address_lines(shipping) if shipping else ["No shipping address on file."]
+        bill_lines = [customer.name or "N/A"]
+        bill_lines += address_lines(billing) if billing else ["No billing address on file."]
+        if customer.phone:
+            bill_lines.append(f"Phone: {customer.phone}")
+    else:
+        ship_lines = bill_lines = ["Customer details not available."]
+
+    details = []
+    if doc.reference_number:
+        details.append(f"Customer Reference: {doc.reference_number}")
+    if term_name:
+        details.append(f"Terms: {term_name}")
+    rows, subtotal = item_rows(items, get_product, lambda item: item.calculate_line_total())
+    return DocumentContent(
+        title=title,
+        number=doc.document_number,
+        company_name=company_name,
+        company_lines=remittance_lines,
+        dates=dates,
+        parties=[PartyBlock("Shipping Address:", ship_lines), PartyBlock("Billing Address:", bill_lines)],
+        details=details,
+        tables=[rows],
+        subtotal=subtotal,
+        notes=doc.notes,
+    )
@@ -11,6 +11,12 @@ PREFERENCES_FILE = Path(__file__).resolve().parent.parent / 'preferences.json'
 DEFAULT_PREFERENCES: Dict[str, Any] = {
     'require_reference_on_quote_accept': False,
     'default_quote_expiry_days': 30,
+    # How often the background scheduler marks past-due tasks as overdue.
+    'overdue_task_sweep_minutes': 15,
+    # How often the background scheduler expires quotes past their expiry date.
+    'quote_expiry_sweep_minutes': 60,
+    # How often the background scheduler looks for queued PDF exports.
+    'render_queue_poll_seconds': 2,
 }
 
 def load_preferences() -> Dict[str, Any]:
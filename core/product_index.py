@@ -0,0 +1,160 @@
+"""In-memory trigram index for product type-ahead.
+
+Every SKU and name word is split into padded trigrams (``"  w"``, ``" wi"``,
+``"wid"`` ... ``"et "``), so a query shares most of its trigrams with the
+product it was meant to find even when a letter is missing or swapped, and a
+short query still matches through the leading trigrams of each word.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Upper bound on posting entries counted when no product contains every
+# query trigram; the rarest (most telling) trigrams are counted first.
+_COUNT_BUDGET = 20000
+# Candidates kept after the cheap trigram count for full scoring.
+_RESCORE_FACTOR = 5
+
+
+@dataclass(frozen=True)
+class ProductMatch:
+    """A ranked type-ahead suggestion."""
+
+    product_id: int
+    sku: str
+    name: str
+    score: float
+
+    @property
+    def label(self) -> str:
+        return f"{self.name} ({self.sku})" if self.sku else self.name
+
+
+def _trigrams(text: str) -> Set[str]:
+    grams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class ProductSuggestIndex:
+    """Trigram and prefix index over product SKU and name."""
+
+    def __init__(self, rows: Iterable[Tuple[int, str, str]] = ()):
+        self._products: Dict[int, Tuple[str, str, str, str]] = {}
+        self._grams: Dict[int, Set[str]] = {}
+        self._gram_count: Dict[int, int] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._by_sku: Dict[str, int] = {}
+        for product_id, sku, name in rows:
+            self.add(product_id, sku, name)
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def __contains__(self, product_id: int) -> bool:
+        return product_id in self._products
+
+    def add(self, product_id: int, sku: Optional[str], name: Optional[str]) -> None:
+        """Index a product, replacing any previous entry for the same id."""
+        self.remove(product_id)
+        sku = sku or ""
+        name = name or ""
+        self._products[product_id] = (sku, name, sku.lower(), name.lower())
+        grams = _trigrams(sku) | _trigrams(name)
+        self._grams[product_id] = grams
+        self._gram_count[product_id] = len(grams)
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(product_id)
+        if sku:
+            self._by_sku[sku.lower()] = product_id
+
+    def remove(self, product_id: int) -> None:
+        entry = self._products.pop(product_id, None)
+        if entry is None:
+            return
+        del self._gram_count[product_id]
+        for gram in self._grams.pop(product_id):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(product_id)
+                if not posting:
+                    del self._postings[gram]
+        if self._by_sku.get(entry[2]) == product_id:
+            del self._by_sku[entry[2]]
+
+    def suggest(self, query: str, limit: int = 10) -> List[ProductMatch]:
+        """Return up to ``limit`` products best matching ``query``.
+
+        An empty query lists the first products by name.
+        """
+        text = (query or "").strip().lower()
+        if not text:
+            first = heapq.nsmallest(limit, self._products.items(), key=lambda item: item[1][3])
+            return [ProductMatch(pid, entry[0], entry[1], 0.0) for pid, entry in first]
+
+        query_grams = _trigrams(text)
+        postings = sorted(
+            (self._postings[gram] for gram in query_grams if gram in self._postings), key=len
+        )
+        shortlist_size = limit * _RESCORE_FACTOR
+        # Trigrams that occur nowhere (usually the ones a typo produced) are
+        # simply dropped, so most misspellings still match on the rest.
+        strict = postings[0].intersection(*postings[1:]) if postings else set()
+        if len(strict) >= limit:
+            shared = len(postings)
+            shortlist = [
+                (product_id, shared)
+                for product_id in heapq.nsmallest(shortlist_size, strict, key=self._gram_count.__getitem__)
+            ]
+        else:
+            counts = Counter()
+            budget = _COUNT_BUDGET
+            for posting in postings:
+                if len(posting) > budget and counts:
+                    break
+                counts.update(posting)
+                budget -= len(posting)
+            # Keep only products sharing at least half of the query trigrams.
+            min_shared = (len(query_grams) + 1) // 2
+            shortlist = [
+                item for item in heapq.nlargest(shortlist_size, counts.items(), key=itemgetter(1))
+                if item[1] >= min_shared
+            ]
+
+        exact_id = self._by_sku.get(text)
+        if exact_id is not None and exact_id not in dict(shortlist):
+            shortlist.append((exact_id, len(query_grams)))
+
+        scored = [
+            (self._score(product_id, shared, text, len(query_grams)), product_id)
+            for product_id, shared in shortlist
+        ]
+        best = heapq.nlargest(limit, scored)
+        return [
+            ProductMatch(product_id, *self._products[product_id][:2], score)
+            for score, product_id in best
+        ]
+
+    def _score(self, product_id: int, shared: int, text: str, query_gram_count: int) -> float:
+        sku, _name, sku_lower, name_lower = self._products[product_id]
+        union = query_gram_count + self._gram_count[product_id] - shared
+        score = shared / union if union else 0.0
+        if sku_lower == text:
+            score += 3.0
+        elif sku_lower.startswith(text):
+            score += 2.0
+        if name_lower.startswith(text):
+            score += 1.0
+        elif f" {text}" in f" {name_lower}":
+            score += 0.5
+        return score
@@ -1,4 +1,5 @@
 import datetime
+from enum import Enum
 from typing import Optional, List
 import logging
 from core.database import DatabaseHandler
@@ -284,28 +285,32 @@ class PurchaseLogic:
     def get_purchase_document_details(self, doc_id: int) -> Optional[PurchaseDocument]:
         doc_data = self.purchase_repo.get_purchase_document_by_id(doc_id)
         if doc_data:
-            status_enum = None
-            if doc_data.get("status"):
-                try:
-                    status_enum = PurchaseDocumentStatus(doc_data["status"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid status '%s' in DB for doc ID %s",
-                        doc_data["status"],
-                        doc_id,
-                    )
-
-            return PurchaseDocument(
-                doc_id=doc_data["id"],
-                document_number=doc_data["document_number"],
-                vendor_id=doc_data["vendor_id"],
-                created_date=doc_data["created_date"],
-                status=status_enum,
-                notes=doc_data.get("notes"),
-                is_active=bool(doc_data.get("is_active", True)),
-            )
+            return self._document_from_row(doc_data)
         return None
 
+    @staticmethod
+    def _document_from_row(doc_data: dict) -> PurchaseDocument:
+        status_enum = None
+        if doc_data.get("status"):
+            try:
+                status_enum = PurchaseDocumentStatus(doc_data["status"])
+            except ValueError:
+                logger.warning(
+                    "Invalid status '%s' in DB for doc ID %s",
+                    doc_data["status"],
+                    doc_data["id"],
+                )
+
+        return PurchaseDocument(
+            doc_id=doc_data["id"],
+            document_number=doc_data["document_number"],
+            vendor_id=doc_data["vendor_id"],
+            created_date=doc_data["created_date"],
+            status=status_enum,
+            notes=doc_data.get("notes"),
+            is_active=bool(doc_data.get("is_active", True)),
+        )
+
     def get_all_documents_by_criteria(
         self,
         vendor_id: int = None,
@@ -316,31 +321,23 @@ class PurchaseLogic:
         docs_data = self.purchase_repo.get_all_purchase_documents(
             vendor_id=vendor_id, status=status_value, is_active=is_active
         )
-        result_list = []
-        for doc_data in docs_data:
-            status_enum = None
-            if doc_data.get("status"):
-                try:
-                    status_enum = PurchaseDocumentStatus(doc_data["status"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid status '%s' in DB for doc ID %s",
-                        doc_data["status"],
-                        doc_data["id"],
-                    )
+        return [self._document_from_row(doc_data) for doc_data in docs_data]
 
-            result_list.append(
-                PurchaseDocument(
-                    doc_id=doc_data["id"],
-                    document_number=doc_data["document_number"],
-                    vendor_id=doc_data["vendor_id"],
-                    created_date=doc_data["created_date"],
-                    status=status_enum,
-                    notes=doc_data.get("notes"),
-                    is_active=bool(doc_data.get("is_active", True)),
-                )
-            )
-        return result_list
+    def get_purchase_documents_page(
+        self,
+        filters: Optional[dict] = None,
+        sort_key: str = "-created_date",
+        after: Optional[tuple] = None,
+        limit: int = 100,
+    ) -> tuple[List[PurchaseDocument], Optional[tuple]]:
+        """Return one keyset-paginated page of purchase documents and the next cursor.
+
+        Filter values may be enums; they are stored by value.
+        """
+        filters = {key: value.value if isinstance(value, Enum) else value
+                   for key, value in (filters or {}).items()}
+        docs_data, next_cursor = self.purchase_repo.get_purchase_documents_page(filters, sort_key, after, limit)
+        return [self._document_from_row(doc_data) for doc_data in docs_data], next_cursor
 
     def get_items_for_document(self, doc_id: int) -> List[PurchaseDocumentItem]:
         items_data = self.purchase_repo.get_items_for_document(doc_id)
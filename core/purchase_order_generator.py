@@ -1,6 +1,7 @@
 import argparse
 import os
 import sys
+from typing import BinaryIO
 import sqlite3
 
 # Ensure the project root is in sys.path for absolute imports like 'from shared.structs'
@@ -12,33 +13,42 @@ if PROJECT_ROOT not in sys.path:
 
 from .database import DatabaseHandler # Relative import for modules within the same package (core)
 from .purchase_logic import PurchaseLogic # Relative import
-from .address_book_logic import AddressBookLogic # Relative import
 from shared.structs import (
     PurchaseDocument,
     PurchaseDocumentItem,
     Account,
-    Address,
     PurchaseDocumentStatus,
 )
-from shared.utils import address_has_type, address_is_primary_for
-from .pdf_generator import PDF, get_company_pdf_context
-from .company_repository import CompanyRepository
-from .company_service import CompanyService
-from .address_service import AddressService
-from .repositories import AddressRepository, AccountRepository
+from .pdf_generator import (
+    LAYOUTS,
+    DocumentContent,
+    PartyBlock,
+    address_lines,
+    build_pdf,
+    date_line,
+    item_rows,
+    preferred_address,
+    write_pdf,
+)
+from .render_session import DocumentRenderSession
 
-def generate_po_pdf(purchase_document_id: int, output_path: str = None):
+def generate_po_pdf(purchase_document_id: int, output_path: str | BinaryIO | None = None,
+                    session: DocumentRenderSession | None = None):
     """
     Generates a PDF for a given purchase_document_id using data
     from the existing application's database and logic.
+
+    Pass a ``session`` to reuse its connection and cached lookups across
+    many documents; otherwise a session is opened and closed for this call.
+    ``output_path`` is a file path or a binary file-like object to write
+    to. Returns the PDF as a ``memoryview``, or None if it could not be
+    rendered.
     """
-    db_handler = None
+    own_session = session is None
     try:
-        # Initialize database handler and logic classes
-        # The DatabaseHandler will find 'address_book.db' in its own directory (core/)
-        db_handler = DatabaseHandler()
-        purchase_logic = PurchaseLogic(db_handler)
-        address_book_logic = AddressBookLogic(db_handler) # Instantiate corrected class
+        if own_session:
+            session = DocumentRenderSession()
+        purchase_logic = session.purchase_logic
 
         # 1. Fetch Purchase Document data
         doc: PurchaseDocument = purchase_logic.get_purchase_document_details(purchase_document_id)
@@ -47,239 +57,67 @@ def generate_po_pdf(purchase_document_id: int, output_path: str = None):
             return
 
         
-        # 2. Fetch Company Information
-        address_repo = AddressRepository(db_handler)
-        account_repo = AccountRepository(db_handler)
-        address_service = AddressService(address_repo, account_repo)
-        company_repo = CompanyRepository(db_handler)
-        company_service = CompanyService(company_repo, address_service)
+        # 2. Fetch Company Information (cached by the session)
         (
             company_name_for_header,
             company_phone_pdf,
             company_shipping_address_pdf_lines,
             company_remittance_address_pdf_lines,
             company_billing_address_pdf_lines,
-        ) = get_company_pdf_context(company_service)
+        ) = session.company_context()
         
         # 3. Fetch Vendor details
-
         vendor: Account | None = None
-        vendor_address: Address | None = None
+        vendor_lines = ["Vendor details not available."]
         if doc.vendor_id:
-            vendor = address_book_logic.get_account_details(doc.vendor_id)  # Use AddressBookLogic
+            vendor = session.get_account(doc.vendor_id)
             if vendor:
-                for address in vendor.addresses:
-                    if address_is_primary_for(address, "Billing"):
-                        vendor_address = address
-                        break
-                if not vendor_address:
-                    vendor_address = next(
-                        (addr for addr in vendor.addresses if address_has_type(addr, "Billing")),
-                        None,
-                    )
+                vendor_address = preferred_address(vendor.addresses, "Billing")
+                vendor_lines = [vendor.name or "N/A"]
+                vendor_lines += address_lines(vendor_address) if vendor_address else ["No address on file."]
+                if vendor.phone:
+                    vendor_lines.append(f"Phone: {vendor.phone}")
             else:
                 print(
                     f"Warning: Vendor with ID {doc.vendor_id} not found for document {doc.document_number}."
                 )
 
-        term_name = None
-        if vendor and getattr(vendor, "payment_term_id", None):
-            term = address_book_logic.get_payment_term(vendor.payment_term_id)
-            if term:
-                term_name = term.term_name
+        term_name = session.payment_term_name(getattr(vendor, "payment_term_id", None))
 
         # 4. Fetch Line Items
         items: list[PurchaseDocumentItem] = purchase_logic.get_items_for_document(doc.id)
+        session.prefetch_products(item.product_id for item in items)
+        rows, subtotal = item_rows(items, session.get_product, lambda item: item.total_price)
 
-        # 5. Initialize PDF (pass document number, company name, and billing address for header)
-        document_type = "Request for Quote" if doc.status == PurchaseDocumentStatus.RFQ else "Purchase Order"
-        pdf = PDF(
-            document_number=doc.document_number,
+        # Company shipping address on the left, vendor on the right.
+        company_lines = [company_name_for_header, *company_shipping_address_pdf_lines]
+        if company_phone_pdf:
+            company_lines.append(f"Phone: {company_phone_pdf}")
+
+        content = DocumentContent(
+            title="Request for Quote" if doc.status == PurchaseDocumentStatus.RFQ else "Purchase Order",
+            number=doc.document_number,
             company_name=company_name_for_header,
-            company_billing_address_lines=company_billing_address_pdf_lines,
-            document_type=document_type
+            company_lines=company_billing_address_pdf_lines,
+            dates=[date_line("Date", doc.created_date)],
+            parties=[PartyBlock("Shipping Address:", company_lines), PartyBlock("Vendor:", vendor_lines)],
+            details=[f"Terms: {term_name}"] if term_name else [],
+            tables=[rows],
+            subtotal=subtotal,
+            notes=doc.notes,
         )
-        pdf.alias_nb_pages() # For total page numbers
-        pdf.add_page()
-
-        # --- PDF Content Generation ---
-        line_height = 7
-        col_width_full = pdf.w - 2 * pdf.l_margin # Full width for content
-
-        # Document Details Section (Date only)
-        pdf.set_font("Arial", "", 11) # Font for the Date
-        date_str = f"Date: {doc.created_date.split('T')[0] if doc.created_date else 'N/A'}"
-        # Full width cell, right aligned, with line break after.
-        pdf.cell(0, line_height, date_str, 0, 1, "R")
-        pdf.ln(line_height * 1.5) # Keep the spacing after this section
-
-        # Company Shipping and Vendor Information Section (Two Columns)
-        col_width_half = col_width_full / 2 - 5  # Half width for each column, with a small gap
-
-        # --- Left Column: Company Shipping Information ---
-        current_x = pdf.get_x()
-        current_y = pdf.get_y()
-
-        pdf.set_font("Arial", "B", 11)
-        pdf.cell(col_width_half, line_height, "Shipping Address:", 0, 1, "L") # Changed title
-        pdf.set_font("Arial", "", 11)
-
-        # Display Company Name above its shipping address
-        pdf.cell(col_width_half, line_height, company_name_for_header, 0, 1, "L")
-
-        # Company Shipping Address
-        temp_x_offset = pdf.get_x()
-        pdf.multi_cell(col_width_half, line_height, "\n".join(company_shipping_address_pdf_lines), 0, "L")
-        y_after_company_address = pdf.get_y()
-        pdf.set_xy(temp_x_offset, y_after_company_address)
-
-        if company_phone_pdf: # Display company phone if available
-            pdf.cell(col_width_half, line_height, f"Phone: {company_phone_pdf}", 0, 1, "L")
-
-        y_after_company_info = pdf.get_y()
-
-        # --- Right Column: Vendor Information ---
-        pdf.set_xy(current_x + col_width_half + 10, current_y) # Move to start of right column
-
-        pdf.set_font("Arial", "B", 11)
-        # Vendor Title - still use ln=1 to move below, but X will be reset for next element.
-        pdf.cell(col_width_half, line_height, "Vendor:", 0, 1, "L")
-        pdf.set_font("Arial", "", 11)
-
-        right_column_x = current_x + col_width_half + 10
-
-        if vendor:
-            pdf.set_x(right_column_x)
-            pdf.cell(col_width_half, line_height, vendor.name or "N/A", 0, 1, "L") # ln=1, so next line starts at margin
-
-            if vendor_address:
-                pdf.set_x(right_column_x) # <<< CRITICAL: Set X before multi_cell
-                pdf.multi_cell(col_width_half, line_height,
-                               f"{vendor_address.street or ''}\n"
-                               f"{vendor_address.city or ''}, {vendor_address.state or ''} {vendor_address.zip_code or ''}\n"
-                               f"{vendor_address.country or ''}".strip(), # Use strip to remove trailing newlines if country is empty
-                               0, "L")
-                # After multi_cell, Y is updated. X might be unpredictable or at left margin.
-                # We need to set X again if something follows in this column on a *new* line created by multi_cell.
-                # However, the phone number should appear directly after the address block, aligned to right_column_x.
-                # multi_cell moves Y. We just need to ensure X is correct for the *next* element.
-            else:
-                pdf.set_x(right_column_x)
-                pdf.cell(col_width_half, line_height, "No address on file.", 0, 1, "L")
-
-            if vendor.phone:
-                pdf.set_x(right_column_x) # Ensure X for phone
-                pdf.cell(col_width_half, line_height, f"Phone: {vendor.phone}", 0, 1, "L")
-            # y_after_vendor_info will be determined by the last element in this block.
-            # The set_y(max(...)) call later will handle overall alignment.
-        else:
-            pdf.set_x(right_column_x)
-            pdf.cell(col_width_half, line_height, "Vendor details not available.", 0, 1, "L")
-
-        y_after_vendor_info = pdf.get_y() # Get Y after the vendor block is complete
-
-        # Ensure the cursor is below the taller of the two columns before proceeding
-        pdf.set_y(max(y_after_company_info, y_after_vendor_info))
-        if term_name:
-            pdf.set_font("Arial", "", 11)
-            pdf.cell(0, line_height, f"Terms: {term_name}", 0, 1, "L")
-        pdf.ln(line_height * 1.5) # Add some space before the line items table
-
-        # Line Items Table
-        pdf.set_font("Arial", "B", 10)
-        # Define column widths - adjust as needed
-        desc_col = col_width_full * 0.50  # 50%
-        qty_col = col_width_full * 0.10   # 10%
-        price_col = col_width_full * 0.20 # 20%
-        total_col = col_width_full * 0.20 # 20%
-
-        # Table Header
-        pdf.set_fill_color(220, 220, 220) # Light grey for header
-        pdf.cell(desc_col, line_height, "Product/Service Description", 1, 0, "C", 1)
-        pdf.cell(qty_col, line_height, "Qty", 1, 0, "C", 1)
-        pdf.cell(price_col, line_height, "Unit Price", 1, 0, "C", 1)
-        pdf.cell(total_col, line_height, "Line Total", 1, 1, "C", 1)
-
-        pdf.set_font("Arial", "", 9)
-        document_subtotal = 0.0
-        if items:
-            for item in items:
-                item_total = item.total_price if item.total_price is not None else 0.0
-                if item.unit_price is None and item.quantity is not None and item_total != 0.0 and item.quantity != 0: # Try to infer unit price if missing but total exists
-                    effective_unit_price = item_total / item.quantity
-                else:
-                    effective_unit_price = item.unit_price if item.unit_price is not None else 0.0
-
-                document_subtotal += item_total
-
-                # Handle multi-line descriptions
-                start_x = pdf.get_x()
-                start_y = pdf.get_y()
-                product_info = (
-                    purchase_logic.product_repo.get_product_details(item.product_id)
-                    if item.product_id
-                    else None
-                )
-                product_name = product_info.get("name") if product_info else None
-                product_description = (
-                    product_info.get("description") if product_info else item.product_description
-                )
-                lines = []
-                if product_name:
-                    lines.append(("B", product_name))
-                if product_description:
-                    lines.append(("", product_description))
-                if item.note:
-                    lines.append(("I", item.note))
-                desc_line_height = 5
-                for idx, (style, text) in enumerate(lines):
-                    border = "LTR" if idx == 0 else ("LBR" if idx == len(lines) - 1 else "LR")
-                    pdf.set_font("Arial", style, 9)
-                    pdf.multi_cell(desc_col, desc_line_height, text, border, "L")
-                    pdf.set_x(start_x)
-                end_y_desc = pdf.get_y()
-
-                pdf.set_xy(start_x + desc_col, start_y) # Reset X position for next cells in the row
-                pdf.set_font("Arial", "", 9)
-
-                pdf.cell(qty_col, end_y_desc - start_y, f"{item.quantity:.2f}" if item.quantity is not None else "0.00", 1, 0, "R")
-                pdf.cell(price_col, end_y_desc - start_y, f"${effective_unit_price:.2f}", 1, 0, "R")
-                pdf.cell(total_col, end_y_desc - start_y, f"${item_total:.2f}", 1, 0, "R")
-                pdf.ln(end_y_desc - start_y) # Move to next line based on height of multi_cell
-
-        else:
-            pdf.cell(col_width_full, line_height, "No items in this document.", 1, 1, "C")
-
-        # Document Subtotal
-        pdf.set_font("Arial", "B", 10)
-        pdf.cell(desc_col + qty_col + price_col, line_height, "Subtotal:", 1, 0, "R")
-        pdf.cell(total_col, line_height, f"${document_subtotal:.2f}", 1, 1, "R")
-
-        # Placeholder for Tax and Grand Total (as per popup, these are not directly available)
-        # You can add logic here if tax calculation is needed
-        # pdf.cell(desc_col + qty_col + price_col, line_height, "Tax (0%):", 1, 0, "R")
-        # pdf.cell(total_col, line_height, "$0.00", 1, 1, "R")
-        # pdf.set_font_size(11) # Slightly larger for grand total
-        # pdf.cell(desc_col + qty_col + price_col, line_height, "Grand Total:", 1, 0, "R")
-        # pdf.cell(total_col, line_height, f"${document_subtotal:.2f}", 1, 1, "R")
-        pdf.ln(line_height * 1.5)
-
-        # Notes Section
-        if doc.notes and doc.notes.strip():
-            pdf.set_font("Arial", "B", 11)
-            pdf.cell(0, line_height, "Notes:", 0, 1, "L")
-            pdf.set_font("Arial", "", 10)
-            pdf.multi_cell(0, line_height, doc.notes.strip(), 0, "L")
-        # --- End PDF Content Generation ---
+        pdf = build_pdf(LAYOUTS["purchase_order"], content)
 
         # 5. Determine output filename and save
         if output_path:
-            filename = output_path
+            destination = output_path
         else:
             prefix = "RFQ" if doc.status == PurchaseDocumentStatus.RFQ else "PurchaseOrder"
-            filename = f"{prefix}_{doc.document_number.replace('/', '_')}.pdf"
-        pdf.output(filename, "F")
-        print(f"PDF generated: {filename}")
+            destination = f"{prefix}_{doc.document_number.replace('/', '_')}.pdf"
+        data = write_pdf(pdf, destination)
+        if not hasattr(destination, "write"):
+            print(f"PDF generated: {destination}")
+        return data
 
     except ImportError as e:
         print(f"Error importing application modules: {e}")
@@ -291,8 +129,8 @@ def generate_po_pdf(purchase_document_id: int, output_path: str = None):
         import traceback
         traceback.print_exc()
     finally:
-        if db_handler:
-            db_handler.close()
+        if own_session and session is not None:
+            session.close()
 
 def main():
     parser = argparse.ArgumentParser(description="Generate a Purchase Order PDF from existing application data.")
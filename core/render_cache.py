@@ -0,0 +1,231 @@
+"""On-disk cache of rendered document PDFs.
+
+Re-printing an unchanged quote or invoice should not mean rendering it with
+FPDF again. :func:`render_document` keys every PDF by a hash of the data that
+goes into it (the document row, its items, the customer or vendor, product
+names, payment terms, the company header) plus the source of the template
+that lays it out. Any edit to one of those produces a new key, so a cached
+file is never stale; old entries simply age out of the size-bounded,
+least-recently-used directory.
+"""
+
+import functools
+import hashlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from enum import Enum
+from pathlib import Path
+
+from core import pdf_generator
+from core.invoice_generator import generate_invoice_pdf
+from core.purchase_order_generator import generate_po_pdf
+from core.quote_generator import generate_quote_pdf
+from core.render_session import DocumentRenderSession
+from core.sales_order_generator import generate_sales_order_pdf
+from shared.structs import SalesDocumentType
+
+# kind -> (sales document type or None for purchase documents, file prefix, generator)
+DOCUMENT_KINDS = {
+    "invoice": (SalesDocumentType.INVOICE, "Invoice", generate_invoice_pdf),
+    "quote": (SalesDocumentType.QUOTE, "Quote", generate_quote_pdf),
+    "sales_order": (SalesDocumentType.SALES_ORDER, "SalesOrder", generate_sales_order_pdf),
+    "purchase_order": (None, "PurchaseOrder", generate_po_pdf),
+}
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".render_cache"
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class RenderCache:
+    """Directory of ``<key>.pdf`` files trimmed to ``max_bytes``.
+
+    Recency is the file's modification time, which a hit refreshes, so
+    eviction removes the least recently used PDFs first.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1.")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.pdf"
+
+    def get(self, key: str) -> Path | None:
+        """Path of the cached PDF for ``key``, marking it recently used."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def temp_path(self) -> Path:
+        """Fresh file name inside the cache directory to render into."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        os.close(fd)
+        os.remove(name)
+        return Path(name)
+
+    def put(self, key: str, source) -> Path:
+        """Move the rendered file ``source`` into the cache under ``key``."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(key)
+        os.replace(source, path)
+        self.evict(keep=path)
+        return path
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Delete least recently used PDFs until the cache fits ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _mtime, size, _path in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+
+@functools.lru_cache(maxsize=None)
+def template_version(generator) -> str:
+    """Hash of the generator's module and the shared PDF layout code."""
+    digest = hashlib.sha256()
+    for module in (sys.modules[generator.__module__], pdf_generator):
+        with open(module.__file__, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def document_key(session: DocumentRenderSession, kind: str, document_id: int) -> str | None:
+    """Cache key for rendering ``document_id`` as ``kind``; None if it does not exist."""
+    document_type, _prefix, generator = DOCUMENT_KINDS[kind]
+    if document_type is None:
+        doc = session.purchase_logic.get_purchase_document_details(document_id)
+        items = session.purchase_logic.get_items_for_document(document_id) if doc else []
+        account_id = getattr(doc, "vendor_id", None)
+    else:
+        doc = session.sales_logic.get_sales_document_details(document_id)
+        items = session.sales_logic.get_items_for_sales_document(document_id) if doc else []
+        account_id = getattr(doc, "customer_id", None)
+    if not doc:
+        return None
+    session.prefetch_products(item.product_id for item in items)
+    account = session.get_account(account_id)
+    data = {
+        "kind": kind,
+        "template": template_version(generator),
+        "document": doc,
+        "items": items,
+        "products": [session.get_product(item.product_id) for item in items],
+        "account": account,
+        "payment_term": session.payment_term_name(getattr(account, "payment_term_id", None)),
+        "company": session.company_context(),
+    }
+    encoded = json.dumps(data, default=_plain, sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "__dict__"):
+        return vars(value)
+    return str(value)
+
+
+_default_cache: RenderCache | None = None
+
+
+def default_cache() -> RenderCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = RenderCache()
+    return _default_cache
+
+
+def render_document(kind: str, document_id: int, output_path=None,
+                    session: DocumentRenderSession | None = None,
+                    cache: RenderCache | None = None):
+    """Render ``document_id`` as ``kind`` through the cache.
+
+    Unchanged documents are served from the cache without running the
+    generator. The PDF is copied to ``output_path`` when one is given;
+    otherwise the cached file's path is returned. Returns None when the
+    document does not exist or could not be rendered.
+    """
+    cache = cache or default_cache()
+    own_session = session is None
+    if own_session:
+        session = DocumentRenderSession()
+    try:
+        key = document_key(session, kind, document_id)
+        if key is None:
+            print(f"Error: Document with ID {document_id} not found.")
+            return None
+        cached = cache.get(key)
+        if cached is None:
+            _document_type, _prefix, generator = DOCUMENT_KINDS[kind]
+            rendered = cache.temp_path()
+            generator(document_id, output_path=str(rendered), session=session)
+            if not rendered.exists():
+                return None
+            cached = cache.put(key, rendered)
+    finally:
+        if own_session:
+            session.close()
+    if output_path is None:
+        return cached
+    shutil.copyfile(cached, output_path)
+    return output_path
+
+
+def render_document_bytes(kind: str, document_id: int,
+                          session: DocumentRenderSession | None = None,
+                          cache: RenderCache | None = None) -> memoryview | None:
+    """Render ``document_id`` as ``kind`` in memory, e.g. for an on-screen preview.
+
+    A cached PDF is read back when the document is unchanged; otherwise the
+    generator renders into a buffer and nothing is written to disk. Returns
+    None when the document does not exist or could not be rendered.
+    """
+    cache = cache or default_cache()
+    own_session = session is None
+    if own_session:
+        session = DocumentRenderSession()
+    try:
+        key = document_key(session, kind, document_id)
+        if key is None:
+            print(f"Error: Document with ID {document_id} not found.")
+            return None
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                return memoryview(cached.read_bytes())
+            except FileNotFoundError:
+                pass  # Evicted since the lookup; render it instead.
+        _document_type, _prefix, generator = DOCUMENT_KINDS[kind]
+        return generator(document_id, output_path=io.BytesIO(), session=session)
+    finally:
+        if own_session:
+            session.close()
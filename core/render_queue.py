@@ -0,0 +1,166 @@
+"""Persistent queue of document PDFs rendered in the background.
+
+Exporting from a document popup used to run the generator on the Tk thread.
+Popups now add a row to the ``render_jobs`` table and return at once; the
+background scheduler drains the queue with :func:`core.scheduler.render_queue_job`
+on its own connection. Jobs live in the database, so they survive a restart,
+and a failed render is retried with a growing delay before it is marked as
+failed for good.
+"""
+
+import datetime
+import logging
+import os
+
+from core.render_cache import DOCUMENT_KINDS, RenderCache, document_key, render_document
+from core.render_session import DocumentRenderSession
+from core.repositories import RenderJobRepository
+from shared.structs import RenderJob, RenderJobStatus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY_SECONDS = 30
+
+
+class RenderQueue:
+    """Enqueue, run and inspect background render jobs.
+
+    A failed attempt is retried after ``retry_delay_seconds``, doubling for
+    each further attempt, until the job has had ``max_attempts`` tries. A job
+    whose document no longer exists fails at once.
+    Renders go through ``cache`` (the default render cache if None).
+    """
+
+    def __init__(self, repo_or_db, max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                 retry_delay_seconds: float = DEFAULT_RETRY_DELAY_SECONDS,
+                 clock=datetime.datetime.now, cache: RenderCache | None = None):
+        if isinstance(repo_or_db, RenderJobRepository):
+            self.repo = repo_or_db
+        else:
+            self.repo = RenderJobRepository(repo_or_db)
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.clock = clock
+        self.cache = cache
+
+    def _now(self) -> str:
+        return self.clock().isoformat()
+
+    def enqueue(self, kind: str, document_id: int, output_path: str, label: str | None = None) -> int:
+        """Queue ``document_id`` to be rendered as ``kind`` into ``output_path``."""
+        return self.enqueue_many([(kind, document_id, output_path, label)])[0]
+
+    def enqueue_many(self, jobs) -> list[int]:
+        """Queue ``(kind, document_id, output_path, label)`` tuples in one transaction."""
+        rows = []
+        for kind, document_id, output_path, label in jobs:
+            if kind not in DOCUMENT_KINDS:
+                raise ValueError(f"Unknown document kind: {kind}")
+            rows.append({
+                "kind": kind,
+                "document_id": document_id,
+                "label": label,
+                # The worker may not share the caller's working directory.
+                "output_path": os.path.abspath(output_path),
+                "max_attempts": self.max_attempts,
+            })
+        return self.repo.add_jobs(rows, self._now()) if rows else []
+
+    def jobs(self, limit: int = 500) -> list[RenderJob]:
+        """Most recently queued jobs first."""
+        return [_job_from_row(row) for row in self.repo.get_jobs(limit)]
+
+    def get_job(self, job_id: int) -> RenderJob | None:
+        row = self.repo.get_job(job_id)
+        return _job_from_row(row) if row else None
+
+    def counts(self) -> dict:
+        """Number of jobs per :class:`RenderJobStatus`; absent statuses count 0."""
+        found = self.repo.get_counts()
+        return {status: found.get(status.value, 0) for status in RenderJobStatus}
+
+    def version(self) -> int:
+        """Change counter of the queue; it moves whenever any job changes."""
+        return self.repo.get_table_versions(["render_jobs"]).get("render_jobs", 0)
+
+    def retry(self, job_ids=None) -> int:
+        """Queue failed jobs (all, or only ``job_ids``) again with fresh attempts."""
+        return self.repo.requeue_jobs([RenderJobStatus.FAILED.value], self._now(),
+                                      job_ids=job_ids, reset_attempts=True)
+
+    def clear_finished(self) -> int:
+        """Delete the jobs that rendered successfully."""
+        return self.repo.delete_jobs(RenderJobStatus.DONE.value)
+
+    def recover(self) -> int:
+        """Requeue jobs left running by a worker that stopped mid-render.
+
+        Call once at startup, before any worker runs.
+        """
+        return self.repo.requeue_jobs([RenderJobStatus.RUNNING.value], self._now())
+
+    def process_due(self, session: DocumentRenderSession | None = None, limit: int | None = None) -> int:
+        """Render queued jobs that are due, oldest first; returns how many ran."""
+        own_session = session is None
+        processed = 0
+        try:
+            while limit is None or processed < limit:
+                row = self.repo.claim_job(self._now())
+                if row is None:
+                    break
+                if session is None:
+                    session = DocumentRenderSession(self.repo.db)
+                self._run(_job_from_row(row), session)
+                processed += 1
+        finally:
+            if own_session and session is not None:
+                session.close()
+        return processed
+
+    def _run(self, job: RenderJob, session: DocumentRenderSession) -> None:
+        error = None
+        permanent = False
+        try:
+            directory = os.path.dirname(job.output_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            if render_document(job.kind, job.document_id, output_path=job.output_path,
+                               session=session, cache=self.cache) is None:
+                # A deleted document will not come back, so it is not retried.
+                permanent = document_key(session, job.kind, job.document_id) is None
+                error = ("The document no longer exists." if permanent
+                         else "The document could not be rendered.")
+        except Exception as exc:  # Record the failure instead of stopping the queue.
+            logger.exception("Render job %s failed", job.id)
+            error = str(exc) or type(exc).__name__
+
+        if error is None:
+            self.repo.update_job(job.id, RenderJobStatus.DONE.value, self._now())
+            logger.info("Render job %s wrote %s", job.id, job.output_path)
+        elif not permanent and job.attempts < job.max_attempts:
+            delay = self.retry_delay_seconds * 2 ** (job.attempts - 1)
+            retry_at = (self.clock() + datetime.timedelta(seconds=delay)).isoformat()
+            self.repo.update_job(job.id, RenderJobStatus.QUEUED.value, self._now(),
+                                 last_error=error, next_attempt_at=retry_at)
+        else:
+            self.repo.update_job(job.id, RenderJobStatus.FAILED.value, self._now(), last_error=error)
+
+
+def _job_from_row(row: dict) -> RenderJob:
+    return RenderJob(
+        id=row["id"],
+        kind=row["kind"],
+        document_id=row["document_id"],
+        label=row.get("label"),
+        output_path=row["output_path"],
+        status=RenderJobStatus(row["status"]),
+        attempts=row["attempts"],
+        max_attempts=row["max_attempts"],
+        next_attempt_at=row.get("next_attempt_at"),
+        last_error=row.get("last_error"),
+        created_at=row.get("created_at"),
+        updated_at=row.get("updated_at"),
+    )
@@ -0,0 +1,103 @@
+"""Shared context for rendering document PDFs.
+
+Every generator needs the same connection, logic objects, company header,
+payment terms, customer records and product names. A :class:`DocumentRenderSession` builds
+them once so rendering a batch of documents only queries what differs per
+document.
+"""
+
+from core.address_book_logic import AddressBookLogic
+from core.address_service import AddressService
+from core.company_repository import CompanyRepository
+from core.company_service import CompanyService
+from core.database import DatabaseHandler
+from core.pdf_generator import get_company_pdf_context
+from core.purchase_logic import PurchaseLogic
+from core.repositories import AccountRepository, AddressRepository
+from core.sales_logic import SalesLogic
+
+
+class DocumentRenderSession:
+    """One connection plus cached lookups shared by the PDF generators.
+
+    Pass ``db_handler`` to render on an existing connection (it is left
+    open on :meth:`close`); otherwise the session opens ``db_path``, or the
+    application database, and closes it again. ``read_only`` suits worker
+    processes that only render; give them a ``company_context`` resolved
+    elsewhere, since loading it may have to create the default company row.
+    """
+
+    def __init__(self, db_handler: DatabaseHandler | None = None, db_path: str | None = None,
+                 read_only: bool = False, company_context: tuple | None = None):
+        self._owns_db = db_handler is None
+        self.db = db_handler or DatabaseHandler(db_path, read_only=read_only)
+        self.sales_logic = SalesLogic(self.db)
+        self.purchase_logic = PurchaseLogic(self.db)
+        self.address_book_logic = AddressBookLogic(self.db)
+        address_service = AddressService(AddressRepository(self.db), AccountRepository(self.db))
+        self.company_service = CompanyService(CompanyRepository(self.db), address_service)
+        self._company_context = company_context
+        self._payment_terms = None
+        self._accounts = {}
+        self._products = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_db:
+            self.db.close()
+
+    def company_context(self) -> tuple:
+        """The :func:`get_company_pdf_context` tuple, loaded on first use."""
+        if self._company_context is None:
+            self._company_context = get_company_pdf_context(self.company_service)
+        return self._company_context
+
+    def payment_term_name(self, term_id: int | None) -> str | None:
+        """Name of payment term ``term_id``; all terms are loaded on first use."""
+        if not term_id:
+            return None
+        if self._payment_terms is None:
+            self._payment_terms = {
+                term.term_id: term.term_name
+                for term in self.address_book_logic.list_payment_terms()
+            }
+        return self._payment_terms.get(term_id)
+
+    def prefetch_accounts(self, account_ids) -> None:
+        """Load the accounts (with addresses) not cached yet in one batch."""
+        missing = {account_id for account_id in account_ids if account_id and account_id not in self._accounts}
+        if not missing:
+            return
+        found = self.address_book_logic.get_accounts_details(sorted(missing))
+        for account_id in missing:
+            self._accounts[account_id] = found.get(account_id)
+
+    def get_account(self, account_id: int | None):
+        """Account with addresses, or None; cached for the session."""
+        if not account_id:
+            return None
+        if account_id not in self._accounts:
+            self.prefetch_accounts([account_id])
+        return self._accounts[account_id]
+
+    def prefetch_products(self, product_ids) -> None:
+        """Load name and description of the products not cached yet in one batch."""
+        missing = {product_id for product_id in product_ids if product_id and product_id not in self._products}
+        if not missing:
+            return
+        found = self.sales_logic.product_repo.get_products_by_ids(sorted(missing))
+        for product_id in missing:
+            self._products[product_id] = found.get(product_id)
+
+    def get_product(self, product_id: int | None) -> dict | None:
+        """``{"product_id", "name", "description"}`` of a product, or None."""
+        if not product_id:
+            return None
+        if product_id not in self._products:
+            self.prefetch_products([product_id])
+        return self._products[product_id]
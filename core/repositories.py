@@ -41,6 +41,9 @@ class ContactRepository:
     def get_all_contacts(self):
         return self.db.get_all_contacts()
 
+    def get_contacts_page(self, filters=None, sort_key="name", after=None, limit=100):
+        return self.db.get_contacts_page(filters, sort_key, after, limit)
+
     def delete_contact(self, contact_id):
         self.db.delete_contact(contact_id)
 
@@ -65,6 +68,9 @@ class AccountRepository:
     def get_all_accounts(self):
         return self.db.get_all_accounts()
 
+    def get_accounts_page(self, filters=None, sort_key="name", after=None, limit=100):
+        return self.db.get_accounts_page(filters, sort_key, after, limit)
+
     def get_accounts(self):
         return self.db.get_accounts()
 
@@ -74,9 +80,18 @@ class AccountRepository:
     def get_account_details(self, account_id):
         return self.db.get_account_details(account_id)
 
+    def get_account_summaries(self, account_ids):
+        return self.db.get_account_summaries(account_ids)
+
+    def get_accounts_details(self, account_ids):
+        return self.db.get_accounts_details(account_ids)
+
     def update_account(self, account_id, name, phone, website, description, account_type, pricing_rule_id=None, payment_term_id=None):
         self.db.update_account(account_id, name, phone, website, description, account_type, pricing_rule_id, payment_term_id)
 
+    def save_account_addresses(self, account_id, addresses):
+        return self.db.save_account_addresses(account_id, addresses)
+
     def clear_account_addresses(self, account_id):
         self.db.cursor.execute("DELETE FROM account_addresses WHERE account_id = ?", (account_id,))
         self.db.conn.commit()
@@ -131,9 +146,18 @@ class ProductRepository:
     def get_product_details(self, product_id):
         return self.db.get_product_details(product_id)
 
+    def get_products_by_ids(self, product_ids):
+        return self.db.get_products_by_ids(product_ids)
+
     def get_all_products(self):
         return self.db.get_all_products()
 
+    def get_products_page(self, filters=None, sort_key="name", after=None, limit=100):
+        return self.db.get_products_page(filters, sort_key, after, limit)
+
+    def get_product_suggest_rows(self):
+        return self.db.get_product_suggest_rows()
+
     def get_all_product_categories_from_table(self):
         return self.db.get_all_product_categories_from_table()
 
@@ -149,6 +173,21 @@ class ProductRepository:
     def delete_product_category(self, category_id):
         self.db.delete_product_category(category_id)
 
+    def is_category_descendant(self, ancestor_id, category_id):
+        return self.db.is_category_descendant(ancestor_id, category_id)
+
+    def get_category_descendant_ids(self, category_id):
+        return self.db.get_category_descendant_ids(category_id)
+
+    def get_product_category_path(self, category_id):
+        return self.db.get_product_category_path(category_id)
+
+    def get_all_product_category_paths(self):
+        return self.db.get_all_product_category_paths()
+
+    def get_products_in_category_recursive(self, category_id, active_only=True):
+        return self.db.get_products_in_category_recursive(category_id, active_only)
+
     def get_all_product_units_of_measure_from_table(self):
         return self.db.get_all_product_units_of_measure_from_table()
 
@@ -196,6 +235,12 @@ class TaskRepository:
     def get_tasks(self, **filters):
         return self.db.get_tasks(**filters)
 
+    def get_tasks_page(self, filters=None, sort_key="due_date", after=None, limit=100):
+        return self.db.get_tasks_page(filters, sort_key, after, limit)
+
+    def get_task_list_rows(self, filters=None, sort_column="due_date", descending=False, limit=None, offset=0):
+        return self.db.get_task_list_rows(filters, sort_column, descending, limit, offset)
+
     def update_task(self, task_id: int, task_data: dict):
         self.db.update_task(task_id, task_data)
 
@@ -205,8 +250,8 @@ class TaskRepository:
     def update_task_status(self, task_id: int, new_status: str, updated_at_iso: str):
         self.db.update_task_status(task_id, new_status, updated_at_iso)
 
-    def get_overdue_tasks(self, current_date_iso: str):
-        return self.db.get_overdue_tasks(current_date_iso)
+    def mark_overdue_tasks(self, current_date_iso: str, updated_at_iso: str) -> int:
+        return self.db.mark_overdue_tasks(current_date_iso, updated_at_iso)
 
 
 class PurchaseRepository:
@@ -223,6 +268,12 @@ class PurchaseRepository:
     def get_all_purchase_documents(self, **filters):
         return self.db.get_all_purchase_documents(**filters)
 
+    def get_purchase_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
+        return self.db.get_purchase_documents_page(filters, sort_key, after, limit)
+
+    def get_purchase_document_numbers(self, status=None, since=None):
+        return self.db.get_purchase_document_numbers(status, since)
+
     def update_purchase_document_status(self, doc_id: int, new_status: str):
         self.db.update_purchase_document_status(doc_id, new_status)
 
@@ -277,6 +328,9 @@ class InteractionRepository:
     def get_interactions(self, **filters):
         return self.db.get_interactions(**filters)
 
+    def get_interaction_page(self, **kwargs):
+        return self.db.get_interaction_page(**kwargs)
+
     def update_interaction(self, interaction_id, *args, **kwargs):
         self.db.update_interaction(interaction_id, *args, **kwargs)
 
@@ -292,12 +346,21 @@ class SalesRepository:
     def get_all_sales_documents(self, **filters):
         return self.db.get_all_sales_documents(**filters)
 
+    def get_sales_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
+        return self.db.get_sales_documents_page(filters, sort_key, after, limit)
+
+    def get_sales_document_numbers(self, document_type=None, status=None, since=None):
+        return self.db.get_sales_document_numbers(document_type, status, since)
+
     def add_sales_document(self, **kwargs):
         return self.db.add_sales_document(**kwargs)
 
     def update_sales_document(self, doc_id: int, updates: dict):
         self.db.update_sales_document(doc_id, updates)
 
+    def expire_quotes(self, as_of_iso: str) -> int:
+        return self.db.expire_quotes(as_of_iso)
+
     def update_sales_document_item(self, item_id: int, updates: dict):
         self.db.update_sales_document_item(item_id, updates)
 
@@ -349,9 +412,24 @@ class InventoryRepository:
     def get_on_order_level(self, product_id: int) -> float:
         return self.db.get_on_order_quantity(product_id)
 
+    def get_on_order_levels(self, product_ids):
+        return self.db.get_on_order_quantities(product_ids)
+
     def get_all_on_order_levels(self):
         return self.db.get_all_on_order_quantities()
 
+    def get_open_sales_order_lines(self, document_type: str, status: str):
+        return self.db.get_open_sales_order_lines(document_type, status)
+
+    def get_purchase_document_lines(self, status: str):
+        return self.db.get_purchase_document_lines(status)
+
+    def get_reorder_candidates(self):
+        return self.db.get_reorder_candidates()
+
+    def get_table_versions(self, tables):
+        return self.db.get_table_versions(tables)
+
     def add_replenishment_item(self, product_id: int, quantity_needed: float):
         return self.db.add_replenishment_item(product_id, quantity_needed)
 
@@ -390,3 +468,48 @@ class PurchaseOrderRepository:
 
     def delete_line_item(self, item_id: int):
         self.db.delete_purchase_order_line_item(item_id)
+
+
+class RenderJobRepository:
+    """Repository for the persistent render queue."""
+    def __init__(self, db: DatabaseHandler):
+        self.db = db
+
+    def add_jobs(self, jobs, now: str):
+        return self.db.add_render_jobs(jobs, now)
+
+    def claim_job(self, now: str):
+        return self.db.claim_render_job(now)
+
+    def get_job(self, job_id: int):
+        return self.db.get_render_job(job_id)
+
+    def get_jobs(self, limit: int = 500):
+        return self.db.get_render_jobs(limit)
+
+    def get_counts(self):
+        return self.db.get_render_job_counts()
+
+    def update_job(self, job_id: int, status: str, now: str, last_error=None, next_attempt_at=None):
+        self.db.update_render_job(job_id, status, now, last_error, next_attempt_at)
+
+    def requeue_jobs(self, statuses, now: str, job_ids=None, reset_attempts: bool = False):
+        return self.db.requeue_render_jobs(statuses, now, job_ids, reset_attempts)
+
+    def delete_jobs(self, status: str):
+        return self.db.delete_render_jobs(status)
+
+    def get_table_versions(self, tables):
+        return self.db.get_table_versions(tables)
+
+
+class SearchRepository:
+    """Repository for the global full-text search index."""
+    def __init__(self, db: DatabaseHandler):
+        self.db = db
+
+    def search(self, match: str, kinds=None, limit: int = 20):
+        return self.db.search_index(match, kinds, limit)
+
+    def rebuild(self):
+        self.db.rebuild_search_index()
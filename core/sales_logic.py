@@ -1,4 +1,5 @@
 import datetime
+from enum import Enum
 from typing import Optional, List
 import logging
 from core.database import DatabaseHandler
@@ -369,6 +370,18 @@ class SalesLogic:
         self.sales_repo.update_sales_document(doc_id, {"status": new_status.value})
         return self.get_sales_document_details(doc_id)
 
+    def expire_quotes(self, as_of: datetime.date | datetime.datetime | None = None) -> int:
+        """Marks every draft or sent quote past its expiry date as expired.
+
+        A quote stays valid through its expiry date and expires on the next
+        day. Returns the number of quotes expired.
+        """
+        if as_of is None:
+            as_of = datetime.date.today()
+        if isinstance(as_of, datetime.datetime):
+            as_of = as_of.date()
+        return self.sales_repo.expire_quotes(as_of.isoformat())
+
     def update_document_notes(self, doc_id: int, notes: str) -> Optional[SalesDocument]:
         doc = self.get_sales_document_details(doc_id)
         if not doc:
@@ -404,47 +417,51 @@ class SalesLogic:
     def get_sales_document_details(self, doc_id: int) -> Optional[SalesDocument]:
         doc_data = self.sales_repo.get_sales_document_by_id(doc_id)
         if doc_data:
-            status_enum = None
-            if doc_data.get("status"):
-                try:
-                    status_enum = SalesDocumentStatus(doc_data["status"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid sales status '%s' in DB for doc ID %s",
-                        doc_data["status"],
-                        doc_id,
-                    )
-
-            doc_type_enum = None
-            if doc_data.get("document_type"):
-                try:
-                    doc_type_enum = SalesDocumentType(doc_data["document_type"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid sales document type '%s' in DB for doc ID %s",
-                        doc_data["document_type"],
-                        doc_id,
-                    )
-
-            return SalesDocument(
-                doc_id=doc_data["id"],
-                document_number=doc_data["document_number"],
-                customer_id=doc_data["customer_id"],
-                document_type=doc_type_enum,
-                created_date=doc_data["created_date"],
-                expiry_date=doc_data.get("expiry_date"),
-                due_date=doc_data.get("due_date"),
-                status=status_enum,
-                notes=doc_data.get("notes"),
-                reference_number=doc_data.get("reference_number"),
-                subtotal=doc_data.get("subtotal"),
-                taxes=doc_data.get("taxes"),
-                total_amount=doc_data.get("total_amount"),
-                related_quote_id=doc_data.get("related_quote_id"),
-                is_active=bool(doc_data.get("is_active", True)),
-            )
+            return self._document_from_row(doc_data)
         return None
 
+    @staticmethod
+    def _document_from_row(doc_data: dict) -> SalesDocument:
+        status_enum = None
+        if doc_data.get("status"):
+            try:
+                status_enum = SalesDocumentStatus(doc_data["status"])
+            except ValueError:
+                logger.warning(
+                    "Invalid sales status '%s' in DB for doc ID %s",
+                    doc_data["status"],
+                    doc_data["id"],
+                )
+
+        doc_type_enum = None
+        if doc_data.get("document_type"):
+            try:
+                doc_type_enum = SalesDocumentType(doc_data["document_type"])
+            except ValueError:
+                logger.warning(
+                    "Invalid sales document type '%s' in DB for doc ID %s",
+                    doc_data["document_type"],
+                    doc_data["id"],
+                )
+
+        return SalesDocument(
+            doc_id=doc_data["id"],
+            document_number=doc_data["document_number"],
+            customer_id=doc_data["customer_id"],
+            document_type=doc_type_enum,
+            created_date=doc_data["created_date"],
+            expiry_date=doc_data.get("expiry_date"),
+            due_date=doc_data.get("due_date"),
+            status=status_enum,
+            notes=doc_data.get("notes"),
+            reference_number=doc_data.get("reference_number"),
+            subtotal=doc_data.get("subtotal"),
+            taxes=doc_data.get("taxes"),
+            total_amount=doc_data.get("total_amount"),
+            related_quote_id=doc_data.get("related_quote_id"),
+            is_active=bool(doc_data.get("is_active", True)),
+        )
+
     def get_all_sales_documents_by_criteria(
         self,
         customer_id: int = None,
@@ -461,49 +478,23 @@ class SalesLogic:
             status=status_value,
             is_active=is_active,
         )
-        result_list = []
-        for doc_data in docs_data:
-            status_enum = None
-            if doc_data.get("status"):
-                try:
-                    status_enum = SalesDocumentStatus(doc_data["status"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid sales status '%s' in DB for doc ID %s",
-                        doc_data["status"],
-                        doc_data["id"],
-                    )
-
-            doc_type_enum = None
-            if doc_data.get("document_type"):
-                try:
-                    doc_type_enum = SalesDocumentType(doc_data["document_type"])
-                except ValueError:
-                    logger.warning(
-                        "Invalid sales document type '%s' in DB for doc ID %s",
-                        doc_data["document_type"],
-                        doc_data["id"],
-                    )
-
-            result_list.append(
-                SalesDocument(
-                    doc_id=doc_data["id"],
-                    document_number=doc_data["document_number"],
-                    customer_id=doc_data["customer_id"],
-                    document_type=doc_type_enum,
-                    created_date=doc_data["created_date"],
-                    expiry_date=doc_data.get("expiry_date"),
-                    due_date=doc_data.get("due_date"),
-                    status=status_enum,
-                    notes=doc_data.get("notes"),
-                    subtotal=doc_data.get("subtotal"),
-                    taxes=doc_data.get("taxes"),
-                    total_amount=doc_data.get("total_amount"),
-                    related_quote_id=doc_data.get("related_quote_id"),
-                    is_active=bool(doc_data.get("is_active", True)),
-                )
-            )
-        return result_list
+        return [self._document_from_row(doc_data) for doc_data in docs_data]
+
+    def get_sales_documents_page(
+        self,
+        filters: Optional[dict] = None,
+        sort_key: str = "-created_date",
+        after: Optional[tuple] = None,
+        limit: int = 100,
+    ) -> tuple[List[SalesDocument], Optional[tuple]]:
+        """Return one keyset-paginated page of sales documents and the next cursor.
+
+        Filter values may be enums; they are stored by value.
+        """
+        filters = {key: value.value if isinstance(value, Enum) else value
+                   for key, value in (filters or {}).items()}
+        docs_data, next_cursor = self.sales_repo.get_sales_documents_page(filters, sort_key, after, limit)
+        return [self._document_from_row(doc_data) for doc_data in docs_data], next_cursor
 
     def get_items_for_sales_document(self, doc_id: int) -> List[SalesDocumentItem]:
         items_data = self.sales_repo.get_items_for_sales_document(doc_id)
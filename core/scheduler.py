@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.render_queue import RenderQueue
+from core.sales_logic import SalesLogic
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class JobResult:
+    """Outcome of one run of a scheduled job."""
+
+    name: str
+    rows_changed: int
+    elapsed_ms: float
+    finished_at: float
+    error: Optional[str] = None
+
+
+@dataclass
+class _Job:
+    name: str
+    func: Callable[[DatabaseHandler], int]
+    interval_seconds: float
+    next_run: float = 0.0
+
+
+class BackgroundScheduler:
+    """Run periodic maintenance jobs on a daemon thread.
+
+    SQLite connections cannot be shared across threads, so the worker opens
+    its own :class:`DatabaseHandler` through ``db_factory`` and passes it to
+    every job. A job returns the number of rows it changed; the scheduler
+    times each run, logs it and keeps the latest :class:`JobResult` per job.
+    """
+
+    def __init__(self, db_factory: Callable[[], DatabaseHandler] = DatabaseHandler,
+                 poll_seconds: float = 1.0):
+        self.db_factory = db_factory
+        self.poll_seconds = poll_seconds
+        self.last_results: Dict[str, JobResult] = {}
+        self._jobs: List[_Job] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def add_job(self, name: str, func: Callable[[DatabaseHandler], int],
+                interval_seconds: float) -> None:
+        """Register ``func`` to run every ``interval_seconds``, first run immediately."""
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive.")
+        with self._lock:
+            self._jobs.append(_Job(name, func, interval_seconds))
+
+    def run_pending(self, db: DatabaseHandler, now: Optional[float] = None) -> List[JobResult]:
+        """Run every job whose next run time has passed and return their results."""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = [job for job in self._jobs if job.next_run <= now]
+        results = []
+        for job in due:
+            results.append(self._run_job(job, db))
+            job.next_run = now + job.interval_seconds
+        return results
+
+    def _run_job(self, job: _Job, db: DatabaseHandler) -> JobResult:
+        start = time.perf_counter()
+        error = None
+        rows_changed = 0
+        try:
+            rows_changed = job.func(db) or 0
+        except Exception as exc:  # A failing job must not kill the worker thread.
+            error = str(exc)
+            logger.exception("Scheduled job '%s' failed", job.name)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        result = JobResult(job.name, rows_changed, elapsed_ms, time.time(), error)
+        self.last_results[job.name] = result
+        if error is None:
+            logger.info("Scheduled job '%s' changed %d rows in %.1f ms", job.name, rows_changed, elapsed_ms)
+        return result
+
+    def start(self) -> None:
+        """Start the worker thread. Calling start twice is a no-op."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="background-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Ask the worker to finish and wait for it."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        db = self.db_factory()
+        try:
+            while not self._stop.is_set():
+                self.run_pending(db)
+                self._stop.wait(self.poll_seconds)
+        finally:
+            db.close()
+
+
+def overdue_task_job(db: DatabaseHandler) -> int:
+    """Scheduled job flipping past-due tasks to 'Overdue'."""
+    return AddressBookLogic(db).check_and_update_overdue_tasks()
+
+
+def quote_expiry_job(db: DatabaseHandler) -> int:
+    """Scheduled job expiring draft and sent quotes past their expiry date."""
+    return SalesLogic(db).expire_quotes()
+
+
+def render_queue_job(db: DatabaseHandler) -> int:
+    """Scheduled job rendering the queued document PDFs that are due."""
+    return RenderQueue(db).process_due()
@@ -77,3 +77,7 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             FOREIGN KEY (account_id) REFERENCES accounts (id) ON DELETE CASCADE
         )
     """)
+
+    # Keyset pagination indexes: (sort column, id) in list order.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_name ON accounts (name, id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts (name, id)")
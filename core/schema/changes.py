@@ -0,0 +1,39 @@
+import sqlite3
+
+# Tables whose writes bump a counter in ``table_changes``. Readers compare
+# counters to tell whether anything they display may have changed without
+# re-running their queries; triggers fire for every connection.
+TRACKED_TABLES = (
+    "products",
+    "product_prices",
+    "sales_documents",
+    "sales_document_items",
+    "purchase_documents",
+    "purchase_document_items",
+    "purchase_receipts",
+    "inventory_transactions",
+    "render_jobs",
+)
+
+
+def create_schema(cursor: sqlite3.Cursor) -> None:
+    """Create the per-table change counters and the triggers bumping them."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS table_changes (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    cursor.executemany(
+        "INSERT OR IGNORE INTO table_changes (table_name, version) VALUES (?, 0)",
+        [(table,) for table in TRACKED_TABLES],
+    )
+    for table in TRACKED_TABLES:
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE")):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_changes_{suffix}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_changes SET version = version + 1 WHERE table_name = '{table}';
+                END;
+            """)
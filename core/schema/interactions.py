@@ -29,3 +29,13 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE interactions SET updated_at = CURRENT_TIMESTAMP WHERE interaction_id = OLD.interaction_id;
         END;
     """)
+
+    # Timeline indexes for keyset pagination, newest first per account/contact.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_interactions_company_date
+        ON interactions (company_id, date_time DESC, interaction_id DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_interactions_contact_date
+        ON interactions (contact_id, date_time DESC, interaction_id DESC)
+    """)
@@ -57,3 +57,9 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE purchase_orders SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
         END;
     """)
+
+    # On-order aggregates sum PURCHASE_ORDER transactions per product.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_inventory_transactions_type_product
+        ON inventory_transactions (transaction_type, product_id, quantity_change)
+    """)
@@ -16,10 +16,29 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             name TEXT NOT NULL,
             parent_id INTEGER,
             description TEXT,
+            full_path TEXT,
             FOREIGN KEY (parent_id) REFERENCES product_categories(id)
         )
     """)
 
+    # Closure table holding every (ancestor, descendant) pair of the category
+    # tree, including the zero-depth self reference of each category.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS product_category_closure (
+            ancestor_id INTEGER NOT NULL,
+            descendant_id INTEGER NOT NULL,
+            depth INTEGER NOT NULL,
+            PRIMARY KEY (ancestor_id, descendant_id),
+            FOREIGN KEY (ancestor_id) REFERENCES product_categories(id) ON DELETE CASCADE,
+            FOREIGN KEY (descendant_id) REFERENCES product_categories(id) ON DELETE CASCADE
+        )
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_category_closure_descendant
+        ON product_category_closure (descendant_id, depth)
+    """)
+
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS products (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -92,3 +111,6 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE products SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
         END;
     """)
+
+    # Keyset pagination index for the product list, sorted by name.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_products_name ON products (name, id)")
@@ -73,3 +73,18 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE purchase_receipts SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
         END;
     """)
+
+    # Keyset pagination index for the document list, newest first.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_purchase_documents_created
+        ON purchase_documents (created_date, id)
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_purchase_document_items_document
+        ON purchase_document_items (purchase_document_id)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_purchase_receipts_item
+        ON purchase_receipts (purchase_document_item_id)
+    """)
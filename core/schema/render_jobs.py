@@ -0,0 +1,30 @@
+import sqlite3
+
+
+def create_schema(cursor: sqlite3.Cursor) -> None:
+    """Create the persistent queue of document PDFs waiting to be rendered."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS render_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kind TEXT NOT NULL,
+            document_id INTEGER NOT NULL,
+            label TEXT,
+            output_path TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'Queued',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            next_attempt_at TEXT NOT NULL,
+            last_error TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # The worker picks the oldest due job among the queued ones. The
+    # predicate must match the literal WHERE clause of
+    # DatabaseHandler.claim_render_job for SQLite to use it.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_render_jobs_due
+        ON render_jobs (next_attempt_at, id)
+        WHERE status = 'Queued'
+    """)
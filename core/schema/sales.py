@@ -58,6 +58,14 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             "ALTER TABLE sales_document_items ADD COLUMN is_shipped BOOLEAN DEFAULT FALSE"
         )
 
+    # Partial index for the quote expiry sweep; the predicate must match the
+    # literal WHERE clause of DatabaseHandler.expire_quotes.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sales_documents_open_quote_expiry
+        ON sales_documents (expiry_date)
+        WHERE document_type = 'Quote' AND status IN ('Quote Draft', 'Quote Sent')
+    """)
+
     cursor.execute("""
         CREATE TRIGGER IF NOT EXISTS update_sales_documents_updated_at
         AFTER UPDATE ON sales_documents
@@ -75,3 +83,15 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE sales_document_items SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
         END;
     """)
+
+    # Keyset pagination index for the document list, newest first.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sales_documents_created
+        ON sales_documents (created_date, id)
+    """)
+
+    # Lines are fetched per document, one at a time or for all open orders.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sales_document_items_document
+        ON sales_document_items (sales_document_id)
+    """)
@@ -0,0 +1,106 @@
+import sqlite3
+
+# Each indexed source row is stored under rowid ``source_id * KIND_SLOTS +
+# kind_code`` so triggers can replace or drop a row by rowid instead of
+# scanning the full-text table.
+KIND_SLOTS = 8
+
+# kind -> (code, table, primary key, title columns, body columns).
+SEARCH_SOURCES = {
+    "account": (1, "accounts", "id", ("name",), ("phone", "email", "website", "description")),
+    "contact": (2, "contacts", "id", ("name",), ("email", "phone", "role")),
+    "product": (3, "products", "id", ("sku", "name"), ("description",)),
+    "sales_document": (4, "sales_documents", "id", ("document_number",), ("reference_number", "notes")),
+    "purchase_document": (5, "purchase_documents", "id", ("document_number",), ("notes",)),
+    "interaction": (6, "interactions", "interaction_id", ("subject",), ("description",)),
+}
+
+# Tables whose rows are hidden by clearing ``is_active``; such rows are kept
+# out of the index so search only returns what the tabs can show.
+SOFT_DELETE_TABLES = ("products", "sales_documents", "purchase_documents")
+
+
+def _rowid(code: int, alias: str, pk: str) -> str:
+    return f"{alias}.{pk} * {KIND_SLOTS} + {code}"
+
+
+def _text(alias: str, columns, available=None) -> str:
+    parts = [
+        f"ifnull({alias}.{column}, '')" if available is None or column in available else "''"
+        for column in columns
+    ]
+    return " || ' ' || ".join(parts)
+
+
+def _insert_sql(kind: str, alias: str, available=None, source: str = "") -> str:
+    code, table, pk, title_columns, body_columns = SEARCH_SOURCES[kind]
+    active = table in SOFT_DELETE_TABLES and (available is None or "is_active" in available)
+    return f"""
+        INSERT INTO search_index (rowid, title, body, kind, source_id)
+        SELECT {_rowid(code, alias, pk)}, {_text(alias, title_columns, available)},
+               {_text(alias, body_columns, available)}, '{kind}', {alias}.{pk}
+        {source} {f"WHERE {alias}.is_active IS NOT 0" if active else ""}
+    """
+
+
+def create_schema(cursor: sqlite3.Cursor) -> None:
+    """Create the full-text search index and the triggers keeping it in sync."""
+    cursor.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5 (
+            title,
+            body,
+            kind UNINDEXED,
+            source_id UNINDEXED,
+            tokenize = 'unicode61 remove_diacritics 2',
+            prefix = '2 3'
+        )
+    """)
+
+    for kind, (code, table, pk, title_columns, body_columns) in SEARCH_SOURCES.items():
+        # Only edits to indexed columns re-index the row, so the updated_at
+        # triggers on the source tables do not cause a second rewrite.
+        watched = ", ".join(title_columns + body_columns
+                            + (("is_active",) if table in SOFT_DELETE_TABLES else ()))
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ai
+            AFTER INSERT ON {table}
+            BEGIN
+                {_insert_sql(kind, 'NEW')};
+            END;
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_au
+            AFTER UPDATE OF {watched} ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = {_rowid(code, 'OLD', pk)};
+                {_insert_sql(kind, 'NEW')};
+            END;
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_search_ad
+            AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM search_index WHERE rowid = {_rowid(code, 'OLD', pk)};
+            END;
+        """)
+
+
+def rebuild_search_index(cursor: sqlite3.Cursor) -> None:
+    """Repopulate ``search_index`` from the source tables.
+
+    Columns missing from an older table layout are indexed as empty text.
+    """
+    cursor.execute("DELETE FROM search_index")
+    for kind, (_code, table, *_rest) in SEARCH_SOURCES.items():
+        cursor.execute(f"PRAGMA table_info({table})")
+        available = {row[1] for row in cursor.fetchall()}
+        if available:
+            cursor.execute(_insert_sql(kind, "src", available, source=f"FROM {table} AS src"))
+
+
+def recreate_triggers(cursor: sqlite3.Cursor) -> None:
+    """Replace the index triggers with the current definitions."""
+    for _code, table, *_rest in SEARCH_SOURCES.values():
+        for suffix in ("ai", "au", "ad"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {table}_search_{suffix}")
+    create_schema(cursor)
@@ -33,3 +33,15 @@ def create_schema(cursor: sqlite3.Cursor) -> None:
             UPDATE tasks SET updated_at = CURRENT_TIMESTAMP WHERE task_id = OLD.task_id;
         END;
     """)
+
+    # Partial index covering only the tasks the overdue sweep can still flip.
+    # The predicate must match the literal WHERE clause of
+    # DatabaseHandler.mark_overdue_tasks for SQLite to use it.
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_tasks_open_due_date
+        ON tasks (due_date)
+        WHERE is_deleted = 0 AND status NOT IN ('Completed', 'Overdue')
+    """)
+
+    # Keyset pagination index for the task list, sorted by due date.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date, task_id)")
@@ -1,10 +1,14 @@
 import sqlite3
 from typing import Callable, Dict
 
+from ..category_tree import rebuild_category_closure
+from .search import rebuild_search_index, recreate_triggers
+
 
 # The current schema version of the application.  Increment this whenever a
-# backwards compatible migration is added below.
-SCHEMA_VERSION = 2
+# backwards compatible migration is added below.  Changes to the DDL in the
+# schema modules are picked up through the fingerprint's hash instead.
+SCHEMA_VERSION = 6
 
 
 def ensure_version_table(cursor: sqlite3.Cursor) -> None:
@@ -38,6 +42,43 @@ def get_current_version(cursor: sqlite3.Cursor) -> int:
     return row[0] if row and row[0] is not None else 0
 
 
+def fingerprint_matches(cursor: sqlite3.Cursor, ddl_hash: str,
+                        target_version: int = SCHEMA_VERSION) -> bool:
+    """Return True when the stored fingerprint equals ``(target_version, ddl_hash)``.
+
+    This is the only query an up-to-date database needs on startup.  A
+    database without the fingerprint table (new, or older than it) does not
+    match.
+    """
+
+    try:
+        cursor.execute("SELECT version, ddl_hash FROM schema_fingerprint WHERE id = 1")
+    except sqlite3.OperationalError:
+        return False
+    row = cursor.fetchone()
+    return row is not None and tuple(row) == (target_version, ddl_hash)
+
+
+def store_fingerprint(cursor: sqlite3.Cursor, ddl_hash: str,
+                      target_version: int = SCHEMA_VERSION) -> None:
+    """Record that the schema matching ``ddl_hash`` is at ``target_version``."""
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_fingerprint (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            version INTEGER NOT NULL,
+            ddl_hash TEXT NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(
+        "INSERT OR REPLACE INTO schema_fingerprint (id, version, ddl_hash) VALUES (1, ?, ?)",
+        (target_version, ddl_hash),
+    )
+
+
 def _column_exists(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
     cursor.execute(f"PRAGMA table_info({table})")
     return any(row[1] == column for row in cursor.fetchall())
@@ -73,10 +114,50 @@ def _migrate_to_2(cursor: sqlite3.Cursor) -> None:
     )
 
 
+def _migrate_to_3(cursor: sqlite3.Cursor) -> None:
+    """Migration to schema version 3.
+
+    Version 3 caches each category's ``full_path`` and keeps the category tree
+    in the ``product_category_closure`` table. Both are backfilled from the
+    existing ``parent_id`` links.
+    """
+
+    _add_column_if_missing(cursor, "product_categories", "full_path", "TEXT")
+    rebuild_category_closure(cursor)
+
+
+def _migrate_to_4(cursor: sqlite3.Cursor) -> None:
+    """Migration to schema version 4.
+
+    Version 4 adds the ``search_index`` full-text table. Triggers keep it in
+    sync from now on; existing rows are indexed here.
+    """
+
+    rebuild_search_index(cursor)
+
+
+# Version 5 adds the ``table_changes`` counters and the inventory work queue
+# indexes.  ``create_tables`` creates both and the counters start at zero, so
+# it needs no migration function.
+
+def _migrate_to_6(cursor: sqlite3.Cursor) -> None:
+    """Migration to schema version 6.
+
+    Version 6 keeps inactive products and documents out of ``search_index``.
+    The existing triggers are replaced and the index is rebuilt without them.
+    """
+
+    recreate_triggers(cursor)
+    rebuild_search_index(cursor)
+
+
 # Mapping of schema version -> migration function.  Each migration upgrades the
 # database *from* the previous version *to* the specified version.
 MIGRATIONS: Dict[int, Callable[[sqlite3.Cursor], None]] = {
     2: _migrate_to_2,
+    3: _migrate_to_3,
+    4: _migrate_to_4,
+    6: _migrate_to_6,
 }
 
 
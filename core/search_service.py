@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from core.repositories import SearchRepository
+from core.schema.search import SEARCH_SOURCES
+
+SEARCH_KINDS = tuple(SEARCH_SOURCES)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@dataclass
+class SearchResult:
+    """One ranked hit from the global search index."""
+
+    kind: str
+    id: int
+    title: str
+    snippet: str
+    rank: float
+
+
+def build_match_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching every word as a prefix.
+
+    Words are quoted so that FTS5 operators and punctuation typed by the user
+    are treated as plain text.
+    """
+    return " ".join(f'"{token}"*' for token in _TOKEN_RE.findall(text))
+
+
+class SearchService:
+    """Ranked full-text search across accounts, contacts, products, documents and interactions."""
+
+    def __init__(self, repo: SearchRepository):
+        self.repo = repo
+
+    def search(
+        self, query: str, kinds: Optional[Iterable[str]] = None, limit: int = 20
+    ) -> List[SearchResult]:
+        """Return up to ``limit`` hits for ``query``, best match first.
+
+        ``kinds`` restricts the result to some of :data:`SEARCH_KINDS`.
+        """
+        kinds = list(kinds) if kinds else None
+        unknown = set(kinds or ()) - set(SEARCH_KINDS)
+        if unknown:
+            raise ValueError(f"Unknown search kinds: {', '.join(sorted(unknown))}")
+        match = build_match_query(query or "")
+        if not match:
+            return []
+        return [
+            SearchResult(
+                kind=row["kind"],
+                id=row["source_id"],
+                title=row["title"],
+                snippet=row["snippet"],
+                rank=row["rank"],
+            )
+            for row in self.repo.search(match, kinds, limit)
+        ]
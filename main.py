@@ -2,6 +2,9 @@ import tkinter as tk
 from ui.main_view import AddressBookView
 from core.address_book_logic import AddressBookLogic
 from core.database import DatabaseHandler
+from core.preferences import load_preferences
+from core.render_queue import RenderQueue
+from core.scheduler import BackgroundScheduler, overdue_task_job, quote_expiry_job, render_queue_job
 from shared.logging_config import setup_logging
 
 if __name__ == '__main__':
@@ -13,11 +16,23 @@ if __name__ == '__main__':
     db_handler = DatabaseHandler()
     logic = AddressBookLogic(db_handler)
 
+    # Periodic maintenance runs on its own thread and database connection
+    prefs = load_preferences()
+    scheduler = BackgroundScheduler()
+    scheduler.add_job("overdue_tasks", overdue_task_job, prefs['overdue_task_sweep_minutes'] * 60)
+    scheduler.add_job("quote_expiry", quote_expiry_job, prefs['quote_expiry_sweep_minutes'] * 60)
+    # Exports interrupted by the last shutdown are picked up again.
+    RenderQueue(db_handler).recover()
+    scheduler.add_job("render_queue", render_queue_job, prefs['render_queue_poll_seconds'])
+    scheduler.start()
+
     # Setup main Tkinter window and application view
     root = tk.Tk()
     # Pass logic to the main view, AddressBookView will need to be updated to accept it
     app = AddressBookView(root, logic)
     root.mainloop()
+    app.loader.stop()
+    scheduler.stop()
 
     # Close database connection when the application exits
     # This might cause an error if root.mainloop() exits and db_handler is already closed by AddressBookView
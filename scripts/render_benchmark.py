@@ -0,0 +1,129 @@
+"""Time rendering a long document with the spec-driven PDF renderer.
+
+Builds a synthetic 2,000-line invoice and renders it twice: with
+``core.pdf_generator.build_pdf`` and with the per-line ``multi_cell`` table
+loop the generators used before, which is kept here as the baseline.
+
+    python scripts/render_benchmark.py --lines 2000 --runs 3
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Ensure project root is on the path for absolute imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.pdf_generator import (
+    LAYOUTS,
+    PDF,
+    DocumentContent,
+    LineRow,
+    PartyBlock,
+    build_pdf,
+    pdf_bytes,
+)
+
+_WORDS = ("bracket", "stainless", "assembly", "hinge", "fitted", "industrial", "coated", "panel")
+
+
+def sample_content(lines: int) -> DocumentContent:
+    """An invoice with ``lines`` items whose descriptions wrap to 1-3 lines."""
+    rows = []
+    for number in range(lines):
+        description = " ".join(_WORDS[(number + i) % len(_WORDS)] for i in range(4 + number % 20))
+        note = "Deliver to dock 4" if number % 7 == 0 else None
+        row = [("B", f"Product {number % 250}"), ("", description)]
+        if note:
+            row.append(("I", note))
+        rows.append(LineRow(row, ["2.00", "$10.00", "$20.00"]))
+    return DocumentContent(
+        title="Invoice",
+        number="INV-BENCH",
+        company_name="Benchmark Co",
+        company_lines=["1 Main St", "Springfield, IL 62701"],
+        dates=["Date: 2026-09-01"],
+        parties=[PartyBlock("Shipping Address:", ["Cust", "2 Side St"]),
+                 PartyBlock("Billing Address:", ["Cust", "2 Side St"])],
+        tables=[rows],
+        subtotal=lines * 20.0,
+    )
+
+
+def render_spec(content: DocumentContent) -> bytes:
+    return pdf_bytes(build_pdf(LAYOUTS["invoice"], content))
+
+
+def render_legacy(content: DocumentContent) -> bytes:
+    """The line item loop as the generators wrote it before the shared renderer."""
+    pdf = PDF(document_number=content.number, company_name=content.company_name,
+              company_billing_address_lines=content.company_lines, document_type=content.title)
+    pdf.alias_nb_pages()
+    pdf.add_page()
+    line_height = 7
+    col_width_full = pdf.w - 2 * pdf.l_margin
+    desc_col = col_width_full * 0.50
+    qty_col = col_width_full * 0.10
+    price_col = col_width_full * 0.20
+    total_col = col_width_full * 0.20
+    pdf.set_font("Arial", "B", 10)
+    pdf.set_fill_color(220, 220, 220)
+    pdf.cell(desc_col, line_height, "Product/Service Description", 1, 0, "C", 1)
+    pdf.cell(qty_col, line_height, "Qty", 1, 0, "C", 1)
+    pdf.cell(price_col, line_height, "Unit Price", 1, 0, "C", 1)
+    pdf.cell(total_col, line_height, "Line Total", 1, 1, "C", 1)
+    for row in content.tables[0]:
+        start_x = pdf.get_x()
+        start_y = pdf.get_y()
+        lines = row.description
+        for idx, (style, text) in enumerate(lines):
+            border = "LTR" if idx == 0 else ("LBR" if idx == len(lines) - 1 else "LR")
+            pdf.set_font("Arial", style, 9)
+            pdf.multi_cell(desc_col, 5, text, border, "L")
+            pdf.set_x(start_x)
+        end_y_desc = pdf.get_y()
+        pdf.set_xy(start_x + desc_col, start_y)
+        pdf.set_font("Arial", "", 9)
+        quantity, price, total = row.values
+        pdf.cell(qty_col, end_y_desc - start_y, quantity, 1, 0, "R")
+        pdf.cell(price_col, end_y_desc - start_y, price, 1, 0, "R")
+        pdf.cell(total_col, end_y_desc - start_y, total, 1, 0, "R")
+        pdf.ln(end_y_desc - start_y)
+    return pdf_bytes(pdf)
+
+
+def time_render(render, content: DocumentContent, runs: int) -> float:
+    """Median seconds of ``runs`` renders of ``content``."""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        render(content)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def run(lines: int = 2000, runs: int = 3) -> dict:
+    content = sample_content(lines)
+    spec = time_render(render_spec, content, runs)
+    legacy = time_render(render_legacy, content, runs)
+    return {"lines": lines, "spec": spec, "legacy": legacy, "speedup": legacy / spec}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PDF renderer on a long document.")
+    parser.add_argument("--lines", type=int, default=2000, help="Line items in the document.")
+    parser.add_argument("--runs", type=int, default=3, help="Renders per variant (median reported).")
+    args = parser.parse_args(argv)
+
+    result = run(args.lines, args.runs)
+    print(f"{result['lines']} lines")
+    print(f"  per-line multi_cell loop: {result['legacy'] * 1000:8.1f} ms")
+    print(f"  spec-driven renderer:     {result['spec'] * 1000:8.1f} ms")
+    print(f"  speedup:                  {result['speedup']:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
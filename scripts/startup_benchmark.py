@@ -0,0 +1,94 @@
+"""Time application startup against a cold and a warm database.
+
+The cold run opens a brand new database file, so the whole schema is created
+and migrated. The warm run reopens that file, which only has to confirm the
+schema is current. When a display is available the main window is built as
+well, which constructs just the first tab.
+
+    python scripts/startup_benchmark.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Ensure project root is on the path for absolute imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+
+
+def time_startup(db_path: str, build_view: bool = True) -> dict:
+    """Open ``db_path`` the way ``main.py`` does and return timings in seconds.
+
+    ``init`` is the handler's schema setup timing, including whether it took
+    the fast path. ``view`` is None when the main window was not built,
+    either because ``build_view`` is False or because no display is available.
+    """
+    started = time.perf_counter()
+    db = DatabaseHandler(db_path)
+    database = time.perf_counter() - started
+    try:
+        view = _time_view(db) if build_view else None
+    finally:
+        db.close()
+    return {"database": database, "init": db.init_timing, "view": view}
+
+
+def _time_view(db):
+    import tkinter as tk
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    try:
+        from ui.main_view import AddressBookView
+
+        started = time.perf_counter()
+        app = AddressBookView(root, AddressBookLogic(db))
+        root.update_idletasks()
+        elapsed = time.perf_counter() - started
+        app.loader.stop()
+        return elapsed
+    finally:
+        root.destroy()
+
+
+def run(runs: int = 5, build_view: bool = True) -> dict:
+    """Return the cold and warm timings of ``runs`` startups each."""
+    results = {"cold": [], "warm": []}
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "startup.db")
+            results["cold"].append(time_startup(path, build_view))
+            results["warm"].append(time_startup(path, build_view))
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--no-view", action="store_true", help="time the database only")
+    args = parser.parse_args(argv)
+
+    results = run(args.runs, build_view=not args.no_view)
+    for phase in ("cold", "warm"):
+        paths = sorted({r["init"]["path"] for r in results[phase]})
+        print(f"{phase:>4} schema setup took the {'/'.join(paths)} path")
+    for phase in ("cold", "warm"):
+        for part in ("database", "view"):
+            samples = [r[part] for r in results[phase] if r[part] is not None]
+            if samples:
+                print(f"{phase:>4} {part:<8} median {statistics.median(samples) * 1000:8.1f} ms"
+                      f"  max {max(samples) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
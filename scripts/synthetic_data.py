@@ -0,0 +1,755 @@
+"""Generate a large, reproducible CRM database for benchmarks.
+
+``sandbox_data.py`` adds a handful of records through the application, one
+committed call at a time. This script writes straight to a new database file
+instead: the schema is created by :class:`DatabaseHandler`, then every table
+is filled with bulk ``executemany`` inserts inside one transaction per phase,
+with secondary indexes and triggers dropped until the load is done. Values
+come from seeded random streams, so the same counts and ``--seed`` always
+produce the same data:
+
+* product popularity and account activity follow a Zipf distribution, so a
+  few products and customers dominate sales lines, receipts and interactions;
+* document statuses follow a realistic mix, and open documents (draft quotes,
+  open orders, unpaid invoices, issued POs) are dated in the last 90 days;
+* shipments and receipts post the matching inventory transactions, and each
+  product gets an opening balance so ``quantity_on_hand`` equals its ledger.
+
+    python scripts/synthetic_data.py --out benchmark.db
+    python scripts/synthetic_data.py --out small.db --scale 0.01 --seed 7
+"""
+
+import argparse
+import contextlib
+import datetime
+import itertools
+import os
+import random
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass, fields, replace
+
+# Ensure project root is on the path for absolute imports
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.category_tree import rebuild_category_closure
+from core.database import DatabaseHandler
+from core.schema.search import rebuild_search_index
+from shared.structs import (
+    AccountType,
+    InteractionType,
+    InventoryTransactionType,
+    PurchaseDocumentStatus,
+    SalesDocumentStatus,
+    SalesDocumentType,
+)
+
+DEFAULT_SEED = 1
+BATCH_SIZE = 50_000
+# Fixed dates keep the output independent of the day the script runs.
+END_DATE = datetime.date(2026, 6, 30)
+HISTORY_DAYS = 3 * 365
+RECENT_DAYS = 90
+ZIPF_EXPONENT = 1.1
+USERS = 25
+
+SALE = InventoryTransactionType.SALE.value
+PURCHASE = InventoryTransactionType.PURCHASE.value
+ADJUSTMENT = InventoryTransactionType.ADJUSTMENT.value
+ON_ORDER = InventoryTransactionType.PURCHASE_ORDER.value
+
+# Every 20th account slot: vendors at 1, 8 and 15, a contact-only account at
+# 19, customers everywhere else (80%). Slot 0 and 1 make sure even tiny runs
+# have a customer and a vendor.
+VENDOR_SLOTS = {1, 8, 15}
+CONTACT_SLOTS = {19}
+
+SALES_TYPE_WEIGHTS = {
+    SalesDocumentType.QUOTE: 30,
+    SalesDocumentType.SALES_ORDER: 25,
+    SalesDocumentType.INVOICE: 45,
+}
+SALES_STATUS_WEIGHTS = {
+    SalesDocumentType.QUOTE: {
+        SalesDocumentStatus.QUOTE_DRAFT: 10,
+        SalesDocumentStatus.QUOTE_SENT: 20,
+        SalesDocumentStatus.QUOTE_ACCEPTED: 35,
+        SalesDocumentStatus.QUOTE_REJECTED: 15,
+        SalesDocumentStatus.QUOTE_EXPIRED: 20,
+    },
+    SalesDocumentType.SALES_ORDER: {
+        SalesDocumentStatus.SO_OPEN: 15,
+        SalesDocumentStatus.SO_FULFILLED: 25,
+        SalesDocumentStatus.SO_CLOSED: 60,
+    },
+    SalesDocumentType.INVOICE: {
+        SalesDocumentStatus.INVOICE_DRAFT: 5,
+        SalesDocumentStatus.INVOICE_SENT: 10,
+        SalesDocumentStatus.INVOICE_PARTIALLY_PAID: 5,
+        SalesDocumentStatus.INVOICE_PAID: 70,
+        SalesDocumentStatus.INVOICE_VOID: 3,
+        SalesDocumentStatus.INVOICE_OVERDUE: 7,
+    },
+}
+OPEN_SALES_STATUSES = {
+    SalesDocumentStatus.QUOTE_DRAFT,
+    SalesDocumentStatus.QUOTE_SENT,
+    SalesDocumentStatus.SO_OPEN,
+    SalesDocumentStatus.INVOICE_DRAFT,
+    SalesDocumentStatus.INVOICE_SENT,
+    SalesDocumentStatus.INVOICE_PARTIALLY_PAID,
+    SalesDocumentStatus.INVOICE_OVERDUE,
+}
+PURCHASE_STATUS_WEIGHTS = {
+    PurchaseDocumentStatus.RFQ: 10,
+    PurchaseDocumentStatus.QUOTED: 10,
+    PurchaseDocumentStatus.PO_ISSUED: 20,
+    PurchaseDocumentStatus.RECEIVED: 25,
+    PurchaseDocumentStatus.CLOSED: 35,
+}
+OPEN_PURCHASE_STATUSES = {
+    PurchaseDocumentStatus.RFQ,
+    PurchaseDocumentStatus.QUOTED,
+    PurchaseDocumentStatus.PO_ISSUED,
+}
+# Ledger rows not tied to a generated document.
+LEDGER_TYPE_WEIGHTS = {SALE: 55, PURCHASE: 30, ADJUSTMENT: 15}
+INTERACTION_TYPE_WEIGHTS = {
+    InteractionType.EMAIL: 45,
+    InteractionType.CALL: 30,
+    InteractionType.MEETING: 12,
+    InteractionType.VISIT: 8,
+    InteractionType.OTHER: 5,
+}
+
+PRICING_RULES = [("Standard Markup", 20.0, None), ("Premium Markup", 35.0, None),
+                 ("Wholesale", 10.0, None), ("Flat Handling", None, 5.0)]
+PAYMENT_TERMS = [("Due on Receipt", 0), ("Net 15", 15), ("Net 30", 30), ("Net 45", 45), ("Net 60", 60)]
+UNITS = ["Each", "Box", "Case", "Pair", "Set", "Kilogram", "Meter", "Liter"]
+CATEGORIES = {
+    "Fasteners": ["Bolts", "Screws", "Nuts", "Washers", "Anchors", "Rivets"],
+    "Electrical": ["Cable", "Connectors", "Switches", "Breakers", "Lighting", "Conduit"],
+    "Plumbing": ["Pipe", "Fittings", "Valves", "Pumps", "Hoses", "Seals"],
+    "Tools": ["Hand Tools", "Power Tools", "Measuring", "Cutting", "Storage", "Accessories"],
+    "Safety": ["Gloves", "Eyewear", "Hearing", "Footwear", "Signage", "First Aid"],
+    "Janitorial": ["Cleaners", "Paper", "Waste", "Mops", "Dispensers", "Absorbents"],
+    "Packaging": ["Boxes", "Tape", "Film", "Labels", "Pallets", "Cushioning"],
+    "Hydraulics": ["Cylinders", "Hose Assemblies", "Couplers", "Filters", "Gauges", "Motors"],
+}
+CITIES = [
+    ("Springfield", "IL", "627"), ("Columbus", "OH", "432"), ("Austin", "TX", "787"),
+    ("Denver", "CO", "802"), ("Portland", "OR", "972"), ("Raleigh", "NC", "276"),
+    ("Madison", "WI", "537"), ("Tucson", "AZ", "857"), ("Albany", "NY", "122"),
+    ("Boise", "ID", "837"), ("Omaha", "NE", "681"), ("Savannah", "GA", "314"),
+]
+STREETS = ["Main", "Oak", "Industrial", "Commerce", "Lake", "Park", "Mill", "River", "Harbor", "Station"]
+STREET_KINDS = ["St", "Ave", "Rd", "Blvd", "Way", "Dr"]
+COMPANY_WORDS = ["Apex", "Summit", "Northern", "Pioneer", "Atlas", "Keystone", "Harbor", "Granite",
+                 "Cedar", "Liberty", "Sterling", "Frontier", "Pacific", "Midwest", "Union", "Eagle"]
+COMPANY_NOUNS = ["Industrial", "Supply", "Manufacturing", "Logistics", "Fabrication", "Foods",
+                 "Construction", "Machining", "Builders", "Distribution", "Energy", "Plastics"]
+COMPANY_SUFFIXES = ["Inc", "LLC", "Co", "Corp", "Group", "Partners"]
+FIRST_NAMES = ["Alex", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Avery", "Quinn", "Jamie",
+               "Robin", "Sam", "Drew", "Kai", "Rowan", "Emery", "Skyler", "Parker", "Reese"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Patel", "Nguyen", "Kowalski", "Okafor", "Silva",
+              "Johnson", "Müller", "Haddad", "Kim", "Rossi", "Novak", "Brown", "Ito"]
+ROLES = ["Purchasing", "Accounts Payable", "Operations", "Owner", "Engineering", "Sales", "Receiving", None]
+PRODUCT_ADJECTIVES = ["Heavy Duty", "Stainless", "Galvanized", "Compact", "Industrial", "Coated",
+                      "Insulated", "Reinforced", "Precision", "Standard", "Premium", "Economy"]
+PRODUCT_SIZES = ["1/4in", "3/8in", "1/2in", "3/4in", "1in", "2in", "Small", "Medium", "Large", "XL"]
+SERVICE_LINES = ["Installation service", "Freight", "Expedite fee", "Custom cutting"]
+INTERACTION_SUBJECTS = {
+    InteractionType.EMAIL: ["Quote follow-up", "Order confirmation", "Invoice question", "Price list request"],
+    InteractionType.CALL: ["Check-in call", "Delivery status", "Credit terms", "Product question"],
+    InteractionType.MEETING: ["Quarterly review", "Contract renewal", "New product line"],
+    InteractionType.VISIT: ["Site visit", "Warehouse walk-through", "Product demo"],
+    InteractionType.OTHER: ["Trade show contact", "Referral", "Web inquiry"],
+}
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Row counts to generate; the defaults are the full benchmark dataset.
+
+    ``sales_lines`` and ``purchase_lines`` are split into documents of a few
+    lines each. ``inventory_transactions`` is the size of the whole ledger,
+    including the rows posted by shipments and receipts and one opening
+    balance per product; it grows to fit those if it is set lower.
+    """
+
+    accounts: int = 50_000
+    contacts: int = 200_000
+    products: int = 100_000
+    sales_lines: int = 1_000_000
+    purchase_lines: int = 200_000
+    inventory_transactions: int = 5_000_000
+    interactions: int = 2_000_000
+
+    def scaled(self, factor: float) -> "Scale":
+        """These counts multiplied by ``factor``, keeping at least the minimum of each."""
+        return Scale(**{
+            f.name: max(_MINIMUMS.get(f.name, 0), round(getattr(self, f.name) * factor))
+            for f in fields(self)
+        })
+
+
+_MINIMUMS = {"accounts": 2, "products": 1}
+
+
+def generate(path: str, scale: Scale = Scale(), seed: int = DEFAULT_SEED, progress=None) -> dict:
+    """Write a new database at ``path`` filled to ``scale``; returns rows per table.
+
+    ``path`` must not exist. ``progress`` is called with a line of text after
+    each table is loaded. The same ``scale`` and ``seed`` always produce the
+    same rows.
+    """
+    for name, minimum in _MINIMUMS.items():
+        if getattr(scale, name) < minimum:
+            raise ValueError(f"{name} must be at least {minimum}.")
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists.")
+
+    DatabaseHandler(path).close()
+    conn = sqlite3.connect(path, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA cache_size = -262144")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        indexes, triggers = _drop_indexes_and_triggers(conn)
+
+        builder = _Builder(conn, scale, seed, progress)
+        builder.run()
+
+        started = time.perf_counter()
+        conn.execute("BEGIN")
+        cursor = conn.cursor()
+        for sql in indexes:
+            cursor.execute(sql)
+        rebuild_category_closure(cursor)
+        rebuild_search_index(cursor)
+        for sql in triggers:
+            cursor.execute(sql)
+        conn.execute("COMMIT")
+        builder.report(f"indexes, triggers and search index rebuilt in {time.perf_counter() - started:.1f}s")
+        conn.execute("PRAGMA journal_mode = DELETE")
+        return builder.counts
+    finally:
+        conn.close()
+
+
+def _drop_indexes_and_triggers(conn: sqlite3.Connection) -> tuple[list[str], list[str]]:
+    """Drop secondary indexes and triggers; returns the SQL to recreate them.
+
+    Indexes backing UNIQUE and PRIMARY KEY constraints have no SQL and stay.
+    """
+    rows = conn.execute(
+        "SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') AND sql IS NOT NULL"
+    ).fetchall()
+    conn.execute("BEGIN")
+    for kind, name, _sql in rows:
+        conn.execute(f'DROP {kind.upper()} "{name}"')
+    conn.execute("COMMIT")
+    return [sql for kind, _name, sql in rows if kind == "index"], [sql for kind, _name, sql in rows if kind == "trigger"]
+
+
+class _Zipf:
+    """Draws ids so that a few are very popular and most are rare.
+
+    Popularity ranks are assigned to ``ids`` in a shuffled order, so the most
+    popular ids are spread over the table rather than being the lowest ones.
+    """
+
+    def __init__(self, rng: random.Random, ids, exponent: float = ZIPF_EXPONENT):
+        self.ids = list(ids)
+        rng.shuffle(self.ids)
+        self.cum_weights = list(itertools.accumulate(
+            1.0 / rank ** exponent for rank in range(1, len(self.ids) + 1)
+        ))
+
+    def __bool__(self) -> bool:
+        return bool(self.ids)
+
+    def draw(self, rng: random.Random) -> int:
+        return rng.choices(self.ids, cum_weights=self.cum_weights)[0]
+
+
+class _Table:
+    """Buffered ``executemany`` inserts into one table."""
+
+    def __init__(self, conn: sqlite3.Connection, name: str, columns: str):
+        names = [column.strip() for column in columns.split(",")]
+        self.conn = conn
+        self.name = name
+        self.sql = f"INSERT INTO {name} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+        self.rows = []
+        self.count = 0
+
+    def add(self, row: tuple) -> None:
+        self.rows.append(row)
+        if len(self.rows) >= BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.rows:
+            self.conn.executemany(self.sql, self.rows)
+            self.count += len(self.rows)
+            self.rows = []
+
+
+def _weighted(weights: dict) -> tuple[list, list]:
+    return list(weights), list(itertools.accumulate(weights.values()))
+
+
+class _Builder:
+    """Generates each phase of the dataset from its own seeded random stream."""
+
+    def __init__(self, conn: sqlite3.Connection, scale: Scale, seed: int, progress=None):
+        self.conn = conn
+        self.scale = scale
+        self.seed = seed
+        self.progress = progress
+        self.counts = {}
+        self.last_day = HISTORY_DAYS - 1
+        self.days = [(END_DATE - datetime.timedelta(days=self.last_day - n)).isoformat()
+                     for n in range(HISTORY_DAYS)]
+        self.next_address_id = 1
+        self.ledger = None
+        self.net_stock = [0.0] * (scale.products + 1)
+
+    def rng(self, name: str) -> random.Random:
+        # String seeds are hashed with SHA-512, so streams do not depend on PYTHONHASHSEED.
+        return random.Random(f"{self.seed}:{name}")
+
+    def report(self, message: str) -> None:
+        if self.progress:
+            self.progress(message)
+
+    @contextlib.contextmanager
+    def phase(self, *tables):
+        """Yield writers for ``(name, columns)`` tables that all commit in one transaction.
+
+        An existing ``_Table`` may be passed instead to flush and commit it too.
+        """
+        started = time.perf_counter()
+        writers = [table if isinstance(table, _Table) else _Table(self.conn, *table) for table in tables]
+        self.conn.execute("BEGIN")
+        yield writers[0] if len(writers) == 1 else writers
+        for writer in writers:
+            writer.flush()
+        self.conn.execute("COMMIT")
+        elapsed = time.perf_counter() - started
+        for writer in writers:
+            self.counts[writer.name] = writer.count
+        self.report(", ".join(f"{w.name}: {w.count:,}" for w in writers) + f" in {elapsed:.1f}s")
+
+    def day(self, rng: random.Random, recent: bool = False) -> int:
+        """Index into ``self.days``: anywhere in the history, or within the last 90 days."""
+        return rng.randint(self.last_day - RECENT_DAYS + 1 if recent else 0, self.last_day)
+
+    def later(self, rng: random.Random, day: int, low: int, high: int) -> int:
+        return min(self.last_day, day + rng.randint(low, high))
+
+    def timestamp(self, rng: random.Random, day: int, sep: str = " ") -> str:
+        seconds = rng.randrange(7 * 3600, 19 * 3600)
+        return f"{self.days[day]}{sep}{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+    def post(self, product_id: int, change: float, kind: str, reference, created_at: str) -> None:
+        """Add a ledger row and track the product's resulting stock."""
+        self.ledger.add((product_id, change, kind, reference, created_at))
+        if kind != ON_ORDER:
+            self.net_stock[product_id] += change
+
+    def run(self) -> None:
+        self.reference_data()
+        self.accounts()
+        self.contacts()
+        self.products()
+        # Shipments and receipts post to the ledger while their documents load;
+        # the inventory phase commits the rest.
+        self.ledger = _Table(self.conn, "inventory_transactions",
+                             "product_id, quantity_change, transaction_type, reference, created_at")
+        self.sales_documents()
+        self.purchase_documents()
+        self.inventory()
+        self.interactions()
+
+    # --- Phases ---
+
+    def reference_data(self) -> None:
+        conn = self.conn
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT OR IGNORE INTO pricing_rules (rule_name, markup_percentage, fixed_markup) VALUES (?, ?, ?)",
+            PRICING_RULES,
+        )
+        conn.executemany("INSERT OR IGNORE INTO payment_terms (term_name, days) VALUES (?, ?)", PAYMENT_TERMS)
+        conn.executemany("INSERT OR IGNORE INTO product_units_of_measure (name) VALUES (?)",
+                         [(name,) for name in UNITS])
+        conn.executemany("INSERT OR IGNORE INTO users (username) VALUES (?)",
+                         [(f"user{n:02d}",) for n in range(1, USERS + 1)])
+        self.pricing_rule_ids = [row[0] for row in conn.execute("SELECT rule_id FROM pricing_rules ORDER BY rule_id")]
+        self.payment_term_ids = [row[0] for row in conn.execute("SELECT term_id FROM payment_terms ORDER BY term_id")]
+        self.unit_ids = [row[0] for row in conn.execute("SELECT id FROM product_units_of_measure ORDER BY id")]
+        self.user_ids = [row[0] for row in conn.execute("SELECT user_id FROM users ORDER BY user_id")]
+
+        self.leaf_category_ids = []
+        category_id = 0
+        for parent, children in CATEGORIES.items():
+            category_id += 1
+            parent_id = category_id
+            conn.execute("INSERT INTO product_categories (id, name, parent_id) VALUES (?, ?, NULL)",
+                         (parent_id, parent))
+            for child in children:
+                category_id += 1
+                conn.execute("INSERT INTO product_categories (id, name, parent_id) VALUES (?, ?, ?)",
+                             (category_id, child, parent_id))
+                self.leaf_category_ids.append(category_id)
+
+        rng = self.rng("company")
+        address_id = self.add_address(conn.execute, rng)
+        conn.execute(
+            "INSERT INTO company_information (company_id, name, phone, billing_address_id, shipping_address_id) "
+            "VALUES (1, 'Synthetic Supply Co', '(555) 010-0000', ?, ?)",
+            (address_id, address_id),
+        )
+        conn.executemany(
+            "INSERT INTO company_addresses (company_id, address_id, address_type, is_primary) VALUES (1, ?, ?, 1)",
+            [(address_id, "Billing"), (address_id, "Shipping")],
+        )
+        conn.execute("COMMIT")
+
+    def add_address(self, insert, rng: random.Random) -> int:
+        """Insert one address through ``insert(sql, params)``; returns its id."""
+        address_id = self.next_address_id
+        self.next_address_id += 1
+        city, state, zip_prefix = rng.choice(CITIES)
+        insert(
+            "INSERT INTO addresses (address_id, street, city, state, zip, country) VALUES (?, ?, ?, ?, ?, ?)",
+            (address_id, f"{rng.randint(1, 9999)} {rng.choice(STREETS)} {rng.choice(STREET_KINDS)}",
+             city, state, f"{zip_prefix}{rng.randint(0, 99):02d}", "USA"),
+        )
+        return address_id
+
+    def accounts(self) -> None:
+        rng = self.rng("accounts")
+        self.customer_ids, self.vendor_ids = [], []
+        with self.phase(
+            ("addresses", "address_id, street, city, state, zip, country"),
+            ("accounts", "id, name, account_type, phone, email, website, description, "
+                         "pricing_rule_id, payment_term_id, created_at, updated_at"),
+            ("account_addresses", "account_id, address_id, address_type, is_primary"),
+        ) as (addresses, accounts, links):
+            for account_id in range(1, self.scale.accounts + 1):
+                slot = (account_id - 1) % 20
+                if slot in VENDOR_SLOTS:
+                    account_type = AccountType.VENDOR
+                    self.vendor_ids.append(account_id)
+                elif slot in CONTACT_SLOTS:
+                    account_type = AccountType.CONTACT
+                else:
+                    account_type = AccountType.CUSTOMER
+                    self.customer_ids.append(account_id)
+                word = rng.choice(COMPANY_WORDS)
+                name = f"{word} {rng.choice(COMPANY_NOUNS)} {rng.choice(COMPANY_SUFFIXES)}"
+                domain = f"{word.lower()}{account_id}.example.com"
+                created_at = self.timestamp(rng, self.day(rng))
+                pricing_rule_id = (rng.choice(self.pricing_rule_ids)
+                                   if account_type is AccountType.CUSTOMER and rng.random() < 0.4 else None)
+                accounts.add((
+                    account_id, name, account_type.value, _phone(rng), f"info@{domain}", f"www.{domain}",
+                    None, pricing_rule_id, rng.choice(self.payment_term_ids), created_at, created_at,
+                ))
+                address_id = self.add_address(lambda _sql, row: addresses.add(row), rng)
+                links.add((account_id, address_id, "Billing", 1))
+                if rng.random() < 0.3:
+                    address_id = self.add_address(lambda _sql, row: addresses.add(row), rng)
+                links.add((account_id, address_id, "Shipping", 1))
+        self.account_popularity = _Zipf(rng, range(1, self.scale.accounts + 1))
+        self.customer_popularity = _Zipf(rng, self.customer_ids)
+        self.vendor_popularity = _Zipf(rng, self.vendor_ids)
+
+    def contacts(self) -> None:
+        rng = self.rng("contacts")
+        self.contacts_by_account = {}
+        with self.phase(("contacts", "id, name, phone, email, role, account_id, created_at, updated_at")) as contacts:
+            for contact_id in range(1, self.scale.contacts + 1):
+                account_id = self.account_popularity.draw(rng)
+                self.contacts_by_account.setdefault(account_id, []).append(contact_id)
+                first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+                created_at = self.timestamp(rng, self.day(rng))
+                contacts.add((
+                    contact_id, f"{first} {last}", _phone(rng),
+                    f"{first.lower()}.{contact_id}@example.com", rng.choice(ROLES), account_id,
+                    created_at, created_at,
+                ))
+
+    def products(self) -> None:
+        rng = self.rng("products")
+        count = self.scale.products
+        self.product_names = [None] * (count + 1)
+        self.costs = [0.0] * (count + 1)
+        self.prices = [0.0] * (count + 1)
+        self.reorder_points = [0] * (count + 1)
+        start = self.days[0]
+        with self.phase(
+            ("products", "id, sku, name, description, category_id, unit_of_measure_id, quantity_on_hand, "
+                         "reorder_point, reorder_quantity, safety_stock, is_active, created_at, updated_at"),
+            ("product_prices", "product_id, price_type, price, currency, valid_from"),
+            ("product_vendors", "product_id, vendor_id, vendor_sku, lead_time, last_price"),
+        ) as (products, prices, vendors):
+            for product_id in range(1, count + 1):
+                category_id = rng.choice(self.leaf_category_ids)
+                name = f"{rng.choice(PRODUCT_ADJECTIVES)} {_category_name(category_id)} {rng.choice(PRODUCT_SIZES)}"
+                cost = round(max(0.5, rng.lognormvariate(3.0, 1.0)), 2)
+                price = round(cost * rng.uniform(1.2, 1.8), 2)
+                reorder_point = rng.randint(5, 100) if rng.random() < 0.7 else 0
+                self.product_names[product_id] = name
+                self.costs[product_id] = cost
+                self.prices[product_id] = price
+                self.reorder_points[product_id] = reorder_point
+                created_at = f"{start} 00:00:00"
+                products.add((
+                    product_id, f"SKU-{product_id:06d}", name, f"{name} for general industrial use",
+                    category_id, rng.choice(self.unit_ids), 0, reorder_point, reorder_point * 2,
+                    reorder_point // 4, int(rng.random() < 0.98), created_at, created_at,
+                ))
+                prices.add((product_id, "COST", cost, "USD", start))
+                prices.add((product_id, "SALE", price, "USD", start))
+                for vendor_id in sorted({self.vendor_popularity.draw(rng) for _ in range(rng.randint(1, 3))}):
+                    vendors.add((product_id, vendor_id, f"V{vendor_id}-{product_id}",
+                                 rng.randint(2, 30), round(cost * rng.uniform(0.9, 1.1), 2)))
+        self.product_popularity = _Zipf(rng, range(1, count + 1))
+
+    def sales_documents(self) -> None:
+        rng = self.rng("sales")
+        types, type_weights = _weighted(SALES_TYPE_WEIGHTS)
+        statuses = {doc_type: _weighted(weights) for doc_type, weights in SALES_STATUS_WEIGHTS.items()}
+        self.sales_document_numbers = []
+        remaining = self.scale.sales_lines
+        document_id = line_id = 0
+        with self.phase(
+            ("sales_documents", "id, document_number, customer_id, document_type, created_date, expiry_date, "
+                                "due_date, status, reference_number, notes, subtotal, taxes, total_amount, "
+                                "is_active, created_at, updated_at"),
+            ("sales_document_items", "id, sales_document_id, product_id, product_description, quantity, "
+                                     "unit_price, discount_percentage, line_total, note, shipped_quantity, "
+                                     "is_shipped, created_at, updated_at"),
+        ) as (documents, items):
+            while remaining > 0:
+                document_id += 1
+                number = f"S{document_id:05d}"
+                self.sales_document_numbers.append(number)
+                doc_type = rng.choices(types, cum_weights=type_weights)[0]
+                population, cum_weights = statuses[doc_type]
+                status = rng.choices(population, cum_weights=cum_weights)[0]
+                day = self.day(rng, recent=status in OPEN_SALES_STATUSES)
+                created_date = self.timestamp(rng, day, sep="T")
+                created_at = created_date.replace("T", " ")
+                if status is SalesDocumentStatus.SO_OPEN:
+                    shipped_share = 0.5 if rng.random() < 0.3 else 0.0
+                elif status in (SalesDocumentStatus.SO_FULFILLED, SalesDocumentStatus.SO_CLOSED):
+                    shipped_share = 1.0
+                else:
+                    shipped_share = 0.0
+                ship_at = self.timestamp(rng, self.later(rng, day, 1, 10)) if shipped_share else None
+
+                lines = min(remaining, 1 + min(11, int(rng.expovariate(0.25))))
+                remaining -= lines
+                subtotal = 0.0
+                for _ in range(lines):
+                    line_id += 1
+                    quantity = 1 + min(49, int(rng.expovariate(0.15)))
+                    discount = rng.choices((0.0, 5.0, 10.0), cum_weights=(80, 93, 100))[0]
+                    if rng.random() < 0.02:
+                        product_id = None
+                        description = rng.choice(SERVICE_LINES)
+                        unit_price = float(rng.randint(25, 500))
+                    else:
+                        product_id = self.product_popularity.draw(rng)
+                        description = self.product_names[product_id]
+                        unit_price = self.prices[product_id]
+                    line_total = round(quantity * unit_price * (1 - discount / 100), 2)
+                    subtotal += line_total
+                    shipped = float(int(quantity * shipped_share))
+                    if shipped and product_id:
+                        self.post(product_id, -shipped, SALE, f"{number}.001", ship_at)
+                    items.add((
+                        line_id, document_id, product_id, description, quantity, unit_price, discount,
+                        line_total, None, shipped, int(shipped >= quantity), created_at, created_at,
+                    ))
+                subtotal = round(subtotal, 2)
+                expiry_date = (f"{self.days[self.later(rng, day, 30, 30)]}T00:00:00"
+                               if doc_type is SalesDocumentType.QUOTE else None)
+                due_date = (f"{self.days[self.later(rng, day, 30, 30)]}T00:00:00"
+                            if doc_type is SalesDocumentType.INVOICE else None)
+                reference = f"PO-{rng.randrange(10 ** 6):06d}" if rng.random() < 0.4 else None
+                documents.add((
+                    document_id, number, self.customer_popularity.draw(rng), doc_type.value, created_date,
+                    expiry_date, due_date, status.value, reference, None, subtotal, 0.0, subtotal, 1,
+                    created_at, created_at,
+                ))
+
+    def purchase_documents(self) -> None:
+        rng = self.rng("purchases")
+        statuses, status_weights = _weighted(PURCHASE_STATUS_WEIGHTS)
+        self.purchase_document_numbers = []
+        remaining = self.scale.purchase_lines
+        document_id = line_id = 0
+        with self.phase(
+            ("purchase_documents", "id, document_number, vendor_id, created_date, status, notes, is_active, "
+                                   "created_at, updated_at"),
+            ("purchase_document_items", "id, purchase_document_id, product_id, product_description, quantity, "
+                                        "unit_price, total_price, note, is_received, created_at, updated_at"),
+            ("purchase_receipts", "purchase_document_item_id, quantity, received_date, created_at, updated_at"),
+        ) as (documents, items, receipts):
+            while remaining > 0:
+                document_id += 1
+                number = f"P{document_id:05d}"
+                reference = f"PO#{number}"
+                self.purchase_document_numbers.append(number)
+                status = rng.choices(statuses, cum_weights=status_weights)[0]
+                day = self.day(rng, recent=status in OPEN_PURCHASE_STATUSES)
+                created_date = self.timestamp(rng, day, sep="T")
+                created_at = created_date.replace("T", " ")
+                issued = status not in (PurchaseDocumentStatus.RFQ, PurchaseDocumentStatus.QUOTED)
+                if status is PurchaseDocumentStatus.PO_ISSUED:
+                    received_share = 0.5 if rng.random() < 0.3 else 0.0
+                else:
+                    received_share = 1.0 if issued else 0.0
+                received_day = self.later(rng, day, 3, 21)
+                received_at = self.timestamp(rng, received_day)
+
+                lines = min(remaining, rng.randint(1, 8))
+                remaining -= lines
+                for _ in range(lines):
+                    line_id += 1
+                    product_id = self.product_popularity.draw(rng)
+                    quantity = float(rng.randint(1, 40) * 5)
+                    unit_price = self.costs[product_id]
+                    received = float(int(quantity * received_share))
+                    items.add((
+                        line_id, document_id, product_id, self.product_names[product_id], quantity,
+                        unit_price, round(quantity * unit_price, 2), None, int(received >= quantity),
+                        created_at, created_at,
+                    ))
+                    if issued:
+                        self.post(product_id, quantity, ON_ORDER, reference, created_at)
+                    if received:
+                        receipts.add((line_id, received, f"{self.days[received_day]}T00:00:00",
+                                      received_at, received_at))
+                        self.post(product_id, -received, ON_ORDER, reference, received_at)
+                        self.post(product_id, received, PURCHASE, reference, received_at)
+                documents.add((document_id, number, self.vendor_popularity.draw(rng), created_date,
+                               status.value, None, 1, created_at, created_at))
+
+    def inventory(self) -> None:
+        """Fill the ledger with unlinked movements, then post opening balances.
+
+        Each product's opening adjustment brings its stock to a target level,
+        about 15% of tracked products ending below their reorder point, and
+        ``quantity_on_hand`` is set to that level.
+        """
+        with self.phase(self.ledger):
+            self._fill_ledger()
+
+    def _fill_ledger(self) -> None:
+        rng = self.rng("inventory")
+        kinds, kind_weights = _weighted(LEDGER_TYPE_WEIGHTS)
+        products = self.scale.products
+        filler = self.scale.inventory_transactions - self.ledger.count - len(self.ledger.rows) - products
+        for _ in range(max(0, filler)):
+            product_id = self.product_popularity.draw(rng)
+            kind = rng.choices(kinds, cum_weights=kind_weights)[0]
+            if kind == SALE:
+                change = -float(1 + min(49, int(rng.expovariate(0.15))))
+                reference = f"SO#{rng.choice(self.sales_document_numbers)}" if self.sales_document_numbers else None
+            elif kind == PURCHASE:
+                change = float(rng.randint(1, 40) * 5)
+                reference = (f"PO#{rng.choice(self.purchase_document_numbers)}"
+                             if self.purchase_document_numbers else None)
+            else:
+                change = float(rng.choice((-1, 1)) * rng.randint(1, 10))
+                reference = "Cycle count"
+            self.post(product_id, change, kind, reference, self.timestamp(rng, self.day(rng)))
+
+        opening_at = f"{self.days[0]} 00:00:00"
+        on_hand = []
+        for product_id in range(1, products + 1):
+            reorder_point = self.reorder_points[product_id]
+            if not reorder_point:
+                target = rng.randint(0, 200)
+            elif rng.random() < 0.15:
+                target = rng.randint(0, reorder_point - 1)
+            else:
+                target = rng.randint(reorder_point, reorder_point * 4)
+            self.post(product_id, target - self.net_stock[product_id], ADJUSTMENT, "Opening balance", opening_at)
+            on_hand.append((float(target), product_id))
+        self.conn.executemany("UPDATE products SET quantity_on_hand = ? WHERE id = ?", on_hand)
+
+    def interactions(self) -> None:
+        rng = self.rng("interactions")
+        types, type_weights = _weighted(INTERACTION_TYPE_WEIGHTS)
+        with self.phase(("interactions", "interaction_id, company_id, contact_id, interaction_type, date_time, "
+                                         "subject, description, created_by_user_id, created_at, updated_at")) as rows:
+            for interaction_id in range(1, self.scale.interactions + 1):
+                account_id = self.account_popularity.draw(rng)
+                contacts = self.contacts_by_account.get(account_id)
+                contact_id = rng.choice(contacts) if contacts and rng.random() < 0.8 else None
+                interaction_type = rng.choices(types, cum_weights=type_weights)[0]
+                subject = rng.choice(INTERACTION_SUBJECTS[interaction_type])
+                date_time = self.timestamp(rng, self.day(rng), sep="T")
+                description = f"{subject} with account {account_id}." if rng.random() < 0.5 else None
+                created_at = date_time.replace("T", " ")
+                rows.add((interaction_id, account_id, contact_id, interaction_type.value, date_time, subject,
+                          description, rng.choice(self.user_ids), created_at, created_at))
+
+
+def _phone(rng: random.Random) -> str:
+    return f"(555) {rng.randint(100, 999)}-{rng.randint(0, 9999):04d}"
+
+
+_CATEGORY_NAMES = [child for children in CATEGORIES.values() for child in [None, *children]]
+
+
+def _category_name(category_id: int) -> str:
+    # Category ids follow CATEGORIES: each parent, then its children.
+    return _CATEGORY_NAMES[category_id - 1]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="benchmark.db", help="database file to create")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiply every default count, e.g. 0.01 for a quick dataset")
+    parser.add_argument("--force", action="store_true", help="replace --out if it exists")
+    for f in fields(Scale):
+        parser.add_argument(f"--{f.name.replace('_', '-')}", type=int, dest=f.name,
+                            help=f"rows to generate (default {f.default:,} times --scale)")
+    args = parser.parse_args(argv)
+
+    scale = Scale().scaled(args.scale) if args.scale != 1.0 else Scale()
+    scale = replace(scale, **{f.name: getattr(args, f.name) for f in fields(Scale)
+                              if getattr(args, f.name) is not None})
+    if args.force:
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(args.out + suffix)
+
+    started = time.perf_counter()
+    try:
+        counts = generate(args.out, scale, seed=args.seed, progress=print)
+    except (FileExistsError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - started
+    size = os.path.getsize(args.out) / 2 ** 20
+    print(f"Wrote {sum(counts.values()):,} rows to {args.out} ({size:,.0f} MiB) in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
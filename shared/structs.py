@@ -425,3 +425,45 @@ class ReplenishmentItem:
         }
 
 # --- End Inventory Management Structures ---
+
+# --- Render Queue Structures ---
+
+class RenderJobStatus(Enum):
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+
+
+@dataclass
+class RenderJob:
+    id: Optional[int] = None
+    kind: str = ""
+    document_id: Optional[int] = None
+    label: Optional[str] = None
+    output_path: str = ""
+    status: RenderJobStatus | None = None
+    attempts: int = 0
+    max_attempts: int = 0
+    next_attempt_at: Optional[str] = None
+    last_error: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "document_id": self.document_id,
+            "label": self.label,
+            "output_path": self.output_path,
+            "status": self.status.value if self.status else None,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "next_attempt_at": self.next_attempt_at,
+            "last_error": self.last_error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+# --- End Render Queue Structures ---
@@ -398,6 +398,37 @@ class TestAccountInteractions(unittest.TestCase): # Renamed class for clarity
         self.assertEqual(len(contact1_interactions), 1)
         self.assertEqual(contact1_interactions[0].subject, "Email C1")
 
+    def test_interaction_page_keyset_pagination(self):
+        base = datetime.datetime.now() - datetime.timedelta(days=30)
+        types = [InteractionType.CALL, InteractionType.EMAIL, InteractionType.MEETING]
+        for day in range(7):
+            self.logic.save_interaction(Interaction(
+                company_id=self.account1_id, interaction_type=types[day % 3],
+                date_time=base + datetime.timedelta(days=day), subject=f"Day {day}",
+                created_by_user_id=self.default_user_id))
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = self.logic.get_interaction_page(company_id=self.account1_id, before=cursor, limit=3)
+            seen.extend(i.subject for i in page)
+            if cursor is None:
+                break
+        self.assertEqual(seen, [f"Day {day}" for day in range(6, -1, -1)])
+
+        calls, _ = self.logic.get_interaction_page(company_id=self.account1_id, types=[InteractionType.CALL])
+        self.assertEqual([i.subject for i in calls], ["Day 6", "Day 3", "Day 0"])
+
+        ranged, next_cursor = self.logic.get_interaction_page(
+            company_id=self.account1_id,
+            date_from=(base + datetime.timedelta(days=2)).date(),
+            date_to=(base + datetime.timedelta(days=4)).date())
+        self.assertEqual([i.subject for i in ranged], ["Day 4", "Day 3", "Day 2"])
+        self.assertIsNone(next_cursor)
+
+        with self.assertRaises(ValueError):
+            self.logic.get_interaction_page()
+
     def test_delete_account_cascades_to_interactions(self):
         # Create a new account and an interaction linked to it
         temp_account_id = self.db_handler.add_account(
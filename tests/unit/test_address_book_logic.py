@@ -3,7 +3,7 @@ import os
 import sqlite3 # Import for PRAGMA
 from core.database import DatabaseHandler
 from core.address_book_logic import AddressBookLogic
-from shared.structs import Product, AccountType, Account # Added AccountType for product tests if needed
+from shared.structs import Product, AccountType, Account, Address # Added AccountType for product tests if needed
 
 class TestAddressBookLogic(unittest.TestCase):
 
@@ -41,6 +41,28 @@ class TestAddressBookLogic(unittest.TestCase):
             self.db_handler.cursor.execute("DELETE FROM product_categories")
             self.db_handler.cursor.execute("DELETE FROM product_units_of_measure") # Added this line
 
+    def test_category_tree_paths_and_cycles(self):
+        root_id = self.logic.add_category("Electronics")
+        audio_id = self.logic.add_category("Audio", parent_id=root_id)
+        phones_id = self.logic.add_category("Headphones", parent_id=audio_id)
+
+        self.assertEqual(self.logic._get_category_path_string(phones_id), "Electronics\\Audio\\Headphones")
+        with self.assertRaises(ValueError):
+            self.logic.update_category_parent(root_id, phones_id)
+
+        self.logic.update_category_name(audio_id, "Sound")
+        self.assertIn((phones_id, "Electronics\\Sound\\Headphones"), self.logic.get_flat_category_paths())
+
+    def test_delete_category_promotes_children(self):
+        root_id = self.logic.add_category("Electronics")
+        audio_id = self.logic.add_category("Audio", parent_id=root_id)
+        phones_id = self.logic.add_category("Headphones", parent_id=audio_id)
+
+        self.logic.delete_category(audio_id)
+
+        self.assertEqual(self.logic._get_category_path_string(phones_id), "Headphones")
+        self.assertEqual(self.db_handler.get_category_descendant_ids(root_id), set())
+
     def test_add_and_get_product(self):
         # Test adding a product and retrieving it
         # Ensure AccountType is available if Product struct or logic needs it implicitly
@@ -231,6 +253,49 @@ class TestAddressBookLogic(unittest.TestCase):
         self.assertEqual(sorted(getattr(addr, 'address_types', [])), ["Billing", "Shipping"])
         self.assertIn("Billing", getattr(addr, 'primary_types', []))
 
+    def test_save_account_addresses_writes_only_changes(self):
+        account = self.logic.save_account(Account(name="Diff", account_type=AccountType.CUSTOMER))
+        kept = Address(street="1 Keep St", city="A", state="AA", zip_code="1", country="US")
+        kept.address_types = ["Billing"]
+        kept.primary_types = ["Billing"]
+        dropped = Address(street="2 Drop St", city="B", state="BB", zip_code="2", country="US")
+        dropped.address_types = ["Shipping"]
+        account.addresses = [kept, dropped]
+        self.logic.save_account_addresses(account)
+        self.assertIsNotNone(kept.address_id)
+        dropped_id = dropped.address_id
+
+        changes_before = self.db_handler.conn.total_changes
+        self.logic.save_account_addresses(account)
+        self.assertEqual(self.db_handler.conn.total_changes, changes_before)
+
+        account.addresses = [kept]
+        self.logic.save_account_addresses(account)
+        rows = self.db_handler.get_account_addresses(account.account_id)
+        self.assertEqual([row['address_id'] for row in rows], [kept.address_id])
+        self.assertIsNone(self.db_handler.get_address(dropped_id))
+
+    def test_account_summaries_and_batch_details(self):
+        first = self.logic.save_account(Account(name="First", account_type=AccountType.CUSTOMER))
+        second = self.logic.save_account(Account(name="Second", account_type=AccountType.VENDOR))
+        addr_id = self.logic.add_address("1 Batch Rd", "Town", "ST", "12345", "US")
+        address = Address(address_id=addr_id, street="1 Batch Rd", city="Town", state="ST", zip_code="12345", country="US")
+        address.address_types = ["Billing"]
+        address.primary_types = ["Billing"]
+        first.addresses.append(address)
+        self.logic.save_account_addresses(first)
+
+        summaries = self.logic.get_account_summaries([first.account_id, second.account_id, first.account_id, 9999])
+        self.assertEqual(set(summaries), {first.account_id, second.account_id})
+        self.assertEqual(summaries[second.account_id]["name"], "Second")
+        self.assertEqual(summaries[first.account_id]["account_type"], AccountType.CUSTOMER.value)
+        self.assertNotIn("addresses", summaries[first.account_id])
+
+        details = self.logic.get_accounts_details([first.account_id, second.account_id])
+        self.assertEqual(details[first.account_id].addresses[0].street, "1 Batch Rd")
+        self.assertEqual(details[second.account_id].addresses, [])
+        self.assertEqual(self.logic.get_account_summaries([]), {})
+
 if __name__ == '__main__':
     unittest.main()
 
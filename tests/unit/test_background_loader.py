@@ -0,0 +1,112 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+from core.database import DatabaseHandler
+from shared.structs import AccountType
+from ui.base.background_loader import BackgroundLoader, LoadContext
+
+
+class FakeRoot:
+    """Stands in for the Tk root: ``after`` callbacks run when pumped."""
+
+    def __init__(self):
+        self.callbacks = []
+
+    def after(self, _ms, func):
+        self.callbacks.append(func)
+        return len(self.callbacks)
+
+    def after_cancel(self, _after_id):
+        pass
+
+    def pump(self, until, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not until() and time.monotonic() < deadline:
+            callbacks, self.callbacks = self.callbacks, []
+            for func in callbacks:
+                func()
+            time.sleep(0.01)
+
+
+class FakeIndicator:
+    def __init__(self):
+        self.pending = 0
+
+    def start(self):
+        self.pending += 1
+
+    def stop(self):
+        self.pending -= 1
+
+
+class TestBackgroundLoader(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db = DatabaseHandler(db_name=self.path)
+        self.db.add_account("Acme", None, None, None, AccountType.CUSTOMER.value)
+        self.root = FakeRoot()
+        self.loader = BackgroundLoader(self.root, lambda: LoadContext.read_only(self.path), workers=2)
+
+    def tearDown(self):
+        self.loader.stop()
+        self.db.close()
+        os.remove(self.path)
+
+    def test_job_runs_off_the_main_thread_on_a_read_only_connection(self):
+        results = []
+
+        def job(ctx):
+            accounts, _ = ctx.address_book_logic.get_accounts_page()
+            with self.assertRaises(sqlite3.OperationalError):
+                ctx.db.add_account("Nope", None, None, None, AccountType.CUSTOMER.value)
+            return threading.current_thread().name, [a.name for a in accounts]
+
+        indicator = FakeIndicator()
+        self.loader.submit("accounts", job, results.append, indicator=indicator)
+        self.assertEqual(indicator.pending, 1)
+        self.root.pump(lambda: results)
+        thread_name, names = results[0]
+        self.assertNotEqual(thread_name, threading.current_thread().name)
+        self.assertEqual(names, ["Acme"])
+        self.assertEqual(indicator.pending, 0)
+        self.assertFalse(self.loader.is_loading("accounts"))
+
+    def test_newer_load_supersedes_pending_one(self):
+        release = threading.Event()
+        delivered = []
+        indicator = FakeIndicator()
+
+        def slow(_ctx):
+            release.wait(5)
+            return "old"
+
+        self.loader.submit("tab", slow, delivered.append, indicator=indicator)
+        self.loader.submit("tab", lambda _ctx: "new", delivered.append, indicator=indicator)
+        release.set()
+        self.root.pump(lambda: indicator.pending == 0)
+        self.assertEqual(delivered, ["new"])
+
+    def test_errors_go_to_on_error(self):
+        errors = []
+
+        def broken(_ctx):
+            raise ValueError("boom")
+
+        self.loader.submit("tab", broken, self.fail, on_error=errors.append)
+        self.root.pump(lambda: errors)
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_inline_loader_runs_immediately(self):
+        results = []
+        inline = BackgroundLoader.inline(self.root, LoadContext(db=self.db))
+        inline.submit("tab", lambda ctx: ctx.db is self.db, results.append)
+        self.assertEqual(results, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
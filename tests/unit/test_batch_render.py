@@ -0,0 +1,74 @@
+import os
+import tempfile
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.batch_render import BatchSummary, _close_worker, _init_worker, _render_one, main, render_batch
+from core.database import DatabaseHandler
+from core.sales_logic import SalesLogic
+from shared.structs import Account, AccountType, Product, SalesDocumentStatus
+
+
+class TestBatchRender(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.db = DatabaseHandler(db_name=self.path)
+        logic = AddressBookLogic(self.db)
+        customer = logic.save_account(Account(name="Cust", account_type=AccountType.CUSTOMER))
+        product_id = logic.save_product(Product(name="Widget", cost=5.0, sale_price=10.0))
+        sales = SalesLogic(self.db)
+        self.quote_ids = []
+        for _ in range(4):
+            quote = sales.create_quote(customer_id=customer.account_id)
+            sales.add_item_to_sales_document(quote.id, product_id, 2)
+            self.quote_ids.append(quote.id)
+        self.db.update_sales_document(self.quote_ids[0], {"status": SalesDocumentStatus.QUOTE_SENT.value})
+        self.db.update_sales_document(self.quote_ids[1], {"created_date": "2026-01-01T09:00:00"})
+        self.out = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.out.cleanup()
+        self.db.close()
+        os.remove(self.path)
+
+    def test_renders_the_selected_documents_across_processes(self):
+        summary = render_batch("quote", self.out.name, db_path=self.path,
+                               status=SalesDocumentStatus.QUOTE_DRAFT.value,
+                               since="2026-06-01", workers=2)
+        self.assertEqual(summary.failures, [])
+        self.assertEqual(len(summary.rendered), 2)
+        names = sorted(os.listdir(self.out.name))
+        self.assertEqual(len(names), 2)
+        self.assertTrue(all(name.startswith("Quote_") and name.endswith(".pdf") for name in names))
+        for name in names:
+            with open(os.path.join(self.out.name, name), "rb") as handle:
+                self.assertEqual(handle.read(5), b"%PDF-")
+        self.assertGreater(summary.docs_per_second, 0)
+
+    def test_document_gone_before_rendering_is_a_failure(self):
+        _init_worker(self.path, ("Co", "", [], [], []))
+        try:
+            path = os.path.join(self.out.name, "Quote_missing.pdf")
+            self.assertEqual(
+                _render_one("quote", 9999, path),
+                (path, "Error: Sales document with ID 9999 not found."),
+            )
+        finally:
+            _close_worker()
+        self.assertEqual(os.listdir(self.out.name), [])
+
+        summary = BatchSummary(rendered=["a.pdf"], failures=[("S9", "boom")], seconds=0.5)
+        self.assertIn("Rendered 1 of 2 documents", summary.format())
+        self.assertIn("1 failed", summary.format())
+        self.assertIn("S9: boom", summary.format())
+
+    def test_main_exit_status(self):
+        self.assertEqual(main(["--type", "invoice", "--out", self.out.name,
+                               "--db", self.path, "--workers", "0"]), 0)
+        with self.assertRaises(SystemExit):
+            main(["--type", "invoice", "--out", self.out.name, "--since", "last week"])
+
+
+if __name__ == '__main__':
+    unittest.main()
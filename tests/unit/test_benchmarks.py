@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from benchmarks.cases import CASES
+from benchmarks.harness import compare, percentile
+from benchmarks.run import run_cases
+from scripts.synthetic_data import Scale, generate
+
+SMALL = Scale().scaled(0.002)
+
+
+class TestBenchmarkHarness(unittest.TestCase):
+    def test_percentile_interpolates(self):
+        values = [4.0, 1.0, 3.0, 2.0]
+        self.assertEqual(percentile(values, 0), 1.0)
+        self.assertEqual(percentile(values, 50), 2.5)
+        self.assertEqual(percentile(values, 100), 4.0)
+        self.assertEqual(percentile([7.0], 95), 7.0)
+
+    def test_compare_flags_slower_medians_and_extra_queries(self):
+        baseline = {
+            "a": {"p50_ms": 10.0, "queries_per_call": 5.0},
+            "b": {"p50_ms": 10.0, "queries_per_call": 5.0},
+            "c": {"p50_ms": 0.1, "queries_per_call": 2.0},
+        }
+        results = {
+            "a": {"p50_ms": 30.0, "queries_per_call": 5.0},
+            "b": {"p50_ms": 9.0, "queries_per_call": 6.0},
+            "c": {"p50_ms": 0.5, "queries_per_call": 2.0},  # Within the slack.
+            "new": {"p50_ms": 99.0, "queries_per_call": 99.0},
+        }
+        regressions = compare(results, baseline, tolerance=0.5)
+        self.assertEqual(len(regressions), 2)
+        self.assertTrue(regressions[0].startswith("a: median"))
+        self.assertTrue(regressions[1].startswith("b: 6 statements"))
+
+        counts_only = compare(results, baseline, tolerance=0.5, timings=False)
+        self.assertEqual(len(counts_only), 1)
+        self.assertTrue(counts_only[0].startswith("b: 6 statements"))
+
+
+class TestBenchmarkCases(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmp.name, "dataset.db")
+        generate(cls.path, SMALL)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def test_every_case_runs_and_counts_queries(self):
+        results = run_cases(self.path, list(CASES), iterations=2, warmup=1)
+        self.assertEqual(set(results), set(CASES))
+        for name, result in results.items():
+            self.assertEqual(result["iterations"], 2, name)
+            self.assertGreater(result["queries_per_call"], 0, name)
+            self.assertLessEqual(result["p50_ms"], result["max_ms"], name)
+
+    def test_query_counts_are_repeatable(self):
+        names = ["sales.record_shipment", "pdf.invoice"]
+        first = run_cases(self.path, names, iterations=3, warmup=0)
+        second = run_cases(self.path, names, iterations=3, warmup=0)
+        for name in names:
+            self.assertEqual(first[name]["queries_per_call"], second[name]["queries_per_call"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -50,6 +50,17 @@ class InventoryServiceTest(unittest.TestCase):
         service.record_purchase_order(self.product_id, -2, reference="PO#1")
         self.assertEqual(service.get_on_order_level(self.product_id), 2)
 
+    def test_on_order_levels_for_many_products(self):
+        service = InventoryService(self.inventory_repo, self.product_repo)
+        second_product = self.db.add_product(
+            sku="PROD2", name="Another", description="desc", cost=0, sale_price=0, is_active=True
+        )
+        service.record_purchase_order(self.product_id, 3)
+        service.record_purchase_order(self.product_id, 1)
+        self.assertEqual(service.get_on_order_levels([self.product_id, second_product]),
+                         {self.product_id: 4, second_product: 0})
+        self.assertEqual(service.get_on_order_levels([]), {})
+
     def test_get_products_on_order_aggregates(self):
         service = InventoryService(self.inventory_repo, self.product_repo)
         second_product = self.db.add_product(
@@ -79,5 +90,16 @@ class InventoryServiceTest(unittest.TestCase):
         self.assertEqual(item["on_order"], 0)
         self.assertEqual(item["to_order"], 10)
 
+    def test_change_token_moves_only_on_writes(self):
+        service = InventoryService(self.inventory_repo, self.product_repo)
+        token = service.get_change_token()
+        service.get_products_below_reorder()
+        self.assertEqual(service.get_change_token(), token)
+        service.adjust_stock(self.product_id, -1, InventoryTransactionType.SALE)
+        changed = service.get_change_token()
+        self.assertNotEqual(changed, token)
+        self.db.cursor.execute("DELETE FROM inventory_transactions")
+        self.assertNotEqual(service.get_change_token(), changed)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+from ui.inventory.inventory_tab import InventoryTab
+
+
+class FakeTree:
+    """Minimal Treeview stand-in recording which calls the sync makes."""
+
+    def __init__(self):
+        self.children = {"": []}
+        self.items = {}
+        self.calls = []
+
+    def get_children(self, parent=""):
+        return tuple(self.children[parent])
+
+    def insert(self, parent, index, iid, text="", values=()):
+        self.calls.append(("insert", iid))
+        self.children[parent].insert(index, iid)
+        self.children[iid] = []
+        self.items[iid] = {"parent": parent, "text": text, "values": values, "open": False}
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.calls.append(("delete", iid))
+            for child in list(self.children[iid]):
+                self._forget(child)
+            self.children[self.items[iid]["parent"]].remove(iid)
+            self._forget(iid)
+
+    def _forget(self, iid):
+        del self.children[iid]
+        del self.items[iid]
+
+    def move(self, iid, parent, index):
+        self.calls.append(("move", iid))
+        self.children[self.items[iid]["parent"]].remove(iid)
+        self.children[parent].insert(index, iid)
+        self.items[iid]["parent"] = parent
+
+    def item(self, iid, **options):
+        self.calls.append(("item", iid))
+        self.items[iid].update(options)
+
+    def layout(self):
+        return [(iid, self.items[iid]["values"], list(self.children[iid])) for iid in self.children[""]]
+
+
+def doc(number, *items):
+    return (f"doc_{number}", f"SO{number}", (), [(item_id, (f"item {item_id}", qty)) for item_id, qty in items])
+
+
+class TestInventoryTreeSync(unittest.TestCase):
+    def setUp(self):
+        self.tree = FakeTree()
+        self.rendered = {}
+
+    def sync(self, rows):
+        self.tree.calls = []
+        InventoryTab._sync_tree(self.tree, rows, self.rendered)
+        return self.tree.calls
+
+    def test_unchanged_rows_cause_no_tree_calls(self):
+        rows = [doc(1, (10, 1), (11, 2)), doc(2, (20, 5))]
+        self.sync(rows)
+        self.tree.items["doc_1"]["open"] = True
+        self.assertEqual(self.sync(rows), [])
+        self.assertTrue(self.tree.items["doc_1"]["open"])
+
+    def test_only_changed_rows_are_touched(self):
+        self.sync([doc(1, (10, 1), (11, 2)), doc(2, (20, 5))])
+        self.tree.items["doc_2"]["open"] = True
+        calls = self.sync([doc(0, (5, 1)), doc(2, (20, 4), (21, 1))])
+        self.assertEqual(sorted(calls), sorted([
+            ("delete", "doc_1"), ("insert", "doc_0"), ("insert", "5"),
+            ("item", "20"), ("insert", "21"),
+        ]))
+        self.assertEqual(self.tree.layout(), [
+            ("doc_0", (), ["5"]),
+            ("doc_2", (), ["20", "21"]),
+        ])
+        self.assertTrue(self.tree.items["doc_2"]["open"])
+        self.assertEqual(self.tree.items["20"]["values"], ("item 20", 4))
+        self.assertNotIn("10", self.rendered)
+
+    def test_reordered_rows_are_moved_not_recreated(self):
+        self.sync([doc(1, (10, 1)), doc(2, (20, 1)), doc(3, (30, 1))])
+        calls = self.sync([doc(3, (30, 1)), doc(1, (10, 1)), doc(2, (20, 1))])
+        self.assertEqual({call for call, _iid in calls}, {"move"})
+        self.assertEqual([iid for iid, _v, _c in self.tree.layout()], ["doc_3", "doc_1", "doc_2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import time
+import unittest
+
+from core.database import DatabaseHandler
+from core.inventory_service import InventoryService
+from core.repositories import InventoryRepository, ProductRepository
+from shared.structs import (
+    AccountType,
+    InventoryTransactionType,
+    PurchaseDocumentStatus,
+    SalesDocumentStatus,
+    SalesDocumentType,
+)
+
+SO = SalesDocumentType.SALES_ORDER.value
+SO_OPEN = SalesDocumentStatus.SO_OPEN.value
+PO_ISSUED = PurchaseDocumentStatus.PO_ISSUED.value
+
+
+class InventoryWorkQueueTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(":memory:")
+        self.service = InventoryService(InventoryRepository(self.db), ProductRepository(self.db))
+        self.customer = self.db.add_account("Customer", None, None, None, AccountType.CUSTOMER.value)
+        self.vendor = self.db.add_account("Vendor", None, None, None, AccountType.VENDOR.value)
+
+    def tearDown(self):
+        self.db.close()
+
+    def _product(self, name, on_hand, reorder_point=0, reorder_quantity=0):
+        return self.db.add_product(
+            sku=name, name=name, description="", cost=0, sale_price=0, is_active=True,
+            quantity_on_hand=on_hand, reorder_point=reorder_point,
+            reorder_quantity=reorder_quantity, safety_stock=0,
+        )
+
+    def test_sections_match_open_orders_stock_and_receipts(self):
+        widget = self._product("Widget", on_hand=2)
+        gadget = self._product("Gadget", on_hand=10)
+        bolt = self._product("Bolt", on_hand=1, reorder_point=5, reorder_quantity=20)
+        self.service.record_purchase_order(widget, 1)
+
+        so = self.db.add_sales_document("SO-1", self.customer, SO, "2024-01-02", SO_OPEN)
+        short = self.db.add_sales_document_item(so, widget, "Widget", 5, 1.0)
+        covered = self.db.add_sales_document_item(so, gadget, "Gadget", 3, 1.0)
+        shipped = self.db.add_sales_document_item(so, gadget, "Gadget", 2, 1.0)
+        self.db.update_sales_document_item(shipped, {"shipped_quantity": 2})
+        quote = self.db.add_sales_document("Q-1", self.customer, "Quote", "2024-01-03", "Quote Draft")
+        self.db.add_sales_document_item(quote, widget, "Widget", 50, 1.0)
+
+        po = self.db.add_purchase_document("PO-1", self.vendor, "2024-01-01", PO_ISSUED)
+        open_line = self.db.add_purchase_document_item(po, "Bolt", 10, product_id=bolt)
+        done_line = self.db.add_purchase_document_item(po, "Gadget", 4, product_id=gadget)
+        self.db.add_purchase_receipt(open_line, 4)
+        self.db.add_purchase_receipt(done_line, 4)
+        empty_po = self.db.add_purchase_document("PO-2", self.vendor, "2024-01-02", PO_ISSUED)
+
+        queue = self.service.get_work_queue()
+
+        self.assertEqual([d["document_number"] for d in queue["to_order"]], ["SO-1"])
+        [line] = queue["to_order"][0]["items"]
+        self.assertEqual(
+            (line["item_id"], line["on_hand"], line["on_order"], line["to_order"]), (short, 2, 1, 2)
+        )
+        self.assertEqual([p["product_id"] for p in queue["reorder"]], [bolt])
+        self.assertEqual(queue["reorder"][0]["to_order"], 20)
+        self.assertEqual(
+            [i["item_id"] for i in queue["ready_to_ship"][0]["items"]], [short, covered]
+        )
+        self.assertEqual(
+            [(d["document_id"], [i["item_id"] for i in d["items"]]) for d in queue["to_receive"]],
+            [(empty_po, []), (po, [open_line])],
+        )
+        self.assertEqual(queue["to_receive"][1]["items"][0]["remaining"], 6)
+
+    def test_reorder_skips_products_already_short_on_an_order(self):
+        bolt = self._product("Bolt", on_hand=0, reorder_point=5, reorder_quantity=5)
+        so = self.db.add_sales_document("SO-1", self.customer, SO, "2024-01-02", SO_OPEN)
+        self.db.add_sales_document_item(so, bolt, "Bolt", 3, 1.0)
+        queue = self.service.get_work_queue()
+        self.assertEqual(len(queue["to_order"]), 1)
+        self.assertEqual(queue["reorder"], [])
+
+    def test_five_thousand_open_lines_under_100ms(self):
+        cursor = self.db.cursor
+        cursor.executemany(
+            "INSERT INTO products (sku, name, quantity_on_hand, reorder_point, reorder_quantity)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(f"P{i}", f"Product {i}", i % 7, i % 5, 10) for i in range(500)],
+        )
+        cursor.executemany(
+            "INSERT INTO sales_documents (document_number, customer_id, document_type, created_date, status)"
+            " VALUES (?, ?, ?, ?, ?)",
+            [(f"SO-{i}", self.customer, SO, f"2024-01-{i % 28 + 1:02d}", SO_OPEN) for i in range(500)],
+        )
+        cursor.executemany(
+            "INSERT INTO sales_document_items"
+            " (sales_document_id, product_id, product_description, quantity, unit_price, line_total)"
+            " VALUES (?, ?, ?, ?, 1, 1)",
+            [(i // 10 + 1, i % 500 + 1, f"Line {i}", i % 9 + 1) for i in range(5000)],
+        )
+        cursor.executemany(
+            "INSERT INTO purchase_documents (document_number, vendor_id, created_date, status)"
+            " VALUES (?, ?, ?, ?)",
+            [(f"PO-{i}", self.vendor, "2024-01-01", PO_ISSUED) for i in range(200)],
+        )
+        cursor.executemany(
+            "INSERT INTO purchase_document_items (purchase_document_id, product_id, product_description, quantity)"
+            " VALUES (?, ?, ?, ?)",
+            [(i // 10 + 1, i % 500 + 1, f"PO line {i}", 10) for i in range(2000)],
+        )
+        cursor.executemany(
+            "INSERT INTO inventory_transactions (product_id, quantity_change, transaction_type)"
+            " VALUES (?, ?, ?)",
+            [(i % 500 + 1, 1, InventoryTransactionType.PURCHASE_ORDER.value) for i in range(2000)],
+        )
+        self.db.conn.commit()
+
+        timings = []
+        for _ in range(3):
+            started = time.perf_counter()
+            queue = self.service.get_work_queue()
+            timings.append(time.perf_counter() - started)
+        self.assertEqual(sum(len(d["items"]) for d in queue["ready_to_ship"]), 5000)
+        self.assertLess(min(timings), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
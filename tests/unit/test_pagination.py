@@ -0,0 +1,143 @@
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.logic.product_management import ProductLogic
+from core.purchase_logic import PurchaseLogic
+from core.sales_logic import SalesLogic
+from shared.structs import AccountType, PurchaseDocumentStatus, SalesDocumentStatus, TaskStatus
+
+
+def _all_pages(fetch, **kwargs):
+    """Follow next cursors until the last page, returning every item."""
+    items, cursor, pages = [], None, 0
+    while True:
+        page, cursor = fetch(after=cursor, **kwargs)
+        items.extend(page)
+        pages += 1
+        if cursor is None:
+            return items, pages
+
+
+class TestKeysetPagination(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.logic = AddressBookLogic(self.db)
+        # Duplicate names make sure the id tie-breaker keeps pages disjoint.
+        names = ["Delta", "Alpha", "Charlie", "Alpha", "Bravo"]
+        self.account_ids = [
+            self.db.add_account(name, None, None, None,
+                                AccountType.CUSTOMER.value if i % 2 else AccountType.VENDOR.value)
+            for i, name in enumerate(names)
+        ]
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_accounts_pages_cover_the_sorted_list_once(self):
+        accounts, pages = _all_pages(self.logic.get_accounts_page, limit=2)
+        self.assertEqual(pages, 3)
+        self.assertEqual([a.name for a in accounts], ["Alpha", "Alpha", "Bravo", "Charlie", "Delta"])
+        self.assertEqual(len({a.account_id for a in accounts}), 5)
+
+        accounts, _ = _all_pages(self.logic.get_accounts_page, sort_key="-name", limit=2)
+        self.assertEqual([a.name for a in accounts], ["Delta", "Charlie", "Bravo", "Alpha", "Alpha"])
+
+        customers, cursor = self.logic.get_accounts_page({"account_type": AccountType.CUSTOMER}, limit=10)
+        self.assertEqual([a.account_id for a in customers], [self.account_ids[1], self.account_ids[3]])
+        self.assertIsNone(cursor)
+
+    def test_invalid_sort_key_and_filter_are_rejected(self):
+        with self.assertRaises(ValueError):
+            self.db.get_accounts_page(sort_key="pricing_rule_id")
+        with self.assertRaises(ValueError):
+            self.db.get_accounts_page(filters={"phone": "1"})
+
+    def test_nullable_sort_columns_page_in_both_directions(self):
+        phones = ["555-3", None, "555-1", None, "555-2"]
+        for account_id, phone in zip(self.account_ids, phones):
+            self.db.cursor.execute("UPDATE accounts SET phone = ? WHERE id = ?", (phone, account_id))
+        accounts, _ = _all_pages(self.logic.get_accounts_page, sort_key="phone", limit=2)
+        self.assertEqual([a.phone for a in accounts], [None, None, "555-1", "555-2", "555-3"])
+        accounts, _ = _all_pages(self.logic.get_accounts_page, sort_key="-phone", limit=2)
+        self.assertEqual([a.phone for a in accounts], ["555-3", "555-2", "555-1", None, None])
+        self.assertEqual(len({a.account_id for a in accounts}), 5)
+
+        term_id = self.db.add_payment_term("Net 30", 30)
+        self.db.cursor.execute("UPDATE accounts SET payment_term_id = ? WHERE id = ?", (term_id, self.account_ids[0]))
+        accounts, _ = _all_pages(self.logic.get_accounts_page, sort_key="-payment_term", limit=2)
+        self.assertEqual(accounts[0].account_id, self.account_ids[0])
+        self.assertEqual(accounts[0].payment_term_id, term_id)
+
+        product_logic = ProductLogic(self.db)
+        for i, cost in enumerate([4.0, None, 2.0, None]):
+            product_id = self.db.add_product(f"SKU-{i}", f"Part {i}", None, cost or 0, 1.0, True)
+            if cost is None:
+                self.db.cursor.execute("DELETE FROM product_prices WHERE product_id = ? AND price_type = 'COST'",
+                                       (product_id,))
+        products, _ = _all_pages(product_logic.get_products_page, sort_key="cost", limit=1)
+        self.assertEqual([p.cost for p in products], [2.0, 4.0, None, None])
+        products, _ = _all_pages(product_logic.get_products_page, sort_key="-cost", limit=1)
+        self.assertEqual([p.cost for p in products], [None, None, 4.0, 2.0])
+
+    def test_contacts_and_tasks(self):
+        for name in ["Zed", "Amy", "Kim"]:
+            self.db.add_contact(name, None, None, None, self.account_ids[0])
+        contacts, _ = _all_pages(self.logic.get_contacts_page, limit=1)
+        self.assertEqual([c.name for c in contacts], ["Amy", "Kim", "Zed"])
+        self.db.cursor.execute("UPDATE contacts SET email = name || '@x.test' WHERE name != 'Kim'")
+        contacts, _ = _all_pages(self.logic.get_contacts_page, sort_key="-email", limit=1)
+        self.assertEqual([c.name for c in contacts], ["Zed", "Amy", "Kim"])
+
+        user_id = self.db.get_user_id_by_username('system_user')
+        for day in (3, 1, 2):
+            self.db.add_task({
+                'title': f"Task {day}", 'due_date': f"2030-01-0{day}", 'status': TaskStatus.OPEN.value,
+                'company_id': self.account_ids[0], 'created_by_user_id': user_id,
+                'created_at': "2024-01-01T00:00:00", 'updated_at': "2024-01-01T00:00:00",
+            })
+        tasks, pages = _all_pages(self.logic.get_tasks_page, filters={"status": TaskStatus.OPEN}, limit=2)
+        self.assertEqual(pages, 2)
+        self.assertEqual([t.title for t in tasks], ["Task 1", "Task 2", "Task 3"])
+
+    def test_products_page_includes_prices_and_paths(self):
+        product_logic = ProductLogic(self.db)
+        category_id = self.db.add_product_category("Tools")
+        for i, name in enumerate(["Saw", "Hammer", "Drill"]):
+            self.db.add_product(f"SKU-{i}", name, None, 1.5, 3.0, True)
+        self.db.cursor.execute("UPDATE products SET category_id = ? WHERE name != 'Hammer'", (category_id,))
+        products, _ = _all_pages(product_logic.get_products_page, filters={"category_id": category_id}, limit=2)
+        self.assertEqual([p.name for p in products], ["Drill", "Saw"])
+        self.assertEqual({(p.cost, p.sale_price, p.category) for p in products}, {(1.5, 3.0, "Tools")})
+
+    def test_documents_default_to_newest_first(self):
+        sales_logic = SalesLogic(self.db)
+        customer_id = self.account_ids[1]
+        quote_ids = []
+        for day in (1, 3, 2):
+            quote = sales_logic.create_quote(customer_id)
+            self.db.update_sales_document(quote.id, {"created_date": f"2024-01-0{day}T00:00:00"})
+            quote_ids.append(quote.id)
+        docs, pages = _all_pages(sales_logic.get_sales_documents_page, limit=2)
+        self.assertEqual(pages, 2)
+        self.assertEqual([d.id for d in docs], [quote_ids[1], quote_ids[2], quote_ids[0]])
+        sent, _ = sales_logic.get_sales_documents_page({"status": SalesDocumentStatus.QUOTE_SENT})
+        self.assertEqual(sent, [])
+
+        purchase_logic = PurchaseLogic(self.db)
+        rfq_ids = [purchase_logic.create_rfq(self.account_ids[0]).id for _ in range(3)]
+        docs, _ = _all_pages(purchase_logic.get_purchase_documents_page,
+                             filters={"status": PurchaseDocumentStatus.RFQ}, limit=2)
+        self.assertCountEqual([d.id for d in docs], rfq_ids)
+
+    def test_page_query_uses_index(self):
+        self.db.cursor.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM accounts WHERE (name, id) > (?, ?) ORDER BY name, id LIMIT 3",
+            ("Alpha", 1),
+        )
+        plan = " ".join(row[3] for row in self.db.cursor.fetchall())
+        self.assertIn("idx_accounts_name", plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
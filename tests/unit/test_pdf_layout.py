@@ -0,0 +1,112 @@
+import re
+import time
+import unittest
+import zlib
+
+from core.pdf_generator import (
+    LAYOUTS,
+    PDF,
+    DocumentContent,
+    FontMetrics,
+    LineRow,
+    build_pdf,
+    column_geometry,
+    pdf_bytes,
+)
+from scripts.render_benchmark import render_spec, sample_content
+
+# A 2,000-line invoice renders in roughly 0.2 s here; the budget leaves
+# headroom for slower machines.
+LONG_DOCUMENT_BUDGET = 1.5
+
+
+def _page_streams(data: bytes) -> list[bytes]:
+    streams = []
+    for match in re.finditer(rb"stream\r?\n(.*?)endstream", data, re.S):
+        try:
+            streams.append(zlib.decompress(match.group(1)))
+        except zlib.error:
+            streams.append(match.group(1))
+    return streams
+
+
+class TestPdfLayout(unittest.TestCase):
+    def setUp(self):
+        self.pdf = PDF()
+        self.pdf.add_page()
+        self.pdf.set_font("Arial", "", 9)
+        self.metrics = FontMetrics.for_pdf(self.pdf)
+
+    def test_wrap_fits_the_width_and_keeps_every_word(self):
+        text = "stainless bracket assembly " * 12 + "\nSecond paragraph"
+        lines = self.metrics.wrap(text.strip(), 60)
+        self.assertGreater(len(lines), 3)
+        for line in lines:
+            self.assertLessEqual(self.pdf.get_string_width(line), 60)
+        self.assertEqual(lines[-1], "Second paragraph")
+        self.assertEqual(" ".join(lines).split(), text.split())
+        self.assertIs(self.metrics.wrap(text.strip(), 60), lines)
+
+    def test_wrap_breaks_words_longer_than_a_line(self):
+        lines = self.metrics.wrap("x" * 200, 30)
+        self.assertGreater(len(lines), 1)
+        self.assertEqual("".join(lines), "x" * 200)
+        self.assertTrue(all(self.pdf.get_string_width(line) <= 30 for line in lines))
+
+    def test_column_geometry_spans_the_content_width(self):
+        columns = LAYOUTS["invoice"].tables[0].columns
+        geometry = column_geometry(columns, 10, 190)
+        self.assertEqual(geometry[0][0], 10)
+        last_x, last_width, _align = geometry[-1]
+        self.assertAlmostEqual(last_x + last_width, 200)
+        self.assertIs(column_geometry(columns, 10, 190), geometry)
+
+    def test_long_table_repeats_its_header_on_every_page(self):
+        data = pdf_bytes(build_pdf(LAYOUTS["invoice"], sample_content(300)))
+        self.assertTrue(data.startswith(b"%PDF-"))
+        pages = [s for s in _page_streams(data) if b"Td" in s]
+        self.assertGreater(len(pages), 1)
+        for page in pages:
+            self.assertIn(b"(Product/Service Description)", page)
+
+    def test_row_taller_than_a_page_continues_on_the_next_pages(self):
+        words = [f"word{i}" for i in range(6000)]
+        content = DocumentContent(
+            title="Invoice", number="INV-1", company_name="Co", company_lines=[],
+            tables=[[LineRow([("", " ".join(words))], ["1", "$1.00", "$1.00"]),
+                     LineRow([("", "After")], ["2", "$2.00", "$4.00"])]],
+        )
+        pdf = build_pdf(LAYOUTS["invoice"], content)
+        pages = [s for s in _page_streams(pdf_bytes(pdf)) if b"Td" in s]
+        self.assertGreater(len(pages), 2)
+        found = []
+        for page in pages:
+            self.assertIn(b"(Product/Service Description)", page)
+            for y, text in re.findall(rb"([-\d.]+) Td \((word[^)]*)\)", page):
+                self.assertGreater(float(y), pdf.b_margin * pdf.k)
+                found.extend(text.decode().split())
+        self.assertEqual(found, words)
+        self.assertEqual(b"".join(pages).count(b"($1.00)"), 2)
+        self.assertIn(b"(After)", pages[-1])
+
+    def test_empty_optional_table_is_left_out(self):
+        content = DocumentContent(
+            title="Packing Slip", number="SHIP-1", company_name="Co", company_lines=[],
+            tables=[[LineRow([("", "Widget")], ["1.00"])], []],
+        )
+        text = b"".join(_page_streams(pdf_bytes(build_pdf(LAYOUTS["packing_slip"], content))))
+        self.assertIn(b"(Qty Shipped)", text)
+        self.assertNotIn(b"Items Remaining to Ship", text)
+
+    def test_long_document_renders_within_budget(self):
+        content = sample_content(2000)
+        render_spec(content)  # Warm the metric caches like a running app would.
+        started = time.perf_counter()
+        data = render_spec(content)
+        elapsed = time.perf_counter() - started
+        self.assertTrue(data.startswith(b"%PDF-"))
+        self.assertLess(elapsed, LONG_DOCUMENT_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
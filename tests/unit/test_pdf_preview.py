@@ -0,0 +1,70 @@
+import io
+import os
+import re
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.pdf_generator import LAYOUTS, DocumentContent, LineRow, build_pdf, pdf_bytes
+from core.quote_generator import generate_quote_pdf
+from core.render_session import DocumentRenderSession
+from scripts.render_benchmark import render_spec, sample_content
+from shared.structs import Account, AccountType, Product
+from ui.base.pdf_preview import read_pages
+
+
+class TestPdfPreview(unittest.TestCase):
+    def test_generator_writes_to_a_stream_and_returns_the_bytes(self):
+        db = DatabaseHandler(db_name=':memory:')
+        try:
+            logic = AddressBookLogic(db)
+            customer = logic.save_account(Account(name="Cust", account_type=AccountType.CUSTOMER))
+            product_id = logic.save_product(Product(name="Widget", cost=5.0, sale_price=10.0))
+            session = DocumentRenderSession(db)
+            quote = session.sales_logic.create_quote(customer_id=customer.account_id)
+            session.sales_logic.add_item_to_sales_document(quote.id, product_id, 2)
+
+            before = set(os.listdir("."))
+            buffer = io.BytesIO()
+            data = generate_quote_pdf(quote.id, output_path=buffer, session=session)
+            self.assertEqual(set(os.listdir(".")), before)
+            self.assertIsInstance(data, memoryview)
+            self.assertEqual(buffer.getvalue(), bytes(data))
+            self.assertEqual(bytes(data[:5]), b"%PDF-")
+            texts = [item[3] for item in read_pages(data)[0].items if item[0] == "text"]
+            self.assertIn("Widget", texts)
+
+            self.assertIsNone(generate_quote_pdf(9999, output_path=io.BytesIO(), session=session))
+        finally:
+            db.close()
+
+    def test_read_pages_recovers_text_and_table_boxes(self):
+        pages = read_pages(render_spec(sample_content(120)))
+        self.assertGreater(len(pages), 1)
+        first = pages[0]
+        self.assertEqual((first.width, first.height), (595.28, 841.89))
+        self.assertIn(("Invoice - INV-BENCH", "Helvetica-Bold"),
+                      [(item[3], item[4]) for item in first.items if item[0] == "text"])
+        header_cells = [item for item in first.items if item[0] == "rect" and item[5] == "#dcdcdc"]
+        self.assertEqual(len(header_cells), 4)
+        last_texts = [item[3] for item in pages[-1].items if item[0] == "text"]
+        self.assertIn(f"Page {len(pages)}/{len(pages)}", last_texts)
+
+    def test_compressed_stream_ending_in_carriage_return(self):
+        data = render_spec(sample_content(385))
+        self.assertTrue(any(m.group(1).endswith(b"\r")
+                            for m in re.finditer(rb"stream\n(.*?)\nendstream", data, re.S)))
+        pages = read_pages(data)
+        self.assertEqual(len(pages), len(re.findall(rb"/Type /Page\b", data)))
+        self.assertTrue(all(page.items for page in pages))
+
+    def test_escaped_characters_are_unescaped(self):
+        name = "Smith (UK) \\ Sons"
+        content = DocumentContent(title="Quote", number="Q-1", company_name=name, company_lines=[],
+                                  tables=[[LineRow([("", "Widget")], ["1", "$1.00", "$1.00"])]])
+        pages = read_pages(pdf_bytes(build_pdf(LAYOUTS["quote"], content)))
+        self.assertIn(name, [item[3] for item in pages[0].items if item[0] == "text"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from core.database import DatabaseHandler
+from core.logic.product_management import ProductLogic
+from core.product_index import ProductSuggestIndex
+from shared.structs import Product
+
+
+class TestProductSuggestIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ProductSuggestIndex([
+            (1, "WID-100", "Steel Widget"),
+            (2, "WID-200", "Brass Widget Large"),
+            (3, "ANV-1", "Anvil"),
+            (4, "HNG-7", "Door Hinge"),
+        ])
+
+    def _ids(self, query, limit=10):
+        return [match.product_id for match in self.index.suggest(query, limit)]
+
+    def test_exact_and_prefix_sku_rank_first(self):
+        self.assertEqual(self._ids("anv-1")[0], 3)
+        self.assertEqual(self._ids("WID-2")[0], 2)
+
+    def test_typos_and_word_prefixes_match(self):
+        self.assertEqual(self._ids("widgte")[:2], [1, 2])
+        self.assertEqual(self._ids("hing")[0], 4)
+        self.assertEqual(self._ids("brass wid")[0], 2)
+        self.assertEqual(self._ids("qqqq"), [])
+
+    def test_empty_query_lists_by_name_and_limit_applies(self):
+        self.assertEqual(self._ids("", limit=2), [3, 2])
+        self.assertEqual(len(self._ids("w", limit=1)), 1)
+
+    def test_incremental_add_and_remove(self):
+        self.index.add(5, "GAD-1", "Gadget")
+        self.assertEqual(self._ids("gadget"), [5])
+        self.index.add(5, "GAD-1", "Gizmo")
+        self.assertEqual(self._ids("gadget"), [])
+        self.index.remove(3)
+        self.assertNotIn(3, self._ids("anvil"))
+        self.assertEqual(len(self.index), 4)
+
+
+class TestProductLogicSuggest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.logic = ProductLogic(self.db)
+        self.widget_id = self.logic.save_product(Product(name="Steel Widget", cost=1.0, sale_price=2.0))
+
+    def tearDown(self):
+        self.db.close()
+
+    def test_suggest_tracks_saves_and_deletes(self):
+        self.assertEqual([m.product_id for m in self.logic.suggest("widg")], [self.widget_id])
+
+        anvil = Product(name="Anvil", cost=1.0, sale_price=2.0)
+        anvil.sku = "ANV-1"
+        anvil_id = self.logic.save_product(anvil)
+        self.assertEqual(self.logic.suggest("anv-1")[0].product_id, anvil_id)
+
+        widget = self.logic.get_product_details(self.widget_id)
+        widget.is_active = False
+        self.logic.save_product(widget)
+        self.assertEqual(self.logic.suggest("widget"), [])
+
+        self.logic.delete_product(anvil_id)
+        self.assertEqual(self.logic.suggest("anvil"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -203,6 +203,18 @@ class TestCategoryManagement(BaseTestCase):
         skus = {p['sku'] for p in products}
         self.assertEqual(skus, {'P1', 'P2', 'P3'})
 
+    def test_category_paths_follow_moves_and_renames(self):
+        leaf_id = pm.create_category({'name': 'Gaming', 'parent_id': self.sub_cat1_id}, db_conn=self.conn)
+        self.assertEqual(pm.get_category(leaf_id, db_conn=self.conn)['full_path'], 'Electronics\\Laptops\\Gaming')
+
+        pm.update_category(self.sub_cat1_id, {'parent_id': self.cat2_id}, db_conn=self.conn)
+        self.assertEqual(pm.get_category(leaf_id, db_conn=self.conn)['full_path'], 'Books\\Laptops\\Gaming')
+        self.assertEqual(pm.get_category_descendants_ids(self.cat2_id, db_conn=self.conn), {self.sub_cat1_id, leaf_id})
+        self.assertEqual(pm.get_category_descendants_ids(self.cat1_id, db_conn=self.conn), set())
+
+        pm.update_category(self.cat2_id, {'name': 'Media'}, db_conn=self.conn)
+        self.assertEqual(pm.get_category(leaf_id, db_conn=self.conn)['full_path'], 'Media\\Laptops\\Gaming')
+
     def test_delete_category_product_reassignment_check(self):
         # Create a product in a category
         prod_id = pm.create_product({'sku': 'CATDELCHECK', 'name': 'Prod in SubCat', 'category_id': self.sub_cat1_id}, db_conn=self.conn)
@@ -0,0 +1,68 @@
+import datetime
+import unittest
+
+from core.database import DatabaseHandler
+from core.sales_logic import SalesLogic
+from core.scheduler import BackgroundScheduler, quote_expiry_job
+from shared.structs import AccountType, SalesDocumentStatus
+
+
+class TestQuoteExpiry(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.sales_logic = SalesLogic(self.db)
+        self.customer_id = self.db.add_account("Cust", None, None, None, AccountType.CUSTOMER.value)
+        self.today = datetime.date.today()
+
+    def tearDown(self):
+        self.db.close()
+
+    def _quote(self, days_offset, status=None):
+        expiry = (self.today + datetime.timedelta(days=days_offset)).isoformat()
+        quote = self.sales_logic.create_quote(self.customer_id, expiry_date_iso=expiry)
+        if status:
+            self.sales_logic.update_sales_document_status(quote.id, status)
+        return quote.id
+
+    def _status(self, doc_id):
+        return self.sales_logic.get_sales_document_details(doc_id).status
+
+    def test_expire_quotes_flips_only_open_overdue_quotes(self):
+        draft_id = self._quote(-1)
+        sent_id = self._quote(-5, SalesDocumentStatus.QUOTE_SENT)
+        accepted_id = self._quote(-5, SalesDocumentStatus.QUOTE_ACCEPTED)
+        due_today_id = self._quote(0)
+        future_id = self._quote(10)
+
+        self.assertEqual(self.sales_logic.expire_quotes(), 2)
+
+        self.assertEqual(self._status(draft_id), SalesDocumentStatus.QUOTE_EXPIRED)
+        self.assertEqual(self._status(sent_id), SalesDocumentStatus.QUOTE_EXPIRED)
+        self.assertEqual(self._status(accepted_id), SalesDocumentStatus.QUOTE_ACCEPTED)
+        self.assertEqual(self._status(due_today_id), SalesDocumentStatus.QUOTE_DRAFT)
+        self.assertEqual(self._status(future_id), SalesDocumentStatus.QUOTE_DRAFT)
+
+        # A later as_of date picks up the quote that was valid through today.
+        as_of = datetime.datetime.combine(self.today + datetime.timedelta(days=1), datetime.time(9))
+        self.assertEqual(self.sales_logic.expire_quotes(as_of), 1)
+        self.assertEqual(self._status(due_today_id), SalesDocumentStatus.QUOTE_EXPIRED)
+
+    def test_scheduled_job_and_index(self):
+        self._quote(-3)
+        scheduler = BackgroundScheduler()
+        scheduler.add_job("quote_expiry", quote_expiry_job, 3600)
+        self.assertEqual(scheduler.run_pending(self.db, now=0)[0].rows_changed, 1)
+
+        self.db.cursor.execute("""
+            EXPLAIN QUERY PLAN
+            UPDATE sales_documents SET status = 'Quote Expired'
+            WHERE expiry_date < ?
+              AND document_type = 'Quote'
+              AND status IN ('Quote Draft', 'Quote Sent')
+        """, (self.today.isoformat(),))
+        plan = " ".join(row[3] for row in self.db.cursor.fetchall())
+        self.assertIn("idx_sales_documents_open_quote_expiry", plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.render_cache import RenderCache, document_key, render_document, render_document_bytes
+from core.render_session import DocumentRenderSession
+from shared.structs import Account, AccountType, Product
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.logic = AddressBookLogic(self.db)
+        self.customer = self.logic.save_account(Account(name="Cust", account_type=AccountType.CUSTOMER))
+        product_id = self.logic.save_product(Product(name="Widget", cost=5.0, sale_price=10.0))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = RenderCache(os.path.join(self.tmp.name, "cache"))
+        sales = DocumentRenderSession(self.db).sales_logic
+        self.quote = sales.create_quote(customer_id=self.customer.account_id)
+        self.item = sales.add_item_to_sales_document(self.quote.id, product_id, 2)
+        self.sales = sales
+
+    def tearDown(self):
+        self.tmp.cleanup()
+        self.db.close()
+
+    def _render(self, output_name=None):
+        output = os.path.join(self.tmp.name, output_name) if output_name else None
+        return render_document("quote", self.quote.id, output_path=output,
+                               session=DocumentRenderSession(self.db), cache=self.cache)
+
+    def _key(self):
+        return document_key(DocumentRenderSession(self.db), "quote", self.quote.id)
+
+    def test_repeat_render_is_served_from_the_cache(self):
+        first = self._render()
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+        with open(first, "rb") as handle:
+            self.assertEqual(handle.read(5), b"%PDF-")
+
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        copy = self._render("copy.pdf")
+        self.db.conn.set_trace_callback(None)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        with open(first, "rb") as cached, open(copy, "rb") as exported:
+            self.assertEqual(cached.read(), exported.read())
+        self.assertFalse(any("INSERT" in s or "UPDATE" in s for s in statements))
+
+    def test_edits_change_the_key(self):
+        keys = [self._key()]
+        self.assertEqual(self._key(), keys[0])
+
+        self.db.update_sales_document(self.quote.id, {"notes": "Rush"})
+        keys.append(self._key())
+        self.sales.update_sales_document_item(self.item.id, self.item.product_id, 3, 10.0)
+        keys.append(self._key())
+        self.db.update_account(self.customer.account_id, "Cust Ltd", None, None, None,
+                               AccountType.CUSTOMER.value)
+        keys.append(self._key())
+        company = self.db.get_company_information() or {"company_id": self.db.add_company_information("Co", "")}
+        self.db.update_company_information(company["company_id"], "New Co", "555")
+        keys.append(self._key())
+        self.assertEqual(len(set(keys)), len(keys))
+
+    def test_in_memory_render_writes_nothing_and_reads_cached_pdfs(self):
+        data = render_document_bytes("quote", self.quote.id, session=DocumentRenderSession(self.db),
+                                     cache=self.cache)
+        self.assertEqual(bytes(data[:5]), b"%PDF-")
+        self.assertFalse(os.path.exists(self.cache.directory))
+
+        cached = self._render()
+        again = render_document_bytes("quote", self.quote.id, session=DocumentRenderSession(self.db),
+                                      cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(bytes(again), cached.read_bytes())
+
+    def test_missing_document_is_not_cached(self):
+        result = render_document("quote", 9999, session=DocumentRenderSession(self.db), cache=self.cache)
+        self.assertIsNone(result)
+        self.assertFalse(os.path.exists(self.cache.directory) and os.listdir(self.cache.directory))
+
+    def test_eviction_drops_least_recently_used(self):
+        cache = RenderCache(os.path.join(self.tmp.name, "small"), max_bytes=250)
+
+        def add(key):
+            source = cache.temp_path()
+            source.write_bytes(b"x" * 100)
+            cache.put(key, source)
+
+        add("a")
+        add("b")
+        os.utime(cache.path_for("a"), (1, 1))
+        os.utime(cache.path_for("b"), (2, 2))
+        self.assertIsNotNone(cache.get("a"))  # Now the most recently used.
+        add("c")
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+
+
+if __name__ == '__main__':
+    unittest.main()
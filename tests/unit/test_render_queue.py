@@ -0,0 +1,123 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.render_cache import RenderCache
+from core.render_queue import RenderQueue
+from core.sales_logic import SalesLogic
+from shared.structs import Account, AccountType, Product, RenderJobStatus
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = datetime.datetime(2026, 9, 1, 9, 0, 0)
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+class TestRenderQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "crm.db")
+        self.db = DatabaseHandler(db_name=self.path)
+        logic = AddressBookLogic(self.db)
+        customer = logic.save_account(Account(name="Cust", account_type=AccountType.CUSTOMER))
+        product_id = logic.save_product(Product(name="Widget", cost=5.0, sale_price=10.0))
+        sales = SalesLogic(self.db)
+        self.quote = sales.create_quote(customer_id=customer.account_id)
+        sales.add_item_to_sales_document(self.quote.id, product_id, 2)
+        self.clock = FakeClock()
+        self.cache = RenderCache(os.path.join(self.tmp.name, "cache"))
+        self.queue = RenderQueue(self.db, retry_delay_seconds=30, clock=self.clock, cache=self.cache)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def test_queued_job_is_rendered_by_the_worker(self):
+        output = os.path.join(self.tmp.name, "out", "Quote.pdf")
+        job_id = self.queue.enqueue("quote", self.quote.id, output, label="Quote Q-1")
+        self.assertEqual(self.queue.get_job(job_id).status, RenderJobStatus.QUEUED)
+
+        self.assertEqual(self.queue.process_due(), 1)
+        job = self.queue.get_job(job_id)
+        self.assertEqual((job.status, job.attempts, job.last_error), (RenderJobStatus.DONE, 1, None))
+        with open(output, "rb") as handle:
+            self.assertEqual(handle.read(5), b"%PDF-")
+        self.assertEqual(self.queue.process_due(), 0)
+        self.assertEqual(self.queue.counts()[RenderJobStatus.DONE], 1)
+
+        self.assertEqual(self.queue.clear_finished(), 1)
+        self.assertEqual(self.queue.jobs(), [])
+
+    def test_failures_are_retried_with_backoff_then_fail(self):
+        # The output directory cannot be created because a file is in the way.
+        blocker = os.path.join(self.tmp.name, "blocker")
+        open(blocker, "w").close()
+        job_id = self.queue.enqueue("quote", self.quote.id, os.path.join(blocker, "Quote.pdf"))
+        self.assertEqual(self.queue.process_due(), 1)
+        job = self.queue.get_job(job_id)
+        self.assertEqual((job.status, job.attempts), (RenderJobStatus.QUEUED, 1))
+        self.assertIsNotNone(job.last_error)
+
+        self.assertEqual(self.queue.process_due(), 0)  # Not due for another 30 s.
+        self.clock.advance(30)
+        self.assertEqual(self.queue.process_due(), 1)
+        self.clock.advance(30)
+        self.assertEqual(self.queue.process_due(), 0)  # The second retry waits 60 s.
+        self.clock.advance(30)
+        self.assertEqual(self.queue.process_due(), 1)
+        job = self.queue.get_job(job_id)
+        self.assertEqual((job.status, job.attempts), (RenderJobStatus.FAILED, 3))
+
+        self.assertEqual(self.queue.retry([job_id]), 1)
+        job = self.queue.get_job(job_id)
+        self.assertEqual((job.status, job.attempts), (RenderJobStatus.QUEUED, 0))
+
+    def test_missing_document_fails_without_retrying(self):
+        job_id = self.queue.enqueue("quote", 9999, os.path.join(self.tmp.name, "missing.pdf"))
+        self.assertEqual(self.queue.process_due(), 1)
+        job = self.queue.get_job(job_id)
+        self.assertEqual((job.status, job.attempts), (RenderJobStatus.FAILED, 1))
+        self.assertEqual(job.last_error, "The document no longer exists.")
+        self.clock.advance(3600)
+        self.assertEqual(self.queue.process_due(), 0)
+
+    def test_jobs_survive_a_restart(self):
+        job_id = self.queue.enqueue("quote", self.quote.id, os.path.join(self.tmp.name, "Quote.pdf"))
+        self.assertIsNotNone(self.db.claim_render_job(self.clock().isoformat()))
+        self.db.close()
+
+        # The app stopped while the job was rendering.
+        self.db = DatabaseHandler(db_name=self.path)
+        queue = RenderQueue(self.db, clock=self.clock, cache=self.cache)
+        self.assertEqual(queue.get_job(job_id).status, RenderJobStatus.RUNNING)
+        self.assertEqual(queue.recover(), 1)
+        self.assertEqual(queue.process_due(), 1)
+        self.assertEqual(queue.get_job(job_id).status, RenderJobStatus.DONE)
+
+    def test_a_claimed_job_is_not_handed_out_twice(self):
+        self.queue.enqueue("quote", self.quote.id, os.path.join(self.tmp.name, "Quote.pdf"))
+        other = DatabaseHandler(db_name=self.path)
+        try:
+            now = self.clock().isoformat()
+            self.assertIsNotNone(self.db.claim_render_job(now))
+            self.assertIsNone(other.claim_render_job(now))
+        finally:
+            other.close()
+
+    def test_unknown_kind_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.queue.enqueue("packing_slip", self.quote.id, "slip.pdf")
+        self.assertEqual(self.queue.jobs(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
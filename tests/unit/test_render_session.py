@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from core.purchase_order_generator import generate_po_pdf
+from core.quote_generator import generate_quote_pdf
+from core.sales_order_generator import generate_sales_order_pdf
+from core.render_session import DocumentRenderSession
+from shared.structs import Account, AccountType, Product
+
+
+class TestDocumentRenderSession(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        logic = AddressBookLogic(self.db)
+        term_id = logic.create_payment_term("Net 30", 30)
+        customer = logic.save_account(Account(
+            name="Cust", account_type=AccountType.CUSTOMER, payment_term_id=term_id,
+        ))
+        vendor = logic.save_account(Account(name="Vend", account_type=AccountType.VENDOR))
+        product_id = logic.save_product(Product(name="Widget", cost=5.0, sale_price=10.0))
+
+        self.session = DocumentRenderSession(self.db)
+        sales = self.session.sales_logic
+        self.quote_ids = []
+        for _ in range(3):
+            quote = sales.create_quote(customer_id=customer.account_id)
+            sales.add_item_to_sales_document(quote.id, product_id, 2)
+            self.quote_ids.append(quote.id)
+        self.order_id = sales.convert_quote_to_sales_order(self.quote_ids[0]).id
+        rfq = self.session.purchase_logic.create_rfq(vendor.account_id)
+        self.session.purchase_logic.add_item_to_document(rfq.id, product_id, 4)
+        self.rfq_id = rfq.id
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.session.close()
+        self.tmp.cleanup()
+        self.db.close()
+
+    def _out(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_documents_share_the_cached_context(self):
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        for doc_id in self.quote_ids:
+            generate_quote_pdf(doc_id, self._out(f"q{doc_id}.pdf"), session=self.session)
+        generate_sales_order_pdf(self.order_id, self._out("so.pdf"), session=self.session)
+        generate_po_pdf(self.rfq_id, self._out("po.pdf"), session=self.session)
+        self.db.conn.set_trace_callback(None)
+
+        outputs = os.listdir(self.tmp.name)
+        self.assertEqual(len(outputs), 5)
+        for name in outputs:
+            self.assertGreater(os.path.getsize(self._out(name)), 0)
+        company_queries = [s for s in statements if "FROM company_information" in s]
+        term_queries = [s for s in statements if "FROM payment_terms" in s]
+        account_queries = [s for s in statements if "FROM accounts AS a" in s]
+        self.assertEqual(len(company_queries), 1)
+        self.assertEqual(len(term_queries), 1)
+        # One lookup for the customer and one for the vendor.
+        self.assertEqual(len(account_queries), 2)
+
+    def test_product_names_come_from_one_query_per_document(self):
+        logic = AddressBookLogic(self.db)
+        product_ids = [
+            logic.save_product(Product(name=f"Part {n}", description=f"Desc {n}", cost=1.0, sale_price=2.0))
+            for n in range(5)
+        ]
+        sales = self.session.sales_logic
+        quote = sales.create_quote(customer_id=sales.get_sales_document_details(self.quote_ids[0]).customer_id)
+        for line in range(200):
+            sales.add_item_to_sales_document(quote.id, product_ids[line % 5], 1)
+
+        statements = []
+        self.db.conn.set_trace_callback(statements.append)
+        generate_quote_pdf(quote.id, self._out("big.pdf"), session=self.session)
+        self.db.conn.set_trace_callback(None)
+
+        self.assertGreater(os.path.getsize(self._out("big.pdf")), 0)
+        product_queries = [s for s in statements if "FROM products" in s]
+        self.assertEqual(len(product_queries), 1)
+        self.assertLess(len(statements), 20)
+        self.assertEqual(self.session.get_product(product_ids[2])["name"], "Part 2")
+
+    def test_session_leaves_a_borrowed_connection_open(self):
+        DocumentRenderSession(self.db).close()
+        self.db.cursor.execute("SELECT 1")
+
+    def test_prefetch_accounts_batches_lookups(self):
+        session = DocumentRenderSession(self.db)
+        session.prefetch_accounts([1, 2, 999])
+        self.assertEqual(session.get_account(1).name, "Cust")
+        self.assertIsNone(session.get_account(999))
+        self.assertIsNone(session.get_account(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
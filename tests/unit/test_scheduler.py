@@ -0,0 +1,85 @@
+import datetime
+import os
+import tempfile
+import time
+import unittest
+
+from core.database import DatabaseHandler
+from core.scheduler import BackgroundScheduler, overdue_task_job
+
+
+class TestBackgroundScheduler(unittest.TestCase):
+    def setUp(self):
+        self.db_handler = DatabaseHandler(db_name=':memory:')
+        self.user_id = self.db_handler.get_user_id_by_username('system_user')
+
+    def tearDown(self):
+        self.db_handler.close()
+
+    def _add_task(self, title, days_offset, status='Open'):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        due = (now + datetime.timedelta(days=days_offset)).date().isoformat()
+        return self.db_handler.add_task({
+            'title': title, 'due_date': due, 'status': status,
+            'created_by_user_id': self.user_id,
+            'created_at': now.isoformat(), 'updated_at': now.isoformat(),
+        })
+
+    def test_overdue_job_reports_rows_and_timing(self):
+        self._add_task("Late", -1)
+        self._add_task("Later", -3)
+        self._add_task("Done", -2, status='Completed')
+        self._add_task("Future", 2)
+
+        scheduler = BackgroundScheduler()
+        scheduler.add_job("overdue_tasks", overdue_task_job, 60)
+        results = scheduler.run_pending(self.db_handler, now=0)
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].rows_changed, 2)
+        self.assertGreaterEqual(results[0].elapsed_ms, 0)
+        self.assertIs(scheduler.last_results["overdue_tasks"], results[0])
+
+        # Not due again until the interval has passed.
+        self.assertEqual(scheduler.run_pending(self.db_handler, now=30), [])
+        self.assertEqual(scheduler.run_pending(self.db_handler, now=60)[0].rows_changed, 0)
+
+    def test_sweep_uses_partial_index(self):
+        self.db_handler.cursor.execute("""
+            EXPLAIN QUERY PLAN
+            UPDATE tasks SET status = 'Overdue', updated_at = ?
+            WHERE due_date < ?
+              AND is_deleted = 0
+              AND status NOT IN ('Completed', 'Overdue')
+        """, ('2024-01-01', '2024-01-01'))
+        plan = " ".join(row[3] for row in self.db_handler.cursor.fetchall())
+        self.assertIn("idx_tasks_open_due_date", plan)
+
+    def test_failing_job_is_recorded(self):
+        def broken(db):
+            raise RuntimeError("boom")
+
+        scheduler = BackgroundScheduler()
+        scheduler.add_job("broken", broken, 10)
+        result = scheduler.run_pending(self.db_handler, now=0)[0]
+        self.assertEqual(result.error, "boom")
+        self.assertEqual(result.rows_changed, 0)
+
+    def test_worker_thread_uses_its_own_connection(self):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        try:
+            scheduler = BackgroundScheduler(db_factory=lambda: DatabaseHandler(db_name=path), poll_seconds=0.01)
+            scheduler.add_job("noop", lambda db: 0, 60)
+            scheduler.start()
+            deadline = time.monotonic() + 5
+            while "noop" not in scheduler.last_results and time.monotonic() < deadline:
+                time.sleep(0.01)
+            scheduler.stop()
+            self.assertIn("noop", scheduler.last_results)
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -63,3 +63,55 @@ def test_initialize_database_applies_migrations():
     finally:
         os.remove(path)
 
+
+
+def test_migration_backfills_category_closure():
+    """Category paths and closure rows are rebuilt for pre-version-3 databases."""
+
+    conn = sqlite3.connect(":memory:")
+    cur = conn.cursor()
+    cur.execute(
+        "CREATE TABLE schema_version (version INTEGER PRIMARY KEY, applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    cur.execute("INSERT INTO schema_version (version) VALUES (2)")
+    cur.execute(
+        "CREATE TABLE product_categories (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, parent_id INTEGER, description TEXT)"
+    )
+    cur.execute("INSERT INTO product_categories (id, name, parent_id) VALUES (1, 'Tools', NULL)")
+    cur.execute("INSERT INTO product_categories (id, name, parent_id) VALUES (2, 'Power', 1)")
+    cur.execute("INSERT INTO product_categories (id, name, parent_id) VALUES (3, 'Drills', 2)")
+    conn.commit()
+
+    initialize_database(db_conn=conn)
+
+    cur.execute("SELECT full_path FROM product_categories WHERE id = 3")
+    assert cur.fetchone()[0] == "Tools\\Power\\Drills"
+    cur.execute("SELECT descendant_id, depth FROM product_category_closure WHERE ancestor_id = 1 ORDER BY depth")
+    assert cur.fetchall() == [(1, 0), (2, 1), (3, 2)]
+    conn.close()
+
+
+def test_current_fingerprint_takes_single_query_fast_path():
+    conn = sqlite3.connect(":memory:")
+    try:
+        assert initialize_database(db_conn=conn)["path"] == "full"
+        statements = []
+        conn.set_trace_callback(statements.append)
+        timing = initialize_database(db_conn=conn)
+        assert timing["path"] == "fast"
+        assert len(statements) == 1
+    finally:
+        conn.close()
+
+
+def test_changed_ddl_hash_reruns_full_setup():
+    conn = sqlite3.connect(":memory:")
+    try:
+        initialize_database(db_conn=conn)
+        conn.execute("UPDATE schema_fingerprint SET ddl_hash = 'stale'")
+        conn.execute("DROP TABLE table_changes")
+        assert initialize_database(db_conn=conn)["path"] == "full"
+        assert conn.execute("SELECT COUNT(*) FROM table_changes").fetchone()[0] > 0
+        assert initialize_database(db_conn=conn)["path"] == "fast"
+    finally:
+        conn.close()
@@ -0,0 +1,75 @@
+import unittest
+
+from core.database import DatabaseHandler
+from core.logic import product_management as pm
+from core.repositories import SearchRepository
+from core.search_service import SearchService, build_match_query
+from shared.structs import AccountType
+
+
+class TestSearchService(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.service = SearchService(SearchRepository(self.db))
+        self.account_id = self.db.add_account("Acme Widgets", "555-0100", None, "Industrial supplier",
+                                              AccountType.CUSTOMER.value)
+        self.contact_id = self.db.add_contact("Wile Coyote", "555-0199", "wile@acme.test", "Buyer", self.account_id)
+        self.product_id = self.db.add_product("ANV-1", "Anvil", "Heavy widget for desert use", 10.0, 20.0, True)
+        self.sales_id = self.db.add_sales_document("S-1001", self.account_id, "Quote", "2024-01-01",
+                                                   "Quote Draft", notes="Rush order of widgets")
+
+    def tearDown(self):
+        self.db.close()
+
+    def _hits(self, query, **kwargs):
+        return [(r.kind, r.id) for r in self.service.search(query, **kwargs)]
+
+    def test_title_matches_rank_above_body_matches(self):
+        hits = self._hits("widget")
+        self.assertEqual(hits[0], ("account", self.account_id))
+        self.assertCountEqual(hits, [("account", self.account_id), ("product", self.product_id),
+                                     ("sales_document", self.sales_id)])
+
+    def test_prefix_kinds_and_document_numbers(self):
+        self.assertEqual(self._hits("coyo"), [("contact", self.contact_id)])
+        self.assertEqual(self._hits("widget", kinds=["product"]), [("product", self.product_id)])
+        self.assertEqual(self._hits("S-1001"), [("sales_document", self.sales_id)])
+        with self.assertRaises(ValueError):
+            self.service.search("widget", kinds=["invoice"])
+
+    def test_triggers_follow_updates_and_deletes(self):
+        self.db.update_contact(self.contact_id, "Road Runner", "555-0199", "rr@acme.test", "Buyer", self.account_id)
+        self.assertEqual(self._hits("coyote"), [])
+        self.assertEqual(self._hits("runner"), [("contact", self.contact_id)])
+
+        self.db.delete_contact(self.contact_id)
+        self.assertEqual(self._hits("runner"), [])
+
+    def test_user_text_cannot_inject_fts_syntax(self):
+        self.assertEqual(build_match_query('acme OR "x'), '"acme"* "OR"* "x"*')
+        self.assertEqual(self.service.search('"(*'), [])
+
+    def test_rebuild_and_product_query_filter(self):
+        self.db.cursor.execute("DELETE FROM search_index")
+        self.assertEqual(self._hits("anvil"), [])
+        self.db.rebuild_search_index()
+        self.assertEqual(self._hits("anvil"), [("product", self.product_id)])
+
+        products = pm.list_products({"query": "desert"}, db_conn=self.db.conn)
+        self.assertEqual([p["id"] for p in products], [self.product_id])
+
+    def test_inactive_rows_are_not_indexed(self):
+        self.db.cursor.execute("UPDATE products SET is_active = 0 WHERE id = ?", (self.product_id,))
+        self.db.delete_sales_document(self.sales_id)
+        self.assertEqual(self._hits("anvil"), [])
+        self.assertEqual(self._hits("S-1001"), [])
+
+        self.db.rebuild_search_index()
+        self.assertEqual(self._hits("anvil"), [])
+
+        self.db.cursor.execute("UPDATE products SET is_active = 1 WHERE id = ?", (self.product_id,))
+        self.assertEqual(self._hits("anvil"), [("product", self.product_id)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from core.database_setup import initialize_database
+from scripts.startup_benchmark import time_startup
+
+# Generous budgets (seconds) so slow CI machines pass; a regression to
+# re-running the schema setup on every launch still trips the warm one.
+COLD_DATABASE_BUDGET = 1.0
+WARM_DATABASE_BUDGET = 0.05
+VIEW_BUDGET = 2.0
+
+
+class TestStartup(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "startup.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cold_and_warm_startup_within_budget(self):
+        cold = time_startup(self.path, build_view=False)
+        warm = min(time_startup(self.path, build_view=False)["database"] for _ in range(3))
+        self.assertLess(cold["database"], COLD_DATABASE_BUDGET)
+        self.assertLess(warm, WARM_DATABASE_BUDGET)
+
+    def test_current_schema_is_not_recreated(self):
+        time_startup(self.path, build_view=False)
+        conn = sqlite3.connect(self.path)
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            initialize_database(db_conn=conn)
+        finally:
+            conn.close()
+        self.assertFalse([s for s in statements if "CREATE" in s.upper()])
+
+    def test_main_window_builds_within_budget(self):
+        timings = time_startup(self.path)
+        if timings["view"] is None:
+            self.skipTest("Tkinter root not available, skipping UI-dependent test.")
+        self.assertLess(timings["view"], VIEW_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
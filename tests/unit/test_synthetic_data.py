@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from core.database import DatabaseHandler
+from scripts.synthetic_data import Scale, generate
+
+TINY = Scale(accounts=40, contacts=120, products=60, sales_lines=400,
+             purchase_lines=150, inventory_transactions=2_000, interactions=300)
+
+
+class TestSyntheticData(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _generate(self, name, seed=1):
+        path = os.path.join(self.tmp.name, name)
+        return path, generate(path, TINY, seed=seed)
+
+    def _dump(self, path, table):
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute(f"SELECT * FROM {table} ORDER BY 1").fetchall()
+        finally:
+            conn.close()
+
+    def test_counts_integrity_and_stock(self):
+        path, counts = self._generate("bench.db")
+        self.assertEqual(counts["accounts"], TINY.accounts)
+        self.assertEqual(counts["contacts"], TINY.contacts)
+        self.assertEqual(counts["products"], TINY.products)
+        self.assertEqual(counts["sales_document_items"], TINY.sales_lines)
+        self.assertEqual(counts["purchase_document_items"], TINY.purchase_lines)
+        self.assertEqual(counts["inventory_transactions"], TINY.inventory_transactions)
+        self.assertEqual(counts["interactions"], TINY.interactions)
+
+        conn = sqlite3.connect(path)
+        try:
+            self.assertEqual(conn.execute("PRAGMA foreign_key_check").fetchall(), [])
+            drift = conn.execute("""
+                SELECT COUNT(*) FROM products p
+                WHERE p.quantity_on_hand != (
+                    SELECT SUM(quantity_change) FROM inventory_transactions t
+                    WHERE t.product_id = p.id AND t.transaction_type != 'Purchase Order')
+            """).fetchone()[0]
+            self.assertEqual(drift, 0)
+            subtotal_drift = conn.execute("""
+                SELECT COUNT(*) FROM sales_documents d
+                WHERE abs(d.subtotal - (SELECT SUM(line_total) FROM sales_document_items i
+                                        WHERE i.sales_document_id = d.id)) > 0.01
+            """).fetchone()[0]
+            self.assertEqual(subtotal_drift, 0)
+            # Indexes and triggers dropped for the load are back.
+            self.assertEqual(conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = 'idx_interactions_company_date'"
+            ).fetchone()[0], 1)
+            self.assertGreater(conn.execute("SELECT COUNT(*) FROM search_index").fetchone()[0], 0)
+        finally:
+            conn.close()
+
+        db = DatabaseHandler(path)
+        try:
+            self.assertEqual(db.init_timing["path"], "fast")
+        finally:
+            db.close()
+
+    def test_same_seed_is_reproducible(self):
+        first, _ = self._generate("a.db")
+        second, _ = self._generate("b.db")
+        other, _ = self._generate("c.db", seed=2)
+        for table in ("accounts", "sales_document_items", "inventory_transactions", "interactions"):
+            self.assertEqual(self._dump(first, table), self._dump(second, table))
+        self.assertNotEqual(self._dump(first, "sales_document_items"), self._dump(other, "sales_document_items"))
+
+    def test_refuses_to_overwrite(self):
+        path, _ = self._generate("bench.db")
+        with self.assertRaises(FileExistsError):
+            generate(path, TINY)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -285,6 +285,35 @@ class TestTaskLogic(unittest.TestCase):
         self.assertEqual(all_tasks_sorted_desc[1].title, "Task1-C1-U1-H") # Due today
         self.assertEqual(all_tasks_sorted_desc[2].title, "Task3-C1-U1-L") # Due yesterday
 
+    def test_task_list_rows_join_names_and_sort_in_sql(self):
+        """get_task_list_rows returns display names and honours filters, sorting and paging."""
+        company_id = self.db_handler.add_account("Acme", None, None, None, AccountType.CUSTOMER.value)
+        self.logic.create_task(self._create_dummy_task_obj("Bravo", days_offset=2, company_id=company_id,
+                                                           priority=TaskPriority.LOW,
+                                                           assigned_to_user_id=self.another_user_id))
+        self.logic.create_task(self._create_dummy_task_obj("alpha", days_offset=1, priority=TaskPriority.HIGH))
+        self.logic.create_task(self._create_dummy_task_obj("Charlie", days_offset=3, priority=TaskPriority.MEDIUM))
+
+        rows = self.logic.get_task_list_rows()
+        self.assertEqual([r["title"] for r in rows], ["alpha", "Bravo", "Charlie"])
+        bravo = rows[1]
+        self.assertEqual(bravo["company"], "Acme")
+        self.assertEqual(bravo["assigned_user"], "another_test_user")
+        self.assertIsNone(bravo["contact"])
+        self.assertEqual(len(bravo["due_date"]), 10)
+
+        by_priority = self.logic.get_task_list_rows(sort=("priority", True))
+        self.assertEqual([r["title"] for r in by_priority], ["alpha", "Charlie", "Bravo"])
+
+        page = self.logic.get_task_list_rows(sort=("title", False), limit=1, offset=1)
+        self.assertEqual([r["title"] for r in page], ["Bravo"])
+
+        filtered = self.logic.get_task_list_rows(filters={"company_id": company_id, "priority": TaskPriority.LOW})
+        self.assertEqual([r["title"] for r in filtered], ["Bravo"])
+
+        with self.assertRaises(ValueError):
+            self.logic.get_task_list_rows(sort=("description; DROP TABLE tasks", False))
+
     # Permissions are conceptually tested by ensuring created_by_user_id and assigned_to_user_id are stored.
     # Actual enforcement (e.g. only assigned user can complete) would be in logic methods not yet specified to that level.
 
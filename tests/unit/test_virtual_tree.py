@@ -0,0 +1,79 @@
+import unittest
+
+from core.address_book_logic import AddressBookLogic
+from core.database import DatabaseHandler
+from shared.structs import AccountType
+from ui.base.virtual_tree import PagedRows
+
+
+class TestPagedRows(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseHandler(db_name=':memory:')
+        self.logic = AddressBookLogic(self.db)
+        self.account_ids = [
+            self.db.add_account(f"Account {i:03d}", None, None, None, AccountType.CUSTOMER.value)
+            for i in range(25)
+        ]
+        self.fetches = []
+
+    def tearDown(self):
+        self.db.close()
+
+    def _fetch(self, sort_key, after, limit):
+        self.fetches.append(after)
+        accounts, next_cursor = self.logic.get_accounts_page(None, sort_key, after, limit)
+        return [(a.account_id, (a.name,)) for a in accounts], next_cursor
+
+    def test_window_fetches_only_the_pages_it_needs(self):
+        rows = PagedRows(self._fetch, "name", page_size=10)
+        window = rows.window(5, 8)
+        self.assertEqual([values[0] for _key, values in window],
+                         [f"Account {i:03d}" for i in range(5, 13)])
+        self.assertEqual(len(self.fetches), 2)
+        self.assertEqual(len(rows), 20)
+        self.assertFalse(rows.complete)
+        self.assertEqual(rows.estimated_total, 30)
+
+        self.assertEqual(len(rows.window(20, 10)), 5)
+        self.assertTrue(rows.complete)
+        self.assertEqual(rows.estimated_total, 25)
+        self.assertIsNone(rows.key_at(25))
+        self.assertIsNone(rows.key_at(-1))
+
+    def test_find_pages_through_and_keys_are_strings(self):
+        rows = PagedRows(self._fetch, "name", page_size=4)
+        last_id = self.account_ids[-1]
+        self.assertIsNone(rows.index_of(last_id))
+        self.assertEqual(rows.find(last_id), 24)
+        self.assertEqual(rows.key_at(24), str(last_id))
+        self.assertEqual(rows.values(str(last_id)), ("Account 024",))
+        self.assertIsNone(rows.find(999999))
+
+    def test_scan_returns_pages_up_to_the_key_for_add_page(self):
+        rows = PagedRows(self._fetch, "name", page_size=4)
+        rows.window(0, 4)
+        generation = rows.generation
+        pages = PagedRows.scan(self._fetch, self.account_ids[9], rows.sort_key, rows.cursor, rows.page_size)
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(len(rows), 4)  # scan leaves the cache alone
+        for page in pages:
+            rows.add_page(*page)
+        self.assertEqual(rows.index_of(self.account_ids[9]), 9)
+        self.assertEqual(rows.generation, generation)
+
+        pages = PagedRows.scan(self._fetch, 999999, rows.sort_key, rows.cursor, rows.page_size)
+        self.assertIsNone(pages[-1][1])
+        rows.reset()
+        self.assertEqual(rows.generation, generation + 1)
+
+    def test_reset_switches_sort_order(self):
+        rows = PagedRows(self._fetch, "name", page_size=10)
+        rows.window(0, 1)
+        rows.reset("-name")
+        self.assertEqual(len(rows), 0)
+        self.assertEqual(rows.window(0, 1)[0][1], ("Account 024",))
+        self.assertEqual(rows.sort_key, "-name")
+
+
+if __name__ == '__main__':
+    unittest.main()
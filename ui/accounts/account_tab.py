@@ -1,18 +1,22 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox
 from ui.accounts.account_popup import AccountDetailsPopup
 from shared.structs import Account, AccountType
 from ui.base.tab_base import TabBase
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
+from ui.base.virtual_tree import VirtualTreeview
 
 
 class AccountTab(TabBase):
-    def __init__(self, master, logic):
+    def __init__(self, master, logic, loader=None):
         super().__init__(master)
         self.logic = logic
         self.selected_account_id = None  # Initialize selected_account_id as None
+        self.loader = loader or BackgroundLoader.inline(self, LoadContext(address_book_logic=logic))
 
         # Setup account tab components
         self.setup_account_tab()
+        self.loading = LoadingIndicator(self)
         self.load_accounts()
 
         # Bind the FocusIn event to reload the listbox each time the tab gains focus
@@ -72,11 +76,10 @@ class AccountTab(TabBase):
                 label=label, variable=var, command=self.update_columns
             )
 
-        # Treeview for displaying accounts
-        self.tree = ttk.Treeview(
+        # Virtualized list for displaying accounts, keyed by account id
+        self.tree = VirtualTreeview(
             self,
-            columns=(
-                "id",
+            (
                 "name",
                 "phone",
                 "description",
@@ -84,36 +87,26 @@ class AccountTab(TabBase):
                 "pricing_rule",
                 "payment_term",
             ),
-            show="headings",
-        )
-        # Hide the ID column and configure displayed columns
-        self.tree.column("id", width=0, stretch=False)
-        self.tree["displaycolumns"] = (
-            "name",
-            "phone",
-            "description",
-            "account_type",
-            "pricing_rule",
-            "payment_term",
-        )
-        self.tree.heading("name", text="Account Name", command=lambda: self.sort_column("name", False))
-        self.tree.heading("phone", text="Phone", command=lambda: self.sort_column("phone", False))
-        self.tree.heading("description", text="Description", command=lambda: self.sort_column("description", False))
-        self.tree.heading(
-            "account_type",
-            text="Account Type",
-            command=lambda: self.sort_column("account_type", False),
-        )
-        self.tree.heading(
-            "pricing_rule",
-            text="Pricing Rule",
-            command=lambda: self.sort_column("pricing_rule", False),
-        )
-        self.tree.heading(
-            "payment_term",
-            text="Payment Term",
-            command=lambda: self.sort_column("payment_term", False),
+            self._fetch_accounts,
+            sort_keys={
+                "name": "name",
+                "phone": "phone",
+                "description": "description",
+                "account_type": "account_type",
+                "pricing_rule": "pricing_rule",
+                "payment_term": "payment_term",
+            },
+            sort_key="name",
+            loader=self.loader,
+            context_fetch=lambda ctx, sort_key, after, limit: self._account_page(
+                ctx.address_book_logic, sort_key, after, limit),
         )
+        self.tree.heading("name", text="Account Name")
+        self.tree.heading("phone", text="Phone")
+        self.tree.heading("description", text="Description")
+        self.tree.heading("account_type", text="Account Type")
+        self.tree.heading("pricing_rule", text="Pricing Rule")
+        self.tree.heading("payment_term", text="Payment Term")
         self.tree.column("name", width=150)
         self.tree.column("phone", width=100)
         self.tree.column("description", width=150)
@@ -140,6 +133,7 @@ class AccountTab(TabBase):
             try:
                 self.logic.delete_account(self.selected_account_id)
                 messagebox.showinfo("Success", "Account deleted successfully.")
+                self.tree.selection_set()
                 self.load_accounts()  # Refresh list
             except Exception as e:  # Catch potential errors from logic/db layer
                 messagebox.showerror("Error", f"Failed to delete account: {e}")
@@ -162,15 +156,29 @@ class AccountTab(TabBase):
         self.load_accounts()  # Then reload
 
     def load_accounts(self):
-        """Load accounts into the Tree"""
+        """Reload the account list, fetching the first page in the background."""
+        sort_key = self.tree.rows.sort_key
+        limit = self.tree.rows.page_size
+        self.loader.submit(
+            "accounts",
+            lambda ctx: self._account_page(ctx.address_book_logic, sort_key, None, limit),
+            lambda page: self.tree.load(page, sort_key),
+            indicator=self.loading,
+        )
 
-        # Clear the Treeview to start fresh
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+    def _fetch_accounts(self, sort_key, after, limit):
+        """Page source for scrolling and re-sorting the account list."""
+        return self._account_page(self.logic, sort_key, after, limit)
 
-        # Retrieve all accounts - logic.get_all_accounts() should now return Account objects
-        accounts_obj_list = self.logic.get_all_accounts()
+    @staticmethod
+    def _account_page(logic, sort_key, after, limit):
+        """Build one page of list rows; runs on a loader thread, so no Tk calls."""
+        accounts_obj_list, next_cursor = logic.get_accounts_page(None, sort_key, after, limit)
 
+        # Each rule and term is looked up once per page rather than once per row.
+        pricing_rules = {}
+        payment_terms = {}
+        rows = []
         for account_obj in accounts_obj_list:
             account_type_display = (
                 account_obj.account_type.value if account_obj.account_type else "N/A"
@@ -178,38 +186,38 @@ class AccountTab(TabBase):
 
             pricing_rule_name = "N/A"
             if account_obj.pricing_rule_id:
-                rule = self.logic.get_pricing_rule(account_obj.pricing_rule_id)
-                pricing_rule_name = rule.rule_name if rule else "N/A"
+                if account_obj.pricing_rule_id not in pricing_rules:
+                    rule = logic.get_pricing_rule(account_obj.pricing_rule_id)
+                    pricing_rules[account_obj.pricing_rule_id] = rule.rule_name if rule else "N/A"
+                pricing_rule_name = pricing_rules[account_obj.pricing_rule_id]
 
             payment_term_name = "N/A"
             if account_obj.payment_term_id:
-                term = self.logic.get_payment_term(account_obj.payment_term_id)
-                payment_term_name = term.term_name if term else "N/A"
-
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    account_obj.account_id,
-                    account_obj.name,
-                    account_obj.phone,
-                    account_obj.description or "N/A",
-                    account_type_display,
-                    pricing_rule_name,
-                    payment_term_name,
-                ),
-            )
+                if account_obj.payment_term_id not in payment_terms:
+                    term = logic.get_payment_term(account_obj.payment_term_id)
+                    payment_terms[account_obj.payment_term_id] = term.term_name if term else "N/A"
+                payment_term_name = payment_terms[account_obj.payment_term_id]
+
+            rows.append((account_obj.account_id, (
+                account_obj.name,
+                account_obj.phone,
+                account_obj.description or "N/A",
+                account_type_display,
+                pricing_rule_name,
+                payment_term_name,
+            )))
+        return rows, next_cursor
 
     def select_account(self, event=None):
         """Retrieve the Account_ID of the selected account."""
         selected_item = self.tree.selection()
         if selected_item:
-            # First value in 'values' is the account_id
-            self.selected_account_id = self.tree.item(selected_item[0], 'values')[0]
+            # Rows are keyed by account_id
+            self.selected_account_id = selected_item[0]
         else:
             self.selected_account_id = None
 
     def update_columns(self):
         """Update which columns are displayed based on menu selections."""
         display_columns = ["name"] + [col for col, var in self.column_vars.items() if var.get()]
-        self.tree.config(displaycolumns=display_columns)
+        self.tree.treeview.config(displaycolumns=display_columns)
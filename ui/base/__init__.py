@@ -1,4 +1,16 @@
+from .background_loader import BackgroundLoader, LoadContext, LoadingIndicator
 from .popup_base import PopupBase
+from .product_typeahead import ProductTypeahead
 from .tab_base import TabBase
+from .virtual_tree import PagedRows, VirtualTreeview
 
-__all__ = ["PopupBase", "TabBase"]
+__all__ = [
+    "BackgroundLoader",
+    "LoadContext",
+    "LoadingIndicator",
+    "PagedRows",
+    "PopupBase",
+    "ProductTypeahead",
+    "TabBase",
+    "VirtualTreeview",
+]
@@ -0,0 +1,258 @@
+"""Run tab queries on worker threads and hand the results back to Tk.
+
+Tk widgets may only be touched from the main thread and SQLite connections
+only from the thread that opened them, so every worker opens its own
+read-only connection (wrapped in a :class:`LoadContext`) and posts results
+to a queue that the main loop drains with ``root.after``.
+"""
+
+import logging
+import queue
+import threading
+import tkinter as tk
+from dataclasses import dataclass
+from tkinter import ttk
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoadContext:
+    """Logic objects a load job may use, all bound to one connection."""
+
+    db: Any = None
+    address_book_logic: Any = None
+    product_logic: Any = None
+    sales_logic: Any = None
+    purchase_logic: Any = None
+    inventory_service: Any = None
+
+    @classmethod
+    def for_database(cls, db) -> "LoadContext":
+        """Build the logic layer on top of ``db`` the way the main view does."""
+        from core.address_book_logic import AddressBookLogic
+        from core.inventory_service import InventoryService
+        from core.logic.product_management import ProductLogic
+        from core.purchase_logic import PurchaseLogic
+        from core.repositories import InventoryRepository, ProductRepository
+        from core.sales_logic import SalesLogic
+
+        inventory_service = InventoryService(InventoryRepository(db), ProductRepository(db))
+        return cls(
+            db=db,
+            address_book_logic=AddressBookLogic(db),
+            product_logic=ProductLogic(db),
+            sales_logic=SalesLogic(db, inventory_service=inventory_service),
+            purchase_logic=PurchaseLogic(db, inventory_service=inventory_service),
+            inventory_service=inventory_service,
+        )
+
+    @classmethod
+    def read_only(cls, db_path: str) -> "LoadContext":
+        """Context on a new read-only connection to ``db_path``."""
+        from core.database import DatabaseHandler
+
+        return cls.for_database(DatabaseHandler(db_path, read_only=True))
+
+
+class LoadTicket:
+    """One submitted load; cancelled when a newer load for its channel arrives."""
+
+    def __init__(self, channel: str, job: Callable[[LoadContext], Any],
+                 on_done: Callable[[Any], None], on_error=None, indicator=None):
+        self.channel = channel
+        self.job = job
+        self.on_done = on_done
+        self.on_error = on_error
+        self.indicator = indicator
+        self.cancelled = False
+        self.context: Optional[LoadContext] = None  # Set while a worker runs the job
+
+
+class LoadingIndicator:
+    """Label reading "Loading…" shown over a tab while any of its loads are pending."""
+
+    def __init__(self, parent, text: str = "Loading…"):
+        self.label = ttk.Label(parent, text=text)
+        self._pending = 0
+
+    @property
+    def active(self) -> bool:
+        return self._pending > 0
+
+    def start(self) -> None:
+        self._pending += 1
+        if self._pending == 1:
+            # place() works alongside whichever manager lays out the parent.
+            self.label.place(relx=1.0, x=-10, y=5, anchor="ne")
+            self.label.lift()
+
+    def stop(self) -> None:
+        self._pending = max(0, self._pending - 1)
+        if not self._pending:
+            self.label.place_forget()
+
+
+class BackgroundLoader:
+    """Worker pool for tab loads.
+
+    ``submit(channel, job, on_done)`` runs ``job(context)`` on a worker and
+    later calls ``on_done(result)`` on the Tk thread. Only the newest load per
+    channel is delivered: submitting again (e.g. on rapid focus changes)
+    cancels the previous one, interrupting its query if it is running.
+    With ``workers=0`` jobs run inline on the calling thread, which is what
+    in-memory databases and the standalone tab demos need.
+    """
+
+    def __init__(self, root, context_factory: Callable[[], LoadContext],
+                 workers: int = 2, poll_ms: int = 20):
+        if workers < 0:
+            raise ValueError("workers must not be negative.")
+        self.root = root
+        self.context_factory = context_factory
+        self.workers = workers
+        self.poll_ms = poll_ms
+        self._latest: dict[str, LoadTicket] = {}
+        self._jobs: queue.Queue = queue.Queue()
+        self._results: queue.Queue = queue.Queue()
+        self._outstanding = 0
+        self._poll_id = None
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._inline_context: Optional[LoadContext] = None
+
+    @classmethod
+    def inline(cls, root, context: LoadContext) -> "BackgroundLoader":
+        """Loader running every job immediately against ``context``."""
+        return cls(root, lambda: context, workers=0)
+
+    def submit(self, channel: str, job: Callable[[LoadContext], Any],
+               on_done: Callable[[Any], None], on_error=None, indicator=None) -> LoadTicket:
+        """Queue ``job`` for ``channel``, superseding any load still pending there."""
+        previous = self._latest.get(channel)
+        if previous is not None:
+            self._cancel_ticket(previous)
+        ticket = LoadTicket(channel, job, on_done, on_error, indicator)
+        self._latest[channel] = ticket
+        if indicator is not None:
+            indicator.start()
+
+        if self.workers == 0:
+            if self._inline_context is None:
+                self._inline_context = self.context_factory()
+            self._finish(ticket, *self._run(ticket, self._inline_context))
+            return ticket
+
+        self._start_workers()
+        self._outstanding += 1
+        self._jobs.put(ticket)
+        self._schedule_poll()
+        return ticket
+
+    def cancel(self, channel: str) -> None:
+        ticket = self._latest.pop(channel, None)
+        if ticket is not None:
+            self._cancel_ticket(ticket)
+
+    def is_loading(self, channel: str) -> bool:
+        return channel in self._latest
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Cancel pending loads and close the worker connections."""
+        for channel in list(self._latest):
+            self.cancel(channel)
+        for _thread in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except tk.TclError:
+                pass  # The window is already gone.
+            self._poll_id = None
+
+    def _cancel_ticket(self, ticket: LoadTicket) -> None:
+        with self._lock:
+            ticket.cancelled = True
+            if ticket.context is not None and ticket.context.db is not None:
+                # Abort the running statement; its result would be dropped anyway.
+                ticket.context.db.conn.interrupt()
+
+    def _start_workers(self) -> None:
+        if self._threads:
+            return
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"background-loader-{number}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        context = None
+        context_error = None
+        try:
+            context = self.context_factory()
+        except Exception as exc:  # Report the failure through every job instead.
+            context_error = exc
+            logger.exception("Background loader could not open its connection")
+        try:
+            while True:
+                ticket = self._jobs.get()
+                if ticket is None:
+                    break
+                with self._lock:
+                    skip = ticket.cancelled
+                    ticket.context = context
+                if skip:
+                    result, error = None, None
+                elif context_error is not None:
+                    result, error = None, context_error
+                else:
+                    result, error = self._run(ticket, context)
+                with self._lock:
+                    ticket.context = None
+                self._results.put((ticket, result, error))
+        finally:
+            if context is not None and context.db is not None:
+                context.db.close()
+
+    @staticmethod
+    def _run(ticket: LoadTicket, context: LoadContext):
+        try:
+            return ticket.job(context), None
+        except Exception as exc:
+            return None, exc
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        self._poll_id = None
+        while True:
+            try:
+                ticket, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            self._finish(ticket, result, error)
+        if self._outstanding:
+            self._schedule_poll()
+
+    def _finish(self, ticket: LoadTicket, result, error) -> None:
+        if ticket.indicator is not None:
+            ticket.indicator.stop()
+        if ticket.cancelled or self._latest.get(ticket.channel) is not ticket:
+            return
+        del self._latest[ticket.channel]
+        try:
+            if error is None:
+                ticket.on_done(result)
+            elif ticket.on_error is not None:
+                ticket.on_error(error)
+            else:
+                logger.error("Background load '%s' failed: %s", ticket.channel, error)
+        except Exception:  # Keep draining the other results.
+            logger.exception("Handling background load '%s' failed", ticket.channel)
@@ -0,0 +1,321 @@
+"""Show a rendered document PDF inside the application.
+
+The document is rendered in memory on a :class:`BackgroundLoader` worker and
+drawn onto a Tk canvas, so previewing never blocks the popup and never
+writes a temporary file. :func:`read_pages` understands the small set of
+operators FPDF emits for our layouts (text, rectangles, lines and colours);
+anything else in a page, such as images, is skipped.
+"""
+
+import re
+import tkinter as tk
+import zlib
+from dataclasses import dataclass, field
+from tkinter import filedialog, ttk
+
+from ui.base.background_loader import BackgroundLoader, LoadContext
+
+PAGE_GAP = 12
+DEFAULT_SCALE = 1.25  # Canvas pixels per PDF point.
+
+_OBJECT = re.compile(rb"(\d+) 0 obj\s*(.*?)\s*endobj", re.S)
+_STREAM = re.compile(rb"stream\r?\n")
+_TOKEN = re.compile(rb"\((?:\\.|[^\\)])*\)|/[^\s/\[\]()<>]+|[-+]?(?:\d+\.?\d*|\.\d+)|[A-Za-z*'\"]+", re.S)
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+@dataclass
+class PreviewPage:
+    """Drawing instructions for one page, in PDF points with the origin bottom left.
+
+    ``items`` holds ``("text", x, y, text, font, size, colour)``,
+    ``("rect", x0, y0, x1, y1, fill, outline)`` and
+    ``("line", x0, y0, x1, y1, colour)`` tuples; colours are ``#rrggbb``.
+    """
+
+    width: float
+    height: float
+    items: list = field(default_factory=list)
+
+
+def read_pages(data) -> list[PreviewPage]:
+    """Pages of the FPDF document ``data`` (bytes or memoryview), in order."""
+    data = bytes(data)
+    objects, starts = {}, {}
+    for match in _OBJECT.finditer(data):
+        objects[int(match.group(1))] = match.group(2)
+        starts[int(match.group(1))] = match.start(2)
+    fonts = {}
+    for name, number in re.findall(rb"/(F\d+) (\d+) 0 R", data):
+        base = re.search(rb"/BaseFont /(\S+)", objects.get(int(number), b""))
+        fonts[name.decode()] = base.group(1).decode() if base else "Helvetica"
+
+    default_box = _media_box(data) or (595.28, 841.89)
+    kids = re.search(rb"/Kids \[([^\]]*)\]", data)
+    page_numbers = [int(n) for n in re.findall(rb"(\d+) 0 R", kids.group(1))] if kids else []
+    pages = []
+    for number in page_numbers:
+        page = objects.get(number, b"")
+        width, height = _media_box(page) or default_box
+        contents = re.search(rb"/Contents (\d+) 0 R", page)
+        start = starts.get(int(contents.group(1))) if contents else None
+        stream = _stream(data, start) if start is not None else b""
+        pages.append(PreviewPage(width, height, _interpret(stream, fonts)))
+    return pages
+
+
+def _media_box(body: bytes):
+    box = re.search(rb"/MediaBox \[\s*\S+\s+\S+\s+(\S+)\s+(\S+)\s*\]", body)
+    return (float(box.group(1)), float(box.group(2))) if box else None
+
+
+def _stream(data: bytes, start: int) -> bytes:
+    """Decoded stream of the object whose body starts at ``start`` in ``data``.
+
+    The bytes are sliced by ``/Length``: compressed data may itself end in
+    ``\\r`` or contain ``endstream``, so searching for the keyword is unsafe.
+    """
+    match = _STREAM.search(data, start)
+    if not match:
+        return b""
+    head = data[start:match.start()]
+    length = re.search(rb"/Length (\d+)", head)
+    if b"endobj" in head or not length:
+        return b""
+    raw = data[match.end():match.end() + int(length.group(1))]
+    if b"/FlateDecode" in head:
+        return zlib.decompress(raw)
+    return raw
+
+
+def _string(token: bytes) -> str:
+    raw = token[1:-1]
+    out = bytearray()
+    index = 0
+    while index < len(raw):
+        char = raw[index:index + 1]
+        if char != b"\\":
+            out += char
+            index += 1
+            continue
+        escaped = raw[index + 1:index + 2]
+        octal = re.match(rb"[0-7]{1,3}", raw[index + 1:index + 4])
+        if octal:
+            out.append(int(octal.group(0), 8) & 0xFF)
+            index += 1 + len(octal.group(0))
+        else:
+            out += _ESCAPES.get(escaped, escaped)
+            index += 2
+    return out.decode("latin-1")
+
+
+def _colour(*components: float) -> str:
+    if len(components) == 1:
+        components = components * 3
+    return "#" + "".join(f"{max(0, min(255, round(c * 255))):02x}" for c in components)
+
+
+def _interpret(stream: bytes, fonts: dict) -> list:
+    items = []
+    operands = []
+    fill, stroke = "#000000", "#000000"
+    saved = []
+    font, size = "Helvetica", 12.0
+    text_x = text_y = 0.0
+    path = []  # ("rect", x, y, w, h) or ("line", x0, y0, x1, y1)
+    position = (0.0, 0.0)
+
+    for token in _TOKEN.findall(stream):
+        if token[:1] == b"(":
+            operands.append(_string(token))
+            continue
+        if token[:1] == b"/":
+            operands.append(token[1:].decode())
+            continue
+        try:
+            operands.append(float(token))
+            continue
+        except ValueError:
+            op = token.decode()
+        try:
+            if op == "rg":
+                fill = _colour(*operands[-3:])
+            elif op == "RG":
+                stroke = _colour(*operands[-3:])
+            elif op == "g":
+                fill = _colour(operands[-1])
+            elif op == "G":
+                stroke = _colour(operands[-1])
+            elif op == "q":
+                saved.append((fill, stroke))
+            elif op == "Q" and saved:
+                fill, stroke = saved.pop()
+            elif op == "BT":
+                text_x = text_y = 0.0
+            elif op == "Tf":
+                font, size = fonts.get(operands[-2], "Helvetica"), operands[-1]
+            elif op == "Td":
+                text_x, text_y = text_x + operands[-2], text_y + operands[-1]
+            elif op == "Tj":
+                items.append(("text", text_x, text_y, operands[-1], font, size, fill))
+            elif op == "re":
+                path.append(("rect", *operands[-4:]))
+            elif op == "m":
+                position = (operands[-2], operands[-1])
+            elif op == "l":
+                path.append(("line", *position, operands[-2], operands[-1]))
+                position = (operands[-2], operands[-1])
+            elif op in ("S", "f", "F", "f*", "B", "B*", "n"):
+                filled = fill if op[0] in "fFB" else None
+                stroked = stroke if op[0] in "SB" else None
+                for shape in path if op != "n" else ():
+                    if shape[0] == "rect":
+                        _kind, x, y, w, h = shape
+                        items.append(("rect", x, y, x + w, y + h, filled, stroked))
+                    elif stroked:
+                        items.append((*shape, stroked))
+                path = []
+        except (IndexError, TypeError):
+            pass  # Operands of an operator we do not draw.
+        operands = []
+    return items
+
+
+def _tk_font(name: str, size: float, scale: float) -> tuple:
+    family = "Courier" if name.startswith("Courier") else "Times" if name.startswith("Times") else "Helvetica"
+    style = []
+    if "Bold" in name:
+        style.append("bold")
+    if "Oblique" in name or "Italic" in name:
+        style.append("italic")
+    # Negative sizes are pixels, so text keeps its place on the scaled page.
+    return (family, -max(1, round(size * scale)), " ".join(style) or "normal")
+
+
+class PdfPreviewWindow(tk.Toplevel):
+    """Window showing the pages of an in-memory PDF, with "Save As…"."""
+
+    def __init__(self, master, title: str, file_name: str, scale: float = DEFAULT_SCALE):
+        super().__init__(master)
+        self.title(title)
+        self.geometry("820x900")
+        self.file_name = file_name
+        self.scale = scale
+        self.data = None
+
+        self.status_var = tk.StringVar(value="Rendering…")
+        button_frame = ttk.Frame(self)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=10)
+        ttk.Label(button_frame, textvariable=self.status_var).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+        self.save_button = ttk.Button(button_frame, text="Save As…", command=self.save_as, state=tk.DISABLED)
+        self.save_button.pack(side=tk.RIGHT, padx=5)
+
+        canvas_frame = ttk.Frame(self)
+        canvas_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(canvas_frame, background="#808080", highlightthickness=0)
+        y_scroll = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        x_scroll = ttk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        y_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+
+    def show(self, data) -> None:
+        """Draw the PDF ``data``; None means the document could not be rendered."""
+        if data is None:
+            self.show_error("The document could not be rendered.")
+            return
+        try:
+            pages = read_pages(data)
+        except Exception as e:
+            self.show_error(f"The preview could not be read: {e}")
+            return
+        self.data = data
+        self._draw(pages)
+        self.status_var.set(f"{len(pages)} page{'s' if len(pages) != 1 else ''}")
+        self.save_button.config(state=tk.NORMAL)
+
+    def show_error(self, message: str) -> None:
+        self.status_var.set(message)
+
+    def _draw(self, pages: list[PreviewPage]) -> None:
+        scale = self.scale
+        self.canvas.delete("all")
+        top = PAGE_GAP
+        widest = 0
+        for page in pages:
+            width, height = page.width * scale, page.height * scale
+            widest = max(widest, width)
+            self.canvas.create_rectangle(PAGE_GAP, top, PAGE_GAP + width, top + height,
+                                         fill="white", outline="#404040")
+
+            def point(x, y, top=top, page=page):
+                return PAGE_GAP + x * scale, top + (page.height - y) * scale
+
+            for item in page.items:
+                if item[0] == "text":
+                    _kind, x, y, text, font, size, colour = item
+                    self.canvas.create_text(*point(x, y), text=text, anchor="sw", fill=colour,
+                                            font=_tk_font(font, size, scale))
+                elif item[0] == "rect":
+                    _kind, x0, y0, x1, y1, fill, outline = item
+                    self.canvas.create_rectangle(*point(x0, y0), *point(x1, y1),
+                                                 fill=fill or "", outline=outline or "")
+                else:
+                    _kind, x0, y0, x1, y1, colour = item
+                    self.canvas.create_line(*point(x0, y0), *point(x1, y1), fill=colour)
+            top += height + PAGE_GAP
+        self.canvas.configure(scrollregion=(0, 0, widest + 2 * PAGE_GAP, top))
+
+    def save_as(self) -> None:
+        if self.data is None:
+            return
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".pdf",
+            initialfile=self.file_name,
+            filetypes=[("PDF files", "*.pdf")],
+        )
+        if not path:
+            return
+        try:
+            with open(path, "wb") as handle:
+                handle.write(self.data)
+        except OSError as exc:
+            self.show_error(f"Could not save: {exc}")
+            return
+        self.status_var.set(f"Saved to {path}")
+
+
+def preview_document(master, db, kind: str, document_id: int, title: str, file_name: str,
+                     loader: BackgroundLoader | None = None) -> PdfPreviewWindow:
+    """Open a preview of ``document_id`` rendered as ``kind`` (see ``DOCUMENT_KINDS``).
+
+    Rendering runs on ``loader``'s workers, each on its own read-only
+    connection; without a loader it runs inline on ``db``. The company
+    header is resolved here first because loading it may create the
+    default company row, which a read-only worker cannot do.
+    """
+    from core.render_cache import render_document_bytes
+    from core.render_session import DocumentRenderSession
+
+    company_context = DocumentRenderSession(db).company_context()
+    window = PdfPreviewWindow(master, title, file_name)
+    loader = loader or BackgroundLoader.inline(window, LoadContext(db=db))
+    channel = f"pdf_preview{window}"
+
+    def render(context: LoadContext):
+        session = DocumentRenderSession(context.db, company_context=company_context)
+        return render_document_bytes(kind, document_id, session=session)
+
+    def on_destroy(event):
+        if event.widget is window:
+            loader.cancel(channel)
+
+    window.bind("<Destroy>", on_destroy, add="+")
+    loader.submit(channel, render, window.show, on_error=lambda exc: window.show_error(f"Preview failed: {exc}"))
+    return window
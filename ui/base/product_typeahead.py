@@ -0,0 +1,89 @@
+from tkinter import ttk
+
+# Keys that move around the dropdown rather than change the typed text.
+_NAVIGATION_KEYS = {"Up", "Down", "Left", "Right", "Return", "KP_Enter", "Escape", "Tab", "Home", "End"}
+
+
+class ProductTypeahead:
+    """Drive a product ``ttk.Combobox`` from ``ProductLogic.suggest``.
+
+    Typing refreshes the dropdown with ranked matches for the entered text;
+    Return picks the best match. ``product_map`` (label -> product id) is
+    shared with the owning popup so its save and price lookups keep working.
+    """
+
+    PLACEHOLDER = "<Select Product>"
+
+    def __init__(self, combobox: ttk.Combobox, product_logic, product_map: dict,
+                 on_select=None, limit: int = 25, delay_ms: int = 150):
+        self.combobox = combobox
+        self.product_logic = product_logic
+        self.product_map = product_map
+        self.on_select = on_select
+        self.limit = limit
+        self.delay_ms = delay_ms
+        self._pending = None
+        self._matches = []
+
+        combobox.configure(state="normal")
+        combobox.bind("<KeyRelease>", self._on_key_release, add="+")
+        combobox.bind("<Return>", self._on_return, add="+")
+        combobox.bind("<FocusIn>", self._clear_placeholder, add="+")
+
+    def refresh(self, query: str = "") -> None:
+        """Show the best matches for ``query`` in the dropdown."""
+        self._matches = self.product_logic.suggest(query, self.limit)
+        labels = []
+        for match in self._matches:
+            self.product_map[match.label] = match.product_id
+            labels.append(match.label)
+        self.combobox["values"] = labels
+
+    def reset(self) -> None:
+        self.refresh()
+        self.combobox.set(self.PLACEHOLDER)
+
+    def select_product(self, product_id: int) -> bool:
+        """Show ``product_id`` as the current choice; False if it no longer exists."""
+        product = self.product_logic.get_product_details(product_id)
+        if not product:
+            self.combobox.set(self.PLACEHOLDER)
+            return False
+        sku = getattr(product, "sku", None)
+        label = f"{product.name} ({sku})" if sku else product.name
+        self.product_map[label] = product_id
+        self.combobox.set(label)
+        return True
+
+    def _clear_placeholder(self, _event=None):
+        if self.combobox.get() == self.PLACEHOLDER:
+            self.combobox.set("")
+
+    def _on_key_release(self, event):
+        if event.keysym in _NAVIGATION_KEYS:
+            return
+        if self._pending is not None:
+            self.combobox.after_cancel(self._pending)
+        self._pending = self.combobox.after(self.delay_ms, self._refresh_from_entry)
+
+    def _refresh_from_entry(self):
+        self._pending = None
+        self.refresh(self.combobox.get())
+
+    def _on_return(self, _event=None):
+        text = self.combobox.get()
+        if text in self.product_map:
+            label = text
+        else:
+            if self._pending is not None:
+                self.combobox.after_cancel(self._pending)
+                self._pending = None
+            self.refresh(text)
+            if not self._matches:
+                return "break"
+            label = self._matches[0].label
+        self.combobox.set(label)
+        self.combobox.icursor("end")
+        if self.on_select:
+            self.on_select()
+        return "break"
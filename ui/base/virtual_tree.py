@@ -0,0 +1,353 @@
+"""Treeview that only materializes the rows currently on screen.
+
+Rows come from a keyset ``fetch_page(sort_key, after, limit)`` callback
+returning ``(rows, next_cursor)`` where every row is a ``(key, values)``
+pair, which matches the ``get_*_page`` methods of the logic layer. Pages are
+cached as plain tuples and fetched only as far as the user scrolls; the
+underlying ``ttk.Treeview`` never holds more items than fit in the window.
+"""
+
+from functools import partial
+from tkinter import ttk
+
+_SORT_MARKERS = {False: " ▲", True: " ▼"}
+
+
+class PagedRows:
+    """Rows pulled page by page from a keyset data source.
+
+    Keys are stored as strings so they can double as Treeview iids.
+    """
+
+    def __init__(self, fetch_page, sort_key=None, page_size=200):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.sort_key = sort_key
+        self.generation = 0
+        self.reset()
+
+    def reset(self, sort_key=None):
+        """Drop every cached row, optionally switching the sort order."""
+        if sort_key is not None:
+            self.sort_key = sort_key
+        self.generation += 1
+        self._rows = []
+        self._index = {}
+        self._cursor = None
+        self.complete = False
+
+    def __len__(self):
+        return len(self._rows)
+
+    @property
+    def cursor(self):
+        """Cursor the next page will be fetched after."""
+        return self._cursor
+
+    @property
+    def estimated_total(self):
+        """Loaded rows plus one page while more may follow."""
+        return len(self._rows) if self.complete else len(self._rows) + self.page_size
+
+    def load_next_page(self):
+        """Fetch one more page; returns False once the source is exhausted."""
+        if self.complete:
+            return False
+        rows, next_cursor = self.fetch_page(self.sort_key, self._cursor, self.page_size)
+        self.add_page(rows, next_cursor)
+        return bool(rows)
+
+    def add_page(self, rows, next_cursor):
+        """Append a page fetched elsewhere, e.g. by a background load."""
+        for key, values in rows:
+            key = str(key)
+            self._index[key] = len(self._rows)
+            self._rows.append((key, tuple(values)))
+        self._cursor = next_cursor
+        if next_cursor is None or not rows:
+            self.complete = True
+
+    def ensure(self, count):
+        """Load pages until at least ``count`` rows are cached or none are left."""
+        while len(self._rows) < count and not self.complete:
+            self.load_next_page()
+        return len(self._rows) >= count
+
+    def load_all(self):
+        while not self.complete:
+            self.load_next_page()
+
+    def window(self, start, size):
+        """Return the ``(key, values)`` rows from ``start``, loading as needed."""
+        self.ensure(start + size)
+        return self._rows[start:start + size]
+
+    def key_at(self, index):
+        if index < 0:
+            return None
+        if index < len(self._rows) or self.ensure(index + 1):
+            return self._rows[index][0]
+        return None
+
+    def index_of(self, key):
+        """Position of an already loaded ``key``, or None."""
+        return self._index.get(str(key))
+
+    def find(self, key):
+        """Position of ``key``, paging through the source until it turns up."""
+        key = str(key)
+        while key not in self._index and not self.complete:
+            self.load_next_page()
+        return self._index.get(key)
+
+    def values(self, key):
+        index = self._index.get(str(key))
+        return None if index is None else self._rows[index][1]
+
+    @staticmethod
+    def scan(fetch_page, key, sort_key, after, page_size):
+        """Pages after ``after`` up to the one holding ``key``, or to the end.
+
+        Keeps no state, so a loader thread can run it; hand the pages to
+        :meth:`add_page` on the Tk thread.
+        """
+        key = str(key)
+        pages = []
+        while True:
+            rows, after = fetch_page(sort_key, after, page_size)
+            pages.append((rows, after))
+            if after is None or not rows or any(str(row_key) == key for row_key, _values in rows):
+                return pages
+
+
+class VirtualTreeview(ttk.Frame):
+    """Scrollable list backed by :class:`PagedRows`.
+
+    ``sort_keys`` maps column names to data source sort keys; clicking one of
+    those headings re-queries in that order and a second click reverses it.
+    Selection is tracked by key, so it survives rows scrolling out of view,
+    and ``<<TreeviewSelect>>`` is raised on this widget whenever it changes.
+    Given a ``loader`` and ``context_fetch(ctx, sort_key, after, limit)``, a
+    page source for its threads, :meth:`see` pages through on the loader.
+    """
+
+    def __init__(self, master, columns, fetch_page, sort_keys=None, sort_key=None,
+                 page_size=200, selectmode="browse", loader=None, context_fetch=None,
+                 **tree_options):
+        super().__init__(master)
+        self.sort_keys = dict(sort_keys or {})
+        self.rows = PagedRows(fetch_page, sort_key, page_size)
+        self._loader = loader if context_fetch is not None else None
+        self._context_fetch = context_fetch
+        self._top = 0
+        self._visible = int(tree_options.get("height", 10))
+        self._selected = []
+        self._headings = {}
+        self._sort_column = next(
+            (col for col, key in self.sort_keys.items() if key == (sort_key or "").lstrip("-")), None
+        )
+
+        self.treeview = ttk.Treeview(self, columns=columns, show="headings",
+                                     selectmode=selectmode, **tree_options)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.treeview.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.treeview.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.treeview.bind("<Configure>", self._on_resize)
+        self.treeview.bind("<MouseWheel>", self._on_mousewheel)
+        self.treeview.bind("<Button-4>", lambda _e: self._scroll_units(-3) or "break")
+        self.treeview.bind("<Button-5>", lambda _e: self._scroll_units(3) or "break")
+        self.treeview.bind("<Up>", lambda _e: self._on_arrow(-1))
+        self.treeview.bind("<Down>", lambda _e: self._on_arrow(1))
+        self.treeview.bind("<Prior>", lambda _e: self._scroll_units(-self._visible) or "break")
+        self.treeview.bind("<Next>", lambda _e: self._scroll_units(self._visible) or "break")
+
+    def heading(self, column, text=None, **options):
+        """Configure a heading; sortable columns get a sort command."""
+        if text is not None:
+            self._headings[column] = text
+            options["text"] = self._heading_text(column)
+        if column in self.sort_keys:
+            options["command"] = lambda: self.sort_by(column)
+        return self.treeview.heading(column, **options)
+
+    def column(self, column, **options):
+        return self.treeview.column(column, **options)
+
+    def _heading_text(self, column):
+        text = self._headings.get(column, "")
+        if column == self._sort_column:
+            text += _SORT_MARKERS[(self.rows.sort_key or "").startswith("-")]
+        return text
+
+    def load(self, first_page=None, sort_key=None):
+        """Re-query from the first page, keeping the scroll position and selection.
+
+        ``first_page`` is a ``(rows, next_cursor)`` page already fetched for
+        ``sort_key``, typically off the Tk thread; it is ignored if the user
+        has re-sorted since.
+        """
+        self.rows.reset()
+        if first_page is not None and sort_key == self.rows.sort_key:
+            self.rows.add_page(*first_page)
+        self._render()
+
+    def sort_by(self, column):
+        """Sort by ``column``; repeating the same column flips the direction."""
+        key = self.sort_keys[column]
+        descending = column == self._sort_column and not (self.rows.sort_key or "").startswith("-")
+        previous = self._sort_column
+        self._sort_column = column
+        self.rows.reset(f"-{key}" if descending else key)
+        self._top = 0
+        for col in {previous, column} - {None}:
+            self.treeview.heading(col, text=self._heading_text(col))
+        self._render()
+
+    def values(self, key):
+        """Display values of a loaded row, or None."""
+        return self.rows.values(key)
+
+    def exists(self, key):
+        return self.rows.index_of(key) is not None
+
+    def identify_row(self, y):
+        return self.treeview.identify_row(y)
+
+    def selection(self):
+        return tuple(self._selected)
+
+    def selection_set(self, *keys):
+        """Select rows by key, whether or not they are currently on screen."""
+        if len(keys) == 1 and isinstance(keys[0], (list, tuple)):
+            keys = keys[0]
+        self._set_selection([str(key) for key in keys])
+        self._sync_tree_selection()
+
+    def see(self, key, on_done=None):
+        """Scroll ``key`` into view, then call ``on_done(found)``.
+
+        Rows not loaded yet are fetched on the loader when the tree has one,
+        so finding a row far down a long list does not block the Tk thread.
+        ``found`` is False when the data source has no such row.
+        """
+        index = self.rows.index_of(key)
+        if index is None and not self.rows.complete and self._loader is not None:
+            self._find_in_background(key, on_done)
+            return
+        if index is None:
+            index = self.rows.find(key)
+        if index is not None and not self._top <= index < self._top + self._visible:
+            self._scroll_to(index - self._visible // 2)
+        if on_done:
+            on_done(index is not None)
+
+    def _find_in_background(self, key, on_done):
+        rows = self.rows
+        generation, sort_key, after = rows.generation, rows.sort_key, rows.cursor
+        fetch = self._context_fetch
+
+        def found(pages):
+            # Pages fetched after a reload or further scrolling do not fit; look again.
+            if rows.generation == generation and rows.cursor == after:
+                for page in pages:
+                    rows.add_page(*page)
+            self.see(key, on_done)
+
+        self._loader.submit(
+            f"see{self}",
+            lambda ctx: PagedRows.scan(partial(fetch, ctx), key, sort_key, after, rows.page_size),
+            found,
+        )
+
+    def _set_selection(self, keys):
+        if keys != self._selected:
+            self._selected = keys
+            self.event_generate("<<TreeviewSelect>>")
+
+    def _sync_tree_selection(self):
+        on_screen = [key for key in self._selected if self.treeview.exists(key)]
+        self.treeview.selection_set(on_screen)
+
+    def _on_tree_select(self, _event=None):
+        visible = set(self.treeview.get_children())
+        chosen = list(self.treeview.selection())
+        if chosen and str(self.treeview.cget("selectmode")) == "browse":
+            keys = chosen
+        else:
+            keys = [key for key in self._selected if key not in visible] + chosen
+        if set(keys) != set(self._selected):
+            self._set_selection(keys)
+
+    def _render(self):
+        rows = self.rows.window(self._top, self._visible)
+        if not rows and self._top:
+            self._top = max(0, len(self.rows) - self._visible)
+            rows = self.rows.window(self._top, self._visible)
+        self.treeview.delete(*self.treeview.get_children())
+        for key, values in rows:
+            self.treeview.insert("", "end", iid=key, values=values)
+        self._sync_tree_selection()
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        total = self.rows.estimated_total
+        if not total:
+            self.scrollbar.set(0.0, 1.0)
+            return
+        self.scrollbar.set(self._top / total, min(1.0, (self._top + self._visible) / total))
+
+    def _scroll_to(self, top):
+        top = max(0, top)
+        self.rows.ensure(top + self._visible)
+        top = min(top, max(0, len(self.rows) - self._visible))
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _scroll_units(self, count):
+        self._scroll_to(self._top + count)
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(int(float(amount) * self.rows.estimated_total))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self._scroll_units(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        self._scroll_units(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_arrow(self, step):
+        """Move past the first or last visible row by scrolling the window."""
+        children = self.treeview.get_children()
+        focus = self.treeview.focus()
+        if focus not in children:
+            return None
+        position = children.index(focus) + step
+        if 0 <= position < len(children):
+            return None
+        key = self.rows.key_at(self._top + position)
+        if key is None:
+            return "break"
+        self._scroll_units(step)
+        self.selection_set(key)
+        self.treeview.focus(key)
+        return "break"
+
+    def _on_resize(self, event):
+        children = self.treeview.get_children()
+        bbox = self.treeview.bbox(children[0]) if children else None
+        if not bbox:
+            return
+        _x, y, _width, row_height = bbox
+        visible = max(1, (event.height - y) // max(1, row_height))
+        if visible != self._visible:
+            self._visible = visible
+            self._render()
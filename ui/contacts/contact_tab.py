@@ -1,15 +1,18 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox
 from ui.contacts.contact_popup import ContactDetailsPopup
 from shared.structs import Contact
 from ui.base.tab_base import TabBase
+from ui.base.background_loader import BackgroundLoader, LoadContext
+from ui.base.virtual_tree import VirtualTreeview
 
 
 class ContactTab(TabBase):
-    def __init__(self, master, logic):
+    def __init__(self, master, logic, loader=None):
         super().__init__(master)
         self.logic = logic
         self.selected_contact_id = None
+        self.loader = loader or BackgroundLoader.inline(self, LoadContext(address_book_logic=logic))
 
         self.setup_contact_tab()
         self.load_contacts()
@@ -46,14 +49,22 @@ class ContactTab(TabBase):
         )
         self.remove_contact_button.pack(side=tk.LEFT, padx=5)
 
-        self.tree = ttk.Treeview(self, columns=("id", "name", "phone", "email", "role", "account_name"), show="headings")
+        self.tree = VirtualTreeview(
+            self,
+            ("name", "phone", "email", "role", "account_name"),
+            self._fetch_contacts,
+            sort_keys={column: column for column in ("name", "phone", "email", "role", "account_name")},
+            sort_key="name",
+            loader=self.loader,
+            context_fetch=lambda ctx, sort_key, after, limit: self._contact_page(
+                ctx.address_book_logic, sort_key, after, limit),
+        )
 
-        self.tree.column("id", width=0, stretch=False)  # Hidden ID column
-        self.tree.heading("name", text="Contact Name", command=lambda: self.sort_column("name", False))
-        self.tree.heading("phone", text="Phone", command=lambda: self.sort_column("phone", False))
-        self.tree.heading("email", text="Email", command=lambda: self.sort_column("email", False))
-        self.tree.heading("role", text="Role", command=lambda: self.sort_column("role", False))
-        self.tree.heading("account_name", text="Account", command=lambda: self.sort_column("account_name", False))
+        self.tree.heading("name", text="Contact Name")
+        self.tree.heading("phone", text="Phone")
+        self.tree.heading("email", text="Email")
+        self.tree.heading("role", text="Role")
+        self.tree.heading("account_name", text="Account")
 
         self.tree.column("name", width=150, anchor=tk.W)
         self.tree.column("phone", width=100, anchor=tk.W)
@@ -70,7 +81,7 @@ class ContactTab(TabBase):
     def on_contact_select(self, event=None):
         selected_items = self.tree.selection()
         if selected_items:
-            # item_id is the contact_id because we set iid=contact_id during insert
+            # Rows are keyed by contact_id
             self.selected_contact_id = selected_items[0]
         else:
             self.selected_contact_id = None
@@ -112,29 +123,41 @@ class ContactTab(TabBase):
         self.load_contacts()
 
     def load_contacts(self, event=None):  # event parameter for binding
-        self.tree.delete(*self.tree.get_children())
+        self.tree.selection_set()
         self.selected_contact_id = None  # Reset selection
 
         try:
-            contacts = self.logic.get_all_contacts()  # Returns list of Contact objects
-            for contact in contacts:
-                account_name_display = "N/A"
-                if contact.account_id:
-                    account = self.logic.get_account_details(contact.account_id)
-                    if account:
-                        account_name_display = account.name
-
-                self.tree.insert("", "end", iid=contact.contact_id, values=(
-                    contact.contact_id,  # Stored in hidden "id" column, accessed by iid
-                    contact.name,
-                    contact.phone,
-                    contact.email,
-                    contact.role,
-                    account_name_display
-                ))
+            self.tree.load()
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load contacts: {e}")
             print(f"Error in load_contacts: {e}")  # For console debugging
 
+    def _fetch_contacts(self, sort_key, after, limit):
+        """Page source for the contact list."""
+        return self._contact_page(self.logic, sort_key, after, limit)
+
+    @staticmethod
+    def _contact_page(logic, sort_key, after, limit):
+        """Build one page of list rows; no Tk calls, so loader threads can use it."""
+        contacts, next_cursor = logic.get_contacts_page(None, sort_key, after, limit)
+        accounts = logic.get_account_summaries(
+            [contact.account_id for contact in contacts if contact.account_id]
+        )
+        rows = []
+        for contact in contacts:
+            account_name_display = "N/A"
+            account_summary = accounts.get(contact.account_id)
+            if account_summary:
+                account_name_display = account_summary["name"]
+
+            rows.append((contact.contact_id, (
+                contact.name,
+                contact.phone,
+                contact.email,
+                contact.role,
+                account_name_display,
+            )))
+        return rows, next_cursor
+
     def refresh_contacts_list(self):  # Added method for popup to call
         self.load_contacts()
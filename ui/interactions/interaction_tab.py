@@ -2,13 +2,19 @@ import tkinter as tk
 from tkinter import ttk
 from core.address_book_logic import AddressBookLogic
 from shared.structs import Interaction, Account, Contact # Assuming these might be needed for type hinting or direct use
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
 
 class InteractionLogTab(ttk.Frame):
-    def __init__(self, parent, logic: AddressBookLogic):
+    def __init__(self, parent, logic: AddressBookLogic, loader=None):
         super().__init__(parent)
         self.logic = logic
+        self.loader = loader or BackgroundLoader.inline(self, LoadContext(address_book_logic=logic))
         self.accounts_map = {} # To map display names to account IDs
         self.contacts_map = {} # To map display names to contact IDs
+        self.page_size = 50
+        self._timeline_filter = None # company_id/contact_id of the displayed timeline
+        self._next_cursor = None # Keyset cursor of the next page, None when exhausted
+        self._loading_cursor = None # Cursor of the page being fetched in the background
 
         # Configure grid layout
         self.columnconfigure(0, weight=1)
@@ -17,6 +23,7 @@ class InteractionLogTab(ttk.Frame):
         self.rowconfigure(1, weight=1)    # Allow interaction display to expand
 
         self._setup_widgets()
+        self.loading = LoadingIndicator(self)
 
     def _setup_widgets(self):
         # Account selection
@@ -61,9 +68,9 @@ class InteractionLogTab(ttk.Frame):
         self.interactions_tree.grid(row=0, column=0, sticky="nsew")
 
         # Scrollbar for the treeview
-        scrollbar = ttk.Scrollbar(interaction_frame, orient=tk.VERTICAL, command=self.interactions_tree.yview)
-        self.interactions_tree.configure(yscroll=scrollbar.set)
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.scrollbar = ttk.Scrollbar(interaction_frame, orient=tk.VERTICAL, command=self.interactions_tree.yview)
+        self.interactions_tree.configure(yscroll=self._on_tree_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
 
         self._load_accounts()
         self._load_contacts() # Initial load of all contacts
@@ -113,8 +120,7 @@ class InteractionLogTab(ttk.Frame):
 
         if account_id:
             # Display interactions for the selected account overall
-            interactions = self.logic.get_all_interactions(company_id=account_id, contact_id=None)
-            self._display_interactions(interactions)
+            self._start_timeline(company_id=account_id)
         # If account_id is None (selection cleared), contacts are loaded (all), and interactions remain cleared.
 
     def _on_contact_selected(self, event=None):
@@ -126,15 +132,50 @@ class InteractionLogTab(ttk.Frame):
         if contact_id:
             # Display interactions for the selected contact.
             # Account selection (if any) is kept to indicate context of the contact list.
-            interactions = self.logic.get_all_interactions(contact_id=contact_id)
-            self._display_interactions(interactions)
+            self._start_timeline(contact_id=contact_id)
         # If contact selection is cleared, interactions are already cleared.
 
-    def _display_interactions(self, interactions: list[Interaction]):
-        # Clear existing items in the treeview
-        for item in self.interactions_tree.get_children():
-            self.interactions_tree.delete(item)
+    def _start_timeline(self, **timeline_filter):
+        """Show the newest page of interactions for a company_id or contact_id."""
+        self._timeline_filter = timeline_filter
+        self._next_cursor = None
+        self._load_next_page()
+
+    def _load_next_page(self):
+        """Fetch the next page in the background; a new timeline supersedes it."""
+        if self._timeline_filter is None:
+            return
+        timeline_filter = self._timeline_filter
+        cursor = self._loading_cursor = self._next_cursor
+        limit = self.page_size
+        self.loader.submit(
+            "interactions",
+            lambda ctx: ctx.address_book_logic.get_interaction_page(
+                before=cursor, limit=limit, **timeline_filter
+            ),
+            self._show_page,
+            indicator=self.loading,
+        )
+
+    def _show_page(self, page):
+        interactions, self._next_cursor = page
+        self._loading_cursor = None
+        self._display_interactions(interactions)
 
+    def _on_tree_scroll(self, first, last):
+        """Update the scrollbar and fetch the next page once the end is nearly visible."""
+        self.scrollbar.set(first, last)
+        if self._next_cursor is not None and float(last) >= 0.95:
+            # Defer so the tree is not modified from inside its own scroll callback.
+            self.after_idle(self._load_page_after, self._next_cursor)
+
+    def _load_page_after(self, cursor):
+        # Several scroll events may queue the same page; only the first loads it.
+        if cursor is not None and cursor == self._next_cursor and cursor != self._loading_cursor:
+            self._load_next_page()
+
+    def _display_interactions(self, interactions: list[Interaction]):
+        # Appends to the existing items; callers clear the tree for a new timeline.
         if interactions:
             for interaction in interactions:
                 # Ensure datetime is formatted nicely if it's a datetime object
@@ -157,6 +198,10 @@ class InteractionLogTab(ttk.Frame):
         # else: No interactions to display (already cleared)
 
     def _clear_interaction_display(self):
+        self.loader.cancel("interactions")
+        self._timeline_filter = None
+        self._next_cursor = None
+        self._loading_cursor = None
         for item in self.interactions_tree.get_children():
             self.interactions_tree.delete(item)
 
@@ -252,6 +297,13 @@ if __name__ == '__main__':
                 return [i for i in self._interactions if i.contact_id == contact_id]
             return list(self._interactions) # Return a copy
 
+        def get_interaction_page(self, company_id=None, contact_id=None, before=None, limit=50, **kwargs):
+            matches = self.get_all_interactions(company_id=company_id, contact_id=contact_id)
+            matches.sort(key=lambda i: (i.date_time, i.interaction_id), reverse=True)
+            start = before or 0
+            page = matches[start:start + limit]
+            return page, (start + limit if start + limit < len(matches) else None)
+
         def save_interaction(self, interaction_obj: Interaction):
             print(f"Mock saving interaction: {interaction_obj.subject} for company {interaction_obj.company_id} / contact {interaction_obj.contact_id}")
             # Simulate adding to DB and getting a new ID
@@ -3,22 +3,22 @@ from tkinter import ttk, messagebox
 from core.purchase_logic import PurchaseLogic
 from core.logic.product_management import ProductLogic
 from core.sales_logic import SalesLogic
-from shared.structs import (
-    PurchaseDocumentStatus,
-    SalesDocumentStatus,
-    SalesDocumentType,
-)
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
 from ui.inventory.record_receipts_popup import RecordReceiptsPopup
 from ui.inventory.record_shipping_popup import RecordShippingPopup
 
 
 class InventoryTab:
+    # Bursts of focus events within this window cause a single refresh.
+    REFRESH_DELAY_MS = 250
+
     def __init__(
         self,
         master,
         purchase_logic: PurchaseLogic,
         product_logic: ProductLogic,
         sales_logic: SalesLogic,
+        loader: BackgroundLoader = None,
     ):
         self.frame = tk.Frame(master)
         self.purchase_logic = purchase_logic
@@ -28,11 +28,29 @@ class InventoryTab:
         self.selected_doc_id = None
         self.selected_ready_item_id = None
         self.selected_ready_doc_id = None
+        self.loader = loader or BackgroundLoader.inline(
+            self.frame,
+            LoadContext(
+                product_logic=product_logic,
+                sales_logic=sales_logic,
+                purchase_logic=purchase_logic,
+                inventory_service=purchase_logic.inventory_service,
+            ),
+        )
 
         self.setup_to_order_section()
         self.setup_to_receive_section()
         self.setup_ready_to_ship_section()
-        self.frame.bind("<FocusIn>", self.refresh_lists)
+        self.loading = LoadingIndicator(self.frame)
+        # What each tree currently shows, by iid: (parent, index, text, values).
+        self._rendered = {
+            self.to_order_tree: {},
+            self.to_receive_tree: {},
+            self.ready_tree: {},
+        }
+        self._shown_token = None
+        self._refresh_after_id = None
+        self.frame.bind("<FocusIn>", self.request_refresh)
 
     # --- To Order Section ---
     def setup_to_order_section(self):
@@ -220,162 +238,144 @@ class InventoryTab:
         )
         self.frame.master.wait_window(popup)
 
-    def refresh_lists(self, event=None):
-        self.refresh_to_order()
-        self.refresh_to_receive()
-        self.refresh_ready_to_ship()
+    def request_refresh(self, event=None):
+        """Refresh once focus events stop arriving for ``REFRESH_DELAY_MS``."""
+        if self._refresh_after_id is not None:
+            self.frame.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.frame.after(self.REFRESH_DELAY_MS, self._run_requested_refresh)
 
-    def refresh_to_order(self):
-        expanded_docs = {
-            iid
-            for iid in self.to_order_tree.get_children()
-            if self.to_order_tree.item(iid, "open")
-        }
-        self.to_order_tree.delete(*self.to_order_tree.get_children())
-        added_products: set[int] = set()
-        orders = self.sales_logic.get_all_sales_documents_by_criteria(
-            doc_type=SalesDocumentType.SALES_ORDER,
-            status=SalesDocumentStatus.SO_OPEN,
-        )
-        for doc in orders:
-            doc_iid = f"doc_{doc.id}"
-            is_open = doc_iid in expanded_docs
-            items = self.sales_logic.get_items_for_sales_document(doc.id)
-            doc_inserted = False
-            for item in items:
-                product = (
-                    self.product_logic.get_product_details(item.product_id)
-                    if item.product_id
-                    else None
-                )
-                on_hand = product.quantity_on_hand if product else 0
-                on_order = (
-                    self.purchase_logic.inventory_service.get_on_order_level(item.product_id)
-                    if item.product_id
-                    else 0
-                )
-                remaining_qty = item.quantity - item.shipped_quantity
-                to_order = remaining_qty - (on_hand + on_order)
-                if to_order > 0:
-                    if not doc_inserted:
-                        self.to_order_tree.insert(
-                            "", "end", iid=doc_iid, text=doc.document_number, open=is_open
-                        )
-                        doc_inserted = True
-                    self.to_order_tree.insert(
-                        doc_iid,
-                        "end",
-                        iid=item.id,
-                        text="",
-                        values=(
-                            item.product_description,
-                            on_hand,
-                            on_order,
-                            to_order,
-                        ),
-                    )
-                    if item.product_id:
-                        added_products.add(item.product_id)
-        low_stock = (
-            self.purchase_logic.inventory_service.get_products_below_reorder()
+    def _run_requested_refresh(self):
+        self._refresh_after_id = None
+        self.refresh_lists()
+
+    def refresh_lists(self, event=None, force=False):
+        """Collect the three work lists in the background, then redraw them.
+
+        Nothing is queried when the inventory tables have not changed since
+        the lists were last drawn, unless ``force`` is set.
+        """
+        token = self.purchase_logic.inventory_service.get_change_token()
+        if not force and token == self._shown_token:
+            return
+        self.loader.submit(
+            "inventory",
+            lambda ctx: self.collect_lists(ctx.inventory_service),
+            lambda lists: self._show_lists(lists, token),
+            indicator=self.loading,
         )
-        for prod in low_stock:
-            pid = prod["product_id"]
-            if pid in added_products:
-                continue
-            self.to_order_tree.insert(
-                "",
-                "end",
-                iid=f"reorder_{pid}",
-                text="Reorder",
-                values=(
-                    prod["name"],
-                    prod["on_hand"],
-                    prod["on_order"],
-                    prod["to_order"],
-                ),
+
+    def _show_lists(self, lists, token=None):
+        to_order, to_receive, ready_to_ship = lists
+        self._sync_tree(self.to_order_tree, to_order, self._rendered[self.to_order_tree])
+        self._sync_tree(self.to_receive_tree, to_receive, self._rendered[self.to_receive_tree])
+        self._sync_tree(self.ready_tree, ready_to_ship, self._rendered[self.ready_tree])
+        self._shown_token = token
+        # Rows that were selected may have been removed.
+        self.on_select_item()
+        self.on_select_ready_item()
+
+    @staticmethod
+    def _sync_tree(tree, rows, rendered):
+        """Bring ``tree`` in line with ``(iid, text, values, children)`` rows.
+
+        Only rows that were added, removed, moved or changed are touched, so
+        expanded documents stay expanded and the selection is kept. ``rendered``
+        records what the tree shows and is updated in place.
+        """
+        wanted = {}
+        for index, (iid, text, values, children) in enumerate(rows):
+            wanted[iid] = ("", index, text, tuple(values))
+            for child_index, (child_iid, child_values) in enumerate(children):
+                wanted[str(child_iid)] = (iid, child_index, "", tuple(child_values))
+
+        stale = {iid for iid in rendered if iid not in wanted}
+        if stale:
+            # Deleting a document also deletes its items, so forget those too.
+            tree.delete(*[iid for iid in stale if rendered[iid][0] not in stale])
+            for iid in [iid for iid, shown in rendered.items() if iid in stale or shown[0] in stale]:
+                del rendered[iid]
+
+        # Insertions alone keep the surviving rows in place; only parents whose
+        # surviving rows changed order get those rows moved.
+        kept = [(iid, row) for iid, row in wanted.items() if iid in rendered]
+        before = InventoryTab._order_by_parent((iid, rendered[iid]) for iid, _row in kept)
+        after = InventoryTab._order_by_parent(kept)
+        reordered = {parent for parent in before.keys() | after.keys()
+                     if before.get(parent) != after.get(parent)}
+
+        for iid, row in wanted.items():
+            parent, index, text, values = row
+            shown = rendered.get(iid)
+            if shown is None:
+                tree.insert(parent, index, iid=iid, text=text, values=values)
+            else:
+                if parent in reordered:
+                    tree.move(iid, parent, index)
+                if shown[2:] != (text, values):
+                    tree.item(iid, text=text, values=values)
+            rendered[iid] = row
+
+    @staticmethod
+    def _order_by_parent(entries):
+        """Map each parent to its child iids, in display order."""
+        children = {}
+        for iid, (parent, _index, _text, _values) in sorted(entries, key=lambda entry: entry[1][1]):
+            children.setdefault(parent, []).append(iid)
+        return children
+
+    @staticmethod
+    def collect_lists(inventory_service):
+        """Return the to-order, to-receive and ready-to-ship rows.
+
+        Only queries, no Tk calls, so it can run on a loader thread.
+        """
+        queue = inventory_service.get_work_queue()
+        to_order = [
+            (
+                f"doc_{doc['document_id']}",
+                doc["document_number"],
+                (),
+                [
+                    (item["item_id"], (item["product_description"], item["on_hand"],
+                                       item["on_order"], item["to_order"]))
+                    for item in doc["items"]
+                ],
             )
-    def refresh_to_receive(self):
-        expanded_docs = {
-            iid
-            for iid in self.to_receive_tree.get_children()
-            if self.to_receive_tree.item(iid, "open")
-        }
-        self.to_receive_tree.delete(*self.to_receive_tree.get_children())
-        self.selected_item_id = None
-        self.selected_doc_id = None
-        docs = self.purchase_logic.get_all_documents_by_criteria(
-            status=PurchaseDocumentStatus.PO_ISSUED
-        )
-        for doc in docs:
-            doc_iid = f"doc_{doc.id}"
-            is_open = doc_iid in expanded_docs
-            self.to_receive_tree.insert(
-                "", "end", iid=doc_iid, text=doc.document_number, open=is_open
+            for doc in queue["to_order"]
+        ]
+        to_order += [
+            (
+                f"reorder_{prod['product_id']}",
+                "Reorder",
+                (prod["name"], prod["on_hand"], prod["on_order"], prod["to_order"]),
+                [],
             )
-            items = self.purchase_logic.get_items_for_document(doc.id)
-            for item in items:
-                remaining = item.quantity - item.received_quantity
-                if remaining > 0:
-                    self.to_receive_tree.insert(
-                        doc_iid,
-                        "end",
-                        iid=item.id,
-                        text="",
-                        values=(
-                            item.product_description,
-                            item.quantity,
-                            item.received_quantity,
-                            remaining,
-                        ),
-                    )
-
-    def refresh_ready_to_ship(self):
-        expanded_docs = {
-            iid
-            for iid in self.ready_tree.get_children()
-            if self.ready_tree.item(iid, "open")
-        }
-        self.ready_tree.delete(*self.ready_tree.get_children())
-        self.selected_ready_item_id = None
-        orders = self.sales_logic.get_all_sales_documents_by_criteria(
-            doc_type=SalesDocumentType.SALES_ORDER,
-            status=SalesDocumentStatus.SO_OPEN,
-        )
-        for doc in orders:
-            doc_iid = f"doc_{doc.id}"
-            is_open = doc_iid in expanded_docs
-            items = self.sales_logic.get_items_for_sales_document(doc.id)
-            doc_inserted = False
-            for item in items:
-                remaining = item.quantity - item.shipped_quantity
-                if remaining <= 0:
-                    continue
-                product = (
-                    self.product_logic.get_product_details(item.product_id)
-                    if item.product_id
-                    else None
-                )
-                on_hand = product.quantity_on_hand if product else 0
-                if not doc_inserted:
-                    self.ready_tree.insert(
-                        "",
-                        "end",
-                        iid=doc_iid,
-                        text=doc.document_number,
-                        open=is_open,
-                    )
-                    doc_inserted = True
-                self.ready_tree.insert(
-                    doc_iid,
-                    "end",
-                    iid=item.id,
-                    text="",
-                    values=(
-                        item.product_description,
-                        item.quantity,
-                        item.shipped_quantity,
-                        remaining,
-                        on_hand,
-                    ),
-                )
+            for prod in queue["reorder"]
+        ]
+        to_receive = [
+            (
+                f"doc_{doc['document_id']}",
+                doc["document_number"],
+                (),
+                [
+                    (item["item_id"], (item["product_description"], item["quantity"],
+                                       item["received_quantity"], item["remaining"]))
+                    for item in doc["items"]
+                ],
+            )
+            for doc in queue["to_receive"]
+        ]
+        ready_to_ship = [
+            (
+                f"doc_{doc['document_id']}",
+                doc["document_number"],
+                (),
+                [
+                    (item["item_id"], (item["product_description"], item["quantity"],
+                                       item["shipped_quantity"], item["remaining"], item["on_hand"]))
+                    for item in doc["items"]
+                ],
+            )
+            for doc in queue["ready_to_ship"]
+        ]
+        return to_order, to_receive, ready_to_ship
@@ -17,12 +17,17 @@ from ui.company_info_tab import CompanyInfoTab
 from core.company_repository import CompanyRepository
 from core.company_service import CompanyService
 from core.address_service import AddressService
-from core.repositories import AddressRepository, AccountRepository, InventoryRepository, ProductRepository
+from core.repositories import AddressRepository, AccountRepository, InventoryRepository, ProductRepository, SearchRepository
+from core.search_service import SearchService
 from core.inventory_service import InventoryService
 from ui.pricing.pricing_rule_tab import PricingRuleTab
 from ui.payment_terms.payment_term_tab import PaymentTermTab
 from ui.category_popup import CategoryListPopup
 from ui.sales_preferences_popup import SalesPreferencesPopup
+from ui.search_results_popup import SearchResultsPopup
+from ui.render_queue_popup import RenderQueuePopup
+from core.render_queue import RenderQueue
+from ui.base.background_loader import BackgroundLoader, LoadContext
 
 
 class AddressBookView:
@@ -53,21 +58,46 @@ class AddressBookView:
         company_repo = CompanyRepository(self.db_handler)
         self.company_service = CompanyService(company_repo, self.address_service)
 
+        self.search_service = SearchService(SearchRepository(self.db_handler))
+
+        # Tab lists load on worker threads with their own read-only connections.
+        # An in-memory database only exists on this connection, so it loads inline.
+        db_path = self.db_handler.db_path
+        if db_path == ":memory:":
+            self.loader = BackgroundLoader.inline(self.root, LoadContext(
+                self.db_handler, self.address_book_logic, self.product_logic,
+                self.sales_logic, self.purchase_logic, self.inventory_service,
+            ))
+        else:
+            self.loader = BackgroundLoader(self.root, lambda: LoadContext.read_only(db_path))
+
         # Track the currently selected contact's ID and account's ID
         self.selected_contact_id = None
         self.selected_account_id = None
 
+        # Global search box above the tabs
+        search_frame = ttk.Frame(self.root)
+        search_frame.grid(row=0, column=0, padx=10, pady=(10, 0), sticky="ew")
+        ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
+        self.search_var = tk.StringVar()
+        search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=40)
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind("<Return>", lambda _event: self.open_search())
+        ttk.Button(search_frame, text="Go", command=self.open_search).pack(side=tk.LEFT)
+
         # Setup Notebook for tabs
         self.notebook = ttk.Notebook(self.root)
-        self.notebook.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        self.notebook.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
         self.root.columnconfigure(0, weight=1)  # Allow notebook to expand
-        self.root.rowconfigure(0, weight=1)  # Allow notebook to expand
+        self.root.rowconfigure(1, weight=1)  # Allow notebook to expand
 
         # Top-level menu
         menu_bar = tk.Menu(self.root)
         self.root.config(menu=menu_bar)
 
         file_menu = tk.Menu(menu_bar, tearoff=0)
+        file_menu.add_command(label="Print Queue", command=self.open_print_queue)
+        file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.destroy)
         menu_bar.add_cascade(label="File", menu=file_menu)
 
@@ -79,30 +109,53 @@ class AddressBookView:
         settings_menu.add_command(label="Sales Preferences", command=self.open_sales_preferences)
         menu_bar.add_cascade(label="Settings", menu=settings_menu)
 
-        # Initialize all tabs
-        self.account_tab = AccountTab(self.notebook, self.address_book_logic)
-        self.contact_tab = ContactTab(self.notebook, self.address_book_logic)
-        self.interaction_log_tab = InteractionLogTab(self.notebook, self.address_book_logic)
-        self.task_tab = TaskTab(self.notebook, self.address_book_logic)
-        self.product_tab = ProductTab(self.notebook, self.address_book_logic, self.product_logic, self.inventory_service, self.purchase_logic) # Pass product_logic here too
-        self.purchase_document_tab = PurchaseDocumentTab(self.notebook, self.purchase_logic, self.address_book_logic, self.product_logic) # Pass product_logic
-        self.sales_document_tab = SalesDocumentTab(
-            self.notebook, self.sales_logic, self.address_book_logic, self.product_logic
-        )  # Add Sales Documents tab
-        self.inventory_tab = InventoryTab(
-            self.notebook, self.purchase_logic, self.product_logic, self.sales_logic
-        )
-
-
-        # Add frames from tabs to Notebook
-        self.notebook.add(self.account_tab, text="Accounts")
-        self.notebook.add(self.contact_tab, text="Contacts")
-        self.notebook.add(self.interaction_log_tab, text="Interaction Log")
-        self.notebook.add(self.task_tab, text="Tasks")
-        self.notebook.add(self.product_tab.frame, text="Products")
-        self.notebook.add(self.purchase_document_tab.frame, text="Purchase")
-        self.notebook.add(self.sales_document_tab.frame, text="Sales")
-        self.notebook.add(self.inventory_tab.frame, text="Inventory")
+        # Tabs are built the first time they are selected, so startup only
+        # pays for the one on screen. Each gets a placeholder frame in the
+        # notebook and is packed into it when built; see _tab().
+        self._tab_specs = {}
+        self._add_lazy_tab("account_tab", "Accounts", lambda parent: AccountTab(
+            parent, self.address_book_logic, loader=self.loader))
+        self._add_lazy_tab("contact_tab", "Contacts", lambda parent: ContactTab(
+            parent, self.address_book_logic, loader=self.loader))
+        self._add_lazy_tab("interaction_log_tab", "Interaction Log", lambda parent: InteractionLogTab(
+            parent, self.address_book_logic, loader=self.loader))
+        self._add_lazy_tab("task_tab", "Tasks", lambda parent: TaskTab(
+            parent, self.address_book_logic, loader=self.loader))
+        self._add_lazy_tab("product_tab", "Products", lambda parent: ProductTab(
+            parent, self.address_book_logic, self.product_logic, self.inventory_service,
+            self.purchase_logic, loader=self.loader))
+        self._add_lazy_tab("purchase_document_tab", "Purchase", lambda parent: PurchaseDocumentTab(
+            parent, self.purchase_logic, self.address_book_logic, self.product_logic, loader=self.loader))
+        self._add_lazy_tab("sales_document_tab", "Sales", lambda parent: SalesDocumentTab(
+            parent, self.sales_logic, self.address_book_logic, self.product_logic, loader=self.loader))
+        self._add_lazy_tab("inventory_tab", "Inventory", lambda parent: InventoryTab(
+            parent, self.purchase_logic, self.product_logic, self.sales_logic, loader=self.loader))
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
+
+    def _add_lazy_tab(self, name, text, factory):
+        """Add a notebook page whose tab ``factory(parent)`` builds on first use."""
+        placeholder = ttk.Frame(self.notebook)
+        self.notebook.add(placeholder, text=text)
+        self._tab_specs[name] = (placeholder, factory)
+
+    def _tab(self, name):
+        """Return the tab stored as ``self.<name>``, building it if needed."""
+        tab = self.__dict__.get(name)
+        if tab is None:
+            placeholder, factory = self._tab_specs[name]
+            tab = factory(placeholder)
+            # Some tabs are frames themselves, others wrap one in ``.frame``.
+            getattr(tab, "frame", tab).pack(fill=tk.BOTH, expand=True)
+            setattr(self, name, tab)
+        return tab
+
+    def _on_tab_changed(self, _event=None):
+        selected = self.notebook.select()
+        for name, (placeholder, _factory) in self._tab_specs.items():
+            if str(placeholder) == selected:
+                self._tab(name)
+                break
 
     def open_company_info(self):
         """Open the company information popup."""
@@ -134,3 +187,31 @@ class AddressBookView:
         """Open the sales preferences popup."""
         popup = SalesPreferencesPopup(self.root)
         self.root.wait_window(popup)
+
+    def open_print_queue(self):
+        """Open the background PDF export queue."""
+        RenderQueuePopup(self.root, RenderQueue(self.db_handler))
+
+    def open_search(self):
+        """Open the global search results for the text in the search box."""
+        query = self.search_var.get().strip()
+        if query:
+            SearchResultsPopup(self.root, self.search_service, query, on_open=self.show_search_result)
+
+    def show_search_result(self, kind, source_id):
+        """Switch to the tab holding a search hit and select its row when listed."""
+        tabs = {
+            "account": ("account_tab", True),
+            "contact": ("contact_tab", True),
+            "product": ("product_tab", True),
+            "sales_document": ("sales_document_tab", True),
+            "purchase_document": ("purchase_document_tab", True),
+            "interaction": ("interaction_log_tab", False),
+        }
+        name, listed = tabs[kind]
+        tab = self._tab(name)
+        self.notebook.select(self._tab_specs[name][0])
+        if not listed:
+            return
+        # The lists are keyed by id; see() pages through the list until the row turns up.
+        tab.tree.see(source_id, lambda found: found and tab.tree.selection_set(source_id))
@@ -1,22 +1,30 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import messagebox
 from ui.products.product_popup import ProductDetailsPopup
 from ui.products.adjust_inventory_popup import AdjustInventoryPopup
 from ui.products.transaction_history_popup import TransactionHistoryPopup
 from ui.inventory_reports import InventoryReportPopup
 from shared.structs import Product
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
+from ui.base.virtual_tree import VirtualTreeview
 # from core.logic.product_management import ProductLogic # For type hinting
 
 class ProductTab:
-    def __init__(self, master, address_book_logic, product_logic, inventory_service, purchase_logic): # Changed 'logic' to specific logics
+    def __init__(self, master, address_book_logic, product_logic, inventory_service, purchase_logic, loader=None): # Changed 'logic' to specific logics
         self.frame = tk.Frame(master)
         self.address_book_logic = address_book_logic # May not be needed by product_tab directly
         self.product_logic = product_logic # Store and use this for product operations
         self.inventory_service = inventory_service
         self.purchase_logic = purchase_logic
         self.selected_product_id = None
+        self.loader = loader or BackgroundLoader.inline(
+            self.frame,
+            LoadContext(address_book_logic=address_book_logic, product_logic=product_logic,
+                        purchase_logic=purchase_logic, inventory_service=inventory_service),
+        )
 
         self.setup_product_tab()
+        self.loading = LoadingIndicator(self.frame)
         self.load_products()
 
         self.frame.bind("<FocusIn>", self.load_products)
@@ -56,10 +64,9 @@ class ProductTab:
             command=self.open_reports, width=button_width)
         self.reports_button.pack(side=tk.LEFT, padx=5)
 
-        self.tree = ttk.Treeview(
+        self.tree = VirtualTreeview(
             self.frame,
-            columns=(
-                "id",
+            (
                 "name",
                 "description",
                 "cost",
@@ -72,21 +79,36 @@ class ProductTab:
                 "reorder_qty",
                 "safety_stock",
             ),
-            show="headings",
+            self._fetch_products,
+            sort_keys={
+                "name": "name",
+                "description": "description",
+                "cost": "cost",
+                "active": "is_active",
+                "category": "category",
+                "unit_of_measure": "unit_of_measure",
+                "qty_on_hand": "quantity_on_hand",
+                "reorder_point": "reorder_point",
+                "reorder_qty": "reorder_quantity",
+                "safety_stock": "safety_stock",
+            },
+            sort_key="name",
+            loader=self.loader,
+            context_fetch=lambda ctx, sort_key, after, limit: self._product_page(
+                ctx.product_logic, ctx.inventory_service, sort_key, after, limit),
         )  # "price" -> "cost"
 
-        self.tree.column("id", width=0, stretch=False) # Hidden ID column
-        self.tree.heading("name", text="Product Name", command=lambda: self.sort_column("name", False))
-        self.tree.heading("description", text="Description", command=lambda: self.sort_column("description", False))
-        self.tree.heading("cost", text="Cost", command=lambda: self.sort_column("cost", False)) # "price" -> "cost"
-        self.tree.heading("active", text="Active", command=lambda: self.sort_column("active", False))
-        self.tree.heading("category", text="Category", command=lambda: self.sort_column("category", False))
-        self.tree.heading("unit_of_measure", text="Unit of Measure", command=lambda: self.sort_column("unit_of_measure", False))
-        self.tree.heading("qty_on_hand", text="On Hand", command=lambda: self.sort_column("qty_on_hand", False))
-        self.tree.heading("on_order", text="On Order", command=lambda: self.sort_column("on_order", False))
-        self.tree.heading("reorder_point", text="Reorder Point", command=lambda: self.sort_column("reorder_point", False))
-        self.tree.heading("reorder_qty", text="Reorder Qty", command=lambda: self.sort_column("reorder_qty", False))
-        self.tree.heading("safety_stock", text="Safety Stock", command=lambda: self.sort_column("safety_stock", False))
+        self.tree.heading("name", text="Product Name")
+        self.tree.heading("description", text="Description")
+        self.tree.heading("cost", text="Cost") # "price" -> "cost"
+        self.tree.heading("active", text="Active")
+        self.tree.heading("category", text="Category")
+        self.tree.heading("unit_of_measure", text="Unit of Measure")
+        self.tree.heading("qty_on_hand", text="On Hand")
+        self.tree.heading("on_order", text="On Order")
+        self.tree.heading("reorder_point", text="Reorder Point")
+        self.tree.heading("reorder_qty", text="Reorder Qty")
+        self.tree.heading("safety_stock", text="Safety Stock")
 
         self.tree.column("name", width=150, anchor=tk.W)
         self.tree.column("description", width=250, anchor=tk.W)
@@ -106,40 +128,6 @@ class ProductTab:
 
         self.tree.bind("<<TreeviewSelect>>", self.on_product_select)
 
-    def sort_column(self, col, reverse):
-        # Get data from treeview, specially handling the 'cost' column
-        data_to_sort = []
-        for k in self.tree.get_children(""):
-            value_str = self.tree.set(k, col)
-            if col == "cost":
-                try:
-                    # Attempt to convert cost to float after stripping '$'
-                    actual_value = float(value_str.lstrip('$'))
-                except ValueError:
-                    actual_value = value_str # Fallback to string if conversion fails
-            else:
-                actual_value = value_str
-            data_to_sort.append((actual_value, k))
-
-        # Define a sort key that tries float conversion, falls back to string
-        def sort_key(item):
-            val = item[0]
-            if isinstance(val, (int, float)):
-                return (0, val) # Type 0 for numbers
-            try:
-                return (0, float(val)) # Try converting string to float
-            except ValueError:
-                return (1, str(val).lower()) # Type 1 for strings, case-insensitive
-
-        data_to_sort.sort(key=sort_key, reverse=reverse)
-
-        # Reorder items in the treeview
-        for index, (val, k) in enumerate(data_to_sort):
-            self.tree.move(k, "", index)
-
-        # Update the heading command to toggle sort direction
-        self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
-
     def on_product_select(self, event=None):
         selected_items = self.tree.selection()
         if selected_items:
@@ -186,34 +174,54 @@ class ProductTab:
         self.load_products()
 
     def load_products(self, event=None):
-        self.tree.delete(*self.tree.get_children())
+        self.tree.selection_set()
         self.selected_product_id = None
 
-        try:
-            products = self.product_logic.get_all_products() # Use product_logic
-            for product in products:
-                self.tree.insert("", "end", iid=product.product_id, values=(
-                    product.product_id,
-                    product.name,
-                    product.description,
-                    f"${product.cost:.2f}", # Format cost with $
-                    "Yes" if product.is_active else "No",
-                    product.category,
-                    product.unit_of_measure,
-                    product.quantity_on_hand,
-                    self.inventory_service.get_on_order_level(product.product_id),
-                    product.reorder_point,
-                    product.reorder_quantity,
-                    product.safety_stock,
-                ))
-        except Exception as e:
-            import traceback
-            detailed_error_message = f"Detailed error in load_products: {type(e).__name__}: {e}"
-            print(detailed_error_message)
-            traceback.print_exc() # Prints the traceback to standard error
-            messagebox.showerror("Load Error", f"Failed to load products. See console for details.\n{type(e).__name__}: {e}")
-            # Kept the original print for your observation too, if it helps, but traceback is more important.
-            # print(f"Original simple error in load_products: {e}")
+        sort_key = self.tree.rows.sort_key
+        limit = self.tree.rows.page_size
+        self.loader.submit(
+            "products",
+            lambda ctx: self._product_page(ctx.product_logic, ctx.inventory_service, sort_key, None, limit),
+            lambda page: self.tree.load(page, sort_key),
+            on_error=self._show_load_error,
+            indicator=self.loading,
+        )
+
+    def _show_load_error(self, e):
+        import traceback
+        detailed_error_message = f"Detailed error in load_products: {type(e).__name__}: {e}"
+        print(detailed_error_message)
+        traceback.print_exception(e) # Prints the traceback to standard error
+        messagebox.showerror("Load Error", f"Failed to load products. See console for details.\n{type(e).__name__}: {e}")
+
+    def _fetch_products(self, sort_key, after, limit):
+        """Page source for scrolling and re-sorting the product list."""
+        return self._product_page(self.product_logic, self.inventory_service, sort_key, after, limit)
+
+    @staticmethod
+    def _product_page(product_logic, inventory_service, sort_key, after, limit):
+        """Build one page of list rows; on-order levels are read for the page only.
+
+        Runs on a loader thread, so no Tk calls.
+        """
+        products, next_cursor = product_logic.get_products_page(None, sort_key, after, limit)
+        on_order = inventory_service.get_on_order_levels([product.product_id for product in products])
+        rows = []
+        for product in products:
+            rows.append((product.product_id, (
+                product.name,
+                product.description,
+                f"${product.cost:.2f}" if product.cost is not None else "", # Format cost with $
+                "Yes" if product.is_active else "No",
+                product.category,
+                product.unit_of_measure,
+                product.quantity_on_hand,
+                on_order.get(product.product_id, 0),
+                product.reorder_point,
+                product.reorder_quantity,
+                product.safety_stock,
+            )))
+        return rows, next_cursor
 
     def refresh_products_list(self):
         self.load_products()
@@ -253,13 +261,13 @@ if __name__ == '__main__':
     root.title("Product Management Tab Test")
 
     class MockLogic:
-        def get_all_products(self):
-            print("MockLogic: get_all_products called")
+        def get_products_page(self, filters=None, sort_key="name", after=None, limit=100):
+            print("MockLogic: get_products_page called")
             return [
                 Product(product_id=1, name="Laptop Pro", description="High-end laptop", price=1200.00),
                 Product(product_id=2, name="Wireless Mouse", description="Ergonomic wireless mouse", price=25.99),
                 Product(product_id=3, name="Mechanical Keyboard", description="RGB mechanical keyboard", price=75.50)
-            ]
+            ], None
 
         def delete_product(self, product_id):
             print(f"MockLogic: delete_product called for {product_id}")
@@ -4,6 +4,7 @@ from typing import Optional
 # from core.purchase_logic import PurchaseLogic # Will be passed in
 # from core.logic.product_management import ProductLogic # Will be passed in (adjust import path if needed)
 from shared.structs import PurchaseDocumentItem, Product # For type hinting
+from ui.base.product_typeahead import ProductTypeahead
 
 class PurchaseDocumentItemPopup(tk.Toplevel):
     def __init__(self, master, purchase_logic, product_logic, document_id: int, item_data: Optional[dict] = None): # Added product_logic
@@ -31,8 +32,11 @@ class PurchaseDocumentItemPopup(tk.Toplevel):
         row = 0
         # Product Selection
         ttk.Label(frame, text="Product:").grid(row=row, column=0, padx=5, pady=(0,2), sticky=tk.W)
-        self.product_combobox = ttk.Combobox(frame, width=47, state="readonly")
+        self.product_combobox = ttk.Combobox(frame, width=47)
         self.product_combobox.grid(row=row, column=1, padx=5, pady=(0,5), sticky=tk.EW)
+        self.product_typeahead = ProductTypeahead(
+            self.product_combobox, self.product_logic, self.product_map, on_select=self._on_product_selected
+        )
         self.populate_products_dropdown()
         self.product_combobox.bind("<<ComboboxSelected>>", self._on_product_selected) # Bind event
         self.product_combobox.focus_set()
@@ -117,17 +121,8 @@ class PurchaseDocumentItemPopup(tk.Toplevel):
         if item_data:
             # Set product in combobox
             if item_data.get('product_id'):
-                product_id_to_select = item_data.get('product_id')
-                selected_product_name = None
-                for name, p_id in self.product_map.items():
-                    if p_id == product_id_to_select:
-                        selected_product_name = name
-                        break
-                if selected_product_name:
-                    self.product_combobox.set(selected_product_name)
-                else:
-                    # Product ID from item_data not found in current product list, maybe log warning
-                    self.product_combobox.set("<Select Product>") # Fallback
+                # Falls back to "<Select Product>" if the product no longer exists
+                self.product_typeahead.select_product(item_data.get('product_id'))
 
             # Set quantity (already done before, but ensure it's correct)
             self.quantity_var.set(str(item_data.get('quantity', '0')))
@@ -168,21 +163,10 @@ class PurchaseDocumentItemPopup(tk.Toplevel):
 
 
     def populate_products_dropdown(self):
+        # The dropdown starts with the first products by name and is refilled
+        # with ranked matches as the user types a SKU or name.
         self.product_map.clear()
-        product_display_names = ["<Select Product>"]
-
-        # Assuming self.product_logic.get_all_products() returns a list of Product objects
-        all_products = self.product_logic.get_all_products()
-        for prod in all_products:
-            # Using a more unique display if names can be non-unique, e.g., "Name (ID: X)"
-            # For now, assuming names are reasonably distinct for selection.
-            display_name = f"{prod.name}" # Consider adding (ID: {prod.product_id}) if names aren't unique
-            self.product_map[display_name] = prod.product_id
-            product_display_names.append(display_name)
-
-        self.product_combobox['values'] = sorted(product_display_names)
-        self.product_combobox.set("<Select Product>")
-        # TODO: If editing an item, set the combobox to the item's current product.
+        self.product_typeahead.reset()
 
     def _on_product_selected(self, event=None):
         """Handles product selection in the combobox to update the default unit price."""
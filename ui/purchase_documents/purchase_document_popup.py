@@ -121,15 +121,17 @@ class PurchaseDocumentPopup(tk.Toplevel):
         self.export_pdf_button = ttk.Button(bottom_button_frame, text="Export to PDF", command=self.export_to_pdf, state=tk.DISABLED)
         self.export_pdf_button.pack(side=tk.RIGHT, padx=5) # Placed before Close for typical Save/Export/Close order
 
+        self.preview_pdf_button = ttk.Button(bottom_button_frame, text="Preview", command=self.preview_pdf, state=tk.DISABLED)
+        self.preview_pdf_button.pack(side=tk.RIGHT, padx=5)
+
         self.close_button = ttk.Button(bottom_button_frame, text="Close", command=self.destroy)
         self.close_button.pack(side=tk.RIGHT, padx=5)
 
 
     def update_export_button_state(self):
-        if self.document_id:
-            self.export_pdf_button.config(state=tk.NORMAL)
-        else:
-            self.export_pdf_button.config(state=tk.DISABLED)
+        state = tk.NORMAL if self.document_id else tk.DISABLED
+        self.export_pdf_button.config(state=state)
+        self.preview_pdf_button.config(state=state)
 
     def export_to_pdf(self):
         if not self.document_id:
@@ -148,7 +150,7 @@ class PurchaseDocumentPopup(tk.Toplevel):
             # And that the main project structure allows this import from ui.purchase_documents
 
             # PDF generation module is now part of the 'core' package
-            from core.purchase_order_generator import generate_po_pdf as call_generate_po_pdf
+            from core.render_queue import RenderQueue
 
             # Determine filename prefix based on document status
             status_enum = PurchaseDocumentStatus(self.status_var.get())
@@ -159,8 +161,14 @@ class PurchaseDocumentPopup(tk.Toplevel):
             # Ensure the output directory exists or handle potential errors if it doesn't
             # For now, outputting to the current working directory of the main application
 
-            call_generate_po_pdf(self.document_id, output_path=output_filename)
-            messagebox.showinfo("PDF Exported", f"Document exported to {output_filename}", parent=self)
+            # The background worker renders it; see File > Print Queue.
+            title = "RFQ" if status_enum == PurchaseDocumentStatus.RFQ else "Purchase Order"
+            label = f"{title} {self.doc_number_var.get()}"
+            RenderQueue(self.purchase_logic.purchase_repo.db).enqueue(
+                "purchase_order", self.document_id, output_filename, label=label
+            )
+            messagebox.showinfo("PDF Export Queued", f"Document will be exported to {output_filename}.\n"
+                                "Progress is shown under File > Print Queue.", parent=self)
 
         except ImportError as ie:
             # This error might still occur if the overall project structure isn't correctly recognized by Python
@@ -174,6 +182,26 @@ class PurchaseDocumentPopup(tk.Toplevel):
             import traceback
             traceback.print_exc()
 
+    def preview_pdf(self):
+        """Render the saved document in the background and show it in a preview window."""
+        if not self.document_id:
+            messagebox.showwarning("No Document", "Please save the document first.", parent=self)
+            return
+        from ui.base.pdf_preview import preview_document
+
+        is_rfq = PurchaseDocumentStatus(self.status_var.get()) == PurchaseDocumentStatus.RFQ
+        prefix = "RFQ" if is_rfq else "PurchaseOrder"
+        document_number = self.doc_number_var.get()
+        preview_document(
+            self,
+            self.purchase_logic.purchase_repo.db,
+            "purchase_order",
+            self.document_id,
+            title=f"{'RFQ' if is_rfq else 'Purchase Order'} {document_number}",
+            file_name=f"{prefix}_{document_number.replace('/', '_')}.pdf",
+            loader=getattr(self.parent_controller, "loader", None),
+        )
+
 
     def populate_vendor_dropdown(self):
         self.vendor_map.clear()
@@ -582,6 +610,9 @@ if __name__ == '__main__':
         def get_all_products(self):
             from shared.structs import Product
             return [Product(product_id=1, name="Laptop"), Product(product_id=2, name="Mouse")]
+        def suggest(self, query, limit=10):
+            from core.product_index import ProductSuggestIndex
+            return ProductSuggestIndex([(1, "LT-1", "Laptop"), (2, "MS-2", "Mouse")]).suggest(query, limit)
         def get_product_details(self,pid): return None
 
     class MockPurchaseLogic:
@@ -1,18 +1,24 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import datetime # Import datetime
+from ui.base.background_loader import BackgroundLoader, LoadContext
+from ui.base.virtual_tree import VirtualTreeview
 # from .purchase_document_popup import PurchaseDocumentPopup # Will be created
 # from core.purchase_logic import PurchaseLogic # Will be passed in
 # from shared.structs import PurchaseDocument # For type hinting
 # from core.logic.product_management import ProductLogic # For type hinting
 
 class PurchaseDocumentTab:
-    def __init__(self, master, purchase_logic, account_logic, product_logic): # Added product_logic
+    def __init__(self, master, purchase_logic, account_logic, product_logic, loader=None): # Added product_logic
         self.frame = ttk.Frame(master)
         self.purchase_logic = purchase_logic
         self.account_logic = account_logic
         self.product_logic = product_logic # Store product_logic
         self.selected_document_id = None
+        self.loader = loader or BackgroundLoader.inline(
+            self.frame,
+            LoadContext(address_book_logic=account_logic, product_logic=product_logic, purchase_logic=purchase_logic),
+        )
 
         self._setup_ui()
         self.load_documents()
@@ -45,7 +51,15 @@ class PurchaseDocumentTab:
 
         # Treeview for displaying documents
         columns = ("doc_number", "vendor_name", "created_date", "status", "notes", "active")
-        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings", selectmode="browse")
+        self.tree = VirtualTreeview(
+            self.frame,
+            columns,
+            self._fetch_documents,
+            sort_keys={"doc_number": "document_number", "created_date": "created_date"},
+            sort_key="-created_date",
+            loader=self.loader,
+            context_fetch=self._fetch_documents_in,
+        )
 
         self.tree.heading("doc_number", text="Document #")
         self.tree.heading("vendor_name", text="Vendor")
@@ -63,9 +77,7 @@ class PurchaseDocumentTab:
 
         self.tree.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
         self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
-        self.tree.bind("<Double-1>", self.on_document_double_click) # Bind double-click
-
-        # TODO: Add scrollbar for treeview
+        self.tree.treeview.bind("<Double-1>", self.on_document_double_click) # Bind double-click
 
     def on_document_double_click(self, event):
         """Handles double-click event on the document treeview."""
@@ -90,21 +102,38 @@ class PurchaseDocumentTab:
         # No need to check edit_button state here, open_edit_document_popup has its own guard.
 
     def load_documents(self):
-        # Clear existing items
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        self._loaded_filters = self._document_filters()
+        self.tree.load()
+        self.on_tree_select(None) # Update button states
+
+    def _document_filters(self):
+        return {"is_active": None if self.show_inactive_var.get() else True}
 
-        show_inactive = self.show_inactive_var.get()
-        documents = self.purchase_logic.get_all_documents_by_criteria(
-            is_active=None if show_inactive else True
+    def _fetch_documents(self, sort_key, after, limit):
+        """Page source for the document list."""
+        return self._document_page(self.purchase_logic, self.account_logic, self._document_filters(),
+                                   sort_key, after, limit)
+
+    def _fetch_documents_in(self, ctx, sort_key, after, limit):
+        """Page source for loader threads; uses the filters of the last load."""
+        return self._document_page(ctx.purchase_logic, ctx.address_book_logic, self._loaded_filters,
+                                   sort_key, after, limit)
+
+    @staticmethod
+    def _document_page(purchase_logic, account_logic, filters, sort_key, after, limit):
+        """Build one page of list rows; no Tk calls, so loader threads can use it."""
+        documents, next_cursor = purchase_logic.get_purchase_documents_page(filters, sort_key, after, limit)
+
+        vendors = account_logic.get_account_summaries(
+            [doc.vendor_id for doc in documents if doc.vendor_id]
         )
 
+        rows = []
         for doc in documents:
             vendor_name = "Unknown Vendor"
-            if doc.vendor_id:
-                vendor_account = self.account_logic.get_account_details(doc.vendor_id)
-                if vendor_account:
-                    vendor_name = vendor_account.name
+            vendor_summary = vendors.get(doc.vendor_id)
+            if vendor_summary:
+                vendor_name = vendor_summary["name"]
 
             # Format created_date if it's an ISO string
             formatted_date = doc.created_date
@@ -114,21 +143,15 @@ class PurchaseDocumentTab:
             except (ValueError, TypeError):
                 pass # Keep original if not parsable
 
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    doc.document_number,
-                    vendor_name,
-                    formatted_date,
-                    doc.status.value if doc.status else "N/A",
-                    doc.notes or "",
-                    "Yes" if doc.is_active else "No",
-                ),
-                iid=str(doc.id),
-            )
-
-        self.on_tree_select(None) # Update button states
+            rows.append((doc.id, (
+                doc.document_number,
+                vendor_name,
+                formatted_date,
+                doc.status.value if doc.status else "N/A",
+                doc.notes or "",
+                "Yes" if doc.is_active else "No",
+            )))
+        return rows, next_cursor
 
     def on_tree_select(self, event):
         selected_items = self.tree.selection()
@@ -205,6 +228,7 @@ class PurchaseDocumentTab:
                 # Use the local variable for the deletion call
                 self.purchase_logic.delete_purchase_document(doc_id_to_delete)
                 messagebox.showinfo("Success", f"Document {doc_to_delete.document_number} deleted successfully.")
+                self.tree.selection_set()
                 self.load_documents()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete document: {e}")
@@ -213,7 +237,9 @@ if __name__ == '__main__':
     # Example usage (for testing this tab standalone)
     # This requires mock objects for purchase_logic and account_logic
     class MockLogic:
-        def get_all_documents_by_criteria(self, **kwargs): return []
+        def get_purchase_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
+            return [], None
+        def get_account_summaries(self, account_ids): return {}
         def get_account_details(self, acc_id): return None
         def delete_purchase_document(self, doc_id): pass
         def get_purchase_document_details(self, doc_id): return None
@@ -0,0 +1,107 @@
+import tkinter as tk
+from tkinter import ttk
+
+from core.render_queue import RenderQueue
+from shared.structs import RenderJobStatus
+
+
+class RenderQueuePopup(tk.Toplevel):
+    """Live view of the background PDF export queue.
+
+    The list is reloaded only when the queue's change counter moves, so
+    polling it every ``refresh_ms`` costs one small query while idle.
+    """
+
+    def __init__(self, master_window, render_queue: RenderQueue, refresh_ms: int = 1000):
+        super().__init__(master_window)
+        self.render_queue = render_queue
+        self.refresh_ms = refresh_ms
+        self._version = None
+        self._after_id = None
+        self.title("Print Queue")
+        self.geometry("800x400")
+
+        self.setup_ui()
+        self.refresh()
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        columns = ("document", "status", "attempts", "output", "error")
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", selectmode="extended")
+        self.tree.heading("document", text="Document")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("attempts", text="Attempts")
+        self.tree.heading("output", text="Output File")
+        self.tree.heading("error", text="Last Error")
+        self.tree.column("document", width=160)
+        self.tree.column("status", width=80, anchor=tk.CENTER, stretch=False)
+        self.tree.column("attempts", width=70, anchor=tk.CENTER, stretch=False)
+        self.tree.column("output", width=260)
+        self.tree.column("error", width=200)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(5, 0))
+        self.status_label = ttk.Label(button_frame, text="")
+        self.status_label.pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Clear Finished", command=self.clear_finished).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(button_frame, text="Retry Failed", command=self.retry_failed).pack(side=tk.RIGHT, padx=5)
+
+    def refresh(self):
+        """Reload the list if the queue changed, then check again later."""
+        self._after_id = None
+        version = self.render_queue.version()
+        if version != self._version:
+            self._version = version
+            self.load_jobs()
+        self._after_id = self.after(self.refresh_ms, self.refresh)
+
+    def load_jobs(self):
+        selected = set(self.tree.selection())
+        self.tree.delete(*self.tree.get_children())
+        for job in self.render_queue.jobs():
+            iid = str(job.id)
+            self.tree.insert("", "end", iid=iid, values=(
+                job.label or f"{job.kind} #{job.document_id}",
+                job.status.value,
+                f"{job.attempts}/{job.max_attempts}",
+                job.output_path,
+                job.last_error or "",
+            ))
+            if iid in selected:
+                self.tree.selection_add(iid)
+        counts = self.render_queue.counts()
+        self.status_label.config(text=", ".join(
+            f"{counts[status]} {status.value.lower()}" for status in RenderJobStatus
+        ))
+
+    def retry_failed(self):
+        """Retry the selected failed jobs, or every failed job when none is selected."""
+        selection = [int(iid) for iid in self.tree.selection()]
+        self.render_queue.retry(selection or None)
+        self.refresh_now()
+
+    def clear_finished(self):
+        self.render_queue.clear_finished()
+        self.refresh_now()
+
+    def refresh_now(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self.refresh()
+
+    def _on_destroy(self, event):
+        if event.widget is self and self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
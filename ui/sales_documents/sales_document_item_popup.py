@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, Toplevel
 from typing import Optional
 from shared.structs import SalesDocumentItem, Product # Import Sales version
+from ui.base.product_typeahead import ProductTypeahead
 
 class SalesDocumentItemPopup(Toplevel): # Changed class name
     def __init__(self, master, sales_logic, account_logic, product_logic, document_id: int, item_data: Optional[dict] = None):
@@ -28,8 +29,11 @@ class SalesDocumentItemPopup(Toplevel): # Changed class name
         row = 0
         # Product Selection
         ttk.Label(frame, text="Product:").grid(row=row, column=0, padx=5, pady=(0,2), sticky=tk.W)
-        self.product_combobox = ttk.Combobox(frame, width=47, state="readonly")
+        self.product_combobox = ttk.Combobox(frame, width=47)
         self.product_combobox.grid(row=row, column=1, padx=5, pady=(0,5), sticky=tk.EW)
+        self.product_typeahead = ProductTypeahead(
+            self.product_combobox, self.product_logic, self.product_map, on_select=self._on_product_selected
+        )
         self.populate_products_dropdown()
         self.product_combobox.bind("<<ComboboxSelected>>", self._on_product_selected)
         self.product_combobox.focus_set()
@@ -93,16 +97,8 @@ class SalesDocumentItemPopup(Toplevel): # Changed class name
     def load_item_data(self, item_data: dict):
         """Loads existing item data into the form fields."""
         if item_data.get('product_id'):
-            prod_id_to_select = item_data.get('product_id')
-            selected_prod_name = None
-            for name, p_id in self.product_map.items():
-                if p_id == prod_id_to_select:
-                    selected_prod_name = name
-                    break
-            if selected_prod_name:
-                self.product_combobox.set(selected_prod_name)
-            else:
-                self.product_combobox.set("<Select Product>") # Fallback if product not found
+            # Falls back to "<Select Product>" if the product no longer exists
+            self.product_typeahead.select_product(item_data.get('product_id'))
 
         self.quantity_var.set(str(item_data.get('quantity', '1')))
         self.unit_price_var.set(f"{item_data.get('unit_price', 0.0):.2f}")
@@ -133,18 +129,10 @@ class SalesDocumentItemPopup(Toplevel): # Changed class name
 
 
     def populate_products_dropdown(self):
+        # The dropdown starts with the first products by name and is refilled
+        # with ranked matches as the user types a SKU or name.
         self.product_map.clear()
-        product_display_names = ["<Select Product>"]
-        all_products = self.product_logic.get_all_products() # Expects list of Product objects or dicts
-
-        for prod in all_products:
-            if prod.name and prod.product_id is not None:
-                display_name = f"{prod.name}"
-                self.product_map[display_name] = prod.product_id
-                product_display_names.append(display_name)
-
-        self.product_combobox['values'] = sorted(product_display_names)
-        self.product_combobox.set("<Select Product>")
+        self.product_typeahead.reset()
 
 
     def _on_product_selected(self, event=None):
@@ -256,6 +244,9 @@ if __name__ == '__main__':
                 {'product_id': 1, 'name': 'Super Widget', 'sale_price': 19.99},
                 {'product_id': 2, 'name': 'Mega Gadget', 'sale_price': 29.50}
             ]
+        def suggest(self, query, limit=10):
+            from core.product_index import ProductSuggestIndex # Local import
+            return ProductSuggestIndex([(1, 'SW-1', 'Super Widget'), (2, 'MG-2', 'Mega Gadget')]).suggest(query, limit)
         def get_product_details(self, pid):
             if pid == 1: return {'product_id': 1, 'name': 'Super Widget', 'sale_price': 19.99, 'description': 'A truly super widget.'}
             if pid == 2: return {'product_id': 2, 'name': 'Mega Gadget', 'sale_price': 29.50, 'description': 'The best gadget ever.'}
@@ -12,6 +12,12 @@ from core.preferences import load_preferences
 
 NO_CUSTOMER_LABEL = "<Select Customer>" # Changed from Vendor
 DEFAULT_DOC_TYPE = SalesDocumentType.QUOTE # Default for new documents
+# Document types with a PDF layout -> (render kind, file name prefix)
+PDF_KINDS = {
+    SalesDocumentType.QUOTE: ("quote", "Quote"),
+    SalesDocumentType.SALES_ORDER: ("sales_order", "SalesOrder"),
+    SalesDocumentType.INVOICE: ("invoice", "Invoice"),
+}
 
 class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
     def __init__(self, master, sales_logic, account_logic, product_logic, document_id=None, initial_doc_type: Optional[SalesDocumentType]=None, parent_controller=None):
@@ -228,6 +234,8 @@ class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
         self.convert_to_invoice_button.pack(side=tk.RIGHT, padx=5)
         self.export_pdf_button = ttk.Button(bottom_button_frame, text="Export to PDF", command=self.export_to_pdf, state=tk.DISABLED)
         self.export_pdf_button.pack(side=tk.RIGHT, padx=5)
+        self.preview_pdf_button = ttk.Button(bottom_button_frame, text="Preview", command=self.preview_pdf, state=tk.DISABLED)
+        self.preview_pdf_button.pack(side=tk.RIGHT, padx=5)
         self.close_button = ttk.Button(bottom_button_frame, text="Close", command=self.destroy)
         self.close_button.pack(side=tk.RIGHT, padx=5)
 
@@ -280,14 +288,10 @@ class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
         can_export = (
             self.document_id
             and self.document_data
-            and self.document_data.document_type
-            in [
-                SalesDocumentType.QUOTE,
-                SalesDocumentType.SALES_ORDER,
-                SalesDocumentType.INVOICE,
-            ]
+            and self.document_data.document_type in PDF_KINDS
         )
         self.export_pdf_button.config(state=tk.NORMAL if can_export else tk.DISABLED)
+        self.preview_pdf_button.config(state=tk.NORMAL if can_export else tk.DISABLED)
 
     def export_to_pdf(self):
         if not self.document_id or not self.document_data:
@@ -295,27 +299,15 @@ class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
             return
 
         doc_type = self.document_data.document_type
-        generator_module = None
+        if doc_type not in PDF_KINDS:
+            messagebox.showwarning(
+                "Not Supported",
+                f"PDF export not supported for document type: {doc_type.value}",
+                parent=self,
+            )
+            return
         try:
-            if doc_type == SalesDocumentType.QUOTE:
-                from core.quote_generator import generate_quote_pdf
-
-                generator_module = generate_quote_pdf
-            elif doc_type == SalesDocumentType.SALES_ORDER:
-                from core.sales_order_generator import generate_sales_order_pdf
-
-                generator_module = generate_sales_order_pdf
-            elif doc_type == SalesDocumentType.INVOICE:
-                from core.invoice_generator import generate_invoice_pdf
-
-                generator_module = generate_invoice_pdf
-            else:
-                messagebox.showwarning(
-                    "Not Supported",
-                    f"PDF export not supported for document type: {doc_type.value}",
-                    parent=self,
-                )
-                return
+            from core.render_queue import RenderQueue
         except ImportError:
             messagebox.showerror(
                 "Error",
@@ -325,19 +317,19 @@ class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
             return
 
         try:
-            if doc_type == SalesDocumentType.QUOTE:
-                file_prefix = "Quote"
-            elif doc_type == SalesDocumentType.SALES_ORDER:
-                file_prefix = "SalesOrder"
-            else:
-                file_prefix = "Invoice"
-            output_filename = f"{file_prefix}_{self.doc_number_var.get()}.pdf"
+            kind, file_prefix = PDF_KINDS[doc_type]
+            document_number = self.doc_number_var.get()
+            output_filename = f"{file_prefix}_{document_number}.pdf"
             # TODO: Use filedialog.asksaveasfilename for better UX
 
-            generator_module(self.document_id, output_path=output_filename)
+            # The background worker renders it; see File > Print Queue.
+            RenderQueue(self.sales_logic.db).enqueue(
+                kind, self.document_id, output_filename, label=f"{doc_type.value} {document_number}"
+            )
             messagebox.showinfo(
-                "PDF Exported",
-                f"{doc_type.value} exported to {output_filename}",
+                "PDF Export Queued",
+                f"{doc_type.value} will be exported to {output_filename}.\n"
+                "Progress is shown under File > Print Queue.",
                 parent=self,
             )
         except Exception as e:
@@ -345,6 +337,28 @@ class SalesDocumentPopup(Toplevel): # Changed from tk.Toplevel for directness
             import traceback
             traceback.print_exc()
 
+    def preview_pdf(self):
+        """Render the saved document in the background and show it in a preview window."""
+        if not self.document_id or not self.document_data:
+            messagebox.showwarning("No Document", "Please save the document first.", parent=self)
+            return
+        doc_type = self.document_data.document_type
+        if doc_type not in PDF_KINDS:
+            return
+        from ui.base.pdf_preview import preview_document
+
+        kind, file_prefix = PDF_KINDS[doc_type]
+        document_number = self.doc_number_var.get()
+        preview_document(
+            self,
+            self.sales_logic.db,
+            kind,
+            self.document_id,
+            title=f"{doc_type.value} {document_number}",
+            file_name=f"{file_prefix}_{document_number}.pdf",
+            loader=getattr(self.parent_controller, "loader", None),
+        )
+
 
     def on_customer_selected(self, event=None):
         selected_customer_name = self.customer_var.get()
@@ -886,6 +900,9 @@ if __name__ == '__main__':
         def get_all_products(self):
             from shared.structs import Product # Local import for test
             return [Product(product_id=1, name="Laptop Pro", sale_price=1200.00), Product(product_id=2, name="Wireless Mouse", sale_price=25.00)]
+        def suggest(self, query, limit=10):
+            from core.product_index import ProductSuggestIndex # Local import for test
+            return ProductSuggestIndex([(1, "LP-1", "Laptop Pro"), (2, "WM-2", "Wireless Mouse")]).suggest(query, limit)
         def get_product_details(self, pid):
             if pid == 1: return {"product_id":1, "name":"Laptop Pro", "sale_price":1200.00, "description":"High-end laptop"}
             if pid == 2: return {"product_id":2, "name":"Wireless Mouse", "sale_price":25.00, "description":"Ergonomic mouse"}
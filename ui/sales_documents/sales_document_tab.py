@@ -1,17 +1,26 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import datetime
+import os
 from shared.structs import SalesDocumentType, SalesDocumentStatus, AccountType # Import for sales
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
+from ui.base.virtual_tree import VirtualTreeview
+from shared.utils import sanitize_filename
 
 class SalesDocumentTab:
-    def __init__(self, master, sales_logic, account_logic, product_logic): # Renamed purchase_logic to sales_logic
+    def __init__(self, master, sales_logic, account_logic, product_logic, loader=None): # Renamed purchase_logic to sales_logic
         self.frame = ttk.Frame(master)
         self.sales_logic = sales_logic # Use sales_logic
         self.account_logic = account_logic
         self.product_logic = product_logic
         self.selected_document_id = None
+        self.loader = loader or BackgroundLoader.inline(
+            self.frame,
+            LoadContext(address_book_logic=account_logic, product_logic=product_logic, sales_logic=sales_logic),
+        )
 
         self._setup_ui()
+        self.loading = LoadingIndicator(self.frame)
         self.load_documents()
 
         self.frame.bind("<FocusIn>", lambda event: self.load_documents())
@@ -29,6 +38,9 @@ class SalesDocumentTab:
         self.delete_button = ttk.Button(button_frame, text="Delete", command=self.delete_selected_document, state=tk.DISABLED)
         self.delete_button.pack(side=tk.LEFT, padx=5)
 
+        self.print_button = ttk.Button(button_frame, text="Print Selected", command=self.print_selected_documents, state=tk.DISABLED)
+        self.print_button.pack(side=tk.LEFT, padx=5)
+
         self.show_inactive_var = tk.BooleanVar(value=False)
         self.show_inactive_cb = ttk.Checkbutton(
             button_frame,
@@ -49,7 +61,16 @@ class SalesDocumentTab:
             "notes",
             "active",
         )
-        self.tree = ttk.Treeview(self.frame, columns=columns, show="headings", selectmode="browse")
+        self.tree = VirtualTreeview(
+            self.frame,
+            columns,
+            self._fetch_documents,
+            sort_keys={"doc_number": "document_number", "created_date": "created_date"},
+            sort_key="-created_date",
+            selectmode="extended",
+            loader=self.loader,
+            context_fetch=self._fetch_documents_in,
+        )
 
         self.tree.heading("doc_number", text="Document #")
         self.tree.heading("doc_type", text="Type")
@@ -69,21 +90,16 @@ class SalesDocumentTab:
         self.tree.column("notes", width=250, anchor=tk.W)
         self.tree.column("active", width=60, anchor=tk.CENTER)
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.tree.pack(expand=True, fill=tk.BOTH, padx=(10,0), pady=10) # Adjust padx to accommodate scrollbar
+        self.tree.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
 
         self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
-        self.tree.bind("<Double-1>", self.on_document_double_click)
+        self.tree.treeview.bind("<Double-1>", self.on_document_double_click)
 
     def on_document_double_click(self, event):
         item_iid = self.tree.identify_row(event.y)
         if not item_iid:
             return
-        current_selection = self.tree.selection()
-        if not current_selection or current_selection[0] != item_iid:
+        if self.tree.selection() != (item_iid,):
             self.tree.selection_set(item_iid)
             try:
                 self.selected_document_id = int(item_iid)
@@ -93,21 +109,50 @@ class SalesDocumentTab:
             self.open_manage_document_popup()
 
     def load_documents(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        """Fetch the first page in the background, then show it."""
+        filters = self._document_filters()
+        self._loaded_filters = filters
+        sort_key = self.tree.rows.sort_key
+        limit = self.tree.rows.page_size
+        self.loader.submit(
+            "sales_documents",
+            lambda ctx: self._document_page(ctx.sales_logic, ctx.address_book_logic, filters, sort_key, None, limit),
+            lambda page: self._show_documents(page, sort_key),
+            indicator=self.loading,
+        )
+
+    def _show_documents(self, page, sort_key):
+        self.tree.load(page, sort_key)
+        self.on_tree_select(None)
+
+    def _document_filters(self):
+        return {"is_active": None if self.show_inactive_var.get() else True}
+
+    def _fetch_documents(self, sort_key, after, limit):
+        """Page source for scrolling and re-sorting the document list."""
+        return self._document_page(self.sales_logic, self.account_logic, self._document_filters(),
+                                   sort_key, after, limit)
+
+    def _fetch_documents_in(self, ctx, sort_key, after, limit):
+        """Page source for loader threads; uses the filters of the last load."""
+        return self._document_page(ctx.sales_logic, ctx.address_book_logic, self._loaded_filters,
+                                   sort_key, after, limit)
 
-        show_inactive = self.show_inactive_var.get()
-        documents = self.sales_logic.get_all_sales_documents_by_criteria(
-            is_active=None if show_inactive else True
+    @staticmethod
+    def _document_page(sales_logic, account_logic, filters, sort_key, after, limit):
+        """Build one page of list rows; runs on a loader thread, so no Tk calls."""
+        documents, next_cursor = sales_logic.get_sales_documents_page(filters, sort_key, after, limit)
+
+        customers = account_logic.get_account_summaries(
+            [doc.customer_id for doc in documents if doc.customer_id]
         )
 
+        rows = []
         for doc in documents:
             customer_name = "Unknown Customer"
-            if doc.customer_id: # Changed from vendor_id
-                customer_account = self.account_logic.get_account_details(doc.customer_id)
-                if customer_account:
-                    customer_name = customer_account.name
-
+            customer_summary = customers.get(doc.customer_id)
+            if customer_summary:
+                customer_name = customer_summary["name"]
 
             formatted_date = doc.created_date
             try:
@@ -120,27 +165,22 @@ class SalesDocumentTab:
             status_display = doc.status.value if doc.status else "N/A"
             total_amount_display = f"${doc.total_amount:.2f}" if doc.total_amount is not None else "$0.00"
 
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(
-                    doc.document_number,
-                    doc_type_display,
-                    customer_name,
-                    formatted_date,
-                    status_display,
-                    total_amount_display,
-                    doc.notes or "",
-                    "Yes" if doc.is_active else "No",
-                ),
-                iid=str(doc.id),
-            )
-
-        self.on_tree_select(None)
+            rows.append((doc.id, (
+                doc.document_number,
+                doc_type_display,
+                customer_name,
+                formatted_date,
+                status_display,
+                total_amount_display,
+                doc.notes or "",
+                "Yes" if doc.is_active else "No",
+            )))
+        return rows, next_cursor
 
     def on_tree_select(self, event):
         selected_items = self.tree.selection()
-        if selected_items:
+        # Edit and Delete act on one document; Print Selected takes them all.
+        if len(selected_items) == 1:
             try:
                 self.selected_document_id = int(selected_items[0])
                 self.delete_button.config(state=tk.NORMAL)
@@ -153,6 +193,38 @@ class SalesDocumentTab:
             self.selected_document_id = None
             self.delete_button.config(state=tk.DISABLED)
             self.edit_button.config(state=tk.DISABLED)
+        self.print_button.config(state=tk.NORMAL if selected_items else tk.DISABLED)
+
+    def print_selected_documents(self):
+        """Queue a PDF export of every selected quote, sales order and invoice."""
+        from core.render_queue import RenderQueue
+        from .sales_document_popup import PDF_KINDS
+
+        jobs = []
+        for key in self.tree.selection():
+            values = self.tree.values(key)
+            if not values:
+                continue
+            document_number, doc_type_display = values[0], values[1]
+            try:
+                kind, file_prefix = PDF_KINDS[SalesDocumentType(doc_type_display)]
+            except (ValueError, KeyError):
+                continue
+            jobs.append((kind, int(key), f"{file_prefix}_{sanitize_filename(document_number)}.pdf",
+                         f"{doc_type_display} {document_number}"))
+        if not jobs:
+            messagebox.showwarning("Nothing to Print", "Select at least one quote, sales order or invoice.")
+            return
+
+        directory = filedialog.askdirectory(parent=self.frame, title="Export PDFs To")
+        if not directory:
+            return
+        RenderQueue(self.sales_logic.db).enqueue_many(
+            (kind, doc_id, os.path.join(directory, name), label) for kind, doc_id, name, label in jobs
+        )
+        messagebox.showinfo("PDF Export Queued",
+                            f"{len(jobs)} document(s) queued for export to {directory}.\n"
+                            "Progress is shown under File > Print Queue.")
 
     def open_manage_document_popup(self, doc_type=None):
         # Import SalesDocumentPopup locally
@@ -192,6 +264,7 @@ class SalesDocumentTab:
             try:
                 self.sales_logic.delete_sales_document(doc_id_to_delete) # Use sales_logic
                 messagebox.showinfo("Success", f"{doc_to_delete.document_type.value} {doc_to_delete.document_number} deleted.")
+                self.tree.selection_set()
                 self.load_documents()
             except ValueError as ve: # Catch specific ValueErrors from logic (e.g., cannot delete paid invoice)
                 messagebox.showerror("Deletion Error", str(ve))
@@ -209,19 +282,22 @@ if __name__ == '__main__':
         def get_all_accounts(self): # Needed by popup
             from shared.structs import Account
             return [Account(account_id=1, name="Customer Alpha", account_type=AccountType.CUSTOMER)]
+        def get_account_summaries(self, account_ids):
+            return {1: {"name": "Customer Alpha"}} if 1 in account_ids else {}
 
 
     class MockProductLogic: # Needed by popup
         def get_all_products(self): return []
+        def suggest(self, query, limit=10): return []
         def get_product_details(self, pid): return None
 
     class MockSalesLogic:
-        def get_all_sales_documents_by_criteria(self, **kwargs):
+        def get_sales_documents_page(self, filters=None, sort_key="-created_date", after=None, limit=100):
             from shared.structs import SalesDocument, SalesDocumentType, SalesDocumentStatus
             return [
                 SalesDocument(doc_id=1, document_number="QUO-20230101-0001", customer_id=1, document_type=SalesDocumentType.QUOTE, created_date=datetime.datetime.now().isoformat(), status=SalesDocumentStatus.QUOTE_DRAFT, total_amount=100.0, notes="Test Quote 1"),
                 SalesDocument(doc_id=2, document_number="INV-20230102-0001", customer_id=1, document_type=SalesDocumentType.INVOICE, created_date=datetime.datetime.now().isoformat(), status=SalesDocumentStatus.INVOICE_SENT, total_amount=250.50, notes="Test Invoice 1")
-            ]
+            ], None
         def get_sales_document_details(self, doc_id):
              from shared.structs import SalesDocument, SalesDocumentType, SalesDocumentStatus
              if doc_id == 1:
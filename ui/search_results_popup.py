@@ -0,0 +1,78 @@
+import tkinter as tk
+from tkinter import ttk
+
+from core.search_service import SearchService
+
+KIND_LABELS = {
+    "account": "Account",
+    "contact": "Contact",
+    "product": "Product",
+    "sales_document": "Sales Document",
+    "purchase_document": "Purchase Document",
+    "interaction": "Interaction",
+}
+
+
+class SearchResultsPopup(tk.Toplevel):
+    """List global search hits; double-clicking one calls ``on_open(kind, id)``."""
+
+    def __init__(self, master_window, search_service: SearchService, query: str, on_open=None, limit: int = 50):
+        super().__init__(master_window)
+        self.search_service = search_service
+        self.on_open = on_open
+        self.limit = limit
+        self.title("Search")
+        self.geometry("650x400")
+
+        self.setup_ui()
+        self.query_var.set(query)
+        self.run_search()
+
+    def setup_ui(self):
+        main_frame = ttk.Frame(self, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+
+        search_frame = ttk.Frame(main_frame)
+        search_frame.pack(fill=tk.X, pady=(0, 5))
+        self.query_var = tk.StringVar()
+        entry = ttk.Entry(search_frame, textvariable=self.query_var)
+        entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        entry.bind("<Return>", lambda _event: self.run_search())
+        ttk.Button(search_frame, text="Search", command=self.run_search).pack(side=tk.LEFT, padx=5)
+
+        tree_frame = ttk.Frame(main_frame)
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(tree_frame, columns=("kind", "title", "snippet"), show="headings")
+        self.tree.heading("kind", text="Type")
+        self.tree.heading("title", text="Title")
+        self.tree.heading("snippet", text="Match")
+        self.tree.column("kind", width=120, stretch=False)
+        self.tree.column("title", width=200)
+        self.tree.column("snippet", width=300)
+        vsb = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        tree_frame.grid_rowconfigure(0, weight=1)
+        tree_frame.grid_columnconfigure(0, weight=1)
+        self.tree.bind("<Double-1>", self.open_selected)
+
+        self.status_label = ttk.Label(main_frame, text="")
+        self.status_label.pack(anchor=tk.W, pady=(5, 0))
+
+    def run_search(self):
+        self.tree.delete(*self.tree.get_children())
+        results = self.search_service.search(self.query_var.get(), limit=self.limit)
+        for index, result in enumerate(results):
+            self.tree.insert(
+                "", "end", iid=f"{result.kind}:{result.id}:{index}",
+                values=(KIND_LABELS.get(result.kind, result.kind), result.title, result.snippet),
+            )
+        self.status_label.config(text=f"{len(results)} result(s)")
+
+    def open_selected(self, _event=None):
+        selection = self.tree.selection()
+        if not selection or not self.on_open:
+            return
+        kind, source_id, _index = selection[0].split(":")
+        self.on_open(kind, int(source_id))
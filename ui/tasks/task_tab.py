@@ -2,16 +2,19 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from ui.tasks.task_popup import TaskDetailsPopup
 from shared.structs import TaskStatus, TaskPriority # For potential direct use, though logic layer should handle most
+from ui.base.background_loader import BackgroundLoader, LoadContext, LoadingIndicator
 
-import datetime # Import the datetime module
 
 class TaskTab(tk.Frame): # Inherit from tk.Frame directly
-    def __init__(self, master, logic):
+    def __init__(self, master, logic, loader=None):
         super().__init__(master) # Initialize the Frame
         self.logic = logic
         self.selected_task_id = None
+        self.sort_state = ("due_date", False) # (column, descending)
+        self.loader = loader or BackgroundLoader.inline(self, LoadContext(address_book_logic=logic))
 
         self.setup_task_tab()
+        self.loading = LoadingIndicator(self)
         self.load_tasks()
 
         # Optional: Bind FocusIn to reload if needed, similar to AccountTab
@@ -90,29 +93,10 @@ class TaskTab(tk.Frame): # Inherit from tk.Frame directly
         # This setup should inherently support resizing if the parent tab in the notebook resizes.
 
     def sort_column(self, col, reverse):
-        """Sort the Treeview column when clicked."""
-        try:
-            # For date sorting, it's better to convert to actual date objects if possible
-            if col == "due_date":
-                data = []
-                for k in self.tree.get_children(""):
-                    date_str = self.tree.set(k, col)
-                    try:
-                        # Attempt to parse date for proper sorting, handle potential errors
-                        parsed_date = datetime.datetime.strptime(date_str, '%Y-%m-%d').date()
-                        data.append((parsed_date, k))
-                    except ValueError:
-                        data.append((date_str, k)) # Fallback to string sort if format is unexpected
-            else:
-                data = [(self.tree.set(k, col), k) for k in self.tree.get_children("")]
-
-            data.sort(key=lambda item: item[0], reverse=reverse)
-
-            for index, (val, k) in enumerate(data):
-                self.tree.move(k, "", index)
-            self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
-        except Exception as e:
-            print(f"Error sorting column {col}: {e}")
+        """Sort the Treeview column when clicked by reloading tasks sorted in SQL."""
+        self.sort_state = (col, reverse)
+        self.load_tasks()
+        self.tree.heading(col, command=lambda: self.sort_column(col, not reverse))
 
 
     def create_new_task(self):
@@ -153,52 +137,35 @@ class TaskTab(tk.Frame): # Inherit from tk.Frame directly
 
 
     def load_tasks(self):
-        """Load tasks into the Treeview."""
+        """Load tasks into the Treeview once the background query returns."""
+        sort_state = self.sort_state
+        self.loader.submit(
+            "tasks",
+            lambda ctx: ctx.address_book_logic.get_task_list_rows(sort=sort_state),
+            self._show_tasks,
+            on_error=self._show_load_error,
+            indicator=self.loading,
+        )
+
+    def _show_tasks(self, rows):
         for item in self.tree.get_children():
             self.tree.delete(item)
 
-        try:
-            tasks = self.logic.get_all_tasks() # This should return list of Task objects
-
-            # For displaying company, contact, user names, we might need to fetch them
-            # This can be inefficient if done per task.
-            # Consider if logic.get_all_tasks could return enriched data, or cache lookups.
-            # For now, let's assume we can get names or make placeholder calls.
-
-            # Pre-fetch related data to avoid multiple DB calls in a loop (conceptual)
-            # Pre-fetch related data to avoid multiple DB calls in a loop
-            accounts_list = self.logic.get_accounts() # list of (id, name)
-            accounts_map = {acc_id: acc_name for acc_id, acc_name in accounts_list}
-
-            contacts_list = self.logic.get_all_contacts() # list of Contact objects
-            contacts_map = {contact.contact_id: contact.name for contact in contacts_list}
-
-            users_list = []
-            if hasattr(self.logic, 'get_all_users'): # Check if method exists
-                users_list = self.logic.get_all_users() # list of (id, username)
-            users_map = {user_id: username for user_id, username in users_list}
-
-
-            for task in tasks:
-                company_name = accounts_map.get(task.company_id, "N/A") if task.company_id else "N/A"
-                contact_name = contacts_map.get(task.contact_id, "N/A") if task.contact_id else "N/A"
-                assigned_user_name = users_map.get(task.assigned_to_user_id, "N/A") if task.assigned_to_user_id else "N/A"
-
-                due_date_str = task.due_date.strftime('%Y-%m-%d') if task.due_date else "N/A"
-
-                self.tree.insert("", "end", values=(
-                    task.task_id,
-                    task.title,
-                    due_date_str,
-                    task.status.value if task.status else "N/A",
-                    task.priority.value if task.priority else "N/A",
-                    company_name,
-                    contact_name,
-                    assigned_user_name
-                ))
-        except Exception as e:
-            messagebox.showerror("Error Loading Tasks", f"An error occurred: {e}")
-            print(f"Error loading tasks: {e}") # For console debugging
+        for row in rows:
+            self.tree.insert("", "end", values=(
+                row["task_id"],
+                row["title"],
+                row["due_date"] or "N/A",
+                row["status"] or "N/A",
+                row["priority"] or "N/A",
+                row["company"] or "N/A",
+                row["contact"] or "N/A",
+                row["assigned_user"] or "N/A"
+            ))
+
+    def _show_load_error(self, e):
+        messagebox.showerror("Error Loading Tasks", f"An error occurred: {e}")
+        print(f"Error loading tasks: {e}") # For console debugging
 
 
     def select_task(self, event=None):
@@ -235,6 +202,15 @@ if __name__ == '__main__':
         def get_task_details(self, task_id): # For popup edit
             if task_id == 1: return self.get_all_tasks()[0]
             return None
+        def get_task_list_rows(self, filters=None, sort=("due_date", False), limit=None, offset=0):
+            rows = [
+                {"task_id": 1, "title": "Test Task 1", "due_date": "2024-07-15", "status": "Open", "priority": "High",
+                 "company": "Company Alpha", "contact": "John Doe", "assigned_user": "TestUser"},
+                {"task_id": 2, "title": "Another Task - Follow up", "due_date": "2024-07-20", "status": "In Progress",
+                 "priority": "Medium", "company": "Company Beta", "contact": None, "assigned_user": None},
+            ]
+            col, descending = sort
+            return sorted(rows, key=lambda r: r[col] or "", reverse=descending)
         def get_accounts(self): return [(1, "Company Alpha"), (2, "Company Beta")]
         def get_all_contacts(self): return [type('obj', (object,), {'contact_id': 10, 'name': 'John Doe'})()]
         # get_all_users would be needed for the popup's assigned user dropdown